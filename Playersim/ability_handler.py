@@ -11,6 +11,7 @@ import re
 from collections import defaultdict
 from .card import Card
 from .ability_utils import EffectFactory
+from .step_latency import SBA_TRIGGER_STAGE
 # *** CHANGED: Import TargetingSystem from its new file ***
 
 
@@ -2675,6 +2676,16 @@ class AbilityHandler:
         one triggers bypass the choice entirely, so training dynamics are
         untouched in the common case.
         """
+        recorder = getattr(self.game_state, "latency_recorder", None)
+        if recorder is None:
+            return self._process_triggered_abilities_impl()
+        recorder.enter(SBA_TRIGGER_STAGE)
+        try:
+            return self._process_triggered_abilities_impl()
+        finally:
+            recorder.exit()
+
+    def _process_triggered_abilities_impl(self):
         gs = self.game_state
         if not self.active_triggers:
             return
@@ -136,6 +136,21 @@ def get_manifest():
     return _manifest
 
 
+def install_manifest(manifest):
+    """Make ``manifest`` the process-wide accumulator; return the previous one.
+
+    Callers that interleave several games in one process (lockstep harvest
+    lanes) save a game's accumulator with ``get_manifest`` and reinstall it
+    here, so each game's reports land in its own manifest.
+    """
+    global _manifest
+    if not isinstance(manifest, CardSupportManifest):
+        raise TypeError(
+            f"expected a CardSupportManifest, got {type(manifest).__name__}")
+    previous, _manifest = _manifest, manifest
+    return previous
+
+
 def report_unsupported(card_name, reason, severity="partial"):
     """Convenience: record a support issue on the process-wide manifest."""
     return _manifest.report(card_name, reason, severity)
@@ -0,0 +1,265 @@
+"""Compact rollout storage for the Dict policy observation.
+
+SB3 rollout buffers store every observation field at its declared dtype for
+``n_steps * n_envs`` transitions.  Most of the policy observation does not
+need that width: integer fields are small counts, phases, and categorical
+ids, and the card-detail tensors are mostly keyword, color, and subtype
+flags.  ``compact_storage_layout`` derives a lossless storage form for every
+field from the declared space and the ``observation_schema`` contract:
+
+* ``bool`` fields, and the elements of ``BINARY_FLAG_FIELDS`` declared over
+  ``[0, 1]``, are bit-packed eight to a byte;
+* integer fields use the narrowest integer dtype that holds their declared
+  bounds (semantic identities use the schema's encoded identity range);
+* every other element keeps its declared dtype.
+
+``CompactArray`` stores one buffer field in that form behind the small part
+of the ndarray interface the rollout buffers use -- item assignment,
+indexing, ``swapaxes`` and ``reshape`` over the leading axes -- and decodes
+to the declared dtype on read.  A write that the compact form cannot hold
+exactly raises ``ValueError`` instead of storing a different value.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+import numpy as np
+from gymnasium import spaces
+
+from .observation_schema import (
+    BINARY_FLAG_FIELDS,
+    SEMANTIC_IDENTITY_FIELDS,
+    SEMANTIC_IDENTITY_MAX,
+)
+
+
+_INTEGER_STORAGE_DTYPES = tuple(
+    np.dtype(name) for name in ("uint8", "int8", "uint16", "int16",
+                                "uint32", "int32"))
+
+
+class CompactField(NamedTuple):
+    """Storage form of one observation field.
+
+    ``bit_elements`` index the flattened field elements that are bit-packed;
+    ``dense_elements`` the ones stored as ``dense_dtype``.  Either may be
+    empty.  ``dense_low``/``dense_high`` are the bounds a narrowed dense
+    store must stay within, or ``None`` when no narrowing happened.
+    """
+
+    name: str
+    dtype: np.dtype
+    shape: tuple
+    bit_elements: np.ndarray
+    dense_elements: np.ndarray
+    dense_dtype: np.dtype
+    dense_low: float | None
+    dense_high: float | None
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self.shape, dtype=np.int64))
+
+    @property
+    def packed_width(self) -> int:
+        return (len(self.bit_elements) + 7) // 8
+
+    @property
+    def itemsize(self) -> int:
+        """Stored bytes per observation of this field."""
+        return (self.packed_width
+                + len(self.dense_elements) * self.dense_dtype.itemsize)
+
+
+def _narrow_integer_dtype(low, high, declared):
+    for dtype in _INTEGER_STORAGE_DTYPES:
+        if dtype.itemsize >= declared.itemsize:
+            break
+        limits = np.iinfo(dtype)
+        if limits.min <= low and high <= limits.max:
+            return dtype
+    return declared
+
+
+def compact_field(name, dtype, shape, low=None, high=None, binary=False):
+    """Return the storage form of one field with declared bounds.
+
+    ``binary`` marks a float field whose ``[0, 1]`` elements are flags.
+    """
+    dtype = np.dtype(dtype)
+    shape = tuple(int(size) for size in shape)
+    size = int(np.prod(shape, dtype=np.int64))
+    elements = np.arange(size, dtype=np.intp)
+    empty = np.zeros(0, dtype=np.intp)
+    if dtype.kind == "b":
+        return CompactField(name, dtype, shape, elements, empty, dtype,
+                            None, None)
+    low = np.broadcast_to(
+        np.asarray(low if low is not None else 0, dtype=np.float64),
+        shape).reshape(-1)
+    high = np.broadcast_to(
+        np.asarray(high if high is not None else 0, dtype=np.float64),
+        shape).reshape(-1)
+    if dtype.kind in "iu":
+        if name in SEMANTIC_IDENTITY_FIELDS:
+            lowest, highest = 0, SEMANTIC_IDENTITY_MAX
+        else:
+            lowest, highest = int(low.min()), int(high.max())
+        storage = _narrow_integer_dtype(lowest, highest, dtype)
+        if storage == dtype:
+            return CompactField(name, dtype, shape, empty, elements, dtype,
+                                None, None)
+        return CompactField(name, dtype, shape, empty, elements, storage,
+                            lowest, highest)
+    if binary:
+        flags = (low == 0.0) & (high == 1.0)
+        return CompactField(
+            name, dtype, shape, elements[flags], elements[~flags], dtype,
+            None, None)
+    return CompactField(name, dtype, shape, empty, elements, dtype,
+                        None, None)
+
+
+def compact_storage_layout(observation_space) -> dict:
+    """Return ``{field: CompactField}`` for a Dict of ``Box`` spaces."""
+    if not isinstance(observation_space, spaces.Dict):
+        raise TypeError(
+            "Compact storage requires a gymnasium Dict observation space")
+    layout = {}
+    for name, subspace in observation_space.spaces.items():
+        if not isinstance(subspace, spaces.Box):
+            raise TypeError(
+                f"Observation field {name!r} is {type(subspace).__name__}; "
+                "compact storage supports Box fields only")
+        layout[name] = compact_field(
+            name, subspace.dtype, subspace.shape, subspace.low,
+            subspace.high, binary=name in BINARY_FLAG_FIELDS)
+    return layout
+
+
+def compact_mask_field(name, dtype, size):
+    """Return the storage form of a ``size``-wide 0/1 action mask."""
+    return CompactField(
+        name, np.dtype(dtype), (int(size),), np.arange(int(size)),
+        np.zeros(0, dtype=np.intp), np.dtype(dtype), None, None)
+
+
+class CompactArray:
+    """One rollout-buffer field stored in its ``CompactField`` form.
+
+    ``shape`` is the logical shape, leading axes first.  Indexes and axis
+    operations apply to the leading axes only; the field's own axes always
+    stay whole.
+    """
+
+    def __init__(self, field, leading_shape, fill=0, *, _bits=None,
+                 _dense=None):
+        self.field = field
+        leading_shape = tuple(int(size) for size in leading_shape)
+        if _bits is None:
+            # np.zeros leaves untouched pages unbacked until a rollout writes
+            # them; only a nonzero fill commits the memory up front.
+            _bits = np.zeros(leading_shape + (field.packed_width,),
+                             dtype=np.uint8)
+            _dense = np.zeros(leading_shape + (len(field.dense_elements),),
+                              dtype=field.dense_dtype)
+            if fill:
+                _bits.fill(0xFF)
+                _dense.fill(fill)
+        self.bits = _bits
+        self.dense = _dense
+        self._all_bits = len(field.dense_elements) == 0
+        self._all_dense = len(field.bit_elements) == 0
+
+    @property
+    def leading_shape(self):
+        return self.bits.shape[:-1]
+
+    @property
+    def shape(self):
+        return self.leading_shape + self.field.shape
+
+    @property
+    def dtype(self):
+        return self.field.dtype
+
+    @property
+    def nbytes(self):
+        return self.bits.nbytes + self.dense.nbytes
+
+    def _derived(self, bits, dense):
+        return CompactArray(self.field, bits.shape[:-1],
+                            _bits=bits, _dense=dense)
+
+    def swapaxes(self, first, second):
+        if max(first, second) >= len(self.leading_shape):
+            raise ValueError("CompactArray can only swap leading axes")
+        return self._derived(self.bits.swapaxes(first, second),
+                             self.dense.swapaxes(first, second))
+
+    def reshape(self, *shape):
+        if len(shape) == 1 and isinstance(shape[0], tuple):
+            shape = shape[0]
+        field_rank = len(self.field.shape)
+        if tuple(shape[len(shape) - field_rank:]) != self.field.shape:
+            raise ValueError(
+                f"CompactArray {self.field.name!r} can only reshape its "
+                f"leading axes; got {shape}")
+        leading = tuple(shape[:len(shape) - field_rank])
+        return self._derived(
+            self.bits.reshape(leading + self.bits.shape[-1:]),
+            self.dense.reshape(leading + self.dense.shape[-1:]))
+
+    def __getitem__(self, index):
+        bits = self.bits[index]
+        dense = self.dense[index]
+        leading = bits.shape[:-1]
+        field = self.field
+        if self._all_dense:
+            values = dense.astype(field.dtype, copy=False)
+        else:
+            unpacked = np.unpackbits(
+                bits, axis=-1, count=len(field.bit_elements))
+            if self._all_bits:
+                values = unpacked.astype(field.dtype)
+            else:
+                values = np.empty(leading + (field.size,), dtype=field.dtype)
+                values[..., field.bit_elements] = unpacked
+                values[..., field.dense_elements] = dense
+        return values.reshape(leading + field.shape)
+
+    def __setitem__(self, index, values):
+        field = self.field
+        values = np.asarray(values)
+        leading = values.shape[:values.ndim - len(field.shape)]
+        if values.shape[len(leading):] != field.shape:
+            raise ValueError(
+                f"Field {field.name!r} expects trailing shape {field.shape}, "
+                f"got {values.shape}")
+        flat = values.reshape(leading + (field.size,))
+        if not self._all_dense:
+            flags = flat if self._all_bits else flat[..., field.bit_elements]
+            if flags.dtype.kind != "b":
+                if ((flags != 0) & (flags != 1)).any():
+                    raise ValueError(
+                        f"Field {field.name!r} has a non-binary value in a "
+                        "bit-packed flag element")
+            self.bits[index] = np.packbits(
+                flags.astype(bool, copy=False), axis=-1)
+        if not self._all_bits:
+            dense = flat if self._all_dense else flat[..., field.dense_elements]
+            if field.dense_low is not None and dense.size and (
+                    dense.min() < field.dense_low
+                    or dense.max() > field.dense_high):
+                raise ValueError(
+                    f"Field {field.name!r} left its declared bounds "
+                    f"[{field.dense_low}, {field.dense_high}]; it cannot be "
+                    f"stored as {field.dense_dtype}")
+            self.dense[index] = dense
+
+
+def compact_observation_storage(layout, leading_shape) -> dict:
+    """Return ``{field: CompactArray}`` for every field in ``layout``."""
+    return {name: CompactArray(field, leading_shape)
+            for name, field in layout.items()}
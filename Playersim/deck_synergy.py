@@ -0,0 +1,127 @@
+"""Per-deck pairwise synergy tables for the observation synergy features.
+
+Both decks are fixed for a whole game, and the observation's synergy features
+(``card_synergy_scores`` and ``hand_synergy_scores``) are functions of card
+pairs drawn from the observer's own deck.  ``DeckSynergyTable`` stores those
+pair values densely over the deck's distinct card ids so the per-step features
+become numpy gathers over the current hand and battlefield.
+
+Pairs are filled lazily on first use and tables are reused across games by
+``deck_synergy_key``.  A table only answers for cards that currently show their
+printed characteristics; tokens, cards from the other deck, and cards changed
+by continuous effects make ``indices`` return None so callers fall back to the
+live computation.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+import numpy as np
+
+
+# Characteristics the synergy heuristics read from a card.
+SYNERGY_CHARACTERISTICS = (
+    "name", "oracle_text", "colors", "subtypes", "card_types", "cmc")
+
+
+def deck_synergy_key(card_ids) -> str:
+    """Return the cache key for a decklist (its distinct card ids)."""
+    digest = hashlib.sha256()
+    for card_id in sorted({str(card_id) for card_id in card_ids}):
+        digest.update(card_id.encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def card_shows_printed(card) -> bool:
+    """Whether a card's live synergy characteristics equal its printed ones."""
+    printed = getattr(card, "_printed", None)
+    if not printed:
+        return False
+    for attribute in SYNERGY_CHARACTERISTICS:
+        if getattr(card, attribute, None) != printed.get(attribute):
+            return False
+    return True
+
+
+class DeckSynergyTable:
+    """Lazily filled pairwise synergy values over one deck's card ids.
+
+    ``board_pairs[i, j]`` is the battlefield pair synergy of card ``i`` with
+    card ``j``; ``hand_terms[i, j]`` holds the per-category contributions of
+    card ``j`` to card ``i``'s hand synergy and ``hand_baseline[i]`` the
+    per-card constant.  Unfilled entries are NaN.
+    """
+
+    def __init__(self, card_ids, card_db, category_count):
+        self.card_ids = tuple(sorted({
+            card_id for card_id in card_ids
+            if card_shows_printed(card_db.get(card_id))}, key=str))
+        self.index = {
+            card_id: position for position, card_id in enumerate(self.card_ids)}
+        size = len(self.card_ids)
+        self.board_pairs = np.full((size, size), np.nan, dtype=np.float64)
+        self.hand_terms = np.full(
+            (size, size, category_count), np.nan, dtype=np.float64)
+        self.hand_baseline = np.full(
+            (size, category_count), np.nan, dtype=np.float64)
+
+    def indices(self, card_ids, card_db):
+        """Return table indices for ``card_ids``, or None if any is unknown."""
+        positions = np.empty(len(card_ids), dtype=np.intp)
+        for position, card_id in enumerate(card_ids):
+            index = self.index.get(card_id)
+            if index is None or not card_shows_printed(card_db.get(card_id)):
+                return None
+            positions[position] = index
+        return positions
+
+    def board_synergies(self, positions, pair_synergy):
+        """Return the ``(n, n)`` pair matrix with a zero positional diagonal.
+
+        ``pair_synergy(card_id, other_id)`` fills missing entries; copies of
+        one card at different positions still pair with each other.
+        """
+        block = self.board_pairs[np.ix_(positions, positions)]
+        missing = np.isnan(block)
+        if missing.any():
+            for row, column in zip(*np.nonzero(missing)):
+                first, second = positions[row], positions[column]
+                if np.isnan(self.board_pairs[first, second]):
+                    self.board_pairs[first, second] = pair_synergy(
+                        self.card_ids[first], self.card_ids[second])
+            block = self.board_pairs[np.ix_(positions, positions)]
+        np.fill_diagonal(block, 0.0)
+        return block
+
+    def hand_synergies(self, hand_positions, pool_positions, synergy_terms,
+                       category_caps, total_cap):
+        """Return each hand card's capped synergy against the pool.
+
+        The pool is every hand and battlefield card; each hand card is
+        compared with the pool cards that have a different card id, counted
+        with multiplicity.  ``synergy_terms(card_id, other_id)`` returns
+        ``(terms, baseline)`` for missing entries.
+        """
+        counts = np.bincount(pool_positions, minlength=len(self.card_ids))
+        present = np.flatnonzero(counts)
+        rows = np.unique(hand_positions)
+        for row in rows:
+            for column in present:
+                if np.isnan(self.hand_terms[row, column, 0]):
+                    terms, baseline = synergy_terms(
+                        self.card_ids[row], self.card_ids[column])
+                    self.hand_terms[row, column] = terms
+                    self.hand_baseline[row] = baseline
+            if np.isnan(self.hand_baseline[row, 0]):
+                _, self.hand_baseline[row] = synergy_terms(
+                    self.card_ids[row], self.card_ids[row])
+        pair_terms = self.hand_terms[np.ix_(hand_positions, present)]
+        others = counts[present][None, :] * (
+            present[None, :] != hand_positions[:, None])
+        totals = np.einsum("hp,hpk->hk", others, pair_terms)
+        has_others = others.sum(axis=1) > 0
+        totals += self.hand_baseline[hand_positions] * has_others[:, None]
+        scores = np.minimum(totals, category_caps).sum(axis=1)
+        return np.where(has_others, np.minimum(scores, total_cap), 0.0)
@@ -33,6 +33,10 @@ from .card_memory import CardMemory
 from .ability_types import ManaAbility
 from .archetypes import classify_full_deck, encode_profile
 from .curriculum import CurriculumScheduler, OPPONENT_PROFILES, _stable_seed
+from .deck_synergy import DeckSynergyTable, deck_synergy_key
+from .opponent_inference import OpponentInferenceClient
+from .step_latency import StepLatencyRecorder
+from .observation_buffer import ObservationBuffer
 from .observation_schema import (
     EXACT_OWN_STRATEGY_PROFILE_FIELD,
     EXACT_OWN_STRATEGY_PROFILE_SIZE,
@@ -102,6 +106,30 @@ class AlphaZeroMTGEnv(gym.Env):
     DIAGNOSTIC_MAX_CONTAINER_ITEMS = 512
     DIAGNOSTIC_MAX_STRING_LENGTH = 4_096
     DIAGNOSTIC_MAX_KEY_LENGTH = 256
+    # How often the strategic planner features are recomputed.  "observation"
+    # reruns the full planner stack for every observation; "dirty" reuses them
+    # until the observer's board signature changes; "phase" and "turn" reuse
+    # the turn-level signals for the rest of that phase/turn.  Cached entries
+    # are always keyed by observer seat.
+    PLANNER_REFRESH_POLICIES = ("observation", "dirty", "phase", "turn")
+    DEFAULT_PLANNER_REFRESH = "observation"
+    # Reporting of bounds/finiteness violations in published observations.
+    # Every observation is checked and repaired; violations are reported
+    # during the warmup, then on every Kth one; an interval of 1 (the
+    # default, and what tests use) reports them all.
+    DEFAULT_OBSERVATION_VALIDATION_INTERVAL = 1
+    DEFAULT_OBSERVATION_VALIDATION_WARMUP = 4_096
+    # Upper bound on consecutive single-legal-action decisions one step()
+    # resolves under fast_forward_forced_actions.
+    FORCED_ACTION_LIMIT = 256
+    # Diagnostics a fast-forwarded decision's ``info`` carries into the
+    # returned one: failure flags stick if any decision raised them, and the
+    # earliest message/path is kept when the last decision has none.
+    FORCED_STEP_FLAGS = (
+        "critical_error", "invalid_action", "execution_failed",
+        "opponent_execution_failed", "error_reset")
+    FORCED_STEP_MESSAGES = (
+        "error_message", "invalid_action_reason", "failure_replay_path")
 
     def __init__(self, decks, card_db, max_turns=30, max_hand_size=7, max_battlefield=20,
                  deck_stats_path="./deck_stats", card_memory_path="./card_memory",
@@ -115,7 +143,15 @@ class AlphaZeroMTGEnv(gym.Env):
                  curriculum=None, opponent_profile="scripted",
                  matchup_seed=None, matchup_weighting=False,
                  adaptive_decision_history_enabled=False,
-                 stats_persistence_interval_games=1):
+                 stats_persistence_interval_games=1,
+                 planner_refresh=DEFAULT_PLANNER_REFRESH,
+                 observation_validation_interval=
+                 DEFAULT_OBSERVATION_VALIDATION_INTERVAL,
+                 observation_validation_warmup=
+                 DEFAULT_OBSERVATION_VALIDATION_WARMUP,
+                 opponent_inference=None,
+                 fast_forward_forced_actions=False,
+                 record_step_latency=False):
         logging.info("Initializing AlphaZeroMTGEnv...")
         super().__init__()
         self.decks = decks
@@ -124,6 +160,10 @@ class AlphaZeroMTGEnv(gym.Env):
         # policy observation indexes this cache by its current observer seat;
         # no observation ever receives the other seat's exact profile.
         self._exact_deck_strategy_profiles = {}
+        # Pairwise synergy tables for the two selected decks, indexed by seat
+        # like the profiles above and reused across games by deck hash.
+        self._deck_synergy_tables = {}
+        self._deck_synergy_table_cache = {}
         self.deck_stats_path = deck_stats_path
         self.card_memory_path = card_memory_path
         self.adaptive_decision_history_enabled = bool(
@@ -164,6 +204,28 @@ class AlphaZeroMTGEnv(gym.Env):
                 or self.time_cost_per_step < 0.0):
             raise ValueError(
                 "time_cost_per_step must be finite and nonnegative")
+        if planner_refresh not in self.PLANNER_REFRESH_POLICIES:
+            raise ValueError(
+                f"planner_refresh must be one of "
+                f"{self.PLANNER_REFRESH_POLICIES}, got {planner_refresh!r}")
+        self.planner_refresh = planner_refresh
+        self._planner_feature_cache = {}
+        self.observation_validation_interval = int(
+            observation_validation_interval)
+        self.observation_validation_warmup = int(observation_validation_warmup)
+        if self.observation_validation_interval < 1:
+            raise ValueError("observation_validation_interval must be positive")
+        if self.observation_validation_warmup < 0:
+            raise ValueError(
+                "observation_validation_warmup must be nonnegative")
+        self._observations_coerced = 0
+        self.fast_forward_forced_actions = bool(fast_forward_forced_actions)
+        # Per-phase decision latency histograms, shipped through ``info`` at
+        # episode end.  None leaves every engine method uninstrumented.
+        self.step_latency = None
+        if record_step_latency:
+            self.step_latency = StepLatencyRecorder()
+            self.step_latency.instrument(self)
         # The rules hand limit is seven, but the public action map exposes hand
         # slots 0-7 for casting and 0-9 for mandatory discards.  Keep the rules
         # limit on GameState while observing every directly actionable hand slot.
@@ -201,6 +263,11 @@ class AlphaZeroMTGEnv(gym.Env):
         self._checkpoint_opponent_rng = random.Random(0)
         self._current_checkpoint_opponent = None
         self._checkpoint_opponent_last_error = None
+        # With an OpponentInferenceAddress, checkpoints are loaded into the
+        # shared batched inference server and the worker holds only a remote
+        # handle; the client connects on the first staged checkpoint.
+        self.opponent_inference = opponent_inference
+        self._opponent_inference_client = None
         if opponent_profile not in OPPONENT_PROFILES:
             raise ValueError(f"Unknown opponent profile: {opponent_profile}")
         self.default_opponent_profile = opponent_profile
@@ -586,6 +653,12 @@ class AlphaZeroMTGEnv(gym.Env):
             "my_permanent_counters", "opp_permanent_counters",
             "my_damage_marked", "opp_damage_marked", "total_available_mana",
         })
+        # One contiguous block backs every published observation (see
+        # observation_buffer). The scratch block seeds _get_obs defaults with
+        # a single fill; it is not reentrant, so a nested build falls back to
+        # per-field zeros instead of clobbering the outer observation.
+        self.observation_buffer = ObservationBuffer(self.observation_space)
+        self._observation_scratch_in_use = False
         self.action_space = spaces.Discrete(self.ACTION_SPACE_SIZE)
         # Add memory for actions and rewards
         self.last_n_actions = np.full(self.action_memory_size, -1, dtype=np.int32) # Use -1 for padding
@@ -884,6 +957,7 @@ class AlphaZeroMTGEnv(gym.Env):
                 self.last_observation_error = None
                 self.last_observation_traceback = None
                 self.current_analysis = None
+                self._planner_feature_cache = {}
                 self.last_n_actions = np.full(self.action_memory_size, -1, dtype=np.int32)
                 self.last_n_rewards = np.zeros(self.action_memory_size, dtype=np.float32)
                 self.opponent_last_n_actions = np.full(
@@ -1008,6 +1082,9 @@ class AlphaZeroMTGEnv(gym.Env):
                     0: self._stats_archetype_label(self.original_p1_deck),
                     1: self._stats_archetype_label(self.original_p2_deck),
                 }
+                # After GameState.reset so every card shows its printed state.
+                self._select_deck_synergy_tables(
+                    self.original_p1_deck, self.original_p2_deck)
                 selected_case = (
                     scheduled_case or curriculum_case or explicit_options)
                 self.current_curriculum_stage = selected_case.get("stage")
@@ -1141,7 +1218,9 @@ class AlphaZeroMTGEnv(gym.Env):
             self.combat_resolver = None
             self.strategic_planner = None
             self.current_analysis = None
+            self._planner_feature_cache = {}
             self._observer_strategy_profiles = {}
+            self._deck_synergy_tables = {}
             fallback_deck = {"cards": [dummy_card_id] * 60}
             self._cache_exact_deck_strategy_profiles(
                 fallback_deck, fallback_deck)
@@ -1490,6 +1569,23 @@ class AlphaZeroMTGEnv(gym.Env):
             profiles[seat_is_p1] = profile
         self._exact_deck_strategy_profiles = profiles
 
+    def _select_deck_synergy_tables(self, p1_cards, p2_cards):
+        """Attach each seat's pairwise synergy table, reusing cached decks."""
+        tables = {}
+        for seat_is_p1, card_ids in ((True, p1_cards), (False, p2_cards)):
+            key = deck_synergy_key(card_ids)
+            table = self._deck_synergy_table_cache.get(key)
+            if table is None:
+                table = DeckSynergyTable(
+                    card_ids, self.card_db,
+                    len(MTGStrategicPlanner.SYNERGY_CATEGORY_CAPS))
+                self._deck_synergy_table_cache[key] = table
+            tables[seat_is_p1] = table
+        self._deck_synergy_tables = tables
+
+    def _observer_synergy_table(self):
+        return self._deck_synergy_tables.get(bool(self.game_state.agent_is_p1))
+
     def _get_exact_own_strategy_profile(self):
         """Encode only the active observer's pinned exact-deck profile."""
         observer_is_p1 = bool(self.game_state.agent_is_p1)
@@ -2007,6 +2103,13 @@ class AlphaZeroMTGEnv(gym.Env):
                 and not self._ensure_stats_artifacts_written()):
             record_failure("terminal provenance remains pending")
 
+        try:
+            client = getattr(self, '_opponent_inference_client', None)
+            self._opponent_inference_client = None
+            if client is not None:
+                client.close()
+        except Exception as error:
+            record_failure("opponent inference client close failed", error)
         try:
             super().close()
         except Exception as error:
@@ -2473,9 +2576,110 @@ class AlphaZeroMTGEnv(gym.Env):
         return diagnostic
 
     def step(self, action_idx, context=None):
+        """Execute one agent decision and return the next state information.
+
+        With ``fast_forward_forced_actions`` the environment then resolves
+        every following agent decision that has exactly one legal action
+        itself, so the policy only sees decisions with a real choice.  Each
+        forced action is a full decision in the replay record; the returned
+        reward is their discounted sum (``reward_discount`` per decision, so
+        potential shaping still telescopes) and ``info`` reports the count as
+        ``forced_actions_skipped``.  The returned ``info`` is the last
+        decision's, with ``reward_components`` summed under the same discount
+        and the ``FORCED_STEP_FLAGS``/``FORCED_STEP_MESSAGES`` diagnostics of
+        every skipped decision merged in.
+
+        With ``record_step_latency`` the final ``info`` of every episode
+        carries ``step_latency``, the sparse per-phase latency histograms of
+        all decisions since the previous report.
+        """
+        if self.fast_forward_forced_actions:
+            result = self._fast_forward_step(action_idx, context)
+        else:
+            result = self._step_decision(action_idx, context=context)
+        if self.step_latency is not None and (result[2] or result[3]):
+            result[4]["step_latency"] = self.step_latency.drain()
+        return result
+
+    def _fast_forward_step(self, action_idx, context=None):
+        """Run one decision, then every following single-legal-action one."""
+        obs, step_reward, done, truncated, env_info = self._step_decision(
+            action_idx, context=context, build_observation=False)
+        forced_actions = []
+        discount = 1.0
+        decision_infos = [(discount, env_info)]
+        while (not (done or truncated)
+               and len(forced_actions) < self.FORCED_ACTION_LIMIT
+               and not env_info.get("critical_error")
+               and not env_info.get("invalid_action")
+               and not env_info.get("execution_failed")):
+            legal = np.flatnonzero(env_info.get("action_mask"))
+            if legal.size != 1:
+                break
+            forced_action = int(legal[0])
+            forced_actions.append(forced_action)
+            discount *= self.reward_discount
+            obs, forced_reward, done, truncated, env_info = \
+                self._step_decision(forced_action, build_observation=False)
+            step_reward += discount * forced_reward
+            decision_infos.append((discount, env_info))
+        if obs is None:
+            # _step_decision leaves the agent's perspective in place.
+            obs = self._get_obs_safe()
+        if len(decision_infos) > 1:
+            self._merge_forced_step_infos(env_info, decision_infos)
+        env_info["forced_actions_skipped"] = len(forced_actions)
+        env_info["forced_actions"] = forced_actions
+        return obs, step_reward, done, truncated, env_info
+
+    def _merge_forced_step_infos(self, env_info, decision_infos):
+        """Fold every fast-forwarded decision's diagnostics into ``env_info``."""
+        for key in self.FORCED_STEP_FLAGS:
+            if any(info.get(key) for _, info in decision_infos):
+                env_info[key] = True
+        for key in self.FORCED_STEP_MESSAGES:
+            if env_info.get(key) is None:
+                for _, info in decision_infos:
+                    if info.get(key) is not None:
+                        env_info[key] = info[key]
+                        break
+        components = {}
+        for discount, info in decision_infos:
+            for name, value in (info.get("reward_components") or {}).items():
+                components[name] = components.get(name, 0.0) \
+                    + discount * float(value)
+        if components:
+            env_info["reward_components"] = components
+
+    def _step_decision(self, action_idx, context=None, build_observation=True):
+        """Execute one agent decision, timed when step latency is recorded."""
+        recorder = self.step_latency
+        if recorder is None:
+            return self._execute_decision(
+                action_idx, context, build_observation)
+        gs = self.game_state
+        if gs is not None:
+            gs.latency_recorder = recorder
+        action_type = "unknown"
+        if self.action_handler is not None:
+            action_type, _ = self.action_handler.get_action_info(action_idx)
+        phase = getattr(gs, "phase", None)
+        recorder.begin_step(
+            action_type, getattr(gs, "_PHASE_NAMES", {}).get(phase, phase))
+        try:
+            return self._execute_decision(
+                action_idx, context, build_observation)
+        finally:
+            recorder.end_step()
+
+    def _execute_decision(self, action_idx, context=None,
+                          build_observation=True):
         """
         Execute the agent's action, simulate opponent actions until control returns
         or the game ends, and return the next state information. (Corrected Final Mask Generation)
+
+        ``build_observation=False`` returns None instead of the next
+        observation on the normal path (fast-forward builds only the last).
         """
         gs = self.game_state
         action_context = {}
@@ -2579,7 +2783,7 @@ class AlphaZeroMTGEnv(gym.Env):
                 self._safe_evaluation_state_snapshot(
                     "learned_pre_state", valid_mask=current_mask)
                 if self._evaluation_trace_enabled() else None)
-            reward, done, truncated, handler_info = self.action_handler.apply_action(action_idx, context=action_context)
+            reward, done, truncated, handler_info = self._apply_handler_action(action_idx, action_context)
             if learned_pre_state is not None:
                 learned_trace_sequence = self._record_evaluation_atomic_action(
                     actor="learned",
@@ -2674,7 +2878,7 @@ class AlphaZeroMTGEnv(gym.Env):
                     self._safe_evaluation_state_snapshot(
                         "opponent_pre_state", valid_mask=opponent_mask)
                     if self._evaluation_trace_enabled() else None)
-                opponent_reward, opp_done, opp_truncated, opp_handler_info = self.action_handler.apply_action(opponent_action_idx, context=opponent_action_context)
+                opponent_reward, opp_done, opp_truncated, opp_handler_info = self._apply_handler_action(opponent_action_idx, opponent_action_context)
                 if not opp_handler_info.get("execution_failed"):
                     self.opponent_last_n_actions = np.roll(
                         self.opponent_last_n_actions, 1)
@@ -2877,7 +3081,7 @@ class AlphaZeroMTGEnv(gym.Env):
             if hasattr(self, 'last_n_rewards'):
                 self.last_n_rewards = np.roll(self.last_n_rewards, 1)
                 self.last_n_rewards[0] = step_reward
-            obs = self._get_obs_safe()
+            obs = self._get_obs_safe() if build_observation else None
             # *** Regenerate mask AFTER perspective is confirmed ***
             # ---> ADDED LOGGING <---
             prio_player_before_final_mask = getattr(getattr(gs, 'priority_player', None), 'name', 'None')
@@ -2978,6 +3182,10 @@ class AlphaZeroMTGEnv(gym.Env):
 
     # --- ADDED Helper Methods for Opponent Simulation ---
 
+    def _apply_handler_action(self, action_idx, context):
+        """Apply one action through the ActionHandler for either seat."""
+        return self.action_handler.apply_action(action_idx, context=context)
+
     def _opponent_needs_to_act(self):
             """Checks if the game state requires the opponent to act."""
             gs = self.game_state
@@ -3579,7 +3787,26 @@ class AlphaZeroMTGEnv(gym.Env):
         return policy
 
     def _load_checkpoint_opponent_policy(self, path):
-        """Load one CPU policy and discard PPO rollout/optimizer state."""
+        """Load one CPU policy and discard PPO rollout/optimizer state.
+
+        An inference export traced from the checkpoint's current bytes is
+        preferred; it carries only the actor path.
+        """
+        if self.opponent_inference is not None:
+            if self._opponent_inference_client is None:
+                self._opponent_inference_client = OpponentInferenceClient(
+                    self.opponent_inference, self.observation_space,
+                    self.action_space)
+            return self._opponent_inference_client.load(path)
+        from .policy_export import (
+            inference_policy_path, load_matching_inference_policy)
+
+        if inference_policy_path(path).is_file():
+            exported = load_matching_inference_policy(path, {
+                "sha256": self._checkpoint_sha256(path),
+                "size": os.path.getsize(path)})
+            if exported is not None:
+                return self._validate_checkpoint_opponent_policy(exported)
         from sb3_contrib import MaskablePPO
 
         algorithm = MaskablePPO.load(path, device="cpu")
@@ -4650,6 +4877,16 @@ class AlphaZeroMTGEnv(gym.Env):
                 return self._evaluation_player_label(last_location[0])
             return None
 
+        # The catalog is built before the trace and replay are budgeted, so
+        # it may only spend what their recorded bytes leave; otherwise its
+        # names would crowd out replay actions at the payload ceiling.
+        capture = getattr(self, "_evaluation_capture", None) or {}
+        byte_budget = int(self.EVALUATION_DEBUG_MAX_BYTES) - sum(
+            int((capture.get(scope) or {}).get("serialized_bytes", 0) or 0)
+            for scope in ("trace", "replay"))
+        byte_budget = max(0, byte_budget // 2)
+        catalog_bytes = 0
+        byte_budget_truncated = False
         entries = []
         for runtime_id in selected_ids:
             card = card_db.get(runtime_id)
@@ -4703,6 +4940,11 @@ class AlphaZeroMTGEnv(gym.Env):
             entry["is_token"] = bool(
                 isinstance(runtime_id, str)
                 and runtime_id.startswith("TOKEN_"))
+            entry_size = len(self._compact_json_bytes(entry)) + 1
+            if catalog_bytes + entry_size > byte_budget:
+                byte_budget_truncated = True
+                break
+            catalog_bytes += entry_size
             entries.append(entry)
         return {
             "schema_version": 1,
@@ -4712,6 +4954,7 @@ class AlphaZeroMTGEnv(gym.Env):
             "entry_limit": limit,
             "candidate_limit": candidate_limit,
             "candidate_scan_truncated": candidate_scan_truncated,
+            "byte_budget_truncated": byte_budget_truncated,
         }
 
     @staticmethod
@@ -4765,33 +5008,31 @@ class AlphaZeroMTGEnv(gym.Env):
             terminal_stats["sanitization_omissions"] += 1
             encoded = attach_capture_and_encode()
 
-        while len(encoded) > self.EVALUATION_DEBUG_MAX_BYTES \
-                and isinstance(replay_actions, list) and replay_actions:
-            removed = replay_actions.pop()
-            removed_size = len(self._compact_json_bytes(removed))
-            separator_size = int(replay_stats["recorded_events"] > 1)
-            replay_stats["recorded_events"] = max(
-                0, replay_stats["recorded_events"] - 1)
-            replay_stats["dropped_events"] += 1
-            replay_stats["serialized_bytes"] = max(
-                0, replay_stats["serialized_bytes"] - removed_size)
-            replay_stats["serialized_bytes"] = max(
-                2, replay_stats["serialized_bytes"] - separator_size)
-            encoded = attach_capture_and_encode()
+        def drop_tail_events(events, stats, encoded):
+            # Subtract each dropped event's bytes from the running size and
+            # re-encode only once the estimate fits, instead of re-encoding
+            # the whole payload after every pop.
+            estimate = len(encoded)
+            while len(encoded) > self.EVALUATION_DEBUG_MAX_BYTES \
+                    and isinstance(events, list) and events:
+                removed = events.pop()
+                removed_size = len(self._compact_json_bytes(removed))
+                separator_size = int(stats["recorded_events"] > 1)
+                stats["recorded_events"] = max(
+                    0, stats["recorded_events"] - 1)
+                stats["dropped_events"] += 1
+                stats["serialized_bytes"] = max(
+                    0, stats["serialized_bytes"] - removed_size)
+                stats["serialized_bytes"] = max(
+                    2, stats["serialized_bytes"] - separator_size)
+                estimate -= removed_size + separator_size
+                if estimate <= self.EVALUATION_DEBUG_MAX_BYTES or not events:
+                    encoded = attach_capture_and_encode()
+                    estimate = len(encoded)
+            return encoded
 
-        while len(encoded) > self.EVALUATION_DEBUG_MAX_BYTES \
-                and isinstance(trace, list) and trace:
-            removed = trace.pop()
-            removed_size = len(self._compact_json_bytes(removed))
-            separator_size = int(trace_stats["recorded_events"] > 1)
-            trace_stats["recorded_events"] = max(
-                0, trace_stats["recorded_events"] - 1)
-            trace_stats["dropped_events"] += 1
-            trace_stats["serialized_bytes"] = max(
-                0, trace_stats["serialized_bytes"] - removed_size)
-            trace_stats["serialized_bytes"] = max(
-                2, trace_stats["serialized_bytes"] - separator_size)
-            encoded = attach_capture_and_encode()
+        encoded = drop_tail_events(replay_actions, replay_stats, encoded)
+        encoded = drop_tail_events(trace, trace_stats, encoded)
 
         if len(encoded) > self.EVALUATION_DEBUG_MAX_BYTES:
             # Controlled fields alone should never reach this branch, but keep
@@ -5207,7 +5448,9 @@ class AlphaZeroMTGEnv(gym.Env):
             raise ValueError("Replay deck selection does not match the recorded seed")
         result = (obs, 0.0, False, False, info)
         for entry in payload.get('actions', []):
-            result = self.step(int(entry['action']), context=entry.get('context') or {})
+            # Recorded forced actions are replayed one decision at a time.
+            result = self._step_decision(
+                int(entry['action']), context=entry.get('context') or {})
             if result[2] or result[3]:
                 break
         return result
@@ -5230,57 +5473,112 @@ class AlphaZeroMTGEnv(gym.Env):
         Feature helpers are intentionally independent, so this is the final API
         boundary: malformed features are replaced, finite values are cast, and
         genuinely out-of-range values are saturated instead of leaking an invalid
-        Gymnasium observation into a rollout.
+        Gymnasium observation into a rollout. Every field is written into one
+        freshly allocated contiguous block, so the returned arrays are views
+        that never alias the scratch block or another observation.
+
+        Fields already in their declared dtype and shape are copied as is;
+        bounds and finiteness are then checked for the whole block at once
+        and only the violating fields take the per-field repair path.  That
+        check runs on every observation; ``observation_validation_interval``
+        only samples which violations are reported.
         """
-        normalized = {}
+        buffer = self.observation_buffer
+        block, normalized = buffer.allocate()
         source = obs if isinstance(obs, dict) else {}
-        for key, space in self.observation_space.spaces.items():
+        spaces_by_key = self.observation_space.spaces
+        for key, view in normalized.items():
             value = source.get(key)
-            try:
-                array = np.asarray(value)
-                if array.shape != space.shape:
-                    raise ValueError(f"shape {array.shape}, expected {space.shape}")
-                if np.issubdtype(array.dtype, np.floating):
-                    if not np.all(np.isfinite(array)):
-                        self._record_observation_error(
-                            f"feature {key}",
-                            ValueError("value contained NaN or infinity"))
-                    array = np.nan_to_num(array, nan=0.0)
-                # Bound values before narrowing the dtype. Casting a large
-                # int64 directly to int32 can wrap it into an apparently valid
-                # (but false) value that clipping can no longer repair.
-                bounded = np.clip(array, space.low, space.high)
-                if not np.array_equal(array, bounded):
-                    if key in getattr(self, '_saturating_features', ()):
-                        # Expected saturation of an unbounded game quantity
-                        # (huge P/T, big mana): clip silently by design.
-                        logging.debug(
-                            "Observation feature '%s' saturated at its "
-                            "declared bound.", key)
-                        normalized[key] = bounded.astype(space.dtype, copy=False)
-                        continue
-                    first_bound_error = self._record_observation_error(
-                        f"feature {key}",
-                        ValueError("value exceeded declared observation bounds"))
-                    if first_bound_error:
-                        violation_index = tuple(
-                            int(index) for index in
-                            np.argwhere(np.not_equal(array, bounded))[0])
-                        logging.warning(
-                            "Observation feature '%s' exceeded its declared bounds; "
-                            "index=%s value=%s bounds=[%s, %s]; the public "
-                            "value was clipped.",
-                            key, violation_index, array[violation_index],
-                            space.low[violation_index], space.high[violation_index])
-                normalized[key] = bounded.astype(space.dtype, copy=False)
-            except Exception as exc:
-                self._record_observation_error(f"feature {key}", exc)
-                logging.error(
-                    "Observation feature '%s' was malformed (%s); using zeros.",
-                    key, exc)
-                normalized[key] = np.zeros(space.shape, dtype=space.dtype)
+            if (isinstance(value, np.ndarray) and value.dtype == view.dtype
+                    and value.shape == view.shape):
+                np.copyto(view, value)
+            else:
+                self._coerce_observation_field(
+                    key, spaces_by_key[key], value, view)
+        self._observations_coerced += 1
+        violations = buffer.violations(block)
+        if violations and self._observation_validation_due():
+            self._report_sampled_observation_violation(violations)
+        for key in violations:
+            self._coerce_observation_field(
+                key, spaces_by_key[key], normalized[key].copy(),
+                normalized[key])
         return normalized
 
+    def _observation_validation_due(self):
+        interval = self.observation_validation_interval
+        count = self._observations_coerced
+        return (interval <= 1 or count <= self.observation_validation_warmup
+                or count % interval == 0)
+
+    def _report_sampled_observation_violation(self, violations):
+        """Stop sampling reports once a sampled one finds a real violation.
+
+        Every observation is still repaired; unreported observations before
+        this one may have carried the same defect, so the run is told loudly
+        and every later violation is reported.  Declared saturating features
+        are expected to clip.
+        """
+        if self.observation_validation_interval <= 1:
+            return
+        unexpected = [
+            key for key in violations
+            if key not in getattr(self, '_saturating_features', ())]
+        if not unexpected:
+            return
+        logging.error(
+            "Sampled observation validation found out-of-bounds or "
+            "non-finite features %s after %d observations; reporting every "
+            "observation from now on.",
+            unexpected, self._observations_coerced)
+        self.observation_validation_interval = 1
+
+    def _coerce_observation_field(self, key, space, value, out):
+        """Cast, repair, and saturate one feature into ``out``."""
+        try:
+            array = np.asarray(value)
+            if array.shape != space.shape:
+                raise ValueError(f"shape {array.shape}, expected {space.shape}")
+            if np.issubdtype(array.dtype, np.floating):
+                if not np.all(np.isfinite(array)):
+                    self._record_observation_error(
+                        f"feature {key}",
+                        ValueError("value contained NaN or infinity"))
+                array = np.nan_to_num(array, nan=0.0)
+            # Bound values before narrowing the dtype. Casting a large
+            # int64 directly to int32 can wrap it into an apparently valid
+            # (but false) value that clipping can no longer repair.
+            bounded = np.clip(array, space.low, space.high)
+            if not np.array_equal(array, bounded):
+                if key in getattr(self, '_saturating_features', ()):
+                    # Expected saturation of an unbounded game quantity
+                    # (huge P/T, big mana): clip silently by design.
+                    logging.debug(
+                        "Observation feature '%s' saturated at its "
+                        "declared bound.", key)
+                    np.copyto(out, bounded, casting="unsafe")
+                    return
+                first_bound_error = self._record_observation_error(
+                    f"feature {key}",
+                    ValueError("value exceeded declared observation bounds"))
+                if first_bound_error:
+                    violation_index = tuple(
+                        int(index) for index in
+                        np.argwhere(np.not_equal(array, bounded))[0])
+                    logging.warning(
+                        "Observation feature '%s' exceeded its declared bounds; "
+                        "index=%s value=%s bounds=[%s, %s]; the public "
+                        "value was clipped.",
+                        key, violation_index, array[violation_index],
+                        space.low[violation_index], space.high[violation_index])
+            np.copyto(out, bounded, casting="unsafe")
+        except Exception as exc:
+            self._record_observation_error(f"feature {key}", exc)
+            logging.error(
+                "Observation feature '%s' was malformed (%s); using zeros.",
+                key, exc)
+            out.fill(0)
+
     def _bounded_int_array(self, key, values):
         """Clamp raw game integers to their declared bounds BEFORE ndarray
         construction. Doubling/big-mana combos produce Python ints beyond
@@ -5986,7 +6284,18 @@ class AlphaZeroMTGEnv(gym.Env):
         gs = self.game_state
         card_count = min(len(player_cards), self.max_battlefield)
         synergy_matrix = np.zeros((self.max_battlefield, self.max_battlefield), dtype=np.float32)
-        
+
+        table = self._observer_synergy_table()
+        positions = (
+            table.indices(player_cards[:card_count], gs.card_db)
+            if table is not None else None)
+        if positions is not None:
+            synergy_matrix[:card_count, :card_count] = table.board_synergies(
+                positions,
+                lambda card_id, other_id: self._card_pair_synergy(
+                    gs._safe_get_card(card_id), gs._safe_get_card(other_id)))
+            return synergy_matrix
+
         for i, card1_id in enumerate(player_cards[:card_count]):
             card1 = gs._safe_get_card(card1_id)
             if not card1:
@@ -5999,33 +6308,37 @@ class AlphaZeroMTGEnv(gym.Env):
                 card2 = gs._safe_get_card(card2_id)
                 if not card2:
                     continue
-                
-                # Creature type synergy
-                shared_types = set(card1.subtypes).intersection(set(card2.subtypes))
-                type_synergy = min(len(shared_types) * 0.2, 0.6)
-                
-                # Color synergy
-                color_synergy = sum(c1 == c2 == 1 for c1, c2 in zip(card1.colors, card2.colors)) * 0.1
-                
-                # Ability synergy (check for complementary abilities)
-                ability_synergy = 0
-                if hasattr(card1, 'oracle_text') and hasattr(card2, 'oracle_text'):
-                    # Deathtouch + first strike is powerful
-                    if ("deathtouch" in card1.oracle_text.lower() and "first strike" in card2.oracle_text.lower()) or \
-                    ("first strike" in card1.oracle_text.lower() and "deathtouch" in card2.oracle_text.lower()):
-                        ability_synergy += 0.3
-                    
-                    # Flying + equipment/auras
-                    if "flying" in card1.oracle_text.lower() and ("equip" in card2.oracle_text.lower() or "enchant creature" in card2.oracle_text.lower()):
-                        ability_synergy += 0.2
-                        
-                    # Lifelink synergies
-                    if "lifelink" in card1.oracle_text.lower() and "whenever you gain life" in card2.oracle_text.lower():
-                        ability_synergy += 0.4
-                
-                synergy_matrix[i, j] = type_synergy + color_synergy + ability_synergy
+
+                synergy_matrix[i, j] = self._card_pair_synergy(card1, card2)
                 
         return synergy_matrix
+
+    def _card_pair_synergy(self, card1, card2):
+        """Battlefield synergy of ``card1`` with ``card2``."""
+        # Creature type synergy
+        shared_types = set(card1.subtypes).intersection(set(card2.subtypes))
+        type_synergy = min(len(shared_types) * 0.2, 0.6)
+
+        # Color synergy
+        color_synergy = sum(c1 == c2 == 1 for c1, c2 in zip(card1.colors, card2.colors)) * 0.1
+
+        # Ability synergy (check for complementary abilities)
+        ability_synergy = 0
+        if hasattr(card1, 'oracle_text') and hasattr(card2, 'oracle_text'):
+            # Deathtouch + first strike is powerful
+            if ("deathtouch" in card1.oracle_text.lower() and "first strike" in card2.oracle_text.lower()) or \
+            ("first strike" in card1.oracle_text.lower() and "deathtouch" in card2.oracle_text.lower()):
+                ability_synergy += 0.3
+
+            # Flying + equipment/auras
+            if "flying" in card1.oracle_text.lower() and ("equip" in card2.oracle_text.lower() or "enchant creature" in card2.oracle_text.lower()):
+                ability_synergy += 0.2
+
+            # Lifelink synergies
+            if "lifelink" in card1.oracle_text.lower() and "whenever you gain life" in card2.oracle_text.lower():
+                ability_synergy += 0.4
+
+        return type_synergy + color_synergy + ability_synergy
     
     def _calculate_position_advantage(self):
         """Calculate overall position advantage considering multiple factors"""
@@ -6131,6 +6444,7 @@ class AlphaZeroMTGEnv(gym.Env):
         
     def _get_obs(self):
         """Build the observation dictionary. Assumes helpers are implemented."""
+        scratch_acquired = False
         try:
             # 0. Ensure layer effects are applied first
             if hasattr(self, 'layer_system') and self.layer_system:
@@ -6147,8 +6461,12 @@ class AlphaZeroMTGEnv(gym.Env):
             opp = gs.p2 if gs.agent_is_p1 else gs.p1
 
             # 1. INITIALIZE obs with default values for ALL keys FIRST
-            obs = {k: np.zeros(space.shape, dtype=space.dtype)
-                for k, space in self.observation_space.spaces.items()}
+            if not self._observation_scratch_in_use:
+                self._observation_scratch_in_use = scratch_acquired = True
+                obs = self.observation_buffer.scratch_views()
+            else:
+                obs = {k: np.zeros(space.shape, dtype=space.dtype)
+                    for k, space in self.observation_space.spaces.items()}
             logging.debug(f"_get_obs: Initialized obs keys: {list(obs.keys())}") # Log initial keys
 
             # Ensure players are valid before proceeding with population
@@ -6551,77 +6869,73 @@ class AlphaZeroMTGEnv(gym.Env):
                     # (Planner population logic - remains the same as previous version)
                     # ... (fill strategic_metrics, opponent_archetype, recommendations etc.) ...
                     # Analysis depends on the complete live board and on
-                    # gs.agent_is_p1.  Caching it by turn alone made every
-                    # same-turn transition stale and could feed the learned
-                    # opponent an analysis from the other seat.  Refresh at
-                    # the observation boundary; this also updates the
-                    # planner's own current_analysis for downstream helpers.
-                    analysis = self.strategic_planner.analyze_game_state()
-                    self.current_analysis = analysis
-
-                    if analysis:
-                        obs["strategic_metrics"][:] = self._analysis_to_metrics(analysis)
-                        obs["position_advantage"][0] = np.clip(
-                            analysis.get("position", {}).get("score", 0),
-                            -1.0, 1.0)
-
-                    opp_arch = self.strategic_planner.predict_opponent_archetype()
-                    arch_len = min(len(obs["opponent_archetype"]), len(opp_arch))
-                    obs["opponent_archetype"][:arch_len] = opp_arch[:arch_len]
-
-                    future_proj = self.strategic_planner.project_future_states(num_turns=7)
-                    proj_len = min(len(obs["future_state_projections"]), len(future_proj))
-                    obs["future_state_projections"][:proj_len] = future_proj[:proj_len]
-
-                    win_cons = self.strategic_planner.identify_win_conditions()
-                    wc_keys = ["combat_damage", "direct_damage", "card_advantage", "combo", "control", "alternate"]
-                    wc_viab_len = min(len(obs["win_condition_viability"]), len(wc_keys))
-                    wc_time_len = min(len(obs["win_condition_timings"]), len(wc_keys))
-                    obs["win_condition_viability"][:wc_viab_len] = np.array([
-                        np.clip(win_cons.get(k, {}).get("score", 0.0), 0.0, 1.0)
-                        for k in wc_keys[:wc_viab_len]
-                    ], dtype=np.float32)
-                    obs["win_condition_timings"][:wc_time_len] = np.array([min(self.max_turns + 1, win_cons.get(k, {}).get("turns_to_win", 99)) for k in wc_keys[:wc_time_len]], dtype=np.float32)
-
+                    # gs.agent_is_p1.  A turn-only cache once fed the learned
+                    # opponent an analysis from the other seat, so cached
+                    # planner features are keyed by observer seat and the
+                    # default "observation" policy refreshes every time.
+                    # Throttled policies trade same-turn freshness of the
+                    # turn-level signals for speed (PLANNER_REFRESH_POLICIES).
+                    perspective = bool(gs.agent_is_p1)
+                    strategic_key = self._planner_cache_key("strategic")
+                    cached = self._planner_feature_cache.get(
+                        ("strategic", perspective))
+                    if strategic_key is not None and cached is not None \
+                            and cached["key"] == strategic_key:
+                        analysis = cached["analysis"]
+                        threat_list = cached["threat_list"]
+                        self.current_analysis = analysis
+                        self.strategic_planner.current_analysis = analysis
+                        self.strategic_planner.opponent_archetype = \
+                            cached["opponent_archetype"]
+                        for key, value in cached["features"].items():
+                            obs[key][...] = value
+                    else:
+                        analysis, threat_list = \
+                            self._populate_strategic_planner_features(obs)
+                        if strategic_key is not None:
+                            self._planner_feature_cache[
+                                ("strategic", perspective)] = {
+                                "key": strategic_key,
+                                "analysis": analysis,
+                                "threat_list": threat_list,
+                                "opponent_archetype": getattr(
+                                    self.strategic_planner,
+                                    "opponent_archetype", None),
+                                "features": {
+                                    key: obs[key].copy()
+                                    for key in
+                                    self._STRATEGIC_PLANNER_FEATURES},
+                            }
+
+                    # Threat levels are re-mapped onto the live battlefield
+                    # order every time; only the planner's list is cached.
                     bf_ids_opp = opp.get("battlefield", [])
-                    threat_list = self.strategic_planner.assess_threats()
-                    turn_plan = self.strategic_planner.plan_multi_turn_sequence(
-                        depth=2,
-                        analysis=analysis,
-                        win_conditions=win_cons,
-                        opponent_threats=threat_list,
-                    )
-                    plan_len = min(len(obs["multi_turn_plan"]), 6)
-                    obs["multi_turn_plan"][:plan_len] = \
-                        self._get_multi_turn_plan_metrics(
-                            plan=turn_plan)[:plan_len]
-
                     threat_assessment_values = self._get_threat_assessment(
                         bf_ids_opp, threat_list=threat_list)
                     copy_len_threat = min(len(obs["threat_assessment"]), len(threat_assessment_values))
                     obs["threat_assessment"][:copy_len_threat] = threat_assessment_values[:copy_len_threat]
 
-                    bf_ids_agent = agent_player_obj.get("battlefield", [])
-                    # The old gate checked strategic_planner for
-                    # find_optimal_attack, but the method belongs to the combat
-                    # action handler, so both advisory features were silently
-                    # dead. Compute individual values with the evaluator and
-                    # the optimal combination with the real combat search,
-                    # only while an attack decision is live.
-                    if gs.phase == gs.PHASE_DECLARE_ATTACKERS:
-                        attacker_values = self._get_attacker_values(
-                            bf_ids_agent, agent_player_obj)
-                        if obs["attacker_values"].shape == attacker_values.shape:
-                            obs["attacker_values"][:] = attacker_values
-                        optimal_ids = set(
-                            self.action_handler.find_optimal_attack() or [])
-                        for battlefield_index, battlefield_card_id in enumerate(
-                                bf_ids_agent[:self.max_battlefield]):
-                            if battlefield_card_id in optimal_ids:
-                                obs["optimal_attackers"][battlefield_index] = 1.0
-
-                    ability_recs = self._get_ability_recommendations(bf_ids_agent, agent_player_obj)
-                    if obs["ability_recommendations"].shape == ability_recs.shape: obs["ability_recommendations"][:,:,:] = ability_recs
+                    # Battlefield-slot recommendations are only reusable while
+                    # the board itself is unchanged, whatever the policy.
+                    tactical_key = self._planner_cache_key("tactical")
+                    cached = self._planner_feature_cache.get(
+                        ("tactical", perspective))
+                    if tactical_key is not None and cached is not None \
+                            and cached["key"] == tactical_key:
+                        for key, value in cached["features"].items():
+                            obs[key][...] = value
+                    else:
+                        self._populate_tactical_planner_features(
+                            obs, agent_player_obj)
+                        if tactical_key is not None:
+                            self._planner_feature_cache[
+                                ("tactical", perspective)] = {
+                                "key": tactical_key,
+                                "features": {
+                                    key: obs[key].copy()
+                                    for key in
+                                    self._TACTICAL_PLANNER_FEATURES},
+                            }
 
             except Exception as planner_e:
                 self._record_observation_error("strategic planner features", planner_e)
@@ -6691,6 +7005,154 @@ class AlphaZeroMTGEnv(gym.Env):
             self._record_observation_error("observation builder", e)
             logging.critical(f"CRITICAL error during _get_obs execution: {str(e)}", exc_info=True)
             return self._get_obs_fallback()
+        finally:
+            if scratch_acquired:
+                self._observation_scratch_in_use = False
+
+    _STRATEGIC_PLANNER_FEATURES = (
+        "strategic_metrics", "position_advantage", "opponent_archetype",
+        "future_state_projections", "win_condition_viability",
+        "win_condition_timings", "multi_turn_plan",
+    )
+    _TACTICAL_PLANNER_FEATURES = (
+        "attacker_values", "optimal_attackers", "ability_recommendations",
+    )
+
+    def _planner_cache_key(self, group):
+        """Return the cache key for one planner feature group, or None.
+
+        ``None`` means the group is recomputed for this observation.  The
+        strategic group follows ``planner_refresh``; the tactical group is
+        indexed by battlefield slot and is therefore only reused under an
+        unchanged board signature.
+        """
+        policy = self.planner_refresh
+        if policy == "observation":
+            return None
+        gs = self.game_state
+        if group == "strategic" and policy == "turn":
+            return (gs.turn,)
+        if group == "strategic" and policy == "phase":
+            return (gs.turn, gs.phase)
+        return (gs.turn, gs.phase, self._planner_state_signature())
+
+    def _planner_state_signature(self):
+        """Return a hashable summary of every state region the planner reads."""
+        gs = self.game_state
+
+        def player_signature(player):
+            if not player:
+                return None
+            battlefield = tuple(player.get("battlefield", ()))
+            battlefield_state = []
+            for card_id in battlefield:
+                card = gs.card_db.get(card_id)
+                counters = getattr(card, "counters", None) or {}
+                battlefield_state.append((
+                    getattr(card, "power", None),
+                    getattr(card, "toughness", None),
+                    frozenset(counters.items())))
+            return (
+                player.get("life", 0),
+                player.get("poison_counters", 0),
+                len(player.get("library", ())),
+                tuple(player.get("hand", ())),
+                battlefield,
+                tuple(battlefield_state),
+                tuple(player.get("graveyard", ())),
+                tuple(player.get("exile", ())),
+                frozenset(player.get("tapped_permanents", ())),
+                frozenset(player.get("damage_counters", {}).items()),
+                frozenset(player.get("mana_pool", {}).items()),
+                bool(player.get("land_played", False)),
+            )
+
+        stack = tuple(
+            (item[0], item[1])
+            if isinstance(item, tuple) and len(item) >= 2 else id(item)
+            for item in getattr(gs, "stack", ()))
+        choice = getattr(gs, "choice_context", None)
+        return (
+            bool(gs.agent_is_p1),
+            player_signature(gs.p1),
+            player_signature(gs.p2),
+            stack,
+            tuple(getattr(gs, "current_attackers", ()) or ()),
+            choice.get("type") if isinstance(choice, dict) else None,
+        )
+
+    def _populate_strategic_planner_features(self, obs):
+        """Run the planner stack and write its turn-level observation fields.
+
+        Returns ``(analysis, threat_list)`` for the threat assessment and the
+        planner feature cache.
+        """
+        # Analysis depends on the complete live board and on gs.agent_is_p1.
+        # This also updates the planner's own current_analysis for downstream
+        # helpers.
+        analysis = self.strategic_planner.analyze_game_state()
+        self.current_analysis = analysis
+
+        if analysis:
+            obs["strategic_metrics"][:] = self._analysis_to_metrics(analysis)
+            obs["position_advantage"][0] = np.clip(
+                analysis.get("position", {}).get("score", 0),
+                -1.0, 1.0)
+
+        opp_arch = self.strategic_planner.predict_opponent_archetype()
+        arch_len = min(len(obs["opponent_archetype"]), len(opp_arch))
+        obs["opponent_archetype"][:arch_len] = opp_arch[:arch_len]
+
+        future_proj = self.strategic_planner.project_future_states(num_turns=7)
+        proj_len = min(len(obs["future_state_projections"]), len(future_proj))
+        obs["future_state_projections"][:proj_len] = future_proj[:proj_len]
+
+        win_cons = self.strategic_planner.identify_win_conditions()
+        wc_keys = ["combat_damage", "direct_damage", "card_advantage", "combo", "control", "alternate"]
+        wc_viab_len = min(len(obs["win_condition_viability"]), len(wc_keys))
+        wc_time_len = min(len(obs["win_condition_timings"]), len(wc_keys))
+        obs["win_condition_viability"][:wc_viab_len] = np.array([
+            np.clip(win_cons.get(k, {}).get("score", 0.0), 0.0, 1.0)
+            for k in wc_keys[:wc_viab_len]
+        ], dtype=np.float32)
+        obs["win_condition_timings"][:wc_time_len] = np.array([min(self.max_turns + 1, win_cons.get(k, {}).get("turns_to_win", 99)) for k in wc_keys[:wc_time_len]], dtype=np.float32)
+
+        threat_list = self.strategic_planner.assess_threats()
+        turn_plan = self.strategic_planner.plan_multi_turn_sequence(
+            depth=2,
+            analysis=analysis,
+            win_conditions=win_cons,
+            opponent_threats=threat_list,
+        )
+        plan_len = min(len(obs["multi_turn_plan"]), 6)
+        obs["multi_turn_plan"][:plan_len] = \
+            self._get_multi_turn_plan_metrics(
+                plan=turn_plan)[:plan_len]
+        return analysis, threat_list
+
+    def _populate_tactical_planner_features(self, obs, agent_player_obj):
+        """Write the battlefield-slot attack and ability recommendations."""
+        gs = self.game_state
+        bf_ids_agent = agent_player_obj.get("battlefield", [])
+        # The old gate checked strategic_planner for find_optimal_attack, but
+        # the method belongs to the combat action handler, so both advisory
+        # features were silently dead. Compute individual values with the
+        # evaluator and the optimal combination with the real combat search,
+        # only while an attack decision is live.
+        if gs.phase == gs.PHASE_DECLARE_ATTACKERS:
+            attacker_values = self._get_attacker_values(
+                bf_ids_agent, agent_player_obj)
+            if obs["attacker_values"].shape == attacker_values.shape:
+                obs["attacker_values"][:] = attacker_values
+            optimal_ids = set(
+                self.action_handler.find_optimal_attack() or [])
+            for battlefield_index, battlefield_card_id in enumerate(
+                    bf_ids_agent[:self.max_battlefield]):
+                if battlefield_card_id in optimal_ids:
+                    obs["optimal_attackers"][battlefield_index] = 1.0
+
+        ability_recs = self._get_ability_recommendations(bf_ids_agent, agent_player_obj)
+        if obs["ability_recommendations"].shape == ability_recs.shape: obs["ability_recommendations"][:,:,:] = ability_recs
 
     def observation_for(self, player):
         """Build one strict player observation without perspective/cache leaks."""
@@ -6731,9 +7193,11 @@ class AlphaZeroMTGEnv(gym.Env):
         }
 
     def _validate_obs(self, obs):
-        """
-        Checks if the generated observation dictionary conforms to the defined observation space.
-        Includes stricter dtype/shape checks and improved logging.
+        """Check an observation against ``observation_space`` and log the first defect.
+
+        Structure (keys, ndarray type, exact dtype and shape) is checked per
+        field; bounds and finiteness are one vectorized pass over the
+        observation's contiguous block (packed first if it has none).
         """
         if not isinstance(obs, dict):
             logging.error("Observation Validation Error: Observation is not a dictionary.")
@@ -6742,114 +7206,37 @@ class AlphaZeroMTGEnv(gym.Env):
             logging.error("Observation Validation Error: Observation space is not defined or not a Dict space.")
             return False
 
-        valid = True
         for key, space in self.observation_space.spaces.items():
-            if key not in obs:
-                logging.error(f"Observation Validation Error: Missing key '{key}'")
-                valid = False
-                continue
-
-            value = obs[key]
+            value = obs.get(key)
             if not isinstance(value, np.ndarray):
-                # Special case: Allow simple scalars if the space shape is () or (1,) - Gymnasium can handle this sometimes
-                if (space.shape == () or space.shape == (1,)) and np.isscalar(value):
-                    # Attempt to cast scalar to numpy array for further checks
-                    try:
-                        value = np.array([value], dtype=space.dtype) # Wrap in array matching space dtype
-                        obs[key] = value # Update the observation dict for consistency if needed downstream
-                    except Exception as e:
-                         logging.error(f"Observation Validation Error: Key '{key}' is scalar but couldn't be cast to expected type {space.dtype}. Value: {value}. Error: {e}")
-                         valid = False
-                         continue # Skip further checks for this key
-                else:
-                    logging.error(f"Observation Validation Error: Key '{key}' is not a numpy array (type: {type(value)}) and not a compatible scalar.")
-                    valid = False
-                    continue
+                logging.error(
+                    f"Observation Validation Error: Key '{key}' is missing or "
+                    f"not a numpy array (type: {type(value)}).")
+                return False
+            if value.shape != space.shape or value.dtype != space.dtype:
+                logging.error(
+                    f"Observation Validation Error: '{key}' is "
+                    f"{value.dtype}{list(value.shape)}, expected "
+                    f"{space.dtype}{list(space.shape)}.")
+                return False
 
-            # Shape check (allow broadcasting for single-element dimensions)
-            expected_shape = space.shape
-            actual_shape = value.shape
-            shape_match = False
-            if len(expected_shape) == len(actual_shape):
-                 shape_match = all(exp_d == act_d or exp_d == 1 or act_d == 1 for exp_d, act_d in zip(expected_shape, actual_shape))
-            # Handle case where space shape is () e.g. Box(0,1, shape=())
-            elif expected_shape == () and (actual_shape == (1,) or actual_shape == ()):
-                 shape_match = True # Allow shape (1,) for a shape () space
-            elif actual_shape == () and (expected_shape == (1,)):
-                shape_match = True
-
-            if not shape_match:
-                 logging.error(f"Observation Validation Error: Shape mismatch for '{key}'. Expected {expected_shape}, got {actual_shape}")
-                 valid = False
-
-            # Dtype check - Be stricter, check exact match or safe casting
-            # Allow safe casting (e.g., int32 to int64, float32 to float64), but flag exact mismatches.
-            if value.dtype != space.dtype:
-                 # Check if casting is safe based on NumPy kinds
-                 expected_kind = np.dtype(space.dtype).kind
-                 actual_kind = value.dtype.kind
-                 # Allow int->int, float->float, bool->bool if target bits >= source bits
-                 can_safely_cast = False
-                 if expected_kind == actual_kind:
-                      if expected_kind == 'b': # Bool
-                           can_safely_cast = True
-                      elif expected_kind in 'iu': # Ints
-                           can_safely_cast = np.dtype(space.dtype).itemsize >= value.dtype.itemsize
-                      elif expected_kind == 'f': # Floats
-                           can_safely_cast = np.dtype(space.dtype).itemsize >= value.dtype.itemsize
-                 # Allow int to float conversion
-                 elif expected_kind == 'f' and actual_kind in 'iu':
-                      can_safely_cast = True
-                 # Allow float to int conversion (often problematic, maybe warn?)
-                 # elif expected_kind in 'iu' and actual_kind == 'f':
-                 #     can_safely_cast = True # Needs explicit check for data loss
-
-                 if not can_safely_cast:
-                     logging.error(f"Observation Validation Error: Dtype mismatch for '{key}'. Expected {space.dtype} (kind '{expected_kind}'), got {value.dtype} (kind '{actual_kind}').")
-                     valid = False
-                 else:
-                     # Optionally log a warning for safe casts if desired for debugging
-                     pass # logging.debug(f"Observation Validation Warning: Safe dtype cast required for '{key}'. Expected {space.dtype}, got {value.dtype}")
-
-
-            # Bounds check (only for Box spaces) - Improved handling for different shapes/NaN
-            if isinstance(space, spaces.Box):
-                try:
-                    # Handle NaN values - skip bounds check for NaNs if space allows
-                    allow_nan = False # Set to True if your space explicitly intends to use NaNs
-                    if allow_nan:
-                        nan_mask = np.isnan(value)
-                        valid_non_nan = True
-                        # Check bounds only for non-NaN values
-                        if not np.all(nan_mask):
-                             value_to_check = value[~nan_mask]
-                             lower_bound = space.low[0] if space.low.size==1 else space.low[~nan_mask] # Align bounds
-                             upper_bound = space.high[0] if space.high.size==1 else space.high[~nan_mask]
-                             valid_non_nan = np.all(np.greater_equal(value_to_check, lower_bound)) and \
-                                             np.all(np.less_equal(value_to_check, upper_bound))
-                    else:
-                        # No NaNs allowed, check directly
-                        # Handle shape mismatch for bounds comparison if space bounds are scalar but value is array
-                        low_bound_val = space.low if space.low.shape == value.shape else space.low[0]
-                        high_bound_val = space.high if space.high.shape == value.shape else space.high[0]
-                        valid_bounds = np.all(np.greater_equal(value, low_bound_val)) and \
-                                       np.all(np.less_equal(value, high_bound_val))
-
-                    if not valid_bounds and not allow_nan:
-                         # Find first violation for logging
-                         lower_violations = value < low_bound_val
-                         upper_violations = value > high_bound_val
-                         violation_indices = np.where(lower_violations | upper_violations)[0]
-                         if violation_indices.size > 0:
-                              first_violation_idx = violation_indices[0]
-                              min_val = value[first_violation_idx]
-                              logging.error(f"Observation Validation Error: Value out of bounds for '{key}'. Expected [{low_bound_val}, {high_bound_val}], got {min_val} at index {first_violation_idx}")
-                              valid = False
-                except Exception as bound_e:
-                    logging.error(f"Observation Validation Error: Error checking bounds for '{key}' with value shape {value.shape} against space {space}. Error: {bound_e}", exc_info=True)
-                    valid = False
-
-        return valid
+        buffer = self.observation_buffer
+        block = buffer.block_of(obs)
+        if block is None:
+            block = buffer.pack(obs)
+        violations = buffer.violations(block)
+        if violations:
+            key = violations[0]
+            space = self.observation_space.spaces[key]
+            value = buffer.views(block)[key]
+            index = tuple(int(i) for i in np.argwhere(
+                ~((value >= space.low) & (value <= space.high)))[0])
+            logging.error(
+                f"Observation Validation Error: '{key}' index {index} value "
+                f"{value[index]} is outside [{space.low[index]}, "
+                f"{space.high[index]}] or not finite.")
+            return False
+        return True
 
     def _get_hand_synergy_scores(self, hand_ids, bf_ids):
         """Calculate synergy for each card in hand with current board/hand state."""
@@ -6858,6 +7245,24 @@ class AlphaZeroMTGEnv(gym.Env):
             return scores
 
         current_hand_and_board = hand_ids + bf_ids
+        observed_hand = hand_ids[:self.hand_observation_size]
+        table = self._observer_synergy_table()
+        card_db = self.game_state.card_db
+        hand_positions = pool_positions = None
+        if table is not None and observed_hand:
+            hand_positions = table.indices(observed_hand, card_db)
+            pool_positions = table.indices(current_hand_and_board, card_db)
+        if hand_positions is not None and pool_positions is not None:
+            planner = self.strategic_planner
+            synergy = table.hand_synergies(
+                hand_positions, pool_positions,
+                planner.card_synergy_terms,
+                np.fromiter(planner.SYNERGY_CATEGORY_CAPS.values(),
+                            dtype=np.float64),
+                planner.SYNERGY_TOTAL_CAP)
+            scores[:len(observed_hand)] = np.clip(synergy / 5.0, 0.0, 1.0)
+            return scores
+
         for i, card_id in enumerate(hand_ids):
             if i >= self.hand_observation_size: break
             # Compare card i with all *other* cards currently available
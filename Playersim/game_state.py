@@ -37,7 +37,8 @@ class GameState(
     # (Keep existing class variables like PHASE_ constants and __slots__)
     __slots__ = ["card_db", "card_instance_printings", "card_instance_owners",
                  "max_turns", "max_hand_size", "max_battlefield", "day_night_checked_this_turn",
-                 "fidelity_counters", "_sba_in_progress", "delayed_triggers",
+                 "fidelity_counters", "_sba_in_progress", "latency_recorder",
+                 "delayed_triggers",
                  "delayed_event_triggers", "copy_overrides", "plotted_cards",
                  "prepared_cards",
                  "graveyard_adventure_permissions", "flashback_permissions",
@@ -564,6 +565,9 @@ class GameState(
             # weight or filter games with high counts — unfaithful games produce
             # misleading win-rate data.
             self._sba_in_progress = False  # re-entrancy guard for check_state_based_actions
+            # Step-latency recorder installed by the environment; SBA and
+            # trigger processing report their time to it when set.
+            self.latency_recorder = None
             # CR 603.7 delayed triggered abilities + legacy asap callables.
             # Entries: dicts from register_delayed_trigger, or bare callables
             # (fire at the next state-based check).
@@ -1513,7 +1517,7 @@ class GameState(
                 identity_memo[id(service)] = service
 
         excluded_slots = {
-            "card_db", "p1", "p2", "delayed_triggers",
+            "card_db", "p1", "p2", "delayed_triggers", "latency_recorder",
             "strategy_memory", "stats_tracker", "card_memory",
             *subsystem_names,
         }
@@ -1666,6 +1670,9 @@ class GameState(
             for service in identities["external"].values()
             if service is not None
         }
+        recorder = getattr(self, "latency_recorder", None)
+        if recorder is not None:
+            donor_memo[id(recorder)] = recorder
         state = copy.deepcopy(self, donor_memo)
         if state.replacement_effects and self.replacement_effects:
             for effect in getattr(
@@ -1812,7 +1819,7 @@ class GameState(
         self.p2 = restore_player(live_p2, snapshot.p2)
 
         special_names = {
-            "card_db", "p1", "p2", "delayed_triggers",
+            "card_db", "p1", "p2", "delayed_triggers", "latency_recorder",
             "_ceased_token_cards",
             "strategy_memory", "stats_tracker", "card_memory",
             *subsystem_names,
@@ -8,6 +8,8 @@ import logging
 import re
 from collections import defaultdict
 
+from .step_latency import SBA_TRIGGER_STAGE
+
 
 class GameStateDamageMixin:
     """Damage application, life totals, and state-based actions."""
@@ -27,10 +29,15 @@ class GameStateDamageMixin:
         if getattr(self, '_sba_in_progress', False):
             return False
         self._sba_in_progress = True
+        recorder = getattr(self, "latency_recorder", None)
+        if recorder is not None:
+            recorder.enter(SBA_TRIGGER_STAGE)
         try:
             return self._check_state_based_actions_impl()
         finally:
             self._sba_in_progress = False
+            if recorder is not None:
+                recorder.exit()
 
     def _check_state_based_actions_impl(self):
         # Legacy asap delayed triggers (damage redirection, deferred lifelink
@@ -0,0 +1,218 @@
+"""Advance several games in lockstep and batch their policy decisions.
+
+A harvest worker normally plays one game at a time, so every checkpoint
+decision is a ``predict`` call on a batch of one.  ``LockstepScheduler`` runs
+K independent game *lanes*, each on its own thread, but lets only one lane
+execute at a time.  A lane runs until it needs a checkpoint decision: the
+policy handle from ``scheduler.policy(...)`` parks the request and hands
+control back.  Once every unfinished lane is parked, the scheduler groups
+the requests by policy and answers each group with a single batched
+``predict`` call, the same grouping ``OpponentInferenceServer`` uses for
+training workers.  The lanes then resume one by one in lane order.
+
+Because lanes never run concurrently, the engine's process-global state can
+be swapped at each hand-off: ``capture`` is called when a lane parks and
+``restore`` when it resumes, so each game keeps its own global ``random``
+streams (and whatever else the caller saves).  A game's actions therefore
+depend only on its own seed and on the policies' outputs.  A batched forward
+pass produces the same rows as single predictions up to floating-point
+reduction order, which can only matter for near-tied logits.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+
+import numpy as np
+
+
+class LockstepAborted(BaseException):
+    """Raised inside a parked lane when another lane failed.
+
+    It derives from ``BaseException`` so engine code that recovers from
+    ordinary errors cannot swallow it and keep the lane running.
+    """
+
+
+def capture_global_random_state():
+    """Return the global ``random`` and NumPy legacy RNG states."""
+    return random.getstate(), np.random.get_state()
+
+
+def restore_global_random_state(state) -> None:
+    python_state, numpy_state = state
+    random.setstate(python_state)
+    np.random.set_state(numpy_state)
+
+
+class _Lane:
+    def __init__(self, index, target):
+        self.index = index
+        self.target = target
+        self.resume = threading.Semaphore(0)
+        self.request = None
+        self.response = None
+        self.result = None
+        self.error = None
+        self.done = False
+        self.abort = False
+
+
+class LockstepPolicy:
+    """``predict``-compatible handle that routes lane calls to the batcher.
+
+    Calls made outside a running lane go straight to the wrapped policy, so
+    the handle can also be validated or used on its own.
+    """
+
+    def __init__(self, scheduler, policy):
+        self._scheduler = scheduler
+        self.policy = policy
+        self.observation_space = getattr(policy, "observation_space", None)
+        self.action_space = getattr(policy, "action_space", None)
+
+    def predict(self, observation, state=None, episode_start=None,
+                deterministic=False, action_masks=None):
+        lane = self._scheduler._current_lane()
+        if lane is None:
+            return self.policy.predict(
+                observation, state=state, episode_start=episode_start,
+                deterministic=deterministic, action_masks=action_masks)
+        if action_masks is None:
+            raise RuntimeError("Lockstep predictions require an action mask")
+        action = self._scheduler._park(
+            lane, (self.policy, observation,
+                   np.asarray(action_masks, dtype=bool), bool(deterministic)))
+        return np.asarray([action]), state
+
+
+class LockstepScheduler:
+    """Run game lanes cooperatively and batch their checkpoint decisions.
+
+    ``capture``/``restore`` save and reinstall one lane's process-global
+    state around every hand-off; the default covers the global ``random``
+    and NumPy RNGs.
+    """
+
+    def __init__(self, *, capture=capture_global_random_state,
+                 restore=restore_global_random_state):
+        self._capture = capture
+        self._restore = restore
+        self._yielded = threading.Semaphore(0)
+        self._lanes_by_thread = {}
+        self.stats = {"requests": 0, "batches": 0, "largest_batch": 0}
+
+    def policy(self, policy) -> LockstepPolicy:
+        return LockstepPolicy(self, policy)
+
+    def _current_lane(self):
+        return self._lanes_by_thread.get(threading.get_ident())
+
+    def _park(self, lane, request):
+        lane.request = request
+        state = self._capture()
+        self._yielded.release()
+        lane.resume.acquire()
+        self._restore(state)
+        if lane.abort:
+            raise LockstepAborted("another lockstep lane failed")
+        response, lane.response = lane.response, None
+        if isinstance(response, BaseException):
+            raise response
+        return response
+
+    def _lane_main(self, lane):
+        self._lanes_by_thread[threading.get_ident()] = lane
+        lane.resume.acquire()
+        try:
+            if lane.abort:
+                raise LockstepAborted("another lockstep lane failed")
+            lane.result = lane.target()
+        except BaseException as error:
+            lane.error = error
+        finally:
+            lane.done = True
+            self._lanes_by_thread.pop(threading.get_ident(), None)
+            self._yielded.release()
+
+    def _step(self, lane):
+        """Let one lane run until it parks or finishes."""
+        lane.resume.release()
+        self._yielded.acquire()
+
+    def _answer(self, lanes):
+        groups = {}
+        for lane in lanes:
+            policy, _, _, deterministic = lane.request
+            groups.setdefault((id(policy), deterministic), []).append(lane)
+        for (_, deterministic), members in groups.items():
+            policy = members[0].request[0]
+            try:
+                first = members[0].request[1]
+                if isinstance(first, dict):
+                    observation = {
+                        key: np.stack([np.asarray(lane.request[1][key])
+                                       for lane in members])
+                        for key in first}
+                else:
+                    observation = np.stack([
+                        np.asarray(lane.request[1]) for lane in members])
+                masks = np.stack([lane.request[2] for lane in members])
+                prediction = policy.predict(
+                    observation, action_masks=masks,
+                    deterministic=deterministic)
+                actions = prediction[0] if isinstance(prediction, tuple) \
+                    else prediction
+                actions = np.asarray(actions).reshape(-1)
+                if len(actions) != len(members):
+                    raise RuntimeError(
+                        f"Batched predict returned {len(actions)} actions "
+                        f"for {len(members)} observations")
+                responses = [int(action) for action in actions]
+            except Exception as error:
+                responses = [error] * len(members)
+            self.stats["requests"] += len(members)
+            self.stats["batches"] += 1
+            self.stats["largest_batch"] = max(
+                self.stats["largest_batch"], len(members))
+            for lane, response in zip(members, responses):
+                lane.request = None
+                lane.response = response
+
+    def run(self, targets) -> list:
+        """Run every zero-argument target as a lane; return their results.
+
+        The first lane error (in lane order) is raised after the remaining
+        lanes have been aborted and joined.
+        """
+        lanes = [_Lane(index, target) for index, target in enumerate(targets)]
+        threads = [
+            threading.Thread(target=self._lane_main, args=(lane,),
+                             name=f"lockstep-lane-{lane.index}", daemon=True)
+            for lane in lanes]
+        for thread in threads:
+            thread.start()
+        runnable = list(lanes)
+        try:
+            while runnable:
+                for lane in runnable:
+                    self._step(lane)
+                    if lane.error is not None:
+                        break
+                if any(lane.error is not None for lane in lanes):
+                    break
+                runnable = [lane for lane in lanes if not lane.done]
+                self._answer(runnable)
+        finally:
+            for lane in lanes:
+                if not lane.done:
+                    lane.abort = True
+                    self._step(lane)
+            for thread in threads:
+                thread.join()
+        for lane in lanes:
+            if lane.error is not None \
+                    and not isinstance(lane.error, LockstepAborted):
+                raise lane.error
+        return [lane.result for lane in lanes]
@@ -0,0 +1,274 @@
+"""Contiguous storage for the Dict policy observation.
+
+``AlphaZeroMTGEnv`` declares its policy observation as a Gym ``Dict`` whose
+identity is versioned by ``observation_schema``.  This module lays that Dict
+out once into a single byte block, grouped by dtype, so every public field is
+a numpy view into one allocation.  Building an observation is then one block
+allocation plus in-place copies, and copying it (rollout buffers, pipes,
+shared memory) is a single memcpy of ``ObservationBuffer.nbytes``.
+
+The layout is derived from the declared space, never from a live observation,
+and is deterministic for a given space: groups are ordered widest dtype first
+(which keeps every group naturally aligned without padding) and fields keep
+their ``Dict`` order inside a group.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+import gymnasium as gym
+import numpy as np
+from gymnasium import spaces
+
+
+class ObservationField(NamedTuple):
+    """One ``Dict`` entry's placement inside the contiguous block."""
+
+    name: str
+    dtype: np.dtype
+    shape: tuple
+    offset: int
+    size: int
+    flat_offset: int
+
+    @property
+    def nbytes(self) -> int:
+        return self.size * self.dtype.itemsize
+
+
+def observation_buffer_layout(observation_space) -> tuple:
+    """Return the deterministic field layout for a ``Dict`` of ``Box`` spaces."""
+    if not isinstance(observation_space, spaces.Dict):
+        raise TypeError(
+            "Observation buffers require a gymnasium Dict observation space")
+    entries = []
+    for name, subspace in observation_space.spaces.items():
+        if not isinstance(subspace, spaces.Box):
+            raise TypeError(
+                f"Observation field {name!r} is {type(subspace).__name__}; "
+                "only Box fields can share a contiguous buffer")
+        entries.append((name, np.dtype(subspace.dtype), tuple(subspace.shape)))
+    group_order = sorted(
+        {dtype for _, dtype, _ in entries},
+        key=lambda dtype: (-dtype.itemsize, dtype.str))
+    fields = []
+    offset = 0
+    flat_offset = 0
+    for group_dtype in group_order:
+        for name, dtype, shape in entries:
+            if dtype != group_dtype:
+                continue
+            size = int(np.prod(shape, dtype=np.int64))
+            fields.append(ObservationField(
+                name, dtype, shape, offset, size, flat_offset))
+            offset += size * dtype.itemsize
+            flat_offset += size
+    return tuple(fields)
+
+
+class ObservationBuffer:
+    """Preallocated scratch block plus views for one observation space.
+
+    ``scratch_views()`` hands out the reusable, zero-filled scratch block; it
+    is overwritten by the next call.  ``allocate()`` returns a fresh block for
+    an observation that must outlive the next build (every observation leaving
+    the environment does).
+    """
+
+    def __init__(self, observation_space):
+        self.observation_space = observation_space
+        self.fields = observation_buffer_layout(observation_space)
+        self.nbytes = sum(field.nbytes for field in self.fields)
+        self.flat_size = sum(field.size for field in self.fields)
+        groups = []
+        for field in self.fields:
+            if groups and groups[-1][0] == field.dtype:
+                dtype, byte_start, _, flat_start, _ = groups[-1]
+                groups[-1] = (
+                    dtype, byte_start, field.offset + field.nbytes,
+                    flat_start, field.flat_offset + field.size)
+            else:
+                groups.append((
+                    field.dtype, field.offset, field.offset + field.nbytes,
+                    field.flat_offset, field.flat_offset + field.size))
+        self._groups = tuple(groups)
+        self._group_bounds = self._bounds_table()
+        self.scratch = np.zeros(self.nbytes, dtype=np.uint8)
+        self._scratch_views = self.views(self.scratch)
+        self.flat_space = self._flat_space()
+
+    def _flat_space(self):
+        low = np.empty(self.flat_size, dtype=np.float32)
+        high = np.empty(self.flat_size, dtype=np.float32)
+        for field in self.fields:
+            subspace = self.observation_space.spaces[field.name]
+            stop = field.flat_offset + field.size
+            low[field.flat_offset:stop] = np.broadcast_to(
+                subspace.low, field.shape).reshape(-1)
+            high[field.flat_offset:stop] = np.broadcast_to(
+                subspace.high, field.shape).reshape(-1)
+        return spaces.Box(low=low, high=high, dtype=np.float32)
+
+    def _bounds_table(self):
+        """Per dtype group: ``(low, high, field starts, field names)``.
+
+        Bounds are stored in the group's own dtype so integer limits compare
+        exactly.  Groups whose dtype cannot leave its declared bounds (bool
+        fields declared over [0, 1]) get ``None`` bounds and are skipped.
+        """
+        table = []
+        for dtype, byte_start, byte_stop, flat_start, flat_stop in self._groups:
+            fields = [
+                field for field in self.fields
+                if byte_start <= field.offset < byte_stop]
+            lows = []
+            highs = []
+            for field in fields:
+                subspace = self.observation_space.spaces[field.name]
+                lows.append(np.broadcast_to(
+                    subspace.low, field.shape).reshape(-1))
+                highs.append(np.broadcast_to(
+                    subspace.high, field.shape).reshape(-1))
+            low = np.concatenate(lows).astype(dtype)
+            high = np.concatenate(highs).astype(dtype)
+            if dtype.kind == "b" and not low.any() and high.all():
+                low = high = None
+            starts = np.array(
+                [field.flat_offset - flat_start for field in fields],
+                dtype=np.intp)
+            table.append((low, high, starts, tuple(f.name for f in fields)))
+        return tuple(table)
+
+    def violations(self, block):
+        """Return the names of fields with a NaN or out-of-bounds value.
+
+        One vectorized comparison per dtype group over the whole block; NaN
+        compares false against both bounds and is reported like any other
+        violation.
+        """
+        names = []
+        for (dtype, byte_start, byte_stop, _, _), (low, high, starts, fields) \
+                in zip(self._groups, self._group_bounds):
+            if low is None:
+                continue
+            values = block[byte_start:byte_stop].view(dtype)
+            inside = np.greater_equal(values, low)
+            inside &= np.less_equal(values, high)
+            if inside.all():
+                continue
+            positions = np.flatnonzero(~inside)
+            for index in np.unique(
+                    np.searchsorted(starts, positions, side="right") - 1):
+                names.append(fields[index])
+        return names
+
+    def views(self, block):
+        """Return ``{field: ndarray view}`` over a block of ``nbytes`` bytes."""
+        if block.dtype != np.uint8 or block.shape != (self.nbytes,):
+            raise ValueError(
+                f"Observation block must be uint8[{self.nbytes}], got "
+                f"{block.dtype}{list(block.shape)}")
+        return {
+            field.name: block[field.offset:field.offset + field.nbytes]
+            .view(field.dtype).reshape(field.shape)
+            for field in self.fields
+        }
+
+    def stacked_views(self, block, count):
+        """Return ``{field: (count, *shape) view}`` over a field-major block.
+
+        Each field's ``count`` rows are adjacent, so a copy of the block is a
+        batch of contiguous per-field arrays (the layout vectorized
+        environments hand to a rollout buffer).
+        """
+        count = int(count)
+        if block.dtype != np.uint8 or block.shape != (count * self.nbytes,):
+            raise ValueError(
+                f"Stacked observation block must be uint8"
+                f"[{count * self.nbytes}], got {block.dtype}"
+                f"{list(block.shape)}")
+        return {
+            field.name: block[
+                count * field.offset:count * (field.offset + field.nbytes)]
+            .view(field.dtype).reshape((count,) + field.shape)
+            for field in self.fields
+        }
+
+    def scratch_views(self):
+        """Zero the scratch block with one fill and return its views."""
+        self.scratch.fill(0)
+        return dict(self._scratch_views)
+
+    def allocate(self):
+        """Return ``(block, views)`` for a new, uninitialized observation."""
+        block = np.empty(self.nbytes, dtype=np.uint8)
+        return block, self.views(block)
+
+    def block_of(self, observation):
+        """Return the block backing ``observation``, or None if it has none.
+
+        Only observations whose every field is a view produced by ``views``
+        over one owning block qualify; anything else must be packed.
+        """
+        if not isinstance(observation, dict) or not self.fields:
+            return None
+        first = observation.get(self.fields[0].name)
+        block = getattr(first, "base", None)
+        if (not isinstance(block, np.ndarray) or block.dtype != np.uint8
+                or block.shape != (self.nbytes,)):
+            return None
+        address = block.__array_interface__["data"][0]
+        for field in self.fields:
+            value = observation.get(field.name)
+            if (not isinstance(value, np.ndarray) or value.base is not block
+                    or value.dtype != field.dtype
+                    or value.shape != field.shape
+                    or value.__array_interface__["data"][0]
+                    != address + field.offset):
+                return None
+        return block
+
+    def pack(self, observation, block=None):
+        """Copy a Dict observation into ``block`` (a new one by default)."""
+        if block is None:
+            block, views = self.allocate()
+        else:
+            views = self.views(block)
+        for name, view in views.items():
+            np.copyto(view, observation[name], casting="unsafe")
+        return block
+
+    def flatten(self, observation, out=None):
+        """Return the observation as one float32 vector in layout order.
+
+        A contiguous observation is cast group by group (one copy per dtype);
+        any other Dict is packed first.
+        """
+        block = self.block_of(observation)
+        if block is None:
+            block = self.pack(observation)
+        if out is None:
+            out = np.empty(self.flat_size, dtype=np.float32)
+        for dtype, byte_start, byte_stop, flat_start, flat_stop in self._groups:
+            np.copyto(
+                out[flat_start:flat_stop],
+                block[byte_start:byte_stop].view(dtype), casting="unsafe")
+        return out
+
+
+class FlatObservationWrapper(gym.ObservationWrapper):
+    """Present the contiguous Dict observation as one float32 ``Box``.
+
+    For flat-input policies (for example an MLP without the Dict feature
+    extractor).  Action masks still come from ``action_masks`` on the wrapped
+    environment; the field order is ``observation_buffer.fields``.
+    """
+
+    def __init__(self, env):
+        super().__init__(env)
+        self.observation_buffer = ObservationBuffer(env.observation_space)
+        self.observation_space = self.observation_buffer.flat_space
+
+    def observation(self, observation):
+        return self.observation_buffer.flatten(observation)
@@ -55,6 +55,19 @@ SEMANTIC_IDENTITY_FIELDS = (
     "my_deck_card_identity",
 )
 
+# Card-detail tensors and per-object flag tables whose elements declared over
+# [0, 1] hold only 0 or 1 (keyword, color, subtype, type, and status flags).
+# Their wider-bounded elements -- mana value, P/T, mana pips, back-face P/T --
+# are numeric.  Compact rollout storage bit-packs the flag elements; this is a
+# storage contract only and is not part of the schema identity.
+BINARY_FLAG_FIELDS = (
+    "my_hand", "my_battlefield", "opp_battlefield",
+    "my_graveyard_cards", "opp_graveyard_cards",
+    "my_exile_cards", "opp_exile_cards",
+    "stack_cards", "target_cards", "choice_cards",
+    "hand_card_types", "my_battlefield_flags", "opp_battlefield_flags",
+)
+
 # The action mask is consumed by MaskablePPO rather than the feature extractor.
 # Runtime target IDs prove selection-page protocol continuity but are unstable
 # per-game object handles and therefore never enter the network.
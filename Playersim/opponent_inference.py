@@ -0,0 +1,492 @@
+"""Batched opponent inference for checkpoint-pool self-play.
+
+Without this service every training worker loads its own frozen checkpoint
+and calls ``policy.predict`` on a batch of one for every opponent decision.
+``OpponentInferenceServer`` instead runs one process that holds the pool
+snapshots (a bounded LRU keyed by checkpoint SHA-256) and serves every
+worker.  Each worker's ``OpponentInferenceClient`` owns one shared-memory
+slot holding an observation block (laid out by ``ObservationBuffer``) and an
+action mask; a request over the connection carries only the snapshot digest.
+The server collects requests until every connected worker is waiting or the
+batch window expires, groups them by snapshot, and answers each group with a
+single batched ``predict`` call.
+
+Checkpoints are still loaded and validated synchronously when a worker stages
+them, so a corrupt or incompatible checkpoint raises at the same boundary as
+a worker-local load.  A snapshot's inference export is preferred over its
+full MaskablePPO archive when one was traced from the same bytes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import multiprocessing
+import os
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from multiprocessing import shared_memory
+from multiprocessing.connection import Client, Listener, wait
+from typing import NamedTuple
+
+import numpy as np
+
+from .observation_buffer import ObservationBuffer
+
+
+DEFAULT_MAX_POLICIES = 8
+DEFAULT_BATCH_WINDOW_SECONDS = 0.002
+SERVER_START_TIMEOUT_SECONDS = 120.0
+
+
+class OpponentInferenceAddress(NamedTuple):
+    """Picklable connection details handed to every training worker."""
+
+    address: object
+    authkey: bytes
+
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        while True:
+            chunk = handle.read(1024 * 1024)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _describe_error(error):
+    return f"{type(error).__name__}: {error}"
+
+
+class _ServedClient:
+    """Server-side view of one worker's shared-memory slot."""
+
+    def __init__(self, shm_name, buffer, action_space):
+        self.observation_space = buffer.observation_space
+        self.action_space = action_space
+        self.buffer = buffer
+        self.action_count = int(action_space.n)
+        self.shm = shared_memory.SharedMemory(name=shm_name)
+        self.observation = np.ndarray(
+            (self.buffer.nbytes,), dtype=np.uint8, buffer=self.shm.buf)
+        self.mask = np.ndarray(
+            (self.action_count,), dtype=bool, buffer=self.shm.buf,
+            offset=self.buffer.nbytes)
+
+    def close(self):
+        self.observation = self.mask = None
+        self.shm.close()
+
+
+class _PolicyCache:
+    """Bounded LRU of frozen CPU policies keyed by checkpoint SHA-256."""
+
+    def __init__(self, max_policies):
+        self.max_policies = int(max_policies)
+        self.policies = OrderedDict()
+        self.paths = {}
+        self.loads = 0
+
+    def load(self, path, observation_space, action_space):
+        path = os.path.abspath(os.fspath(path))
+        sha256 = _file_sha256(path)
+        self.paths[sha256] = path
+        self.get(sha256, observation_space, action_space, verify=True)
+        return sha256
+
+    def get(self, sha256, observation_space, action_space, verify=False):
+        policy = self.policies.get(sha256)
+        if policy is None:
+            path = self.paths.get(sha256)
+            if path is None:
+                raise ValueError(f"Unknown checkpoint snapshot {sha256}")
+            if _file_sha256(path) != sha256:
+                raise ValueError(
+                    f"Checkpoint changed on disk since it was staged: {path}")
+            policy = self._load_policy(
+                path, observation_space, action_space, sha256)
+            self.policies[sha256] = policy
+            self.loads += 1
+            while len(self.policies) > self.max_policies:
+                self.policies.popitem(last=False)
+        else:
+            self.policies.move_to_end(sha256)
+        if verify and (policy.observation_space != observation_space
+                       or policy.action_space != action_space):
+            raise ValueError(
+                "Checkpoint policy spaces are incompatible with the "
+                "requesting environment")
+        return policy
+
+    @staticmethod
+    def _load_policy(path, observation_space, action_space, sha256=None):
+        from .environment import AlphaZeroMTGEnv
+        from .policy_export import load_matching_inference_policy
+
+        if sha256 is not None:
+            exported = load_matching_inference_policy(path, {
+                "sha256": sha256, "size": os.path.getsize(path)})
+            if exported is not None:
+                if (exported.observation_space != observation_space
+                        or exported.action_space != action_space):
+                    raise ValueError(
+                        "Checkpoint inference export spaces are incompatible "
+                        "with this environment")
+                return exported
+
+        from sb3_contrib import MaskablePPO
+
+        algorithm = MaskablePPO.load(path, device="cpu")
+        try:
+            if algorithm.observation_space != observation_space:
+                raise ValueError(
+                    "Checkpoint algorithm observation space is incompatible "
+                    "with this environment")
+            if algorithm.action_space != action_space:
+                raise ValueError(
+                    "Checkpoint algorithm action space is incompatible with "
+                    "this environment")
+            return AlphaZeroMTGEnv._freeze_checkpoint_opponent_policy(
+                algorithm.policy)
+        finally:
+            del algorithm
+
+
+def _accept_clients(listener, incoming, lock, wake):
+    while True:
+        try:
+            connection = listener.accept()
+        except (OSError, EOFError):
+            return
+        except Exception:
+            # A failed authentication handshake only drops that connection.
+            continue
+        with lock:
+            incoming.append(connection)
+        try:
+            wake.send_bytes(b"\0")
+        except OSError:
+            return
+
+
+def _serve_opponent_inference(control, authkey, max_policies, batch_window,
+                              torch_threads):
+    """Server process: answer load/predict requests until told to stop."""
+    if torch_threads is not None:
+        import torch
+        torch.set_num_threads(int(torch_threads))
+    listener = Listener(authkey=authkey)
+    wake_reader, wake_writer = multiprocessing.Pipe(duplex=False)
+    incoming = []
+    lock = threading.Lock()
+    threading.Thread(
+        target=_accept_clients,
+        args=(listener, incoming, lock, wake_writer),
+        daemon=True).start()
+    control.send(listener.address)
+
+    policies = _PolicyCache(max_policies)
+    # Clients with equal observation spaces share one buffer, so requests
+    # from different workers land in the same batch group.
+    buffers = []
+    clients = {}
+    pending = {}
+    stats = {"requests": 0, "batches": 0, "largest_batch": 0}
+
+    def drop(connection):
+        client = clients.pop(connection, None)
+        pending.pop(connection, None)
+        if client is not None:
+            client.close()
+        connection.close()
+
+    def receive(connection):
+        try:
+            message = connection.recv()
+        except (EOFError, OSError):
+            drop(connection)
+            return
+        command = message[0]
+        try:
+            if command == "predict":
+                if clients[connection] is None:
+                    raise RuntimeError("Client predicted before attaching")
+                pending[connection] = message[1:]
+                return
+            if command == "attach":
+                _, shm_name, observation_space, action_space = message
+                previous = clients[connection]
+                if previous is not None:
+                    clients[connection] = None
+                    previous.close()
+                buffer = next((
+                    candidate for candidate in buffers
+                    if candidate.observation_space == observation_space),
+                    None)
+                if buffer is None:
+                    buffer = ObservationBuffer(observation_space)
+                    buffers.append(buffer)
+                clients[connection] = _ServedClient(
+                    shm_name, buffer, action_space)
+                reply = None
+            elif command == "load":
+                client = clients[connection]
+                if client is None:
+                    raise RuntimeError("Client loaded before attaching")
+                reply = policies.load(
+                    message[1], client.observation_space, client.action_space)
+            else:
+                raise NotImplementedError(
+                    f"`{command}` is not an inference server command")
+        except Exception as error:
+            connection.send(("error", _describe_error(error)))
+            return
+        connection.send(("ok", reply))
+
+    def run_batches():
+        groups = {}
+        for connection, (sha256, deterministic) in pending.items():
+            groups.setdefault(
+                (id(clients[connection].buffer), sha256,
+                 bool(deterministic)), []).append(connection)
+        pending.clear()
+        for (_, sha256, deterministic), connections in groups.items():
+            first = clients[connections[0]]
+            try:
+                policy = policies.get(
+                    sha256, first.observation_space, first.action_space)
+                rows = np.stack([clients[c].observation for c in connections])
+                masks = np.stack([clients[c].mask for c in connections])
+                observation = {
+                    field.name: rows[:, field.offset:field.offset + field.nbytes]
+                    .view(field.dtype).reshape((len(connections),) + field.shape)
+                    for field in first.buffer.fields}
+                actions, _ = policy.predict(
+                    observation, action_masks=masks,
+                    deterministic=deterministic)
+                actions = np.asarray(actions).reshape(-1)
+                replies = [("ok", int(action)) for action in actions]
+            except Exception as error:
+                replies = [("error", _describe_error(error))] * len(connections)
+            stats["requests"] += len(connections)
+            stats["batches"] += 1
+            stats["largest_batch"] = max(
+                stats["largest_batch"], len(connections))
+            for connection, reply in zip(connections, replies):
+                try:
+                    connection.send(reply)
+                except OSError:
+                    drop(connection)
+
+    try:
+        while True:
+            ready = wait([control, wake_reader, *clients])
+            if control in ready:
+                try:
+                    command = control.recv()
+                except EOFError:
+                    break
+                if command == "close":
+                    break
+                if command == "stats":
+                    control.send(dict(
+                        stats, clients=len(clients),
+                        resident_policies=len(policies.policies),
+                        policy_loads=policies.loads))
+            if wake_reader in ready:
+                wake_reader.recv_bytes()
+                with lock:
+                    accepted, incoming[:] = list(incoming), []
+                for connection in accepted:
+                    clients[connection] = None
+            for connection in ready:
+                if connection in clients:
+                    receive(connection)
+            if not pending:
+                continue
+            # Hold the batch open for the window unless every attached worker
+            # is already waiting on an opponent decision.
+            deadline = time.monotonic() + batch_window
+            while len(pending) < sum(
+                    client is not None for client in clients.values()):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                idle = [c for c in clients if c not in pending]
+                for connection in wait(idle, timeout=remaining):
+                    if connection in clients:
+                        receive(connection)
+            run_batches()
+    except Exception:
+        try:
+            control.send(("error", traceback.format_exc()))
+        except OSError:
+            pass
+    finally:
+        for connection in list(clients):
+            drop(connection)
+        listener.close()
+
+
+class OpponentInferenceServer:
+    """Start and own the batched opponent inference process.
+
+    ``address`` is the picklable ``OpponentInferenceAddress`` passed to each
+    environment's ``opponent_inference`` argument.
+    """
+
+    def __init__(self, max_policies=DEFAULT_MAX_POLICIES,
+                 batch_window=DEFAULT_BATCH_WINDOW_SECONDS,
+                 torch_threads=None, start_method=None):
+        if int(max_policies) < 1:
+            raise ValueError("max_policies must be positive")
+        if not batch_window >= 0:
+            raise ValueError("batch_window must be nonnegative")
+        self.max_policies = int(max_policies)
+        self.batch_window = float(batch_window)
+        if start_method is None:
+            start_method = (
+                "forkserver"
+                if "forkserver" in multiprocessing.get_all_start_methods()
+                else "spawn")
+        context = multiprocessing.get_context(start_method)
+        self._control, child = context.Pipe()
+        authkey = os.urandom(32)
+        self.process = context.Process(
+            target=_serve_opponent_inference,
+            args=(child, authkey, self.max_policies, self.batch_window,
+                  torch_threads),
+            name="OpponentInferenceServer", daemon=True)
+        self.process.start()
+        child.close()
+        self.closed = False
+        try:
+            if not self._control.poll(SERVER_START_TIMEOUT_SECONDS):
+                raise RuntimeError(
+                    "Opponent inference server did not report its address")
+            self.address = OpponentInferenceAddress(
+                self._control.recv(), authkey)
+        except EOFError:
+            self._terminate()
+            raise RuntimeError(
+                "Opponent inference server exited during startup") from None
+        except BaseException:
+            self._terminate()
+            raise
+
+    def stats(self):
+        """Return request/batch counters and resident policy count."""
+        self._control.send("stats")
+        message = self._control.recv()
+        if isinstance(message, tuple) and message[:1] == ("error",):
+            raise RuntimeError(
+                f"Opponent inference server failed:\n{message[1]}")
+        return message
+
+    def _terminate(self):
+        self.closed = True
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join(timeout=10)
+        self._control.close()
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            self._control.send("close")
+        except OSError:
+            pass
+        self.process.join(timeout=10)
+        self._terminate()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class OpponentInferenceClient:
+    """One worker's connection and shared-memory slot on the server."""
+
+    def __init__(self, address, observation_space, action_space):
+        self.observation_space = observation_space
+        self.action_space = action_space
+        self.buffer = ObservationBuffer(observation_space)
+        action_count = int(action_space.n)
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=self.buffer.nbytes + action_count)
+        self._observation = np.ndarray(
+            (self.buffer.nbytes,), dtype=np.uint8, buffer=self._shm.buf)
+        self._mask = np.ndarray(
+            (action_count,), dtype=bool, buffer=self._shm.buf,
+            offset=self.buffer.nbytes)
+        try:
+            self._connection = Client(address.address, authkey=address.authkey)
+            self._request(
+                "attach", self._shm.name, observation_space, action_space)
+        except BaseException:
+            self._release()
+            raise
+
+    def _request(self, *message):
+        self._connection.send(message)
+        status, payload = self._connection.recv()
+        if status != "ok":
+            raise RuntimeError(f"Opponent inference server: {payload}")
+        return payload
+
+    def load(self, path):
+        """Load ``path`` on the server and return its remote policy."""
+        sha256 = self._request("load", os.fspath(path))
+        return RemoteOpponentPolicy(self, sha256)
+
+    def predict(self, sha256, observation, action_masks, deterministic):
+        block = self.buffer.block_of(observation)
+        if block is not None:
+            np.copyto(self._observation, block)
+        else:
+            self.buffer.pack(observation, block=self._observation)
+        if action_masks is None:
+            self._mask.fill(True)
+        else:
+            np.copyto(self._mask, np.asarray(action_masks, dtype=bool)
+                      .reshape(self._mask.shape))
+        return self._request("predict", sha256, bool(deterministic))
+
+    def _release(self):
+        self._observation = self._mask = None
+        try:
+            self._shm.close()
+        finally:
+            self._shm.unlink()
+
+    def close(self):
+        if self._shm is None:
+            return
+        try:
+            self._connection.close()
+        finally:
+            self._release()
+            self._shm = None
+
+
+class RemoteOpponentPolicy:
+    """``predict``-compatible handle to one snapshot held by the server."""
+
+    def __init__(self, client, sha256):
+        self.client = client
+        self.sha256 = sha256
+        self.observation_space = client.observation_space
+        self.action_space = client.action_space
+
+    def predict(self, observation, state=None, episode_start=None,
+                deterministic=False, action_masks=None):
+        action = self.client.predict(
+            self.sha256, observation, action_masks, deterministic)
+        return np.array([action]), None
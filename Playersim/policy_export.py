@@ -0,0 +1,335 @@
+"""Inference-only export of MaskablePPO checkpoint policies.
+
+Evaluation workers, Harvest shards, and frozen checkpoint-pool opponents only
+ever ask a checkpoint for masked actions.  Loading the full SB3 ZIP for that
+rebuilds the algorithm, its rollout buffer, and its optimizer state in every
+process.  An inference export keeps only the actor path -- observation
+preprocessing, feature extractor, policy MLP, and action head -- traced to a
+TorchScript module that plain ``torch`` loads without importing the trainer.
+
+The export is written next to its checkpoint (``name.inference.pt``) and
+records the observation key order, the exact observation/action spaces, and
+the SHA-256 and size of the ZIP it was traced from.  The ZIP remains the
+artifact of record: callers keep running their provenance checks against it
+and only use an export whose recorded source matches the bytes they just
+verified.  A missing or stale export falls back to the full checkpoint load.
+
+Export an existing checkpoint with::
+
+    python -m Playersim.policy_export models/best_model.zip
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import hashlib
+import json
+import logging
+import os
+import warnings
+from pathlib import Path
+
+import numpy as np
+import torch
+from gymnasium import spaces
+
+
+INFERENCE_POLICY_KIND = "playersim_inference_policy"
+INFERENCE_POLICY_FORMAT_VERSION = 1
+INFERENCE_POLICY_SUFFIX = ".inference.pt"
+_METADATA_NAME = "metadata.json"
+# MaskableCategorical's fill for masked logits.
+_MASKED_LOGIT = -1e8
+
+
+def _file_identity(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return {"sha256": digest.hexdigest(), "size": os.path.getsize(path)}
+
+
+def inference_policy_path(checkpoint_path):
+    """Return the export path that sits beside ``checkpoint_path``."""
+    checkpoint = Path(checkpoint_path)
+    if checkpoint.suffix.lower() == ".zip":
+        checkpoint = checkpoint.with_suffix("")
+    return checkpoint.with_name(checkpoint.name + INFERENCE_POLICY_SUFFIX)
+
+
+def _bound_json(values):
+    """Collapse a uniform bound to one scalar to keep metadata small."""
+    values = np.asarray(values)
+    if values.size and np.all(values == values.flat[0]):
+        return values.flat[0].item()
+    return values.tolist()
+
+
+def _space_to_json(space):
+    if isinstance(space, spaces.Box):
+        return {
+            "type": "Box",
+            "shape": list(space.shape),
+            "dtype": np.dtype(space.dtype).name,
+            "low": _bound_json(space.low),
+            "high": _bound_json(space.high),
+        }
+    if isinstance(space, spaces.Discrete):
+        return {"type": "Discrete", "n": int(space.n),
+                "start": int(space.start)}
+    raise ValueError(
+        f"Inference export does not support {type(space).__name__} spaces")
+
+
+def _space_from_json(payload):
+    if payload.get("type") == "Box":
+        dtype = np.dtype(payload["dtype"])
+        shape = tuple(int(size) for size in payload["shape"])
+        return spaces.Box(
+            low=np.broadcast_to(np.asarray(payload["low"], dtype=dtype), shape),
+            high=np.broadcast_to(
+                np.asarray(payload["high"], dtype=dtype), shape),
+            shape=shape, dtype=dtype)
+    if payload.get("type") == "Discrete":
+        return spaces.Discrete(int(payload["n"]), start=int(payload["start"]))
+    raise RuntimeError(
+        f"Inference export has an unknown space type {payload.get('type')!r}")
+
+
+class _ActorPath(torch.nn.Module):
+    """The part of an SB3 actor-critic policy that chooses actions."""
+
+    def __init__(self, policy):
+        super().__init__()
+        self.observation_space = policy.observation_space
+        self.normalize_images = policy.normalize_images
+        self.features_extractor = policy.pi_features_extractor
+        self.mlp_extractor = policy.mlp_extractor
+        self.action_net = policy.action_net
+
+    def forward(self, observations):
+        from stable_baselines3.common.preprocessing import preprocess_obs
+
+        features = self.features_extractor(preprocess_obs(
+            observations, self.observation_space,
+            normalize_images=self.normalize_images))
+        return self.action_net(self.mlp_extractor.forward_actor(features))
+
+
+def trace_inference_policy(policy, source_checkpoint):
+    """Trace ``policy``'s actor path into an in-memory ``InferencePolicy``.
+
+    ``source_checkpoint`` is the ``{"sha256": ..., "size": ...}`` identity of
+    the ZIP ``policy`` was saved to or loaded from.
+    """
+    observation_space = policy.observation_space
+    action_space = policy.action_space
+    if not isinstance(observation_space, spaces.Dict):
+        raise ValueError("Inference export requires a Dict observation space")
+    if not isinstance(action_space, spaces.Discrete):
+        raise ValueError("Inference export requires a Discrete action space")
+    keys = list(observation_space.spaces)
+    metadata = {
+        "kind": INFERENCE_POLICY_KIND,
+        "format_version": INFERENCE_POLICY_FORMAT_VERSION,
+        "observation_keys": keys,
+        "observation_spaces": {
+            key: _space_to_json(observation_space[key]) for key in keys},
+        "action_space": _space_to_json(action_space),
+        "source_checkpoint": {
+            "sha256": str(source_checkpoint["sha256"]),
+            "size": int(source_checkpoint["size"]),
+        },
+    }
+    example = {
+        key: torch.as_tensor(
+            np.stack([observation_space[key].sample() for _ in range(2)]),
+            dtype=torch.float32)
+        for key in keys}
+    # Trace a CPU copy so a learner's live policy keeps its device and mode.
+    actor = copy.deepcopy(_ActorPath(policy)).cpu().eval()
+    with torch.no_grad(), warnings.catch_warnings():
+        # The actor path has no data-dependent control flow; the LSTM's
+        # shape assertions are the only trace-time constants, and re-running
+        # the trace to check it would double the export time.
+        warnings.simplefilter("ignore", torch.jit.TracerWarning)
+        traced = torch.jit.trace(
+            actor, (example,), strict=False, check_trace=False)
+    for parameter in traced.parameters():
+        parameter.requires_grad_(False)
+    return InferencePolicy(traced, metadata)
+
+
+def export_inference_policy(policy, checkpoint_path, output_path=None):
+    """Trace ``policy`` and write it beside ``checkpoint_path``.
+
+    ``policy`` must be the policy saved in ``checkpoint_path``; the export
+    records that file's SHA-256 and size.  Returns the written export path.
+    The file is published atomically so concurrent readers see either no
+    export or a complete one.
+    """
+    inference = trace_inference_policy(
+        policy, _file_identity(checkpoint_path))
+    output = Path(output_path or inference_policy_path(checkpoint_path))
+    temporary = output.with_name(f".{output.name}.{os.getpid()}.tmp")
+    try:
+        torch.jit.save(inference.module, str(temporary), _extra_files={
+            _METADATA_NAME: json.dumps(inference.metadata, sort_keys=True)})
+        os.replace(temporary, output)
+    finally:
+        if temporary.exists():
+            temporary.unlink()
+    return output
+
+
+class InferencePolicy:
+    """Masked action selection from an inference export.
+
+    ``predict`` accepts the arguments of ``MaskableActorCriticPolicy.predict``
+    and returns the same shapes, so the export is a drop-in replacement on
+    every prediction-only path.
+    """
+
+    def __init__(self, module, metadata):
+        self.module = module
+        self.metadata = metadata
+        self.observation_keys = tuple(metadata["observation_keys"])
+        self.observation_space = spaces.Dict([
+            (key, _space_from_json(metadata["observation_spaces"][key]))
+            for key in self.observation_keys])
+        self.action_space = _space_from_json(metadata["action_space"])
+        self.source_checkpoint = dict(metadata["source_checkpoint"])
+
+    def _observation_tensors(self, observation):
+        if not isinstance(observation, dict):
+            raise ValueError("Inference policy expects a dict observation")
+        tensors = {}
+        vectorized = None
+        for key in self.observation_keys:
+            if key not in observation:
+                raise ValueError(f"Observation is missing field {key!r}")
+            value = np.asarray(observation[key])
+            shape = self.observation_space[key].shape
+            if value.shape == shape:
+                batched = False
+            elif value.shape[1:] == shape:
+                batched = True
+            else:
+                raise ValueError(
+                    f"Observation field {key!r} has shape {value.shape}; "
+                    f"expected {shape} or (n_envs,) + {shape}")
+            if vectorized is None:
+                vectorized = batched
+            elif vectorized != batched:
+                raise ValueError(
+                    "Observation mixes batched and unbatched fields")
+            tensors[key] = torch.as_tensor(
+                value, dtype=torch.float32).reshape((-1,) + shape)
+        return tensors, bool(vectorized)
+
+    def action_logits(self, observation):
+        """Return unmasked action logits and whether the input was batched."""
+        tensors, vectorized = self._observation_tensors(observation)
+        with torch.no_grad():
+            return self.module(tensors), vectorized
+
+    def predict(self, observation, state=None, episode_start=None,
+                deterministic=False, action_masks=None):
+        logits, vectorized = self.action_logits(observation)
+        if action_masks is not None:
+            masks = torch.as_tensor(
+                np.asarray(action_masks, dtype=bool).reshape(logits.shape))
+            logits = torch.where(
+                masks, logits, torch.full_like(logits, _MASKED_LOGIT))
+        if deterministic:
+            actions = torch.argmax(logits, dim=1)
+        else:
+            actions = torch.distributions.Categorical(logits=logits).sample()
+        actions = actions.cpu().numpy() + int(self.action_space.start)
+        if not vectorized:
+            actions = actions.squeeze(axis=0)
+        return actions, state
+
+
+def load_inference_policy(path, source_checkpoint=None):
+    """Load an export, optionally requiring it to match source ZIP identity.
+
+    ``source_checkpoint`` is a ``{"sha256": ..., "size": ...}`` identity of
+    the checkpoint the caller has already verified; ``size`` may be omitted.
+    Raises ``RuntimeError`` for an unknown format or a different source.
+    """
+    extra_files = {_METADATA_NAME: ""}
+    module = torch.jit.load(str(path), map_location="cpu",
+                            _extra_files=extra_files)
+    try:
+        metadata = json.loads(extra_files[_METADATA_NAME])
+    except ValueError as error:
+        raise RuntimeError(
+            f"Inference export metadata is unreadable: {error}") from error
+    if not isinstance(metadata, dict) or metadata.get(
+            "kind") != INFERENCE_POLICY_KIND:
+        raise RuntimeError("Inference export has an unknown artifact kind")
+    if metadata.get("format_version") != INFERENCE_POLICY_FORMAT_VERSION:
+        raise RuntimeError(
+            "Inference export format version "
+            f"{metadata.get('format_version')!r} is not supported")
+    if source_checkpoint is not None:
+        recorded = metadata.get("source_checkpoint") or {}
+        expected_size = source_checkpoint.get("size")
+        if (recorded.get("sha256") != source_checkpoint.get("sha256")
+                or (expected_size is not None
+                    and recorded.get("size") != expected_size)):
+            raise RuntimeError(
+                "Inference export was traced from a different checkpoint")
+    module.eval()
+    for parameter in module.parameters():
+        parameter.requires_grad_(False)
+    return InferencePolicy(module, metadata)
+
+
+def load_matching_inference_policy(checkpoint_path, source_checkpoint):
+    """Return the export beside a verified checkpoint, or ``None``.
+
+    A missing export is the normal case for checkpoints that were never
+    exported.  An unreadable or stale export is logged and ignored so the
+    caller falls back to the full checkpoint it has already verified.
+    """
+    path = inference_policy_path(checkpoint_path)
+    if not path.is_file():
+        return None
+    try:
+        return load_inference_policy(path, source_checkpoint)
+    except (OSError, RuntimeError) as error:
+        logging.warning("Ignoring inference export %s: %s", path, error)
+        return None
+
+
+def export_checkpoint(checkpoint_path, output_path=None):
+    """Load a MaskablePPO checkpoint and write its inference export."""
+    import main as _training_entrypoint  # noqa: F401 - registers custom policy classes
+    from sb3_contrib import MaskablePPO
+
+    algorithm = MaskablePPO.load(str(checkpoint_path), device="cpu")
+    return export_inference_policy(
+        algorithm.policy, checkpoint_path, output_path)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Write inference-only exports of MaskablePPO checkpoints.")
+    parser.add_argument("checkpoints", nargs="+", type=Path,
+                        help="checkpoint ZIP files to export")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    for checkpoint in args.checkpoints:
+        print(export_checkpoint(checkpoint))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
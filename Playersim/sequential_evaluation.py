@@ -0,0 +1,119 @@
+"""Sequential stopping for paired-seat evaluation and qualification.
+
+Both the periodic fixed-suite evaluation and ``harvest_protocol.py qualify``
+score a candidate in seat-swapped pairs: the same seed and matchup played
+once from each seat.  A pair's unit score is the mean of its two game points
+(win 1, draw 0.5, loss or timeout 0), so it lies in ``[0, 1]``.
+
+``sequential_score_test`` runs Wald's sequential probability ratio test on
+those units.  With a qualification threshold ``t`` and an indifference
+margin ``d`` it weighs ``mean <= t - d`` (fail) against ``mean >= t + d``
+(pass) through the Bernoulli likelihood ratio
+
+    LR_n = prod (p1 / p0) ** x_i * ((1 - p1) / (1 - p0)) ** (1 - x_i)
+
+The ratio is convex in each ``x_i``, so for any unit bounded in ``[0, 1]``
+whose mean is at most ``p0`` it is still a nonnegative supermartingale.
+Ville's inequality then bounds the chance that it ever reaches
+``1 / error_rate``, so the test may be checked after every pair and
+stopped at the first crossing without inflating either error rate.  Pairs
+are treated as exchangeable draws from the matchup distribution, the same
+assumption the fixed-sample interval makes.
+
+A test that never crosses either bound leaves the decision to the caller's
+fixed-sample rule once the configured game budget is spent.
+"""
+
+from __future__ import annotations
+
+import math
+
+
+SEQUENTIAL_TEST_METHOD = "bounded-bernoulli-sprt-v1"
+DEFAULT_SEQUENTIAL_ERROR_RATE = 0.05
+DEFAULT_SEQUENTIAL_INDIFFERENCE = 0.05
+
+
+def sequential_test_config(threshold, *,
+                           error_rate=DEFAULT_SEQUENTIAL_ERROR_RATE,
+                           indifference=DEFAULT_SEQUENTIAL_INDIFFERENCE):
+    """Return the validated, JSON-ready stopping rule for ``threshold``.
+
+    ``error_rate`` bounds both the chance of passing a candidate whose mean
+    unit score is at most ``threshold - indifference`` and the chance of
+    failing one whose mean is at least ``threshold + indifference``.
+    """
+    threshold = float(threshold)
+    error_rate = float(error_rate)
+    indifference = float(indifference)
+    if not 0.0 < error_rate < 0.5:
+        raise ValueError("sequential error rate must be between 0 and 0.5")
+    if not 0.0 < indifference < 0.5:
+        raise ValueError(
+            "sequential indifference margin must be between 0 and 0.5")
+    null_score = threshold - indifference
+    alternative_score = threshold + indifference
+    if not 0.0 < null_score < alternative_score < 1.0:
+        raise ValueError(
+            "sequential testing needs threshold +/- indifference strictly "
+            "inside (0, 1)")
+    bound = math.log(1.0 / error_rate)
+    return {
+        "method": SEQUENTIAL_TEST_METHOD,
+        "unit": "seat-swapped pair mean score",
+        "threshold": threshold,
+        "error_rate": error_rate,
+        "indifference": indifference,
+        "null_score": null_score,
+        "alternative_score": alternative_score,
+        "pass_log_bound": bound,
+        "fail_log_bound": -bound,
+    }
+
+
+def sequential_score_test(units, config, previous=None):
+    """Run the stopping rule over pair units in play order.
+
+    Returns the rule with its evidence: the log likelihood ratio and unit
+    count at the first bound crossing (or over every unit when no bound is
+    crossed), and ``decision`` as ``"pass"``, ``"fail"`` or ``None``.
+
+    ``previous`` is an earlier result of the same rule; ``units`` then holds
+    only the pairs played since, so a caller testing after every stage never
+    re-reads the pairs it already scored.  A settled ``previous`` is final.
+    """
+    if previous is not None and previous["decision"] is not None:
+        return dict(previous)
+    null_score = config["null_score"]
+    alternative_score = config["alternative_score"]
+    win_weight = math.log(alternative_score / null_score)
+    loss_weight = math.log((1.0 - alternative_score) / (1.0 - null_score))
+    log_ratio = 0.0
+    decision = None
+    used = 0
+    total = 0.0
+    if previous is not None:
+        log_ratio = previous["log_likelihood_ratio"]
+        used = previous["units"]
+        total = (previous["mean_unit_score"] or 0.0) * used
+    for unit in units:
+        unit = float(unit)
+        if not 0.0 <= unit <= 1.0:
+            raise ValueError(
+                f"sequential test units must lie in [0, 1], got {unit}")
+        used += 1
+        total += unit
+        log_ratio += unit * win_weight + (1.0 - unit) * loss_weight
+        if log_ratio >= config["pass_log_bound"]:
+            decision = "pass"
+            break
+        if log_ratio <= config["fail_log_bound"]:
+            decision = "fail"
+            break
+    return {
+        **config,
+        "units": used,
+        "mean_unit_score": total / used if used else None,
+        "log_likelihood_ratio": log_ratio,
+        "decision": decision,
+    }
@@ -0,0 +1,187 @@
+"""Per-phase step latency histograms for environment workers.
+
+``StepLatencyRecorder`` splits every agent decision's wall time into the
+engine phases that dominate it: action-mask generation, action execution,
+state-based action and trigger processing, observation building, strategic
+planner features, and the opponent's policy.  Phases are measured
+exclusively, so time spent in a nested phase (the masks an observation
+regenerates, the SBAs an action runs) is charged to the nested phase only.
+
+Samples land in fixed logarithmic buckets, four per power of two from one
+microsecond to about a minute, keyed by ``(phase, action category, game
+phase)``.  Recording a sample is an integer bucket computation and one dict
+increment; the environment ships the sparse counts through ``info`` at the
+end of each episode and the trainer merges and logs percentiles.
+
+Environment phases are timed by wrapping the environment's own bound methods
+on the instance.  Engine subsystems are deep-copied by transaction
+checkpoints, so they are never patched: ``GameState`` carries the recorder in
+its ``latency_recorder`` slot and its SBA and trigger entry points report to
+it directly.  An environment without a recorder runs exactly the code it
+always ran.
+"""
+
+from __future__ import annotations
+
+import functools
+import time
+
+import numpy as np
+
+
+STEP_STAGE = "step"
+SBA_TRIGGER_STAGE = "sba_triggers"
+LATENCY_STAGES = (
+    "mask_generation",
+    "action_execution",
+    SBA_TRIGGER_STAGE,
+    "observation",
+    "planner_features",
+    "opponent_policy",
+    STEP_STAGE,
+)
+SUB_BUCKETS = 4
+BUCKET_COUNT = 100
+LATENCY_QUANTILES = (0.5, 0.95, 0.99)
+
+# Environment methods timed as (method name, stage).
+_INSTRUMENTED_METHODS = (
+    ("action_mask", "mask_generation"),
+    ("_apply_handler_action", "action_execution"),
+    ("_get_obs", "observation"),
+    ("_populate_strategic_planner_features", "planner_features"),
+    ("_populate_tactical_planner_features", "planner_features"),
+    ("_get_opponent_policy_action", "opponent_policy"),
+)
+
+
+def latency_bucket(nanoseconds):
+    """Return the histogram bucket for a duration in nanoseconds."""
+    micros = int(nanoseconds) // 1000
+    if micros < SUB_BUCKETS:
+        return max(micros, 0)
+    exponent = micros.bit_length() - 1
+    index = ((exponent - 1) * SUB_BUCKETS
+             + ((micros >> (exponent - 2)) & (SUB_BUCKETS - 1)))
+    return min(index, BUCKET_COUNT - 1)
+
+
+def bucket_upper_bound_ms(index):
+    """Return the exclusive upper edge of ``index`` in milliseconds."""
+    index = int(index)
+    if index < SUB_BUCKETS:
+        return (index + 1) / 1000.0
+    exponent = index // SUB_BUCKETS + 1
+    sub_bucket = index % SUB_BUCKETS
+    return ((SUB_BUCKETS + sub_bucket + 1) << (exponent - 2)) / 1000.0
+
+
+def histogram_percentiles(counts, quantiles=LATENCY_QUANTILES):
+    """Return ``{quantile: milliseconds}`` from dense bucket counts.
+
+    Each percentile reports its bucket's upper edge, so the estimate never
+    understates a tail by more than one bucket width (about 25%).
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    total = int(counts.sum())
+    if total <= 0:
+        return {}
+    cumulative = np.cumsum(counts)
+    return {
+        quantile: bucket_upper_bound_ms(int(np.searchsorted(
+            cumulative, max(1, int(np.ceil(quantile * total))))))
+        for quantile in quantiles
+    }
+
+
+def merge_latency_histograms(target, payload):
+    """Add one episode's sparse ``payload`` into dense ``target`` arrays."""
+    for key, buckets in (payload or {}).items():
+        dense = target.get(key)
+        if dense is None:
+            dense = target[key] = np.zeros(BUCKET_COUNT, dtype=np.int64)
+        for index, count in buckets.items():
+            dense[int(index)] += int(count)
+    return target
+
+
+class StepLatencyRecorder:
+    """Accumulate exclusive per-stage decision latency for one environment."""
+
+    def __init__(self, clock=time.perf_counter_ns):
+        self._clock = clock
+        self._histograms = {}
+        self._stage_totals = {}
+        # Open stages: [stage, start_ns, nested_ns].
+        self._open = []
+        self._step_started = None
+        self._step_key = ("unknown", "unknown")
+
+    def begin_step(self, action_category, game_phase):
+        """Start one agent decision made in ``game_phase``."""
+        self._stage_totals = {}
+        self._step_key = (str(action_category), str(game_phase))
+        self._step_started = self._clock()
+
+    def end_step(self):
+        """Close the current decision and bucket every stage it touched."""
+        if self._step_started is None:
+            return
+        elapsed = self._clock() - self._step_started
+        self._step_started = None
+        self._stage_totals[STEP_STAGE] = elapsed
+        category, phase = self._step_key
+        for stage, total in self._stage_totals.items():
+            buckets = self._histograms.setdefault((stage, category, phase), {})
+            bucket = latency_bucket(total)
+            buckets[bucket] = buckets.get(bucket, 0) + 1
+        self._stage_totals = {}
+
+    def enter(self, stage):
+        """Open a timed ``stage``; every ``enter`` needs a matching ``exit``."""
+        self._open.append([stage, self._clock(), 0])
+
+    def exit(self):
+        """Close the innermost open stage."""
+        stage, started, nested = self._open.pop()
+        elapsed = self._clock() - started
+        if self._open:
+            self._open[-1][2] += elapsed
+        if self._step_started is not None:
+            self._stage_totals[stage] = (
+                self._stage_totals.get(stage, 0) + elapsed - nested)
+
+    def timed(self, stage, method):
+        """Return ``method`` wrapped to charge its exclusive time to ``stage``."""
+        recorder = self
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            recorder.enter(stage)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                recorder.exit()
+
+        wrapper._latency_stage = stage
+        return wrapper
+
+    def instrument(self, env):
+        """Wrap ``env``'s phase methods so they report to this recorder."""
+        for method_name, stage in _INSTRUMENTED_METHODS:
+            method = getattr(env, method_name)
+            if getattr(method, "_latency_stage", None) is None:
+                setattr(env, method_name, self.timed(stage, method))
+
+    def drain(self):
+        """Return and clear the sparse histograms recorded so far.
+
+        The payload maps ``"stage/action_category/game_phase"`` to
+        ``{bucket: count}``.
+        """
+        payload = {
+            "/".join(key): dict(buckets)
+            for key, buckets in self._histograms.items()
+        }
+        self._histograms = {}
+        return payload
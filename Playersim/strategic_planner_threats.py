@@ -22,6 +22,14 @@ class ThreatSynergyMixin:
 
     __slots__ = ()
 
+    # Per-category caps applied by identify_card_synergies, in the order used
+    # by card_synergy_terms, and the cap on the summed score.
+    SYNERGY_CATEGORY_CAPS = {
+        "tribal": 3.0, "mechanic": 4.0, "color": 2.0, "curve": 2.0,
+        "ability": 3.0, "combo": 5.0, "keyword": 2.5, "archetypes": 3.0,
+    }
+    SYNERGY_TOTAL_CAP = 10.0
+
     def analyze_game_state(self):
         """
         Perform a comprehensive analysis of the current game state.
@@ -529,8 +537,10 @@ class ThreatSynergyMixin:
                     tribal_synergy_cards.append(comp_card)
             
             # Cap tribal synergy at a reasonable value but allow for high synergy
-            synergy_value += min(3.0, tribal_synergy)
-            synergy_details["tribal"] = min(3.0, tribal_synergy)
+            tribal_synergy = min(
+                self.SYNERGY_CATEGORY_CAPS["tribal"], tribal_synergy)
+            synergy_value += tribal_synergy
+            synergy_details["tribal"] = tribal_synergy
             synergy_details["tribal_cards"] = list(set([c.name if hasattr(c, 'name') else "Unknown Card" for c in tribal_synergy_cards]))
             if tribal_lords:
                 synergy_details["tribal_lords"] = list(set([c.name if hasattr(c, 'name') else "Unknown Card" for c in tribal_lords]))
@@ -687,8 +697,10 @@ class ThreatSynergyMixin:
                 }
         
         # Cap mechanic synergy at a reasonable value
-        synergy_value += min(4.0, mechanic_synergy)
-        synergy_details["mechanic"] = min(4.0, mechanic_synergy)
+        mechanic_synergy = min(
+            self.SYNERGY_CATEGORY_CAPS["mechanic"], mechanic_synergy)
+        synergy_value += mechanic_synergy
+        synergy_details["mechanic"] = mechanic_synergy
         if mechanic_details:
             synergy_details["mechanic_details"] = mechanic_details
 
@@ -759,8 +771,10 @@ class ThreatSynergyMixin:
                                 color_match_cards.append(comp_card.name if hasattr(comp_card, 'name') else "Unknown Card")
             
             # Cap color synergy and add to details
-            synergy_value += min(2.0, color_synergy)
-            synergy_details["color"] = min(2.0, color_synergy)
+            color_synergy = min(
+                self.SYNERGY_CATEGORY_CAPS["color"], color_synergy)
+            synergy_value += color_synergy
+            synergy_details["color"] = color_synergy
             if color_match_cards:
                 synergy_details["color_cards"] = color_match_cards
     
@@ -809,8 +823,7 @@ class ThreatSynergyMixin:
                             curve_synergy_cards.append(comp_card.name if hasattr(comp_card, 'name') else "Unknown Card")
                 
                 # Value for early card draw/filtering
-                if "draw" in card_text or "scry" in card_text:
-                    curve_synergy += 0.3
+                curve_synergy += self._card_synergy_baseline(card)["curve"]
             
             # Look for cost reduction effects
             for comp_card in comparison_cards:
@@ -825,8 +838,10 @@ class ThreatSynergyMixin:
                     curve_synergy_cards.append(comp_card.name if hasattr(comp_card, 'name') else "Unknown Card")
             
             # Add curve synergy
-            synergy_value += min(2.0, curve_synergy)
-            synergy_details["curve"] = min(2.0, curve_synergy)
+            curve_synergy = min(
+                self.SYNERGY_CATEGORY_CAPS["curve"], curve_synergy)
+            synergy_value += curve_synergy
+            synergy_details["curve"] = curve_synergy
             if curve_synergy_cards:
                 synergy_details["curve_cards"] = curve_synergy_cards
         
@@ -884,8 +899,10 @@ class ThreatSynergyMixin:
                         ability_synergy_cards.append(comp_card.name if hasattr(comp_card, 'name') else "Unknown Card")
         
         # Add ability synergy
-        synergy_value += min(3.0, ability_synergy)
-        synergy_details["ability"] = min(3.0, ability_synergy)
+        ability_synergy = min(
+            self.SYNERGY_CATEGORY_CAPS["ability"], ability_synergy)
+        synergy_value += ability_synergy
+        synergy_details["ability"] = ability_synergy
         if ability_synergy_cards:
             synergy_details["ability_cards"] = list(set(ability_synergy_cards))
         
@@ -975,8 +992,11 @@ class ThreatSynergyMixin:
                         combo_cards.append(comp_card.name if hasattr(comp_card, 'name') else "Unknown Card")
         
         # Add combo synergy
-        synergy_value += min(5.0, combo_synergy)  # Allow higher cap for powerful combos
-        synergy_details["combo"] = min(5.0, combo_synergy)
+        # The combo cap is higher to allow for powerful combos
+        combo_synergy = min(
+            self.SYNERGY_CATEGORY_CAPS["combo"], combo_synergy)
+        synergy_value += combo_synergy
+        synergy_details["combo"] = combo_synergy
         if combo_cards:
             synergy_details["combo_cards"] = list(set(combo_cards))
         
@@ -1052,8 +1072,10 @@ class ThreatSynergyMixin:
                                 keyword_synergy_cards[keyword].append(comp_name)
         
         # Add keyword synergy
-        synergy_value += min(2.5, keyword_synergy)
-        synergy_details["keyword"] = min(2.5, keyword_synergy)
+        keyword_synergy = min(
+            self.SYNERGY_CATEGORY_CAPS["keyword"], keyword_synergy)
+        synergy_value += keyword_synergy
+        synergy_details["keyword"] = keyword_synergy
         if keyword_synergy_cards:
             synergy_details["keyword_synergy"] = keyword_synergy_cards
         
@@ -1101,8 +1123,10 @@ class ThreatSynergyMixin:
                     archetype_match_cards.append((comp_name, archetype))
         
         # Add archetype synergy
-        synergy_value += min(3.0, archetype_synergy)
-        synergy_details["archetypes"] = min(3.0, archetype_synergy)
+        archetype_synergy = min(
+            self.SYNERGY_CATEGORY_CAPS["archetypes"], archetype_synergy)
+        synergy_value += archetype_synergy
+        synergy_details["archetypes"] = archetype_synergy
         if archetype_match_cards:
             archetype_cards = {}
             for card_name, archetype in archetype_match_cards:
@@ -1114,10 +1138,52 @@ class ThreatSynergyMixin:
         
         # Final synergy calculation - cap total value to prevent extreme scores
         # but allow for really powerful combinations to score highly
-        final_synergy = min(float(synergy_value), 10.0)
+        final_synergy = min(float(synergy_value), self.SYNERGY_TOTAL_CAP)
         
         return final_synergy, synergy_details
 
+    def _card_synergy_baseline(self, card):
+        """Category values a card scores against any non-empty comparison.
+
+        Every other identify_card_synergies term is a sum over comparison
+        cards; this is the only per-card constant.
+        """
+        card_text = (
+            card.oracle_text.lower() if hasattr(card, 'oracle_text') else "")
+        card_cmc = card.cmc if hasattr(card, 'cmc') else 0
+        curve = 0.0
+        if hasattr(card, 'cmc') and card_cmc <= 2:
+            if "draw" in card_text or "scry" in card_text:
+                curve = 0.3
+        return {"curve": curve}
+
+    def card_synergy_terms(self, card_id, other_id):
+        """Return ``(terms, baseline)`` for one ordered pair of cards.
+
+        ``terms`` holds each SYNERGY_CATEGORY_CAPS category's contribution of
+        ``other_id`` to ``card_id``'s synergy, without the per-card baseline.
+        Because every contribution is nonnegative, the full score against a
+        multiset of comparison cards is reproduced exactly by summing terms,
+        adding the baseline, applying each category cap, then the total cap
+        (capping a single pair cannot change a capped sum).
+        """
+        categories = tuple(self.SYNERGY_CATEGORY_CAPS)
+        terms = np.zeros(len(categories), dtype=np.float64)
+        baseline = np.zeros(len(categories), dtype=np.float64)
+        card = self.game_state._safe_get_card(card_id)
+        if not card:
+            return terms, baseline
+        card_baseline = self._card_synergy_baseline(card)
+        for index, category in enumerate(categories):
+            baseline[index] = card_baseline.get(category, 0.0)
+        if other_id == card_id:
+            return terms, baseline
+        _, details = self.identify_card_synergies(card_id, [other_id], [])
+        for index, category in enumerate(categories):
+            terms[index] = max(
+                0.0, float(details.get(category, 0.0)) - baseline[index])
+        return terms, baseline
+
     def advanced_position_evaluation(self):
         """
         Evaluate the current board position using comprehensive strategic metrics.
@@ -0,0 +1,172 @@
+"""Preloaded worker templates for copy-on-write sharing on Linux.
+
+A spawned or forkserver worker starts from an empty interpreter: it imports
+torch, SB3, and the whole ``Playersim`` package and unpickles its own copy
+of the card database before it builds an environment.  With many workers
+that is the dominant startup cost and most of the resident memory.
+
+``start_worker_template`` starts one template process through forkserver.
+The template imports the heavy modules, unpickles every worker's target and
+arguments in a single pass -- so the card database the environment factories
+share arrives as one object -- moves all of it into the permanent GC
+generation with ``gc.freeze()``, and then forks the workers.  The workers
+share those pages copy-on-write, and their collections never write to the
+frozen objects' GC headers.  The template reaps the workers and exits after
+the last one; terminating the template terminates them.
+
+``frozen_for_fork`` applies the same discipline when the current process is
+itself a safe template, as the Harvest protocol parent is.  Platforms
+without ``fork`` (Windows) keep launching spawned workers.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gc
+import importlib
+import multiprocessing
+import signal
+import sys
+from multiprocessing.connection import Connection
+
+
+TEMPLATE_START_METHOD = "template"
+TEMPLATE_PRELOAD_MODULES = (
+    "numpy",
+    "torch",
+    "gymnasium",
+    "stable_baselines3",
+    "sb3_contrib",
+    "Playersim.environment",
+)
+
+
+def template_supported():
+    """Return whether workers may be forked from a preloaded template."""
+    methods = multiprocessing.get_all_start_methods()
+    return (sys.platform.startswith("linux")
+            and "fork" in methods and "forkserver" in methods)
+
+
+def preload_modules(modules=TEMPLATE_PRELOAD_MODULES):
+    """Import ``modules`` so forked children inherit them initialized."""
+    for name in modules:
+        importlib.import_module(name)
+
+
+@contextlib.contextmanager
+def frozen_for_fork():
+    """Freeze every live object while children are forked from this process.
+
+    Objects that exist on entry move to the permanent generation, so the
+    collectors of children forked inside the block never touch their pages.
+    The parent's objects return to normal collection on exit.
+    """
+    gc.collect()
+    gc.freeze()
+    try:
+        yield
+    finally:
+        gc.unfreeze()
+
+
+class _ConnectionSlot:
+    """Placeholder for a connection sent beside the cloudpickled workers."""
+
+    def __init__(self, index):
+        self.index = index
+
+
+def _worker_main(target, args):
+    # Workers start with the signal handling of a freshly spawned process,
+    # not the template's.
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGTERM})
+    target(*args)
+
+
+def _template_main(workers, connections, modules):
+    # Ctrl-C reaches the whole process group; the workers handle it, and the
+    # template keeps reaping them until they exit.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    preload_modules(modules)
+    workers = [
+        (target, tuple(
+            connections[arg.index] if isinstance(arg, _ConnectionSlot)
+            else arg for arg in args))
+        for target, args in workers.var]
+    fork_context = multiprocessing.get_context("fork")
+    children = []
+
+    def stop(_signum, _frame):
+        for child in children:
+            if child.is_alive():
+                child.terminate()
+        for child in children:
+            child.join(timeout=10)
+        sys.exit(1)
+
+    # The parent starts the template as a daemon so an abandoned pool never
+    # blocks interpreter exit; its own children are daemonic as well.
+    multiprocessing.current_process().daemon = False
+    gc.collect()
+    gc.freeze()
+    # A SIGTERM that arrives while forking waits until every worker is in
+    # ``children``, so ``stop`` never leaves one running.
+    signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGTERM})
+    for target, args in workers:
+        child = fork_context.Process(
+            target=_worker_main, args=(target, args), daemon=True)
+        child.start()
+        children.append(child)
+    signal.signal(signal.SIGTERM, stop)
+    signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGTERM})
+    # Only the workers may hold their pipe ends, or a dead worker would
+    # never look closed to the parent.
+    for connection in connections:
+        connection.close()
+    del workers, connections
+    failed = False
+    for child in children:
+        child.join()
+        failed = failed or child.exitcode != 0
+    sys.exit(1 if failed else 0)
+
+
+def start_worker_template(workers, modules=TEMPLATE_PRELOAD_MODULES):
+    """Start a template that preloads ``modules`` and forks ``workers``.
+
+    ``workers`` is a sequence of ``(target, args)`` pairs.  Every pair is
+    cloudpickled together, so objects the arguments share are shared by the
+    forked workers too; wrapping an argument in its own
+    ``CloudpickleWrapper`` would give each worker a private copy.  ``args``
+    may hold ``multiprocessing`` connections, which are transferred to the
+    template at start.  Returns the started template process.
+    """
+    from stable_baselines3.common.vec_env.base_vec_env import (
+        CloudpickleWrapper)
+
+    if not template_supported():
+        raise RuntimeError(
+            "Worker templates require fork and forkserver on Linux")
+    connections = []
+    slotted = []
+    for target, args in workers:
+        slotted_args = []
+        for arg in args:
+            if isinstance(arg, Connection):
+                slotted_args.append(_ConnectionSlot(len(connections)))
+                connections.append(arg)
+            else:
+                slotted_args.append(arg)
+        slotted.append((target, tuple(slotted_args)))
+    context = multiprocessing.get_context("forkserver")
+    template = context.Process(
+        target=_template_main,
+        args=(CloudpickleWrapper(slotted), connections, tuple(modules)),
+        daemon=True,
+        name="worker-template",
+    )
+    template.start()
+    return template
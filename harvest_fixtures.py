@@ -8,18 +8,28 @@ or pre-fix statistics.
 Example::
 
     python harvest_fixtures.py --games 8 --seed 42 --output harvest_runs/seed_42
+
+``--benchmark`` also writes ``benchmark.json`` with games/sec, steps/sec and
+the time spent in environment resets and steps, policy inference and
+artifact validation.  Pass an earlier report as ``--benchmark-baseline`` to
+fail (exit status 2) when throughput on the same schedule regresses.
 """
 
 from __future__ import annotations
 
 import argparse
+import contextlib
+import copy
 import gzip
 import hashlib
 import json
 import logging
 import math
+import os
+import platform
 import random
 import sys
+import time
 from collections import Counter
 from pathlib import Path
 from typing import Iterable, Sequence
@@ -38,6 +48,18 @@ CONCEDE_ACTION = 12
 NO_OP_ACTION = 224
 HARVEST_VERSION = "fixture-harvest-v2"
 VALID_RESULTS = {"win", "loss", "draw", "draw_both_loss"}
+SEVERITY_RANK = {"partial": 0, "unparsed": 1, "crash": 2}
+HARVEST_ARTIFACTS = (
+    "game_log.jsonl", "fidelity_report.json", "card_support_manifest.json",
+)
+# Exclusive wall-clock phases of a harvest run (see ``HarvestTimer``).
+TIMING_PHASES = (
+    "env_reset", "env_step", "policy_inference", "artifact_validation",
+    "tracker_validation",
+)
+BENCHMARK_SCHEMA_VERSION = 1
+DEFAULT_BENCHMARK_TOLERANCE = 0.15
+BENCHMARK_METRICS = ("games_per_second", "steps_per_second")
 FIDELITY_COUNTERS = (
     "unimplemented_action", "unparsed_mana", "unparsed_modal", "unparsed_effects",
     "effect_continuation_failures", "lost_spell_recoveries",
@@ -165,6 +187,47 @@ def load_corpus_decks(decks_directory: Path, format_name: str | None = None,
     return decks, card_db, lineage
 
 
+def _corpus_arguments(decks_directory=None, format_name=None, format_dir=None):
+    """Return the ``load_corpus_decks`` arguments a Harvest run uses."""
+    if decks_directory is None and format_name is None and format_dir is None:
+        return (DEFAULT_DECKS_DIRECTORY, DEFAULT_FORMAT_NAME,
+                DEFAULT_FORMAT_DIRECTORY)
+    return (resolve_decks_directory(decks_directory, format_name, format_dir),
+            format_name, format_dir)
+
+
+def _corpus_key(decks_directory, format_name, format_dir) -> tuple:
+    return (str(Path(decks_directory).resolve()), format_name,
+            None if format_dir is None else str(Path(format_dir).resolve()))
+
+
+# Corpora a parent loaded before running or forking Harvest shards, keyed by
+# their load arguments. A shard deep-copies the entry instead of rebuilding
+# the card database, so one process can run many shards from a single load
+# and no game state leaks from one shard into the next.
+_PRELOADED_CORPORA: dict[tuple, tuple] = {}
+
+
+def preload_corpus(decks_directory=None, format_name=None, format_dir=None):
+    """Load a Harvest corpus for shards run here or forked from here.
+
+    Takes the arguments of ``run_harvest``; a run with the same corpus in
+    this process, or in a child forked afterwards, copies this entry.
+    ``clear_preloaded_corpora`` drops the reference once its shards are done.
+    """
+    arguments = _corpus_arguments(decks_directory, format_name, format_dir)
+    corpus_directory, corpus_format, corpus_format_dir = arguments
+    corpus = load_corpus_decks(
+        corpus_directory, format_name=corpus_format,
+        format_dir=corpus_format_dir)
+    _PRELOADED_CORPORA[_corpus_key(*arguments)] = corpus
+    return corpus
+
+
+def clear_preloaded_corpora() -> None:
+    _PRELOADED_CORPORA.clear()
+
+
 def prepare_output_directory(output_directory: Path) -> Path:
     """Create an empty artifact directory, refusing to overwrite any content."""
     output = output_directory.expanduser().resolve()
@@ -197,16 +260,20 @@ def resolve_checkpoint_path(path: Path | str) -> Path:
     return checkpoint
 
 
-def checkpoint_identity(path: Path | str) -> dict:
-    """Return stable provenance without embedding a machine-specific path."""
-    checkpoint = resolve_checkpoint_path(path)
+def _file_sha256(path: Path) -> str:
     digest = hashlib.sha256()
-    with checkpoint.open("rb") as handle:
+    with path.open("rb") as handle:
         for chunk in iter(lambda: handle.read(1024 * 1024), b""):
             digest.update(chunk)
+    return digest.hexdigest()
+
+
+def checkpoint_identity(path: Path | str) -> dict:
+    """Return stable provenance without embedding a machine-specific path."""
+    checkpoint = resolve_checkpoint_path(path)
     return {
         "name": checkpoint.name,
-        "sha256": digest.hexdigest(),
+        "sha256": _file_sha256(checkpoint),
         "size": checkpoint.stat().st_size,
     }
 
@@ -462,12 +529,24 @@ def verify_checkpoint_identity_unchanged(
             "provenance validation")
 
 
-def load_checkpoint_policy(path: Path | str):
-    """Load a MaskablePPO checkpoint with this project's custom classes known."""
+def load_checkpoint_policy(path: Path | str, identity: dict | None = None):
+    """Load a checkpoint policy with this project's custom classes known.
+
+    When ``identity`` holds the checkpoint's verified ``sha256``/``size`` and
+    an inference export traced from exactly those bytes sits beside it, the
+    lightweight export is returned instead of the full MaskablePPO object.
+    """
+    checkpoint = resolve_checkpoint_path(path)
+    if identity is not None:
+        from Playersim.policy_export import load_matching_inference_policy
+
+        exported = load_matching_inference_policy(checkpoint, identity)
+        if exported is not None:
+            return exported
     import main as _training_entrypoint  # noqa: F401 - registers custom policy classes
     from sb3_contrib import MaskablePPO
 
-    return MaskablePPO.load(str(resolve_checkpoint_path(path)), device="auto")
+    return MaskablePPO.load(str(checkpoint), device="auto")
 
 
 def validate_checkpoint_policy_compatibility(policy, env, *, role: str):
@@ -1033,7 +1112,9 @@ def _validate_artifacts(
     expected_decks: Sequence[dict] | None = None,
     card_db: dict | None = None,
     expected_deck_names: Sequence[str] | None = None,
+    timer: HarvestTimer | None = None,
 ):
+    timer = timer if timer is not None else HarvestTimer()
     if expected_deck_names is None:
         expected_deck_names = EXPECTED_SAMPLE_DECKS
     required = {
@@ -1153,8 +1234,9 @@ def _validate_artifacts(
                 or int(entry.get("count", 0)) < 1
                 or entry.get("severity") not in {"partial", "unparsed", "crash"}):
             raise RuntimeError("Card support manifest contains an invalid entry")
-    _validate_tracker_artifacts(
-        output, records, canonical_decks=expected_decks, card_db=card_db)
+    with timer.phase("tracker_validation"):
+        _validate_tracker_artifacts(
+            output, records, canonical_decks=expected_decks, card_db=card_db)
     return records, fidelity, manifest
 
 
@@ -1194,6 +1276,414 @@ def print_summary(
     print(f"Artifacts: {output}")
 
 
+class HarvestTimer:
+    """Exclusive wall-clock seconds per harvest phase, plus a step count.
+
+    Entering a phase pauses the enclosing one, so an opponent checkpoint's
+    ``predict`` inside ``env.step`` is charged to ``policy_inference`` only;
+    the scripted opponent's choices stay in ``env_step``.  Phase ``None``
+    charges nobody: lockstep lanes use it while parked on other lanes.
+    """
+
+    def __init__(self):
+        self.seconds = Counter()
+        self.steps = 0
+        self._stack: list[str | None] = []
+        self._since = 0.0
+
+    @contextlib.contextmanager
+    def phase(self, name: str | None):
+        now = time.perf_counter()
+        if self._stack and self._stack[-1] is not None:
+            self.seconds[self._stack[-1]] += now - self._since
+        self._stack.append(name)
+        self._since = now
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            if self._stack.pop() is not None:
+                self.seconds[name] += now - self._since
+            self._since = now
+
+    def merge(self, other: "HarvestTimer") -> None:
+        self.seconds.update(other.seconds)
+        self.steps += other.steps
+
+
+class _TimedPolicy:
+    """``predict`` wrapper that charges each call to one timer phase."""
+
+    def __init__(self, policy, timer: HarvestTimer, phase: str | None):
+        self.policy = policy
+        self._timer = timer
+        self._phase = phase
+        self.observation_space = getattr(policy, "observation_space", None)
+        self.action_space = getattr(policy, "action_space", None)
+
+    def predict(self, *args, **kwargs):
+        with self._timer.phase(self._phase):
+            return self.policy.predict(*args, **kwargs)
+
+
+def run_timing(timer: HarvestTimer, elapsed_seconds: float) -> dict:
+    """Return the JSON timing block of one run; ``other`` is the remainder."""
+    seconds = {phase: timer.seconds.get(phase, 0.0) for phase in TIMING_PHASES}
+    seconds["other"] = max(elapsed_seconds - sum(seconds.values()), 0.0)
+    return {
+        "elapsed_seconds": elapsed_seconds,
+        "steps": timer.steps,
+        "seconds": seconds,
+    }
+
+
+def sum_run_timing(timings: Iterable[dict]) -> dict:
+    """Add up ``run_timing`` blocks, e.g. one per harvest shard.
+
+    ``shard_seconds`` is the runs' summed wall time, which exceeds the
+    elapsed time of a parallel harvest.
+    """
+    seconds = Counter()
+    shard_seconds = 0.0
+    steps = 0
+    for timing in timings:
+        shard_seconds += float(timing["elapsed_seconds"])
+        steps += int(timing["steps"])
+        seconds.update(timing["seconds"])
+    return {
+        "shard_seconds": shard_seconds,
+        "steps": steps,
+        "seconds": {phase: seconds.get(phase, 0.0)
+                    for phase in TIMING_PHASES + ("other",)},
+    }
+
+
+def benchmark_report(kind: str, settings: dict, *, games: int,
+                     elapsed_seconds: float, timing: dict) -> dict:
+    """Build a machine-readable throughput report.
+
+    ``settings`` pins the seeded schedule; a baseline is only comparable to
+    a report with identical settings.  ``timing`` is a ``run_timing`` block
+    (or a sum of them) whose component seconds may exceed
+    ``elapsed_seconds`` when several workers ran at once.
+    """
+    elapsed_seconds = max(float(elapsed_seconds), 1e-9)
+    steps = int(timing["steps"])
+    return {
+        "schema_version": BENCHMARK_SCHEMA_VERSION,
+        "kind": kind,
+        "settings": settings,
+        "host": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "games": games,
+        "steps": steps,
+        "elapsed_seconds": elapsed_seconds,
+        "games_per_second": games / elapsed_seconds,
+        "steps_per_second": steps / elapsed_seconds,
+        "seconds": dict(timing["seconds"]),
+        "milliseconds_per_step": {
+            phase: 1000.0 * value / steps if steps else None
+            for phase, value in timing["seconds"].items()},
+    }
+
+
+def harvest_benchmark_report(run_manifest: dict) -> dict:
+    """Benchmark report for one ``run_harvest`` from its run manifest."""
+    timing = run_manifest["timing"]
+    return benchmark_report(
+        "harvest_fixtures",
+        {key: run_manifest[key] for key in (
+            "seed", "games", "game_offset", "max_steps", "agent_seat",
+            "lockstep_games", "agent_policy", "opponent_policy", "lineage")},
+        games=run_manifest["games"],
+        elapsed_seconds=timing["elapsed_seconds"], timing=timing)
+
+
+def compare_benchmark(report: dict, baseline: dict, *,
+                      tolerance: float = DEFAULT_BENCHMARK_TOLERANCE) -> dict:
+    """Check ``report`` against a stored baseline report.
+
+    Fails when games/sec or steps/sec drop more than ``tolerance`` (a
+    fraction) below the baseline.  Per-step component times are reported
+    for diagnosis but do not decide the check.
+    """
+    if not 0.0 <= tolerance < 1.0:
+        raise ValueError("benchmark tolerance must be in [0, 1)")
+    if not isinstance(baseline, dict) \
+            or baseline.get("schema_version") != BENCHMARK_SCHEMA_VERSION:
+        raise ValueError("Benchmark baseline has an unsupported schema")
+    if baseline.get("kind") != report["kind"]:
+        raise ValueError(
+            f"Benchmark baseline is a {baseline.get('kind')!r} report, "
+            f"not {report['kind']!r}")
+    recorded = baseline.get("settings") or {}
+    differing = sorted(
+        key for key in set(recorded) | set(report["settings"])
+        if recorded.get(key) != report["settings"].get(key))
+    if differing:
+        raise ValueError(
+            "Benchmark baseline ran a different schedule: "
+            + ", ".join(differing))
+    metrics = {}
+    for metric in BENCHMARK_METRICS:
+        expected = float(baseline[metric])
+        actual = float(report[metric])
+        metrics[metric] = {
+            "baseline": expected,
+            "current": actual,
+            "ratio": actual / expected if expected else None,
+            "passed": actual >= expected * (1.0 - tolerance),
+        }
+    baseline_steps = baseline.get("milliseconds_per_step") or {}
+    return {
+        "tolerance": tolerance,
+        "metrics": metrics,
+        "milliseconds_per_step": {
+            phase: {"baseline": baseline_steps.get(phase), "current": value}
+            for phase, value in report["milliseconds_per_step"].items()},
+        "passed": all(item["passed"] for item in metrics.values()),
+    }
+
+
+def publish_benchmark(output: Path, report: dict,
+                      baseline_path: Path | str | None = None, *,
+                      tolerance: float = DEFAULT_BENCHMARK_TOLERANCE) -> dict:
+    """Compare against an optional baseline, write benchmark.json, print it.
+
+    The written report is itself a valid baseline for later runs.
+    """
+    if baseline_path is not None:
+        baseline_path = Path(baseline_path).expanduser()
+        with baseline_path.open(encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        report = {
+            **report,
+            "comparison": {
+                "baseline": str(baseline_path),
+                **compare_benchmark(report, baseline, tolerance=tolerance),
+            },
+        }
+    with (Path(output) / "benchmark.json").open("w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+    components = " ".join(
+        f"{phase}={value:.3f}ms" for phase, value
+        in report["milliseconds_per_step"].items() if value is not None)
+    print(
+        f"Benchmark: games_per_second={report['games_per_second']:.3f} "
+        f"steps_per_second={report['steps_per_second']:.1f} "
+        f"per_step=[{components}]")
+    comparison = report.get("comparison")
+    if comparison is not None:
+        for metric, item in comparison["metrics"].items():
+            print(
+                f"  {metric}: {item['current']:.3f} vs baseline "
+                f"{item['baseline']:.3f} "
+                f"({'ok' if item['passed'] else 'REGRESSION'})")
+    return report
+
+
+def _play_fixture_game(env, decks: Sequence[dict], game_index: int, seed: int,
+                       max_steps: int, agent_policy=None,
+                       timer: HarvestTimer | None = None) -> tuple[str, str]:
+    """Play one scheduled game to a recorded result; return its matchup."""
+    timer = timer if timer is not None else HarvestTimer()
+    game_seed = seed + game_index
+    p1_deck, p2_deck = scheduled_matchup(decks, game_index, seed)
+    expected_pair = (p1_deck["name"], p2_deck["name"])
+    env.decks = _ScheduledDeckPair(p1_deck, p2_deck)
+    with timer.phase("env_reset"):
+        observation, reset_info = env.reset(seed=game_seed)
+    if reset_info.get("error_reset"):
+        raise RuntimeError(
+            f"Fixture game {game_index + 1} used the emergency reset")
+    if getattr(env, "last_observation_error", None):
+        raise RuntimeError(
+            f"Fixture game {game_index + 1} reset observation degraded: "
+            f"{env.last_observation_error}\n"
+            f"{getattr(env, 'last_observation_traceback', '') or ''}")
+    actual_pair = (
+        getattr(env, "current_deck_name_p1", None),
+        getattr(env, "current_deck_name_p2", None),
+    )
+    if actual_pair != expected_pair:
+        raise RuntimeError(
+            f"Fixture game {game_index + 1} reset the wrong matchup: "
+            f"{actual_pair} != {expected_pair}")
+    rng = random.Random(game_seed ^ 0x5EED5EED)
+
+    terminated = truncated = False
+    steps = 0
+    final_info = {}
+    repeated_waits = 0
+    previous_wait_signature = None
+    abort_reason = None
+    while not (terminated or truncated) and steps < max_steps:
+        if getattr(env.game_state, "_consecutive_no_ops", 0) > 12:
+            abort_reason = "engine NO_OP recovery limit"
+            break
+        mask = env.action_mask()
+        mask_error = getattr(
+            getattr(env, "action_handler", None),
+            "last_mask_error", None)
+        if mask_error:
+            raise RuntimeError(
+                f"Fixture game {game_index + 1} action mask degraded: "
+                f"{mask_error}")
+        wait_signature = _wait_state_signature(env, mask)
+        previous_wait_signature, repeated_waits = _advance_wait_counter(
+            previous_wait_signature, repeated_waits, wait_signature)
+        if repeated_waits >= MAX_REPEATED_WAIT_STATES:
+            abort_reason = f"repeated wait state {wait_signature}"
+            break
+
+        with timer.phase("policy_inference"):
+            action = (
+                choose_checkpoint_action(agent_policy, observation, mask)
+                if agent_policy is not None
+                else choose_fixture_action(mask, rng)
+            )
+        action_metadata = getattr(
+            getattr(env, "action_handler", None),
+            "action_reasons_with_context", {}).get(action, {})
+        with timer.phase("env_step"):
+            observation, _, terminated, truncated, final_info = env.step(action)
+        steps += 1
+        timer.steps += 1
+        if getattr(env, "last_observation_error", None):
+            raise RuntimeError(
+                f"Fixture game {game_index + 1} observation degraded: "
+                f"{env.last_observation_error}\n"
+                f"{getattr(env, 'last_observation_traceback', '') or ''}")
+        if final_info.get("execution_failed"):
+            actor = ("opponent" if final_info.get("opponent_execution_failed")
+                     else "agent")
+            raise RuntimeError(
+                f"Fixture game {game_index + 1} had a mask-valid {actor} "
+                f"action {action} fail: "
+                f"{final_info.get('error_message', 'unspecified')}; "
+                f"mask_metadata={action_metadata}")
+        if final_info.get("invalid_action"):
+            raise RuntimeError(
+                f"Fixture game {game_index + 1} had a mask-valid action "
+                f"rejected: {final_info.get('invalid_action_reason', 'unspecified')}")
+        if final_info.get("critical_error"):
+            raise RuntimeError(
+                f"Fixture game {game_index + 1} hit a critical error: "
+                f"{final_info.get('error_message', 'unspecified')}")
+
+    if not (terminated or truncated):
+        abort_reason = abort_reason or f"{max_steps}-step safety cap"
+        raise RuntimeError(
+            f"Fixture game {game_index + 1} aborted: {abort_reason}")
+    if not getattr(env, "_game_result_recorded", False):
+        detail = final_info.get("error_message", "no result recorded")
+        raise RuntimeError(f"Fixture game {game_index + 1} failed: {detail}")
+    if getattr(env, "_game_result", None) not in VALID_RESULTS:
+        raise RuntimeError(
+            f"Fixture game {game_index + 1} ended without a usable result: "
+            f"{getattr(env, '_game_result', None)!r}")
+    return expected_pair
+
+
+def _load_harvest_policies(agent_model, agent_identity, opponent_model,
+                           opponent_identity):
+    """Load the bound checkpoints, rechecking their bytes around each load."""
+    agent_policy = opponent_policy = None
+    if agent_model:
+        verify_checkpoint_identity_unchanged(
+            agent_model, agent_identity, role="Agent")
+        agent_policy = load_checkpoint_policy(agent_model, agent_identity)
+        verify_checkpoint_identity_unchanged(
+            agent_model, agent_identity, role="Agent")
+    if opponent_model:
+        verify_checkpoint_identity_unchanged(
+            opponent_model, opponent_identity, role="Opponent")
+        opponent_policy = load_checkpoint_policy(
+            opponent_model, opponent_identity)
+        verify_checkpoint_identity_unchanged(
+            opponent_model, opponent_identity, role="Opponent")
+    return agent_policy, opponent_policy
+
+
+# Process-global state each lockstep lane owns: the scheduler saves it when a
+# lane parks and reinstalls it when the lane resumes.  Everything else the
+# engine touches is shared by every lane in the process.  Engine caches only
+# memoize pure functions of card text, so sharing them cannot change a game;
+# the harvest-wide settings in ``_shared_lane_settings`` are fixed before
+# lanes start and checked at every hand-off.
+LANE_OWNED_GLOBALS = (
+    "random (global Python RNG)",
+    "numpy.random (legacy global RNG)",
+    "Playersim.card_support manifest accumulator",
+)
+
+
+def _shared_lane_settings() -> tuple:
+    from Playersim import environment as environment_module
+
+    return (logging.root.manager.disable,
+            environment_module.DEBUG_ACTION_STEPS)
+
+
+def _capture_lane_state():
+    """Save the ``LANE_OWNED_GLOBALS`` of the lane that is parking."""
+    from Playersim import card_support
+    from Playersim.lockstep_inference import capture_global_random_state
+
+    return (capture_global_random_state(), card_support.get_manifest(),
+            _shared_lane_settings())
+
+
+def _restore_lane_state(state) -> None:
+    """Reinstall a resuming lane's globals; shared settings must not move."""
+    from Playersim import card_support
+    from Playersim.lockstep_inference import restore_global_random_state
+
+    random_state, manifest, shared_settings = state
+    if _shared_lane_settings() != shared_settings:
+        raise RuntimeError(
+            "A lockstep lane changed harvest-wide logging or debug settings; "
+            "lanes may only own " + ", ".join(LANE_OWNED_GLOBALS))
+    card_support.install_manifest(manifest)
+    restore_global_random_state(random_state)
+
+
+def merge_support_manifests(manifests: Sequence[dict]) -> dict:
+    """Sum per-card support counts; the worst severity sticks."""
+    merged: dict[str, dict] = {}
+    for manifest in manifests:
+        for card_name, entry in manifest.items():
+            target = merged.setdefault(card_name, {
+                "count": 0, "severity": "partial", "reasons": {},
+            })
+            target["count"] += int(entry.get("count", 0))
+            if SEVERITY_RANK.get(entry.get("severity"), 0) \
+                    > SEVERITY_RANK.get(target["severity"], 0):
+                target["severity"] = entry["severity"]
+            for reason, count in entry.get("reasons", {}).items():
+                target["reasons"][reason] = (
+                    target["reasons"].get(reason, 0) + int(count))
+    return merged
+
+
+def _merge_lane_fidelity(reports: Sequence[dict]) -> dict:
+    unparsed_cards = Counter()
+    for report in reports:
+        unparsed_cards.update(report.get("unparsed_cards", {}))
+    return {
+        **reports[0],
+        **{counter: sum(int(report[counter]) for report in reports)
+           for counter in FIDELITY_COUNTERS},
+        "games_recorded": sum(
+            int(report["games_recorded"]) for report in reports),
+        "unparsed_cards": dict(unparsed_cards),
+    }
+
+
 def run_harvest(games: int, seed: int, output_directory: Path,
                 max_steps: int = MAX_STEPS_PER_GAME, *, game_offset: int = 0,
                 agent_model: Path | str | None = None,
@@ -1201,12 +1691,18 @@ def run_harvest(games: int, seed: int, output_directory: Path,
                 agent_is_p1: bool = True,
                 decks_directory: Path | str | None = None,
                 format_name: str | None = None,
-                format_dir: Path | str | None = None):
+                format_dir: Path | str | None = None,
+                lockstep_games: int = 1):
     """Run harvest games and return their validated artifact data.
 
     With no corpus arguments this is the audited eight-deck fixture. Passing
     ``decks_directory`` (and optionally ``format_name``/``format_dir``)
     harvests any strictly loaded corpus under the same artifact contract.
+
+    ``lockstep_games`` above one plays game ``i`` on lane ``i % K`` of a
+    ``LockstepScheduler`` so checkpoint decisions from up to K games share
+    one batched ``predict`` per policy.  Each lane owns an environment and a
+    ``lane_NN`` artifact directory; records are returned in game order.
     """
     if games < 1:
         raise ValueError("games must be at least 1")
@@ -1217,7 +1713,13 @@ def run_harvest(games: int, seed: int, output_directory: Path,
         raise ValueError("game_offset must be a non-negative integer")
     if not isinstance(agent_is_p1, bool):
         raise ValueError("agent_is_p1 must be a boolean")
+    if isinstance(lockstep_games, bool) \
+            or not isinstance(lockstep_games, int) or lockstep_games < 1:
+        raise ValueError("lockstep_games must be a positive integer")
+    lane_count = min(lockstep_games, games)
 
+    started = time.perf_counter()
+    timer = HarvestTimer()
     output = prepare_output_directory(Path(output_directory))
     agent_identity = None
     opponent_identity = None
@@ -1227,6 +1729,8 @@ def run_harvest(games: int, seed: int, output_directory: Path,
     previous_debug_action_steps = None
     environment_module = None
     expected_matchups: list[tuple[str, str]] = []
+    lanes: list[dict] = []
+    lockstep_stats = None
     logging.disable(logging.CRITICAL)
     env = None
     agent_policy = None
@@ -1236,16 +1740,18 @@ def run_harvest(games: int, seed: int, output_directory: Path,
         # fresh output directory must start with a fresh in-memory manifest too.
         from Playersim.card_support import reset_manifest_for_tests
         reset_manifest_for_tests()
-        if decks_directory is None and format_name is None \
-                and format_dir is None:
-            decks, card_db, lineage = load_corpus_decks(
-                DEFAULT_DECKS_DIRECTORY, format_name=DEFAULT_FORMAT_NAME,
-                format_dir=DEFAULT_FORMAT_DIRECTORY)
+        corpus_arguments = _corpus_arguments(
+            decks_directory, format_name, format_dir)
+        corpus = _PRELOADED_CORPORA.get(_corpus_key(*corpus_arguments))
+        if corpus is not None:
+            corpus = copy.deepcopy(corpus)
         else:
-            decks, card_db, lineage = load_corpus_decks(
-                resolve_decks_directory(
-                    decks_directory, format_name, format_dir),
-                format_name=format_name, format_dir=format_dir)
+            corpus_directory, corpus_format, corpus_format_dir = \
+                corpus_arguments
+            corpus = load_corpus_decks(
+                corpus_directory, format_name=corpus_format,
+                format_dir=corpus_format_dir)
+        decks, card_db, lineage = corpus
         deck_names = tuple(deck.get("name") for deck in decks)
 
         # Reject unbound, foreign, or lineage-incompatible bytes before SB3
@@ -1267,132 +1773,99 @@ def run_harvest(games: int, seed: int, output_directory: Path,
         environment_module.DEBUG_ACTION_STEPS = False
         AlphaZeroMTGEnv = environment_module.AlphaZeroMTGEnv
         previous_root_level = _quiet_engine_console_logging()
-        env = AlphaZeroMTGEnv(
-            decks,
-            card_db,
-            deck_stats_path=str(output),
-            card_memory_path=str(output / "card_memory"),
-            agent_is_p1=agent_is_p1,
-        )
-        env.set_agent_version(agent_version)
 
-        # Bind every loaded policy to the exact live v6 boundary before a
-        # reset, opponent installation, or prediction can occur. This keeps
-        # both externally driven agent policies and direct opponent policies
-        # from bypassing the checkpoint-league's stricter loader.
-        if agent_model:
-            verify_checkpoint_identity_unchanged(
-                agent_model, agent_identity, role="Agent")
-            agent_policy = load_checkpoint_policy(agent_model)
-            verify_checkpoint_identity_unchanged(
-                agent_model, agent_identity, role="Agent")
-            agent_policy = validate_checkpoint_policy_compatibility(
-                agent_policy, env, role="Agent")
-        if opponent_model:
-            verify_checkpoint_identity_unchanged(
-                opponent_model, opponent_identity, role="Opponent")
-            opponent_policy = load_checkpoint_policy(opponent_model)
-            verify_checkpoint_identity_unchanged(
-                opponent_model, opponent_identity, role="Opponent")
-            opponent_policy = validate_checkpoint_policy_compatibility(
-                opponent_policy, env, role="Opponent")
-        if opponent_policy is not None:
-            env.set_opponent_policy(opponent_policy)
-
-        for local_game_index in range(games):
-            game_index = game_offset + local_game_index
-            game_seed = seed + game_index
-            p1_deck, p2_deck = scheduled_matchup(decks, game_index, seed)
-            expected_pair = (p1_deck["name"], p2_deck["name"])
-            expected_matchups.append(expected_pair)
-            env.decks = _ScheduledDeckPair(p1_deck, p2_deck)
-            observation, reset_info = env.reset(seed=game_seed)
-            if reset_info.get("error_reset"):
-                raise RuntimeError(
-                    f"Fixture game {game_index + 1} used the emergency reset")
-            if getattr(env, "last_observation_error", None):
-                raise RuntimeError(
-                    f"Fixture game {game_index + 1} reset observation degraded: "
-                    f"{env.last_observation_error}\n"
-                    f"{getattr(env, 'last_observation_traceback', '') or ''}")
-            actual_pair = (
-                getattr(env, "current_deck_name_p1", None),
-                getattr(env, "current_deck_name_p2", None),
+        def harvest_environment(directory):
+            harvest_env = AlphaZeroMTGEnv(
+                decks,
+                card_db,
+                deck_stats_path=str(directory),
+                card_memory_path=str(directory / "card_memory"),
+                agent_is_p1=agent_is_p1,
             )
-            if actual_pair != expected_pair:
-                raise RuntimeError(
-                    f"Fixture game {game_index + 1} reset the wrong matchup: "
-                    f"{actual_pair} != {expected_pair}")
-            rng = random.Random(game_seed ^ 0x5EED5EED)
-
-            terminated = truncated = False
-            steps = 0
-            final_info = {}
-            repeated_waits = 0
-            previous_wait_signature = None
-            abort_reason = None
-            while not (terminated or truncated) and steps < max_steps:
-                if getattr(env.game_state, "_consecutive_no_ops", 0) > 12:
-                    abort_reason = "engine NO_OP recovery limit"
-                    break
-                mask = env.action_mask()
-                mask_error = getattr(
-                    getattr(env, "action_handler", None),
-                    "last_mask_error", None)
-                if mask_error:
-                    raise RuntimeError(
-                        f"Fixture game {game_index + 1} action mask degraded: "
-                        f"{mask_error}")
-                wait_signature = _wait_state_signature(env, mask)
-                previous_wait_signature, repeated_waits = _advance_wait_counter(
-                    previous_wait_signature, repeated_waits, wait_signature)
-                if repeated_waits >= MAX_REPEATED_WAIT_STATES:
-                    abort_reason = f"repeated wait state {wait_signature}"
-                    break
-
-                action = (
-                    choose_checkpoint_action(agent_policy, observation, mask)
-                    if agent_policy is not None
-                    else choose_fixture_action(mask, rng)
-                )
-                action_metadata = getattr(
-                    getattr(env, "action_handler", None),
-                    "action_reasons_with_context", {}).get(action, {})
-                observation, _, terminated, truncated, final_info = env.step(action)
-                steps += 1
-                if getattr(env, "last_observation_error", None):
-                    raise RuntimeError(
-                        f"Fixture game {game_index + 1} observation degraded: "
-                        f"{env.last_observation_error}\n"
-                        f"{getattr(env, 'last_observation_traceback', '') or ''}")
-                if final_info.get("execution_failed"):
-                    actor = ("opponent" if final_info.get("opponent_execution_failed")
-                             else "agent")
-                    raise RuntimeError(
-                        f"Fixture game {game_index + 1} had a mask-valid {actor} "
-                        f"action {action} fail: "
-                        f"{final_info.get('error_message', 'unspecified')}; "
-                        f"mask_metadata={action_metadata}")
-                if final_info.get("invalid_action"):
-                    raise RuntimeError(
-                        f"Fixture game {game_index + 1} had a mask-valid action "
-                        f"rejected: {final_info.get('invalid_action_reason', 'unspecified')}")
-                if final_info.get("critical_error"):
-                    raise RuntimeError(
-                        f"Fixture game {game_index + 1} hit a critical error: "
-                        f"{final_info.get('error_message', 'unspecified')}")
-
-            if not (terminated or truncated):
-                abort_reason = abort_reason or f"{max_steps}-step safety cap"
-                raise RuntimeError(
-                    f"Fixture game {game_index + 1} aborted: {abort_reason}")
-            if not getattr(env, "_game_result_recorded", False):
-                detail = final_info.get("error_message", "no result recorded")
-                raise RuntimeError(f"Fixture game {game_index + 1} failed: {detail}")
-            if getattr(env, "_game_result", None) not in VALID_RESULTS:
-                raise RuntimeError(
-                    f"Fixture game {game_index + 1} ended without a usable result: "
-                    f"{getattr(env, '_game_result', None)!r}")
+            harvest_env.set_agent_version(agent_version)
+            return harvest_env
+
+        if lane_count == 1:
+            env = harvest_environment(output)
+            # Bind every loaded policy to the exact live v6 boundary before a
+            # reset, opponent installation, or prediction can occur. This
+            # keeps both externally driven agent policies and direct opponent
+            # policies from bypassing the checkpoint-league's stricter loader.
+            agent_policy, opponent_policy = _load_harvest_policies(
+                agent_model, agent_identity, opponent_model, opponent_identity)
+            if agent_policy is not None:
+                agent_policy = validate_checkpoint_policy_compatibility(
+                    agent_policy, env, role="Agent")
+            if opponent_policy is not None:
+                opponent_policy = validate_checkpoint_policy_compatibility(
+                    opponent_policy, env, role="Opponent")
+                env.set_opponent_policy(_TimedPolicy(
+                    opponent_policy, timer, "policy_inference"))
+
+            for local_game_index in range(games):
+                expected_matchups.append(_play_fixture_game(
+                    env, decks, game_offset + local_game_index, seed,
+                    max_steps, agent_policy, timer))
+        else:
+            from Playersim.lockstep_inference import LockstepScheduler
+
+            agent_policy, opponent_policy = _load_harvest_policies(
+                agent_model, agent_identity, opponent_model, opponent_identity)
+            scheduler = LockstepScheduler(
+                capture=_capture_lane_state, restore=_restore_lane_state)
+            # Batched predictions run on this thread and are charged here;
+            # lanes charge nothing while parked on them.
+            agent_handle = (
+                scheduler.policy(_TimedPolicy(
+                    agent_policy, timer, "policy_inference"))
+                if agent_policy is not None else None)
+            opponent_handle = (
+                scheduler.policy(_TimedPolicy(
+                    opponent_policy, timer, "policy_inference"))
+                if opponent_policy is not None else None)
+            lanes = [
+                {"lane": lane_index,
+                 "output": output / f"lane_{lane_index:02d}",
+                 "games": list(range(lane_index, games, lane_count)),
+                 "timer": HarvestTimer()}
+                for lane_index in range(lane_count)]
+
+            def play_lane(lane):
+                # Each lane accumulates its own card-support manifest; the
+                # scheduler swaps it with the RNGs at every hand-off.
+                reset_manifest_for_tests()
+                lane_timer = lane["timer"]
+                lane_env = harvest_environment(
+                    prepare_output_directory(lane["output"]))
+                try:
+                    if agent_policy is not None:
+                        validate_checkpoint_policy_compatibility(
+                            agent_policy, lane_env, role="Agent")
+                    if opponent_policy is not None:
+                        validate_checkpoint_policy_compatibility(
+                            opponent_policy, lane_env, role="Opponent")
+                        lane_env.set_opponent_policy(
+                            _TimedPolicy(opponent_handle, lane_timer, None))
+                    lane_agent = (
+                        _TimedPolicy(agent_handle, lane_timer, None)
+                        if agent_handle is not None else None)
+                    return [
+                        _play_fixture_game(
+                            lane_env, decks, game_offset + local_game_index,
+                            seed, max_steps, lane_agent, lane_timer)
+                        for local_game_index in lane["games"]]
+                finally:
+                    lane_env.close()
+
+            lane_matchups = scheduler.run([
+                lambda lane=lane: play_lane(lane) for lane in lanes])
+            for lane, matchups in zip(lanes, lane_matchups):
+                lane["matchups"] = matchups
+                timer.merge(lane["timer"])
+            expected_matchups = [
+                lane_matchups[index % lane_count][index // lane_count]
+                for index in range(games)]
+            lockstep_stats = dict(scheduler.stats)
     finally:
         if env is not None:
             env.close()
@@ -1402,10 +1875,26 @@ def run_harvest(games: int, seed: int, output_directory: Path,
             logging.getLogger().setLevel(previous_root_level)
         logging.disable(previous_log_disable)
 
-    records, fidelity, manifest = _validate_artifacts(
-        output, games, agent_version, expected_matchups=expected_matchups,
-        expected_decks=decks, card_db=card_db,
-        expected_deck_names=deck_names)
+    if lane_count == 1:
+        with timer.phase("artifact_validation"):
+            records, fidelity, manifest = _validate_artifacts(
+                output, games, agent_version,
+                expected_matchups=expected_matchups, expected_decks=decks,
+                card_db=card_db, expected_deck_names=deck_names, timer=timer)
+    else:
+        with timer.phase("artifact_validation"):
+            validated = [
+                _validate_artifacts(
+                    lane["output"], len(lane["games"]), agent_version,
+                    expected_matchups=lane["matchups"], expected_decks=decks,
+                    card_db=card_db, expected_deck_names=deck_names,
+                    timer=timer)
+                for lane in lanes]
+        records = [
+            validated[index % lane_count][0][index // lane_count]
+            for index in range(games)]
+        fidelity = _merge_lane_fidelity([lane[1] for lane in validated])
+        manifest = merge_support_manifests([lane[2] for lane in validated])
     run_manifest = {
         "schema_version": 1,
         "status": "complete",
@@ -1415,6 +1904,7 @@ def run_harvest(games: int, seed: int, output_directory: Path,
         "games": games,
         "game_offset": game_offset,
         "max_steps": max_steps,
+        "lockstep_games": lockstep_games,
         "agent_seat": "p1" if agent_is_p1 else "p2",
         "agent_policy": agent_identity or {"kind": "random-valid"},
         "opponent_policy": opponent_identity or {"kind": "scripted"},
@@ -1427,9 +1917,29 @@ def run_harvest(games: int, seed: int, output_directory: Path,
         "results": dict(sorted(Counter(
             record["result"] for record in records).items())),
     }
-    with (output / "harvest_run.json").open("w", encoding="utf-8") as handle:
+    if lane_count > 1:
+        run_manifest["lockstep"] = {
+            **lockstep_stats,
+            "lanes": [
+                {"lane": lane["lane"], "output": lane["output"].name,
+                 "games": [game_offset + index for index in lane["games"]]}
+                for lane in lanes],
+        }
+    artifact_directories = (
+        [lane["output"] for lane in lanes] if lane_count > 1 else [output])
+    run_manifest["artifacts"] = {
+        path.relative_to(output).as_posix(): _file_sha256(path)
+        for directory in artifact_directories
+        for path in (directory / name for name in HARVEST_ARTIFACTS)
+        if path.is_file()}
+    run_manifest["timing"] = run_timing(timer, time.perf_counter() - started)
+    # harvest_run.json is the completion marker a resumed protocol run
+    # trusts, so it appears only whole and only after validation.
+    temporary = output / "harvest_run.json.tmp"
+    with temporary.open("w", encoding="utf-8") as handle:
         json.dump(run_manifest, handle, indent=2, sort_keys=True)
         handle.write("\n")
+    temporary.replace(output / "harvest_run.json")
     print_summary(output, seed, records, fidelity, manifest)
     return {
         "output": output,
@@ -1441,6 +1951,86 @@ def run_harvest(games: int, seed: int, output_directory: Path,
     }
 
 
+def load_completed_harvest(output_directory: Path | str) -> dict:
+    """Reload a finished ``run_harvest`` directory without replaying it.
+
+    Only a directory whose ``harvest_run.json`` says ``complete`` qualifies,
+    and every artifact must still hash to the digest recorded there, so the
+    reloaded records are the ones that passed validation.  Returns the same
+    shape as ``run_harvest``.
+    """
+    output = Path(output_directory).expanduser().resolve()
+    marker = output / "harvest_run.json"
+    if not marker.is_file():
+        raise RuntimeError(f"Harvest did not complete: {output}")
+    with marker.open(encoding="utf-8") as handle:
+        run_manifest = json.load(handle)
+    if not isinstance(run_manifest, dict) \
+            or run_manifest.get("status") != "complete":
+        raise RuntimeError(f"Harvest did not complete: {output}")
+    artifacts = run_manifest.get("artifacts")
+    if not isinstance(artifacts, dict) or not artifacts:
+        raise RuntimeError(
+            f"Harvest predates artifact digests and cannot be reused: {output}")
+    for name, expected in artifacts.items():
+        path = output / name
+        if not path.is_file() or _file_sha256(path) != expected:
+            raise RuntimeError(
+                f"Harvest artifact changed after completion: {path}")
+
+    lockstep = run_manifest.get("lockstep")
+    offset = int(run_manifest["game_offset"])
+    if lockstep:
+        lanes = [(output / lane["output"], lane["games"])
+                 for lane in lockstep["lanes"]]
+    else:
+        lanes = [(output, list(range(
+            offset, offset + int(run_manifest["games"]))))]
+    by_game = {}
+    reports = []
+    manifests = []
+    for directory, lane_games in lanes:
+        lane_records = _read_records(directory / "game_log.jsonl")
+        if len(lane_records) != len(lane_games):
+            raise RuntimeError(
+                f"Harvest game log does not match its run manifest: "
+                f"{directory}")
+        by_game.update(zip(lane_games, lane_records))
+        with (directory / "fidelity_report.json").open(
+                encoding="utf-8") as handle:
+            reports.append(json.load(handle))
+        with (directory / "card_support_manifest.json").open(
+                encoding="utf-8") as handle:
+            manifests.append(json.load(handle) or {})
+    records = [by_game[index] for index in sorted(by_game)]
+    return {
+        "output": output,
+        "agent_version": run_manifest["agent_version"],
+        "records": records,
+        "fidelity": (_merge_lane_fidelity(reports) if lockstep
+                     else reports[0]),
+        "manifest": (merge_support_manifests(manifests) if lockstep
+                     else manifests[0]),
+        "run_manifest": run_manifest,
+    }
+
+
+def add_benchmark_arguments(parser) -> None:
+    parser.add_argument(
+        "--benchmark", action="store_true",
+        help="write benchmark.json with games/sec, steps/sec and per-phase "
+             "timing for this seeded schedule")
+    parser.add_argument(
+        "--benchmark-baseline", type=Path, default=None,
+        help="earlier benchmark.json for the same schedule; exit with "
+             "status 2 if throughput regressed (implies --benchmark)")
+    parser.add_argument(
+        "--benchmark-tolerance", type=float,
+        default=DEFAULT_BENCHMARK_TOLERANCE,
+        help="fraction of baseline throughput that may be lost before "
+             "the check fails (default: %(default)s)")
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Run deterministic random-valid fixtures against the scripted opponent."
@@ -1473,10 +2063,16 @@ def build_parser() -> argparse.ArgumentParser:
         "--game-offset", type=int, default=0,
         help="global schedule offset used by parallel protocol shards",
     )
+    parser.add_argument(
+        "--lockstep-games", type=_positive_int, default=1,
+        help="games advanced together so checkpoint decisions share one "
+             "batched forward pass per policy (default: 1)",
+    )
     parser.add_argument(
         "--agent-model", type=Path,
         help="optional MaskablePPO checkpoint for the learning/P1 seat",
     )
+    add_benchmark_arguments(parser)
     parser.add_argument(
         "--opponent-model", type=Path,
         help="optional MaskablePPO checkpoint for the environment/P2 seat",
@@ -1501,11 +2097,19 @@ def build_parser() -> argparse.ArgumentParser:
 def main(argv: Sequence[str] | None = None) -> int:
     args = build_parser().parse_args(argv)
     try:
-        run_harvest(
+        result = run_harvest(
             args.games, args.seed, args.output, max_steps=args.max_steps,
             game_offset=args.game_offset, agent_model=args.agent_model,
             opponent_model=args.opponent_model, decks_directory=args.decks,
-            format_name=args.format, format_dir=args.format_dir)
+            format_name=args.format, format_dir=args.format_dir,
+            lockstep_games=args.lockstep_games)
+        if args.benchmark or args.benchmark_baseline is not None:
+            report = publish_benchmark(
+                result["output"],
+                harvest_benchmark_report(result["run_manifest"]),
+                args.benchmark_baseline, tolerance=args.benchmark_tolerance)
+            if not report.get("comparison", {}).get("passed", True):
+                return 2
     except (OSError, RuntimeError, ValueError) as exc:
         print(f"ERROR: {exc}", file=sys.stderr)
         return 1
@@ -13,60 +13,113 @@ Examples::
         --candidate models/candidate.zip --minimum-score 0.55 \
         --output harvest_runs/qualification_001
 
-Each worker owns an isolated tracker/card-memory directory.  The root protocol
+    python harvest_protocol.py qualify --games 256 --workers 4 --sequential \
+        --candidate models/candidate.zip --output harvest_runs/qualification_002
+
+    python harvest_protocol.py harvest --games 64 --workers 4 --benchmark \
+        --output harvest_runs/benchmark_001
+
+    python harvest_protocol.py harvest --games 64 --workers 4 \
+        --benchmark-baseline harvest_runs/benchmark_001/benchmark.json \
+        --output harvest_runs/benchmark_002
+
+Workers pull small shards of the global game schedule from a queue; each
+shard owns an isolated tracker/card-memory directory.  Shards hand back
+compact summaries rather than records, and the parent streams their game
+logs into one root ``game_log.jsonl`` in global game order.  The root protocol
 manifest is written only after every strict shard validates successfully.
+A shard's own ``harvest_run.json`` marks it complete, so ``--resume`` can
+finish an interrupted run by replaying only the shards without one.
 """
 
 from __future__ import annotations
 
 import argparse
 from collections import Counter
+from collections.abc import Iterable, Iterator, Sequence
 from concurrent.futures import ProcessPoolExecutor, as_completed
+import hashlib
+import heapq
+import itertools
 import json
+import multiprocessing
 from pathlib import Path
+import shutil
 import sys
 import time
-from typing import Sequence
 
 import harvest_fixtures as fixture
+from Playersim.sequential_evaluation import (
+    DEFAULT_SEQUENTIAL_ERROR_RATE,
+    DEFAULT_SEQUENTIAL_INDIFFERENCE,
+    sequential_score_test,
+    sequential_test_config,
+)
+from Playersim.worker_template import (
+    TEMPLATE_PRELOAD_MODULES,
+    frozen_for_fork,
+    preload_modules,
+    template_supported,
+)
 
 
 PROTOCOL_VERSION = "harvest-protocol-v1"
-SEVERITY_RANK = {"partial": 0, "unparsed": 1, "crash": 2}
+# Games per queued shard.  Each shard builds its own environment and
+# tracker directory, so this trades that fixed cost against tail idle time.
+DEFAULT_CHUNK_GAMES = 4
+
 
+def partition_games(games: int, chunk_games: int) -> list[dict]:
+    """Split a global deterministic schedule into small contiguous shards.
 
-def partition_games(games: int, workers: int) -> list[dict]:
-    """Partition a global deterministic schedule without duplicate game IDs."""
+    Shards depend only on ``games`` and ``chunk_games``, never on the worker
+    count: workers pull them from a queue as they finish, so a slow matchup
+    holds up one small shard instead of a whole worker's share.
+    """
     if isinstance(games, bool) or not isinstance(games, int) or games < 1:
         raise ValueError("games must be a positive integer")
-    if isinstance(workers, bool) or not isinstance(workers, int) or workers < 1:
-        raise ValueError("workers must be a positive integer")
-    worker_count = min(games, workers)
-    base, remainder = divmod(games, worker_count)
-    shards = []
-    offset = 0
-    for shard_index in range(worker_count):
-        count = base + (1 if shard_index < remainder else 0)
-        shards.append({"shard": shard_index, "offset": offset, "games": count})
-        offset += count
-    return shards
-
-
-def _merge_manifests(manifests: Sequence[dict]) -> dict:
-    merged: dict[str, dict] = {}
-    for manifest in manifests:
-        for card_name, entry in manifest.items():
-            target = merged.setdefault(card_name, {
-                "count": 0, "severity": "partial", "reasons": {},
-            })
-            target["count"] += int(entry.get("count", 0))
-            if SEVERITY_RANK.get(entry.get("severity"), 0) \
-                    > SEVERITY_RANK.get(target["severity"], 0):
-                target["severity"] = entry["severity"]
-            for reason, count in entry.get("reasons", {}).items():
-                target["reasons"][reason] = (
-                    target["reasons"].get(reason, 0) + int(count))
-    return merged
+    if isinstance(chunk_games, bool) or not isinstance(chunk_games, int) \
+            or chunk_games < 1:
+        raise ValueError("chunk_games must be a positive integer")
+    return [
+        {"shard": shard_index, "offset": offset,
+         "games": min(chunk_games, games - offset)}
+        for shard_index, offset in enumerate(range(0, games, chunk_games))
+    ]
+
+
+def _preload_shard_template(decks_directory, format_name, format_dir, *,
+                            load_policies: bool) -> None:
+    """Load what every forked shard would otherwise load for itself."""
+    preload_modules(TEMPLATE_PRELOAD_MODULES + (("main",) if load_policies else ()))
+    try:
+        fixture.preload_corpus(decks_directory, format_name, format_dir)
+    except Exception as error:
+        # Preloading is only an optimization. Each shard loads the corpus
+        # again and reports the failure with its own context.
+        print(f"Shards will load the corpus themselves: {error}",
+              file=sys.stderr)
+
+
+def _run_shards(arguments: Sequence[dict], workers: int,
+                **executor_kwargs) -> list[tuple[dict, dict]]:
+    """Run shards on ``workers`` processes that each take the next queued one.
+
+    Returns ``(arguments, summary)`` pairs in completion order.
+    """
+    results = []
+    with ProcessPoolExecutor(
+            max_workers=workers, **executor_kwargs) as executor:
+        futures = {executor.submit(_run_shard, item): item for item in arguments}
+        try:
+            for future in as_completed(futures):
+                results.append((futures[future], future.result()))
+        except BaseException:
+            # A failed shard fails the run; do not start the queued rest.
+            for future in futures:
+                future.cancel()
+            raise
+    return results
 
 
 def _atomic_json(path: Path, payload: dict) -> None:
@@ -79,7 +132,7 @@ def _atomic_json(path: Path, payload: dict) -> None:
 
 def _run_shard(arguments: dict) -> dict:
     output = Path(arguments["output"])
-    result = fixture.run_harvest(
+    return _shard_summary(arguments, fixture.run_harvest(
         arguments["games"], arguments["seed"], output,
         max_steps=arguments["max_steps"],
         game_offset=arguments["offset"],
@@ -89,16 +142,37 @@ def _run_shard(arguments: dict) -> dict:
         decks_directory=arguments.get("decks_directory"),
         format_name=arguments.get("format_name"),
         format_dir=arguments.get("format_dir"),
-    )
+        lockstep_games=arguments.get("lockstep_games", 1),
+    ))
+
+
+def _shard_summary(arguments: dict, result: dict) -> dict:
+    """Describe a finished shard without its records.
+
+    Records stay in the shard's game logs; ``record_logs`` names each log
+    relative to the shard directory with the global game indices it holds,
+    in order, and the digest validation recorded for it.
+    """
+    run_manifest = result["run_manifest"]
+    digests = run_manifest.get("artifacts") or {}
+    lockstep = run_manifest.get("lockstep")
+    if lockstep:
+        logs = [(f"{lane['output']}/game_log.jsonl", lane["games"])
+                for lane in lockstep["lanes"]]
+    else:
+        logs = [("game_log.jsonl", list(range(
+            arguments["offset"], arguments["offset"] + arguments["games"])))]
     return {
         "shard": arguments["shard"],
         "offset": arguments["offset"],
         "games": arguments["games"],
-        "output": output.name,
+        "output": Path(arguments["output"]).name,
         "agent_version": result["agent_version"],
-        "results": dict(Counter(
-            record["result"] for record in result["records"])),
-        "records": result["records"],
+        "results": dict(run_manifest["results"]),
+        "timing": run_manifest.get("timing"),
+        "record_logs": [
+            {"path": path, "games": list(games), "sha256": digests.get(path)}
+            for path, games in logs],
         "fidelity": result["fidelity"],
         "manifest": result["manifest"],
         "agent_policy": result["run_manifest"].get("agent_policy"),
@@ -108,6 +182,138 @@ def _run_shard(arguments: dict) -> dict:
     }
 
 
+def _record_log_lines(path: Path, games: Sequence[int],
+                      sha256: str | None):
+    """Yield ``(game index, line)`` from one shard log, verifying its bytes."""
+    digest = hashlib.sha256()
+    indices = iter(games)
+    with path.open("rb") as handle:
+        for line in handle:
+            digest.update(line)
+            if not line.strip():
+                continue
+            index = next(indices, None)
+            if index is None:
+                raise RuntimeError(
+                    f"Shard game log holds more records than games: {path}")
+            yield index, line.rstrip(b"\r\n") + b"\n"
+    if next(indices, None) is not None:
+        raise RuntimeError(
+            f"Shard game log holds fewer records than games: {path}")
+    if sha256 is not None and digest.hexdigest() != sha256:
+        raise RuntimeError(f"Shard game log changed after validation: {path}")
+
+
+def _merge_record_logs(output: Path, results: Sequence[dict]) -> Counter:
+    """Stream every shard log into the root game log in global game order.
+
+    Shard and lane logs are each already ordered, so a k-way merge holds
+    one line per log in memory however many games the run has.  Returns
+    the result counts.
+    """
+    streams = [
+        _record_log_lines(
+            output / shard["output"] / log["path"], log["games"],
+            log.get("sha256"))
+        for shard in results for log in shard["record_logs"]]
+    counts = Counter()
+    temporary = output / "game_log.jsonl.tmp"
+    try:
+        with temporary.open("wb") as handle:
+            for _, line in heapq.merge(*streams, key=lambda item: item[0]):
+                counts[json.loads(line)["result"]] += 1
+                handle.write(line)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+    temporary.replace(output / "game_log.jsonl")
+    return counts
+
+
+class HarvestRecordLog(Sequence):
+    """Read-only sequence of game records streamed from a merged game log."""
+
+    def __init__(self, path: Path, count: int):
+        self.path = Path(path)
+        self._count = count
+        self._offsets = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self):
+        with self.path.open(encoding="utf-8") as handle:
+            for line in handle:
+                if line.strip():
+                    yield json.loads(line)
+
+    def _line_offsets(self) -> list[int]:
+        """Byte offset of every record line, indexed on first random access."""
+        if self._offsets is None:
+            offsets = []
+            with self.path.open("rb") as handle:
+                position = 0
+                for line in handle:
+                    if line.strip():
+                        offsets.append(position)
+                    position += len(line)
+            self._offsets = offsets
+        return self._offsets
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[item] for item in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("harvest record index out of range")
+        with self.path.open("rb") as handle:
+            handle.seek(self._line_offsets()[index])
+            return json.loads(handle.readline())
+
+
+def _resume_shard(arguments: dict) -> dict | None:
+    """Reuse a shard a previous attempt completed, or clear its remains.
+
+    A completed shard must still hold the artifacts it validated, for the
+    same slice of the schedule, and its checkpoints must be byte-identical
+    to the ones it recorded.  Anything short of a completion marker is
+    deleted so the shard can be replayed from its first game.
+    """
+    output = Path(arguments["output"])
+    if not (output / "harvest_run.json").is_file():
+        if output.exists():
+            shutil.rmtree(output)
+        return None
+    result = fixture.load_completed_harvest(output)
+    run_manifest = result["run_manifest"]
+    expected = {
+        "seed": arguments["seed"],
+        "games": arguments["games"],
+        "game_offset": arguments["offset"],
+        "max_steps": arguments["max_steps"],
+        "agent_seat": "p1" if arguments.get("agent_is_p1", True) else "p2",
+    }
+    for key, value in expected.items():
+        if run_manifest.get(key) != value:
+            raise RuntimeError(
+                f"Completed shard {output.name} has {key}="
+                f"{run_manifest.get(key)!r}, expected {value!r}")
+    for role, model, recorded in (
+            ("Agent", arguments.get("agent_model"),
+             run_manifest.get("agent_policy")),
+            ("Opponent", arguments.get("opponent_model"),
+             run_manifest.get("opponent_policy"))):
+        if model:
+            fixture.verify_checkpoint_identity_unchanged(
+                model, recorded, role=role)
+        elif (recorded or {}).get("kind") not in {"random-valid", "scripted"}:
+            raise RuntimeError(
+                f"Completed shard {output.name} used a {role.lower()} "
+                "checkpoint this run does not")
+    return _shard_summary(arguments, result)
+
+
 def run_parallel_harvest(
     games: int,
     workers: int,
@@ -121,10 +327,126 @@ def run_parallel_harvest(
     decks_directory: Path | str | None = None,
     format_name: str | None = None,
     format_dir: Path | str | None = None,
+    game_offset: int = 0,
+    chunk_games: int = DEFAULT_CHUNK_GAMES,
+    lockstep_games: int = 1,
+    resume: bool = False,
 ) -> dict:
-    """Run strict isolated shards and publish one success-only root manifest."""
-    shards = partition_games(games, workers)
-    output = fixture.prepare_output_directory(Path(output_directory))
+    """Run strict isolated shards and publish one success-only root manifest.
+
+    The games are split into ``chunk_games`` shards that ``workers``
+    processes pull from a queue.  A game's seed and matchup come from its
+    global index and shards are merged in index order, so the records and
+    card-support manifest do not depend on the worker count.
+    ``game_offset`` starts the run at that index of the global game
+    schedule, so consecutive runs can continue one schedule.
+    ``lockstep_games`` lets each shard batch checkpoint decisions across
+    that many of its games (see ``fixture.run_harvest``).
+
+    Every run records its plan in ``harvest_protocol_plan.json`` first.
+    ``resume=True`` continues an interrupted run in the same directory: the
+    plan must match exactly, completed shards are reloaded and verified, and
+    only the remaining shards are played.  The root manifest is still
+    written only once every shard has validated.
+    """
+    return run_parallel_harvests([{
+        "games": games, "seed": seed, "output_directory": output_directory,
+        "max_steps": max_steps, "agent_model": agent_model,
+        "opponent_model": opponent_model, "agent_is_p1": agent_is_p1,
+        "decks_directory": decks_directory, "format_name": format_name,
+        "format_dir": format_dir, "game_offset": game_offset,
+        "chunk_games": chunk_games, "lockstep_games": lockstep_games,
+        "resume": resume,
+    }], workers)[0]
+
+
+def run_parallel_harvests(runs: Sequence[dict], workers: int) -> list[dict]:
+    """Play several harvest runs' shards from one shared worker queue.
+
+    Each entry holds ``run_parallel_harvest``'s arguments other than
+    ``workers``.  Every run is planned, merged, checked and published on
+    its own exactly as a single run would be; only the queue is shared, so
+    one run's short games fill the workers while another's long ones
+    finish.  Queued shards alternate between runs.  Returns the runs'
+    results in order.
+    """
+    if isinstance(workers, bool) or not isinstance(workers, int) or workers < 1:
+        raise ValueError("workers must be a positive integer")
+    plans = [_plan_harvest_run(index, **run) for index, run in enumerate(runs)]
+    started = time.perf_counter()
+    pending = [
+        item
+        for group in itertools.zip_longest(
+            *(plan["pending"] for plan in plans))
+        for item in group if item is not None]
+    worker_count = min(workers, max(len(pending), 1))
+    load_policies = any(
+        item.get("agent_model") or item.get("opponent_model")
+        for item in pending)
+    corpora = dict.fromkeys(
+        (item["decks_directory"], item["format_name"], item["format_dir"])
+        for item in pending)
+
+    if not pending:
+        completed = []
+    elif len(pending) == 1:
+        completed = [(pending[0], _run_shard(pending[0]))]
+    elif worker_count == 1:
+        # Every shard in this process copies one loaded corpus.
+        for corpus in corpora:
+            _preload_shard_template(*corpus, load_policies=False)
+        try:
+            completed = [(item, _run_shard(item)) for item in pending]
+        finally:
+            fixture.clear_preloaded_corpora()
+    elif template_supported():
+        # This process becomes the workers' template: they fork with the
+        # modules and card database already loaded and share them.
+        for corpus in corpora:
+            _preload_shard_template(*corpus, load_policies=load_policies)
+        try:
+            with frozen_for_fork():
+                completed = _run_shards(
+                    pending, worker_count,
+                    mp_context=multiprocessing.get_context("fork"))
+        finally:
+            fixture.clear_preloaded_corpora()
+    else:
+        completed = _run_shards(pending, worker_count)
+    elapsed = max(time.perf_counter() - started, 1e-9)
+    return [
+        _publish_harvest_run(
+            plan, [summary for item, summary in completed
+                   if item["run"] == plan["run"]],
+            elapsed=elapsed, worker_count=worker_count)
+        for plan in plans]
+
+
+def _plan_harvest_run(
+    run: int,
+    *,
+    games: int,
+    seed: int,
+    output_directory: Path,
+    max_steps: int = fixture.MAX_STEPS_PER_GAME,
+    agent_model: Path | str | None = None,
+    opponent_model: Path | str | None = None,
+    agent_is_p1: bool = True,
+    decks_directory: Path | str | None = None,
+    format_name: str | None = None,
+    format_dir: Path | str | None = None,
+    game_offset: int = 0,
+    chunk_games: int = DEFAULT_CHUNK_GAMES,
+    lockstep_games: int = 1,
+    resume: bool = False,
+) -> dict:
+    """Validate one run, claim its directory and list its shards to play."""
+    if isinstance(game_offset, bool) or not isinstance(game_offset, int) \
+            or game_offset < 0:
+        raise ValueError("game_offset must be a non-negative integer")
+    shards = [
+        dict(shard, offset=shard["offset"] + game_offset)
+        for shard in partition_games(games, chunk_games)]
     # Capture the expected checkpoint bytes before any worker loads them.  Each
     # shard reports the identity it actually stamped into its fixture run; a
     # mismatch means this was not one coherent policy evaluation.
@@ -133,10 +455,48 @@ def run_parallel_harvest(
         fixture.checkpoint_identity(opponent_model) if opponent_model else None)
     expected_agent_policy = agent_identity or {"kind": "random-valid"}
     expected_opponent_policy = opponent_identity or {"kind": "scripted"}
-    started = time.perf_counter()
+    plan = {
+        "schema_version": 1,
+        "protocol_version": PROTOCOL_VERSION,
+        "seed": seed,
+        "games": games,
+        "game_offset": game_offset,
+        "chunk_games": chunk_games,
+        "lockstep_games": lockstep_games,
+        "max_steps": max_steps,
+        "agent_seat": "p1" if agent_is_p1 else "p2",
+        "agent_policy": expected_agent_policy,
+        "opponent_policy": expected_opponent_policy,
+        "corpus": {
+            "decks_directory": (
+                str(decks_directory) if decks_directory else None),
+            "format_name": format_name,
+            "format_dir": str(format_dir) if format_dir else None,
+        },
+    }
+    if resume:
+        output = Path(output_directory).expanduser().resolve()
+        if (output / "harvest_protocol.json").is_file():
+            raise RuntimeError(f"Harvest already completed: {output}")
+        plan_path = output / "harvest_protocol_plan.json"
+        if not plan_path.is_file():
+            raise RuntimeError(f"No interrupted harvest to resume: {output}")
+        with plan_path.open(encoding="utf-8") as handle:
+            recorded_plan = json.load(handle)
+        if recorded_plan != plan:
+            differing = sorted(
+                key for key in set(plan) | set(recorded_plan)
+                if plan.get(key) != recorded_plan.get(key))
+            raise RuntimeError(
+                "Resumed harvest does not match the interrupted run: "
+                + ", ".join(differing))
+    else:
+        output = fixture.prepare_output_directory(Path(output_directory))
+        _atomic_json(output / "harvest_protocol_plan.json", plan)
     arguments = [
         {
             **shard,
+            "run": run,
             "seed": seed,
             "max_steps": max_steps,
             "output": str(output / f"shard_{shard['shard']:03d}"),
@@ -147,30 +507,49 @@ def run_parallel_harvest(
                 str(decks_directory) if decks_directory else None),
             "format_name": format_name,
             "format_dir": str(format_dir) if format_dir else None,
+            "lockstep_games": lockstep_games,
         }
         for shard in shards
     ]
+    resumed = []
+    if resume:
+        for item in arguments:
+            summary = _resume_shard(item)
+            if summary is not None:
+                resumed.append(summary)
+        completed = {summary["shard"] for summary in resumed}
+        arguments = [item for item in arguments
+                     if item["shard"] not in completed]
+    return {
+        **plan,
+        "run": run,
+        "output": output,
+        "agent_model": agent_model,
+        "opponent_model": opponent_model,
+        "agent_identity": agent_identity,
+        "opponent_identity": opponent_identity,
+        "pending": arguments,
+        "resumed": resumed,
+    }
 
-    if len(arguments) == 1:
-        results = [_run_shard(arguments[0])]
-    else:
-        results = []
-        with ProcessPoolExecutor(max_workers=len(arguments)) as executor:
-            futures = {executor.submit(_run_shard, item): item for item in arguments}
-            for future in as_completed(futures):
-                results.append(future.result())
-    results.sort(key=lambda item: item["shard"])
 
-    elapsed = max(time.perf_counter() - started, 1e-9)
-    all_records = [record for shard in results for record in shard["records"]]
-    if len(all_records) != games:
-        raise RuntimeError(
-            f"Parallel harvest returned {len(all_records)} records for {games} games")
+def _publish_harvest_run(plan: dict, played: Sequence[dict], *,
+                         elapsed: float, worker_count: int) -> dict:
+    """Check one run's shards and write its success-only root artifacts."""
+    output = plan["output"]
+    games = plan["games"]
+    expected_agent_policy = plan["agent_policy"]
+    expected_opponent_policy = plan["opponent_policy"]
+    results = sorted(plan["resumed"] + list(played),
+                     key=lambda item: item["shard"])
+    played_games = sum(item["games"] for item in played)
+    timing = fixture.sum_run_timing(
+        item["timing"] for item in played if item.get("timing"))
     fidelity = {
         counter: sum(int(shard["fidelity"].get(counter, 0)) for shard in results)
         for counter in fixture.FIDELITY_COUNTERS
     }
-    manifest = _merge_manifests([shard["manifest"] for shard in results])
+    manifest = fixture.merge_support_manifests([shard["manifest"] for shard in results])
     # Every shard loads the same corpus; a lineage mismatch means the run is
     # not one coherent stats scope and must not publish a root manifest.
     lineages = [shard.get("lineage") for shard in results]
@@ -186,28 +565,40 @@ def run_parallel_harvest(
             "Harvest shards disagree on the opponent checkpoint identity")
     # Catch a persistent replacement that occurs after workers start.  The
     # per-shard checks above also catch workers that observed different bytes.
-    if agent_model and fixture.checkpoint_identity(agent_model) != agent_identity:
+    agent_model, opponent_model = plan["agent_model"], plan["opponent_model"]
+    if agent_model and fixture.checkpoint_identity(agent_model) \
+            != plan["agent_identity"]:
         raise RuntimeError("Agent checkpoint changed during parallel harvest")
-    if opponent_model \
-            and fixture.checkpoint_identity(opponent_model) != opponent_identity:
+    if opponent_model and fixture.checkpoint_identity(opponent_model) \
+            != plan["opponent_identity"]:
         raise RuntimeError("Opponent checkpoint changed during parallel harvest")
+    results_count = _merge_record_logs(output, results)
+    if sum(results_count.values()) != games:
+        raise RuntimeError(
+            f"Parallel harvest returned {sum(results_count.values())} "
+            f"records for {games} games")
     protocol_manifest = {
         "schema_version": 1,
         "status": "complete",
         "protocol_version": PROTOCOL_VERSION,
-        "seed": seed,
+        "seed": plan["seed"],
         "games": games,
-        "workers": len(results),
-        "max_steps": max_steps,
+        "game_offset": plan["game_offset"],
+        "chunk_games": plan["chunk_games"],
+        "lockstep_games": plan["lockstep_games"],
+        "workers": worker_count,
+        "max_steps": plan["max_steps"],
         "elapsed_seconds": elapsed,
-        "games_per_second": games / elapsed,
+        "games_per_second": played_games / elapsed,
+        "steps_per_second": timing["steps"] / elapsed,
+        "timing": timing,
+        "resumed_shards": len(plan["resumed"]),
         "agent_policy": expected_agent_policy,
         "opponent_policy": expected_opponent_policy,
-        "agent_seat": "p1" if agent_is_p1 else "p2",
+        "agent_seat": plan["agent_seat"],
         "lineage": lineages[0],
         "decks": results[0].get("decks"),
-        "results": dict(sorted(Counter(
-            record["result"] for record in all_records).items())),
+        "results": dict(sorted(results_count.items())),
         "fidelity": fidelity,
         "manifest_entries": len(manifest),
         "shards": [
@@ -220,13 +611,37 @@ def run_parallel_harvest(
     _atomic_json(output / "card_support_manifest.json", manifest)
     return {
         "output": output,
-        "records": all_records,
+        "records": HarvestRecordLog(output / "game_log.jsonl", games),
         "fidelity": fidelity,
         "manifest": manifest,
         "protocol_manifest": protocol_manifest,
     }
 
 
+def protocol_benchmark_report(protocol_manifest: dict) -> dict:
+    """Benchmark report for a fresh ``run_parallel_harvest``.
+
+    Throughput is over the run's wall time; component seconds are summed
+    across shards, and ``worker_utilization`` is the share of the workers'
+    wall time spent inside shards.
+    """
+    if protocol_manifest["resumed_shards"]:
+        raise ValueError("A resumed harvest cannot be benchmarked")
+    timing = protocol_manifest["timing"]
+    elapsed = protocol_manifest["elapsed_seconds"]
+    report = fixture.benchmark_report(
+        "harvest_protocol",
+        {key: protocol_manifest[key] for key in (
+            "seed", "games", "game_offset", "chunk_games", "lockstep_games",
+            "workers", "max_steps", "agent_seat", "agent_policy",
+            "opponent_policy", "lineage")},
+        games=protocol_manifest["games"], elapsed_seconds=elapsed,
+        timing=timing)
+    report["worker_utilization"] = timing["shard_seconds"] / (
+        max(elapsed, 1e-9) * protocol_manifest["workers"])
+    return report
+
+
 def _candidate_points(records: Sequence[dict], candidate_is_agent: bool) -> float:
     """Score agent-relative records for the policy occupying either role."""
     points = 0.0
@@ -271,14 +686,16 @@ def run_promotion(
         "format_name": format_name,
         "format_dir": format_dir,
     }
-    candidate_p1 = run_parallel_harvest(
-        games_per_seat, workers, seed, output / "candidate_p1",
-        max_steps=max_steps, agent_model=candidate, opponent_model=baseline,
-        **corpus_kwargs)
-    candidate_p2 = run_parallel_harvest(
-        games_per_seat, workers, seed, output / "candidate_p2",
-        max_steps=max_steps, agent_model=baseline, opponent_model=candidate,
-        **corpus_kwargs)
+    candidate_p1, candidate_p2 = run_parallel_harvests([
+        {"games": games_per_seat, "seed": seed,
+         "output_directory": output / "candidate_p1", "max_steps": max_steps,
+         "agent_model": candidate, "opponent_model": baseline,
+         **corpus_kwargs},
+        {"games": games_per_seat, "seed": seed,
+         "output_directory": output / "candidate_p2", "max_steps": max_steps,
+         "agent_model": baseline, "opponent_model": candidate,
+         **corpus_kwargs},
+    ], workers)
 
     points = (
         _candidate_points(candidate_p1["records"], True)
@@ -290,7 +707,7 @@ def run_promotion(
             + candidate_p2["fidelity"].get(counter, 0))
         for counter in fixture.FIDELITY_COUNTERS
     }
-    merged_manifest = _merge_manifests([
+    merged_manifest = fixture.merge_support_manifests([
         candidate_p1["manifest"], candidate_p2["manifest"]])
     severe_cards = sorted(
         name for name, entry in merged_manifest.items()
@@ -333,7 +750,7 @@ def _qualification_leg(
         raise RuntimeError(
             f"Candidate {seat} qualification leg did not complete its protocol")
     records = result.get("records")
-    if not isinstance(records, list) or len(records) != games:
+    if not isinstance(records, Sequence) or len(records) != games:
         raise RuntimeError(
             f"Candidate {seat} qualification leg returned the wrong game count")
     expected_agent_is_p1 = seat == "p1"
@@ -350,6 +767,21 @@ def _qualification_leg(
     return protocol_manifest, result
 
 
+def _qualification_pair_units(p1_records: Iterable[dict],
+                               p2_records: Iterable[dict],
+                               raw_results: Counter) -> Iterator[float]:
+    """Score game ``i`` of both seat legs as one seat-swapped pair.
+
+    Records are consumed as streams; each one's raw result is tallied into
+    ``raw_results`` as its pair is scored.
+    """
+    for first, second in zip(p1_records, p2_records):
+        raw_results[first["result"]] += 1
+        raw_results[second["result"]] += 1
+        yield (_candidate_points((first,), True)
+               + _candidate_points((second,), True)) / 2.0
+
+
 def run_qualification(
     candidate: Path | str,
     games: int,
@@ -362,70 +794,129 @@ def run_qualification(
     decks_directory: Path | str | None = None,
     format_name: str | None = None,
     format_dir: Path | str | None = None,
+    sequential: bool = False,
+    sequential_error_rate: float = DEFAULT_SEQUENTIAL_ERROR_RATE,
+    sequential_indifference: float = DEFAULT_SEQUENTIAL_INDIFFERENCE,
+    sequential_batch: int = 8,
 ) -> dict:
     """Gate a checkpoint against scripted play in equal, paired seats.
 
     A 0.55 default requires evidence of an edge rather than merely tying the
     baseline. The decision is published only after both strict legs complete,
     agree on lineage/checkpoint identity, and yield validated game artifacts.
+
+    With ``sequential``, both seats play stages of ``sequential_batch`` games
+    that continue one game schedule, and qualification stops once the
+    sequential test over the pairs played so far settles the decision.
+    ``games`` is then the budget; an unsettled test falls back to the
+    fixed-sample score rule over every game played.
     """
     if games < 2 or games % 2:
         raise ValueError("qualification games must be an even integer of at least 2")
     if not 0.5 <= minimum_score <= 1.0:
         raise ValueError("minimum_score must be between 0.5 and 1.0")
+    rule = None
+    if sequential:
+        if sequential_batch < 1:
+            raise ValueError("sequential_batch must be at least 1")
+        rule = sequential_test_config(
+            minimum_score, error_rate=sequential_error_rate,
+            indifference=sequential_indifference)
 
     output = fixture.prepare_output_directory(Path(output_directory))
     candidate_identity = fixture.checkpoint_identity(candidate)
-    games_per_seat = games // 2
+    games_budget_per_seat = games // 2
+    stage_games = (
+        min(sequential_batch, games_budget_per_seat) if sequential
+        else games_budget_per_seat)
     corpus_kwargs = {
         "decks_directory": decks_directory,
         "format_name": format_name,
         "format_dir": format_dir,
     }
-    candidate_p1 = run_parallel_harvest(
-        games_per_seat, workers, seed, output / "candidate_p1",
-        max_steps=max_steps, agent_model=candidate, agent_is_p1=True,
-        **corpus_kwargs)
-    candidate_p2 = run_parallel_harvest(
-        games_per_seat, workers, seed, output / "candidate_p2",
-        max_steps=max_steps, agent_model=candidate, agent_is_p1=False,
-        **corpus_kwargs)
-
-    p1_protocol, candidate_p1 = _qualification_leg(
-        candidate_p1, games=games_per_seat, seat="p1",
-        candidate_identity=candidate_identity)
-    p2_protocol, candidate_p2 = _qualification_leg(
-        candidate_p2, games=games_per_seat, seat="p2",
-        candidate_identity=candidate_identity)
-    lineage = p1_protocol.get("lineage")
-    if lineage != p2_protocol.get("lineage"):
+    legs: dict[str, list[dict]] = {"p1": [], "p2": []}
+    protocols: list[dict] = []
+    stages: list[dict] = []
+    sequential_result = None
+    games_per_seat = 0
+    # Running totals over the streamed game logs; no stage's records are
+    # held in memory or read again once scored.
+    raw_results: Counter = Counter()
+    points = 0.0
+    while games_per_seat < games_budget_per_seat:
+        count = min(stage_games, games_budget_per_seat - games_per_seat)
+        runs = []
+        for seat in ("p1", "p2"):
+            leg_output = output / f"candidate_{seat}"
+            if sequential:
+                leg_output = leg_output / f"stage_{len(stages):03d}"
+            runs.append({
+                "games": count, "seed": seed, "output_directory": leg_output,
+                "max_steps": max_steps, "agent_model": candidate,
+                "agent_is_p1": seat == "p1", "game_offset": games_per_seat,
+                **corpus_kwargs})
+        # Both seats share one worker queue, so neither leg's slow games
+        # leave workers idle while the other seat waits its turn.
+        for seat, leg in zip(("p1", "p2"), run_parallel_harvests(runs, workers)):
+            protocol_manifest, result = _qualification_leg(
+                leg, games=count, seat=seat,
+                candidate_identity=candidate_identity)
+            protocols.append(protocol_manifest)
+            legs[seat].append(result)
+        games_per_seat += count
+        units = []
+        for unit in _qualification_pair_units(
+                legs["p1"][-1]["records"], legs["p2"][-1]["records"],
+                raw_results):
+            points += 2.0 * unit
+            if rule is not None:
+                units.append(unit)
+        if rule is None:
+            break
+        sequential_result = sequential_score_test(
+            units, rule, previous=sequential_result)
+        stages.append({
+            "games_per_seat": games_per_seat,
+            "log_likelihood_ratio": sequential_result["log_likelihood_ratio"],
+            "decision": sequential_result["decision"],
+        })
+        if sequential_result["decision"] is not None:
+            break
+
+    lineage = protocols[0].get("lineage")
+    if any(item.get("lineage") != lineage for item in protocols[1:]):
         raise RuntimeError("Qualification seat legs disagree on corpus/format lineage")
     if fixture.checkpoint_identity(candidate) != candidate_identity:
         raise RuntimeError("Candidate checkpoint changed during qualification")
 
-    records = candidate_p1["records"] + candidate_p2["records"]
-    raw_results = Counter(record["result"] for record in records)
+    results = legs["p1"] + legs["p2"]
     outcome_counts = {
         "wins": raw_results.get("win", 0),
         "losses": raw_results.get("loss", 0),
         "draws": raw_results.get("draw", 0)
                  + raw_results.get("draw_both_loss", 0),
     }
-    points = _candidate_points(records, True)
-    score = points / games
+    games_played = 2 * games_per_seat
+    score = points / games_played
     fidelity = {
-        counter: (
-            candidate_p1["fidelity"].get(counter, 0)
-            + candidate_p2["fidelity"].get(counter, 0))
+        counter: sum(result["fidelity"].get(counter, 0) for result in results)
         for counter in fixture.FIDELITY_COUNTERS
     }
-    merged_manifest = _merge_manifests([
-        candidate_p1["manifest"], candidate_p2["manifest"]])
+    merged_manifest = fixture.merge_support_manifests(
+        [result["manifest"] for result in results])
     severe_cards = sorted(
         name for name, entry in merged_manifest.items()
         if entry.get("severity") in {"unparsed", "crash"})
     fidelity_clean = not any(fidelity.values()) and not severe_cards
-    score_passed = score >= minimum_score
+    if sequential_result is not None \
+            and sequential_result["decision"] is not None:
+        stopping_rule = "sequential"
+        score_passed = sequential_result["decision"] == "pass"
+    else:
+        stopping_rule = "game_budget" if sequential else "fixed"
+        score_passed = score >= minimum_score
+    if sequential_result is not None:
+        sequential_result["stages"] = stages
     passed = fidelity_clean and score_passed
     decision = {
         "schema_version": 1,
@@ -434,8 +925,11 @@ def run_qualification(
         "lineage": lineage,
         "candidate": candidate_identity,
         "opponent": {"kind": "scripted"},
-        "games": games,
+        "games": games_played,
+        "games_budget": games,
         "games_per_seat": games_per_seat,
+        "stopping_rule": stopping_rule,
+        "sequential_test": sequential_result,
         "seed": seed,
         "result_counts": dict(sorted(raw_results.items())),
         "outcome_counts": outcome_counts,
@@ -485,8 +979,22 @@ def build_parser() -> argparse.ArgumentParser:
     harvest.add_argument("--max-steps", type=_positive_int,
                          default=fixture.MAX_STEPS_PER_GAME)
     harvest.add_argument("--output", type=Path, required=True)
+    harvest.add_argument(
+        "--chunk-games", type=_positive_int, default=DEFAULT_CHUNK_GAMES,
+        help="games per shard that workers pull from the queue "
+             "(default: %(default)s)")
+    harvest.add_argument(
+        "--lockstep-games", type=_positive_int, default=1,
+        help="games each shard advances together so checkpoint decisions "
+             "share one batched forward pass per policy "
+             "(default: %(default)s)")
+    harvest.add_argument(
+        "--resume", action="store_true",
+        help="continue an interrupted run in --output, reusing every shard "
+             "it completed; all other arguments must match that run")
     harvest.add_argument("--agent-model", type=Path)
     harvest.add_argument("--opponent-model", type=Path)
+    fixture.add_benchmark_arguments(harvest)
     _add_corpus_arguments(harvest)
 
     promote = subparsers.add_parser(
@@ -512,12 +1020,35 @@ def build_parser() -> argparse.ArgumentParser:
     qualify.add_argument("--max-steps", type=_positive_int,
                          default=fixture.MAX_STEPS_PER_GAME)
     qualify.add_argument("--output", type=Path, required=True)
+    qualify.add_argument(
+        "--sequential", action="store_true",
+        help="stop early once a sequential probability ratio test over "
+             "seat-swapped pairs settles the decision; --games is the budget")
+    qualify.add_argument(
+        "--sequential-error-rate", type=float,
+        default=DEFAULT_SEQUENTIAL_ERROR_RATE,
+        help="bound on both wrong-decision rates outside the indifference "
+             "margin (default: %(default)s)")
+    qualify.add_argument(
+        "--sequential-indifference", type=float,
+        default=DEFAULT_SEQUENTIAL_INDIFFERENCE,
+        help="score margin around --minimum-score where either decision "
+             "is acceptable (default: %(default)s)")
+    qualify.add_argument(
+        "--sequential-batch", type=_positive_int, default=8,
+        help="games per seat played between sequential checks "
+             "(default: %(default)s)")
     _add_corpus_arguments(qualify)
     return parser
 
 
 def main(argv: Sequence[str] | None = None) -> int:
-    args = build_parser().parse_args(argv)
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    benchmark = args.command == "harvest" and (
+        args.benchmark or args.benchmark_baseline is not None)
+    if benchmark and args.resume:
+        parser.error("--benchmark needs a fresh run, not --resume")
     try:
         if args.command == "harvest":
             result = run_parallel_harvest(
@@ -525,12 +1056,20 @@ def main(argv: Sequence[str] | None = None) -> int:
                 max_steps=args.max_steps, agent_model=args.agent_model,
                 opponent_model=args.opponent_model,
                 decks_directory=args.decks, format_name=args.format,
-                format_dir=args.format_dir)
+                format_dir=args.format_dir, chunk_games=args.chunk_games,
+                lockstep_games=args.lockstep_games, resume=args.resume)
             summary = result["protocol_manifest"]
             print(
                 f"Harvest complete: games={summary['games']} "
                 f"workers={summary['workers']} "
                 f"games_per_second={summary['games_per_second']:.3f}")
+            if benchmark:
+                report = fixture.publish_benchmark(
+                    result["output"], protocol_benchmark_report(summary),
+                    args.benchmark_baseline,
+                    tolerance=args.benchmark_tolerance)
+                if not report.get("comparison", {}).get("passed", True):
+                    return 2
         elif args.command == "promote":
             decision = run_promotion(
                 args.candidate, args.baseline, args.games, args.workers,
@@ -546,12 +1085,19 @@ def main(argv: Sequence[str] | None = None) -> int:
                 args.candidate, args.games, args.workers, args.seed, args.output,
                 minimum_score=args.minimum_score, max_steps=args.max_steps,
                 decks_directory=args.decks, format_name=args.format,
-                format_dir=args.format_dir)
+                format_dir=args.format_dir, sequential=args.sequential,
+                sequential_error_rate=args.sequential_error_rate,
+                sequential_indifference=args.sequential_indifference,
+                sequential_batch=args.sequential_batch)
             print(
                 f"Qualification {decision['decision']}: "
                 f"score={decision['candidate_score']:.3f} "
                 f"threshold={decision['minimum_score']:.3f} "
                 f"fidelity_clean={decision['fidelity_clean']}")
+            if decision.get("stopping_rule", "fixed") != "fixed":
+                print(
+                    f"Sequential stopping: rule={decision['stopping_rule']} "
+                    f"games={decision['games']}/{decision['games_budget']}")
             if not decision["passed"]:
                 return 2
     except (OSError, RuntimeError, ValueError) as exc:
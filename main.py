@@ -8,9 +8,11 @@ import re
 import platform
 import shutil
 import subprocess
+import zipfile
 import multiprocessing
+from multiprocessing import shared_memory
+from multiprocessing.connection import wait as wait_for_connections
 import threading
-import torch
 import time
 import random
 import logging
@@ -20,11 +22,21 @@ import traceback
 import warnings
 from copy import deepcopy
 from collections import deque
+from concurrent.futures import Future
+from types import SimpleNamespace
 from datetime import datetime, timezone
 from importlib import metadata as importlib_metadata
-from typing import Any, Dict, List, Type, Union, Optional
+from typing import Any, Dict, List, NamedTuple, Type, Union, Optional
 import sys
 
+if __name__ == "__main__":
+    # Answer --help and reject invalid arguments before the training stack
+    # loads; main() parses the same command line again below.
+    import training_cli
+    training_cli.check_command_line()
+
+import torch
+
 # Stable Baselines and Contrib Imports
 from sb3_contrib.ppo_mask import MaskablePPO
 import sb3_contrib.common.maskable.policies
@@ -34,16 +46,21 @@ from stable_baselines3.common.callbacks import (
     BaseCallback
 )
 from stable_baselines3.common.vec_env import (
-    CloudpickleWrapper, DummyVecEnv, SubprocVecEnv, VecEnvWrapper, VecMonitor)
+    CloudpickleWrapper, DummyVecEnv, SubprocVecEnv, VecEnv, VecEnvWrapper,
+    VecMonitor)
 from stable_baselines3.common.torch_layers import BaseFeaturesExtractor
 from stable_baselines3.common.env_util import make_vec_env
-from stable_baselines3.common.utils import set_random_seed
+from stable_baselines3.common.utils import (
+    get_system_info, obs_as_tensor, set_random_seed)
+from stable_baselines3.common.save_util import (
+    data_to_json, recursive_getattr)
+import stable_baselines3
 from sb3_contrib.common.maskable.callbacks import MaskableEvalCallback
 from sb3_contrib.common.maskable.evaluation import evaluate_policy
-from sb3_contrib.common.maskable.utils import get_action_masks
+from sb3_contrib.common.maskable.buffers import MaskableDictRolloutBuffer
+from sb3_contrib.common.maskable.utils import (
+    get_action_masks, is_masking_supported)
 from sb3_contrib.common.wrappers import ActionMasker
-# Optuna for Hyperparameter Optimization
-import optuna
 # Additional imports for network functionality
 import torch.nn.functional as F
 import torch.nn as nn
@@ -52,20 +69,72 @@ import torch.nn as nn
 from Playersim.card import Card, load_decks_and_card_db
 from Playersim.environment import AlphaZeroMTGEnv
 from Playersim.curriculum import (
-    derive_checkpoint_lease_seed, derive_checkpoint_pool_seed,
-    derive_matchup_seed, resolve_curriculum,
+    derive_checkpoint_lease_seed, derive_matchup_seed, resolve_curriculum,
 )
 from Playersim.archetypes import (
     classifier_identity as archetype_classifier_identity,
     declared_profile_hash,
     taxonomy_identity as archetype_taxonomy_identity,
 )
+from Playersim.observation_buffer import (
+    FlatObservationWrapper, ObservationBuffer)
+from Playersim.compact_storage import (
+    CompactArray,
+    compact_mask_field,
+    compact_observation_storage,
+    compact_storage_layout,
+)
+from Playersim.opponent_inference import OpponentInferenceServer
+from Playersim.worker_template import (
+    TEMPLATE_START_METHOD,
+    start_worker_template,
+    template_supported,
+)
+from Playersim.policy_export import (
+    export_inference_policy,
+    inference_policy_path,
+    trace_inference_policy,
+)
+from Playersim.sequential_evaluation import (
+    DEFAULT_SEQUENTIAL_ERROR_RATE,
+    DEFAULT_SEQUENTIAL_INDIFFERENCE,
+    sequential_score_test,
+    sequential_test_config,
+)
+from Playersim.step_latency import (
+    histogram_percentiles, merge_latency_histograms)
 from Playersim.observation_schema import (
     EXACT_OWN_STRATEGY_PROFILE_FIELD,
     EXACT_OWN_STRATEGY_PROFILE_SIZE,
     SEMANTIC_IDENTITY_FIELDS,
 )
 from Playersim.debug import DEBUG_MODE
+from training_cli import (
+    CANARY_CONFIGS,
+    DEFAULT_CHECKPOINT_POOL_PROBABILITY,
+    DEFAULT_CHECKPOINT_POOL_SIZE,
+    DEFAULT_CHECKPOINT_POOL_SNAPSHOT_FREQUENCY,
+    DEFAULT_EVALUATION_SEED,
+    DEFAULT_FORMAT_NAME,
+    DEFAULT_MINIMUM_QUALIFICATION_SCORE,
+    DEFAULT_RECOVERY_CHECKPOINT_FREQUENCY,
+    DEFAULT_TRAINING_ENVIRONMENTS,
+    DEFAULT_TRAINING_SEED,
+    EVALUATION_SEED_OFFSET,
+    ROUND_7_92_CANARY,
+    ROUND_7_93_CANARY,
+    ROUND_7_94_CANARY,
+    ROUND_7_95_CANARY,
+    ROUND_7_96_CANARY,
+    ROUND_7_97_CANARY,
+    ROUND_7_98_CANARY,
+    ROUND_7_99_CANARY,
+    _configuration_values_match,
+    build_parser,
+    resolve_checkpoint_pool_config,
+    validate_arguments,
+    validate_canary_cli,
+)
 
 # Observation v6 exposes the observer's exact own-deck strategy profile. It
 # is conditioning context, not another interchangeable state vector: routing
@@ -250,6 +319,14 @@ class FixedWindowMTGExtractor(BaseFeaturesExtractor):
         """
         return torch.sign(tensor) * torch.log1p(torch.abs(tensor))
 
+    def _encode_fields(self, observations):
+        """Encode the continuous observation fields in ``extractors`` order."""
+        return [
+            extractor(self._symlog(observations[key]))
+            for key, extractor in self.extractors.items()
+            if key in observations
+        ]
+
     def forward(self, observations):
         """Process the observations through the feature extractors"""
         if EXACT_OWN_STRATEGY_PROFILE_FIELD not in observations:
@@ -276,11 +353,7 @@ class FixedWindowMTGExtractor(BaseFeaturesExtractor):
                     0, embedding.num_embeddings - 1)
                 encoded_tensor_list.append(embedding(identity_tensor))
 
-        # Process continuous observation spaces
-        for key, extractor in self.extractors.items():
-            if key in observations:
-                encoded_tensor_list.append(
-                    extractor(self._symlog(observations[key])))
+        encoded_tensor_list.extend(self._encode_fields(observations))
         
         batch_size = encoded_tensor_list[0].shape[0]
         
@@ -340,6 +413,248 @@ class FixedWindowMTGExtractor(BaseFeaturesExtractor):
 # before the active extractor received an honest non-recurrent name.
 CompletelyFixedMTGExtractor = FixedWindowMTGExtractor
 
+
+class FusedFieldGroup(NamedTuple):
+    """Observation fields whose per-key projections share one batched matmul."""
+
+    keys: tuple
+    shape: tuple
+    in_features: int
+    hidden_features: int
+    final_relu: bool
+    # Positions of the two Linear layers inside each per-key Sequential.
+    linear_indices: tuple
+
+
+class FusedExtractorLayout(NamedTuple):
+    groups: tuple
+    # feature_merger input columns in fused concatenation order, as indices
+    # into the per-key layout's columns.
+    merger_column_order: tuple
+
+
+def fused_extractor_layout(observation_space):
+    """Group ``FixedWindowMTGExtractor``'s per-key fields by input shape.
+
+    Groups are ordered by their first field in the observation ``Dict`` and
+    keep that order inside a group, so the layout is deterministic for a
+    given space.
+    """
+    excluded = {"phase", "action_mask", "target_card_ids",
+                EXACT_OWN_STRATEGY_PROFILE_FIELD}
+    prefix_width = 0
+    if "phase" in observation_space.spaces:
+        prefix_width += int(np.prod(observation_space.spaces["phase"].shape)) * 16
+    fields = []
+    for key, subspace in observation_space.spaces.items():
+        if key in excluded:
+            continue
+        shape = tuple(int(size) for size in subspace.shape)
+        if key in SEMANTIC_IDENTITY_FIELDS:
+            prefix_width += int(np.prod(shape)) * 32
+            continue
+        if len(shape) == 1:
+            fields.append((key, shape, shape[0], 64, False, (0, 2), 128))
+        elif len(shape) == 2:
+            fields.append((key, shape, shape[1], 256, True, (0, 2),
+                           shape[0] * 128))
+        elif len(shape) == 3:
+            fields.append((key, shape, shape[1] * shape[2], 256, True,
+                           (1, 3), shape[0] * 128))
+        else:
+            raise ValueError(
+                f"Unsupported observation rank for '{key}': shape={shape}")
+    columns = {}
+    column = prefix_width
+    for key, *_, width in fields:
+        columns[key] = range(column, column + width)
+        column += width
+    grouped = {}
+    for key, shape, in_features, hidden, final_relu, linear_indices, _ in fields:
+        grouped.setdefault(
+            (shape, in_features, hidden, final_relu, linear_indices),
+            []).append(key)
+    groups = tuple(
+        FusedFieldGroup(tuple(keys), *signature)
+        for signature, keys in grouped.items())
+    order = list(range(prefix_width))
+    for group in groups:
+        for key in group.keys:
+            order.extend(columns[key])
+    return FusedExtractorLayout(groups, tuple(order))
+
+
+def _extractor_prefixes(state_dict, marker):
+    return sorted({
+        name[:-len("feature_merger.weight")]
+        for name in state_dict
+        if name.endswith("feature_merger.weight")
+        and any(other.startswith(
+            name[:-len("feature_merger.weight")] + marker)
+            for other in state_dict)
+    })
+
+
+def fuse_extractor_state_dict(state_dict, observation_space):
+    """Convert per-key ``extractors.*`` weights to the fused layout.
+
+    Accepts an extractor or whole-policy state dict; every extractor prefix
+    (``features_extractor.``, ``pi_features_extractor.``, ...) is converted.
+    """
+    layout = fused_extractor_layout(observation_space)
+    prefixes = _extractor_prefixes(state_dict, "extractors.")
+    if not prefixes:
+        raise ValueError("State dict has no per-key extractor weights")
+    order = torch.as_tensor(layout.merger_column_order, dtype=torch.long)
+    converted = dict(state_dict)
+    for prefix in prefixes:
+        for index, group in enumerate(layout.groups):
+            first, second = group.linear_indices
+            for name, position in (("1", first), ("2", second)):
+                weights = []
+                biases = []
+                for key in group.keys:
+                    base = f"{prefix}extractors.{key}.{position}"
+                    weights.append(converted.pop(f"{base}.weight").t())
+                    biases.append(converted.pop(f"{base}.bias").unsqueeze(0))
+                target = f"{prefix}grouped_extractors.{index}"
+                converted[f"{target}.weight{name}"] = torch.stack(weights)
+                converted[f"{target}.bias{name}"] = torch.stack(biases)
+        merger = f"{prefix}feature_merger.weight"
+        converted[merger] = converted[merger].index_select(
+            1, order.to(converted[merger].device))
+        leftover = [name for name in converted
+                    if name.startswith(f"{prefix}extractors.")]
+        if leftover:
+            raise ValueError(
+                f"Per-key extractor weights do not match the observation "
+                f"space: {leftover[:3]}")
+    return converted
+
+
+def unfuse_extractor_state_dict(state_dict, observation_space):
+    """Convert fused ``grouped_extractors.*`` weights back to per-key form."""
+    layout = fused_extractor_layout(observation_space)
+    prefixes = _extractor_prefixes(state_dict, "grouped_extractors.")
+    if not prefixes:
+        raise ValueError("State dict has no fused extractor weights")
+    order = torch.as_tensor(layout.merger_column_order, dtype=torch.long)
+    converted = dict(state_dict)
+    for prefix in prefixes:
+        for index, group in enumerate(layout.groups):
+            first, second = group.linear_indices
+            for name, position in (("1", first), ("2", second)):
+                target = f"{prefix}grouped_extractors.{index}"
+                weights = converted.pop(f"{target}.weight{name}")
+                biases = converted.pop(f"{target}.bias{name}")
+                for slot, key in enumerate(group.keys):
+                    base = f"{prefix}extractors.{key}.{position}"
+                    converted[f"{base}.weight"] = \
+                        weights[slot].t().contiguous()
+                    converted[f"{base}.bias"] = biases[slot, 0].clone()
+        merger = f"{prefix}feature_merger.weight"
+        fused_merger = converted[merger]
+        restored = torch.empty_like(fused_merger)
+        restored[:, order.to(fused_merger.device)] = fused_merger
+        converted[merger] = restored
+    return converted
+
+
+class GroupedFieldProjection(torch.nn.Module):
+    """Every field of one ``FusedFieldGroup`` in two batched matmuls.
+
+    Slot ``g`` of each stacked parameter is the transposed weight (or the
+    bias) of the ``g``-th field's per-key ``Linear``.
+    """
+
+    def __init__(self, group):
+        super().__init__()
+        size = len(group.keys)
+        self.keys = tuple(group.keys)
+        self.final_relu = bool(group.final_relu)
+        self.weight1 = torch.nn.Parameter(
+            torch.empty(size, group.in_features, group.hidden_features))
+        self.bias1 = torch.nn.Parameter(
+            torch.empty(size, 1, group.hidden_features))
+        self.weight2 = torch.nn.Parameter(
+            torch.empty(size, group.hidden_features, 128))
+        self.bias2 = torch.nn.Parameter(torch.empty(size, 1, 128))
+
+    def forward(self, stacked):
+        """Map ``[fields, batch, ...]`` to ``[batch, fields * objects * 128]``."""
+        batch_size = stacked.shape[1]
+        inputs = stacked.reshape(
+            stacked.shape[0], -1, self.weight1.shape[1])
+        hidden = torch.relu(torch.baddbmm(self.bias1, inputs, self.weight1))
+        output = torch.baddbmm(self.bias2, hidden, self.weight2)
+        if self.final_relu:
+            output = torch.relu(output)
+        return output.reshape(
+            output.shape[0], batch_size, -1).transpose(0, 1).reshape(
+                batch_size, -1)
+
+
+class FusedFixedWindowMTGExtractor(FixedWindowMTGExtractor):
+    """``FixedWindowMTGExtractor`` with its per-key projections fused.
+
+    Fields with the same input shape share one ``GroupedFieldProjection``,
+    so a forward pass runs two batched matmuls per shape group (about twenty
+    groups for the Observation-v6 space) instead of one ``Sequential`` per
+    observation key, and has no data-dependent Python
+    control flow (it traces and compiles).  Outputs match the per-key
+    extractor within float tolerance; ``fuse_extractor_state_dict`` and
+    ``unfuse_extractor_state_dict`` convert weights between the two layouts.
+    A fresh instance is initialized from the per-key layout, so both classes
+    draw identical initial weights from the same seed.
+    """
+
+    def __init__(self, observation_space, features_dim=512):
+        super().__init__(observation_space, features_dim=features_dim)
+        self.field_layout = fused_extractor_layout(observation_space)
+        fused_state = fuse_extractor_state_dict(
+            self.state_dict(), observation_space)
+        self.extractors = torch.nn.ModuleDict()
+        self.grouped_extractors = torch.nn.ModuleList(
+            GroupedFieldProjection(group)
+            for group in self.field_layout.groups)
+        self.load_state_dict(fused_state)
+
+    def _encode_fields(self, observations):
+        return [
+            group(self._symlog(torch.stack(
+                [observations[key] for key in group.keys])))
+            for group in self.grouped_extractors
+        ]
+
+
+def fuse_policy_features_extractor(policy):
+    """Swap a policy's per-key extractor for the fused one, in place.
+
+    Intended for inference (evaluation, harvest, opponent serving): the
+    policy's optimizer still references the replaced parameters, and a
+    saved model's ``policy_kwargs`` still name the per-key class.
+    """
+    extractor = policy.features_extractor
+    if isinstance(extractor, FusedFixedWindowMTGExtractor):
+        return policy
+    if not isinstance(extractor, FixedWindowMTGExtractor):
+        raise TypeError(
+            f"Cannot fuse {type(extractor).__name__}; expected "
+            "FixedWindowMTGExtractor")
+    observation_space = extractor._observation_space
+    fused = FusedFixedWindowMTGExtractor(
+        observation_space, features_dim=extractor.features_dim)
+    fused.load_state_dict(fuse_extractor_state_dict(
+        extractor.state_dict(), observation_space))
+    fused.to(next(extractor.parameters()).device)
+    fused.train(extractor.training)
+    for attribute in (
+            "features_extractor", "pi_features_extractor",
+            "vf_features_extractor"):
+        if getattr(policy, attribute, None) is extractor:
+            setattr(policy, attribute, fused)
+    return policy
+
 class FixedDimensionMaskableActorCriticPolicy(sb3_contrib.common.maskable.policies.MaskableActorCriticPolicy):
     """
     Custom policy that ensures dimensions match correctly between feature extractor and policy networks.
@@ -1025,7 +1340,6 @@ torch.set_float32_matmul_precision('high')
 # Path Configuration
 VERSION = "ALPHA_ZERO_MTG_V3.00"
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-DEFAULT_FORMAT_NAME = "standard"
 DEFAULT_FORMAT_DIR = os.path.join(BASE_DIR, "formats", DEFAULT_FORMAT_NAME)
 DECKS_DIR = os.path.join(DEFAULT_FORMAT_DIR, "decks")
 MODEL_DIR = os.path.join(BASE_DIR, "models")
@@ -1033,271 +1347,6 @@ LOG_DIR = os.path.join(BASE_DIR, "logs")
 TENSORBOARD_DIR = os.path.join(BASE_DIR, "tensorboard_logs")
 
 TRAINING_MANIFEST_SCHEMA_VERSION = 1
-EVALUATION_SEED_OFFSET = 1_000_000
-DEFAULT_TRAINING_SEED = 20_260_715
-DEFAULT_EVALUATION_SEED = 21_260_715
-DEFAULT_TRAINING_ENVIRONMENTS = 8
-DEFAULT_RECOVERY_CHECKPOINT_FREQUENCY = 500_000
-DEFAULT_CHECKPOINT_POOL_SNAPSHOT_FREQUENCY = 100_000
-DEFAULT_CHECKPOINT_POOL_SIZE = 4
-DEFAULT_CHECKPOINT_POOL_PROBABILITY = 0.5
-
-
-def _checkpoint_pool_contract(
-        *, enabled, snapshot_frequency, max_checkpoints,
-        self_play_probability, base_seed, num_envs):
-    """Normalize the resource-bounded checkpoint-league experiment contract."""
-    frequency = int(snapshot_frequency)
-    pool_size = int(max_checkpoints)
-    probability = float(self_play_probability)
-    environment_count = int(num_envs)
-    if frequency <= 0:
-        raise ValueError("checkpoint pool snapshot frequency must be positive")
-    if pool_size <= 0:
-        raise ValueError("checkpoint pool size must be positive")
-    if not math.isfinite(probability) or not 0.0 <= probability <= 1.0:
-        raise ValueError(
-            "checkpoint pool probability must be between 0 and 1")
-    if bool(enabled) and probability <= 0.0:
-        raise ValueError(
-            "enabled checkpoint pool self-play requires positive probability")
-    if environment_count <= 0:
-        raise ValueError("checkpoint pool requires at least one training worker")
-    worker_seeds = [
-        derive_checkpoint_pool_seed(int(base_seed), worker_index)
-        for worker_index in range(environment_count)
-    ]
-    return {
-        "schema_version": 1,
-        "enabled": bool(enabled),
-        "snapshot_frequency_timesteps": frequency,
-        "max_checkpoints": pool_size,
-        "self_play_probability": probability,
-        "base_seed": int(base_seed),
-        "worker_seeds": worker_seeds,
-        "storage": "bounded_on_disk_fifo",
-        "sampling": "resident_checkpoint_vs_scripted_per_episode",
-        "lease_assignment": "deterministic_seeded_uniform",
-        "lease_refresh": "pool_snapshot",
-        "resident_policies_per_worker": 1,
-        # Eager compatibility validation briefly holds active+pending during a
-        # refresh; reset atomically promotes pending and releases the old one.
-        "maximum_resident_policies_per_worker_during_refresh": 2,
-        "estimated_resident_policy_copies": (
-            environment_count if bool(enabled) else 0),
-        "checkpoint_loader_device": "cpu",
-        "evaluation_opponent": "scripted_unchanged",
-    }
-
-
-def resolve_checkpoint_pool_config(args, *, num_envs):
-    """Resolve CLI settings into a manifest-safe self-play contract."""
-    return _checkpoint_pool_contract(
-        enabled=getattr(args, "checkpoint_pool_self_play", False),
-        snapshot_frequency=getattr(
-            args, "checkpoint_pool_snapshot_freq",
-            DEFAULT_CHECKPOINT_POOL_SNAPSHOT_FREQUENCY),
-        max_checkpoints=getattr(
-            args, "checkpoint_pool_size", DEFAULT_CHECKPOINT_POOL_SIZE),
-        self_play_probability=getattr(
-            args, "checkpoint_pool_probability",
-            DEFAULT_CHECKPOINT_POOL_PROBABILITY),
-        base_seed=getattr(args, "seed", DEFAULT_TRAINING_SEED),
-        num_envs=num_envs,
-    )
-
-# A named canary is an experiment contract, not merely a convenient collection
-# of defaults.  Supplying --canary-config makes launch fail closed if a CLI,
-# lineage, reward, curriculum, or evaluation-suite input drifts.
-ROUND_7_92_CANARY = {
-    "id": "round-7.92",
-    "cli": {
-        "timesteps": 1_000_000,
-        "eval_freq": 100_000,
-        "eval_episodes": 64,
-        "checkpoint_freq": 50_000,
-        "learning_rate": 2e-4,
-        "batch_size": 256,
-        "n_steps": 1024,
-        "n_envs": DEFAULT_TRAINING_ENVIRONMENTS,
-        "seed": DEFAULT_TRAINING_SEED,
-        "eval_seed": DEFAULT_EVALUATION_SEED,
-        "curriculum": "combat-v5",
-        "format": DEFAULT_FORMAT_NAME,
-        "cpu_only": False,
-        "checkpoint_pool_self_play": False,
-        "checkpoint_pool_snapshot_freq":
-            DEFAULT_CHECKPOINT_POOL_SNAPSHOT_FREQUENCY,
-        "checkpoint_pool_size": DEFAULT_CHECKPOINT_POOL_SIZE,
-        "checkpoint_pool_probability": DEFAULT_CHECKPOINT_POOL_PROBABILITY,
-    },
-    "training_config": {
-        "learning_rate": 2e-4,
-        "n_steps": 1024,
-        "batch_size": 256,
-        "reward_contract_version": "discounted-state-potential-v6",
-        "gamma": 0.999,
-        "gae_lambda": 0.98,
-        "clip_range": 0.2,
-        "clip_range_vf": 0.2,
-        "ent_coef": 0.01,
-        "vf_coef": 0.25,
-        "target_kl": 0.02,
-        "net_arch": {
-            "pi": [512, 256, 128],
-            "vf": [512, 256, 128],
-        },
-        "n_epochs": 5,
-        "max_grad_norm": 0.5,
-        "activation_fn": "torch.nn.modules.activation.ReLU",
-        "action_reward_scale": 0.0,
-        "state_potential_scale": 0.4,
-    },
-    "lineage": {
-        "observation_schema_version": 3,
-        "observation_schema_sha256": (
-            "6e29a94e3443881681afd794185f061133f24ff72350a7df27f48524f00d4137"),
-        "card_registry_sha256": (
-            "c1c7248db35957a43b0068c1c790dce2e615f0b349eb15967fb64001ef2351bb"),
-        "feature_schema_sha256": (
-            "4a0bf0357ae8f9b9b647e4cffa81ef512a36bfcc676fc63b68f7b9a58b99f2fb"),
-        "corpus_sha256": (
-            "26fc8d70005e25f43bc2f6e2e557274ee7b0c752d5e6e9addf7a104aba7cd89e"),
-        "evaluation_schedule_sha256": (
-            "f5aa91235bade4a49db923577542032dfcb04a2db2f6fae180f6083072755763"),
-    },
-    "runtime": {
-        "curriculum_sha256": (
-            "10a22d4a539a017673e484fc5fcfd3a2ff9f70a1892bcfb8f0bf06948f77f0bb"),
-        "feature_output_dim": 1024,
-        "selected_device": "cuda",
-    },
-}
-# Round 7.93 reruns the 7.92 contract after the Three Steps Ahead modal
-# continuation fix, with the confidence-gated reversible handicap ratchet and
-# combat-v6's 48-episode ratchet windows.  Every other input is identical.
-ROUND_7_93_CANARY = {
-    **ROUND_7_92_CANARY,
-    "id": "round-7.93",
-    "cli": {**ROUND_7_92_CANARY["cli"], "curriculum": "combat-v6"},
-    "runtime": {
-        **ROUND_7_92_CANARY["runtime"],
-        "curriculum_sha256": (
-            "8a47648d41234ecac04285e8e08ed35981c95e28f088da4fbc5c285535823c3b"),
-    },
-}
-# Round 7.94 overhauls the reward contract.  Rounds 7.88-7.93 all converged
-# on timeout-dominant play (76-88% of episodes) under the
-# discounted-state-potential family's flat +-10 terminals, so
-# tempo-graded-potential-v1 adds a bounded win speed premium, a continuous
-# damage-graded turn-limit penalty, a clearly negative draw, a per-step time
-# cost, and an offense-only potential without the hand-hoarding term.  The
-# curriculum and every other input carry over from round 7.93; the older
-# canaries keep their frozen v6 contract and now fail closed by design.
-ROUND_7_94_CANARY = {
-    **ROUND_7_93_CANARY,
-    "id": "round-7.94",
-    "training_config": {
-        **ROUND_7_93_CANARY["training_config"],
-        "reward_contract_version": "tempo-graded-potential-v1",
-        "time_cost_per_step": 0.005,
-    },
-}
-# Round 7.95 keeps the 7.94 reward contract and swaps in combat-v7, which
-# halves the scripted handicap step to 0.10: round-7.94-tempo-v1 measured
-# ~38% decisive wins at epsilon 0.40 against ~12% at 0.20, so the whole
-# skill cliff sat inside one 0.20 rung and the ratchet ping-ponged for the
-# entire back half of the run.  Finer rungs need more windows to climb, so
-# the horizon doubles to 2M timesteps.
-ROUND_7_95_CANARY = {
-    **ROUND_7_94_CANARY,
-    "id": "round-7.95",
-    "cli": {
-        **ROUND_7_94_CANARY["cli"],
-        "curriculum": "combat-v7",
-        "timesteps": 2_000_000,
-    },
-    "runtime": {
-        **ROUND_7_94_CANARY["runtime"],
-        "curriculum_sha256": (
-            "91de663c2e15b7f61252e4dfafb431383834fa20f8408e0f52a064b0c28bb252"),
-    },
-}
-# Round 7.96 re-pins the round-7.95 contract (tempo-graded-potential-v1 reward,
-# combat-v7 curriculum, 2M horizon) onto Observation v4, which exposes the
-# observer's own decklist and remaining-library composition.  The observation
-# change is a hard lineage boundary: the v3-pinned canaries above fail closed
-# against v4 runtime by design.  Only the observation lineage differs.
-ROUND_7_96_CANARY = {
-    **ROUND_7_95_CANARY,
-    "id": "round-7.96",
-    "lineage": {
-        **ROUND_7_95_CANARY["lineage"],
-        "observation_schema_version": 4,
-        "observation_schema_sha256": (
-            "15783924c36af23cf9dffb2700894f21d4c15343d0dc1fb353d351eae2f5d19f"),
-    },
-}
-# Round 7.97 re-pins the round-7.96 contract onto Observation v5, which adds
-# producible mana by color (my/opp_producible_mana).  Reward, curriculum, and
-# every other input carry over; only the observation lineage changes, and the
-# v4-pinned round-7.96 canary fails closed against v5 runtime by design.
-ROUND_7_97_CANARY = {
-    **ROUND_7_96_CANARY,
-    "id": "round-7.97",
-    "lineage": {
-        **ROUND_7_96_CANARY["lineage"],
-        "observation_schema_version": 5,
-        "observation_schema_sha256": (
-            "cc7d2e002af3338ee1192f3b85cc16d0913f1a4b4ee763b6b9ba7750d6c50a16"),
-    },
-}
-# Round 7.98 changes exactly one structural training lever: a resource-bounded
-# checkpoint league. Four frozen snapshots live on disk, while each worker
-# eagerly validates and leases exactly one CPU policy at pool-refresh cadence.
-# Episodes independently choose that resident policy or the unchanged scripted
-# curriculum at probability 0.5. Fixed evaluation remains scripted-only.
-ROUND_7_98_CANARY = {
-    **ROUND_7_97_CANARY,
-    "id": "round-7.98",
-    "cli": {
-        **ROUND_7_97_CANARY["cli"],
-        "checkpoint_pool_self_play": True,
-        "checkpoint_pool_snapshot_freq":
-            DEFAULT_CHECKPOINT_POOL_SNAPSHOT_FREQUENCY,
-        "checkpoint_pool_size": DEFAULT_CHECKPOINT_POOL_SIZE,
-        "checkpoint_pool_probability": DEFAULT_CHECKPOINT_POOL_PROBABILITY,
-        "matchup_weighting": False,
-    },
-    "runtime": {
-        **ROUND_7_97_CANARY["runtime"],
-        "checkpoint_pool_config": _checkpoint_pool_contract(
-            enabled=True,
-            snapshot_frequency=DEFAULT_CHECKPOINT_POOL_SNAPSHOT_FREQUENCY,
-            max_checkpoints=DEFAULT_CHECKPOINT_POOL_SIZE,
-            self_play_probability=DEFAULT_CHECKPOINT_POOL_PROBABILITY,
-            base_seed=DEFAULT_TRAINING_SEED,
-            num_envs=DEFAULT_TRAINING_ENVIRONMENTS,
-        ),
-    },
-}
-# Round 7.99 preserves the failed 7.98 experiment as an immutable historical
-# contract and changes only permanent recovery-checkpoint cadence. The bounded
-# self-play opponent pool continues to refresh independently at 100k.
-ROUND_7_99_CANARY = {
-    **ROUND_7_98_CANARY,
-    "id": "round-7.99",
-    "cli": {
-        **ROUND_7_98_CANARY["cli"],
-        "checkpoint_freq": DEFAULT_RECOVERY_CHECKPOINT_FREQUENCY,
-    },
-}
-CANARY_CONFIGS = {
-    config["id"]: config
-    for config in (ROUND_7_92_CANARY, ROUND_7_93_CANARY, ROUND_7_94_CANARY,
-                   ROUND_7_95_CANARY, ROUND_7_96_CANARY, ROUND_7_97_CANARY,
-                   ROUND_7_98_CANARY, ROUND_7_99_CANARY)
-}
 
 
 def utc_timestamp():
@@ -1346,16 +1395,29 @@ def write_bytes_atomic(path, payload):
 
 
 def write_gzip_json_atomic(path, payload):
-    """Atomically publish deterministic, compact gzip JSON."""
-    serialized = json.dumps(
-        json_safe(payload), ensure_ascii=False, allow_nan=False,
-        separators=(",", ":"), sort_keys=True,
-    ).encode("utf-8") + b"\n"
-    # A zero timestamp keeps the gzip header stable across repeated writes of
-    # the same evaluation payload.  Sidecar identity hashes the exact bytes
-    # consumed by the viewer, not a second uncompressed representation.
-    compressed = gzip.compress(serialized, compresslevel=6, mtime=0)
-    write_bytes_atomic(path, compressed)
+    """Atomically publish deterministic, compact gzip JSON.
+
+    The document is encoded and compressed chunk by chunk, so a large debug
+    payload never exists as one serialized string or compressed buffer.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    encoder = json.JSONEncoder(
+        ensure_ascii=False, allow_nan=False, separators=(",", ":"),
+        sort_keys=True)
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as handle:
+        # A zero timestamp and empty name keep the gzip header stable across
+        # repeated writes of the same evaluation payload.  Sidecar identity
+        # hashes the exact bytes consumed by the viewer, not a second
+        # uncompressed representation.
+        with gzip.GzipFile(filename="", mode="wb", fileobj=handle,
+                           compresslevel=6, mtime=0) as compressed:
+            for chunk in encoder.iterencode(json_safe(payload)):
+                compressed.write(chunk.encode("utf-8"))
+            compressed.write(b"\n")
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temporary_path, path)
 
 
 def sha256_file(path):
@@ -1375,6 +1437,183 @@ def resolve_artifact_path(path):
                  if os.path.isfile(candidate)), None)
 
 
+def _host_copy(value):
+    """Return ``value`` with every tensor copied to host memory."""
+    if isinstance(value, torch.Tensor):
+        return value.detach().to("cpu", copy=True)
+    if isinstance(value, dict):
+        copied = type(value)(
+            (key, _host_copy(item)) for key, item in value.items())
+        # Module state dicts carry per-submodule versions that
+        # load_state_dict reads back.
+        metadata = getattr(value, "_metadata", None)
+        if metadata is not None:
+            copied._metadata = deepcopy(metadata)
+        return copied
+    if isinstance(value, (list, tuple)):
+        return type(value)(_host_copy(item) for item in value)
+    return deepcopy(value)
+
+
+class ModelArchiveCapture:
+    """A point-in-time copy of everything ``BaseAlgorithm.save`` writes.
+
+    Capturing runs on the training thread and only serializes the non-tensor
+    attributes and copies the state dicts to host memory; compressing and
+    writing the archive -- the part that scales with model size -- happens
+    in ``write``, which is safe on any thread because it never touches the
+    live model. The archive has the same members as ``model.save``'s.
+    """
+
+    def __init__(self, model):
+        data = model.__dict__.copy()
+        excluded = set(model._excluded_save_params())
+        state_dict_names, variable_names = model._get_torch_save_params()
+        for name in [*state_dict_names, *(variable_names or ())]:
+            excluded.add(name.split(".")[0])
+        for name in excluded:
+            data.pop(name, None)
+        self.num_timesteps = int(getattr(model, "num_timesteps", 0))
+        self.serialized_data = data_to_json(data)
+        self.pytorch_variables = (
+            None if variable_names is None else {
+                name: _host_copy(recursive_getattr(model, name))
+                for name in variable_names})
+        self.params = _host_copy(model.get_parameters())
+        self.policy_class = type(model.policy)
+        self.policy_arguments = model.policy._get_constructor_parameters()
+
+    def write(self, path):
+        """Atomically publish the archive and return its actual path.
+
+        Like ``model.save``, a path without a suffix gains ``.zip``.
+        """
+        path = str(path)
+        if not os.path.splitext(os.path.basename(path))[1]:
+            path = f"{path}.zip"
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary_path, "wb") as handle:
+                with zipfile.ZipFile(handle, mode="w") as archive:
+                    archive.writestr("data", self.serialized_data)
+                    if self.pytorch_variables is not None:
+                        with archive.open("pytorch_variables.pth", mode="w",
+                                          force_zip64=True) as member:
+                            torch.save(self.pytorch_variables, member)
+                    for name, state_dict in self.params.items():
+                        with archive.open(f"{name}.pth", mode="w",
+                                          force_zip64=True) as member:
+                            torch.save(state_dict, member)
+                    archive.writestr(
+                        "_stable_baselines3_version",
+                        stable_baselines3.__version__)
+                    archive.writestr(
+                        "system_info.txt",
+                        get_system_info(print_info=False)[1])
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(temporary_path, path)
+        finally:
+            if os.path.isfile(temporary_path):
+                os.remove(temporary_path)
+        return path
+
+    def policy(self):
+        """Rebuild the captured policy on the CPU."""
+        policy = self.policy_class(**self.policy_arguments)
+        policy.load_state_dict(self.params["policy"])
+        return policy
+
+
+class PersistenceWriter:
+    """Publish artifacts on one background thread, in submission order.
+
+    ``submit`` queues a zero-argument callable and returns its
+    ``concurrent.futures.Future``. Writes run one at a time in the order they
+    were submitted, so an artifact never lands before one submitted earlier.
+    At most ``max_pending`` writes are outstanding; a further ``submit``
+    waits for the oldest, bounding the host memory that captured archives
+    hold. The first failed write is re-raised by the next ``submit``,
+    ``check`` or ``barrier``, so a lost checkpoint fails the run instead of
+    passing silently.
+    """
+
+    def __init__(self, max_pending=2, name="playersim-persistence"):
+        if int(max_pending) < 1:
+            raise ValueError("max_pending must be at least one")
+        self.max_pending = int(max_pending)
+        self._queue = queue.Queue()
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._pending = deque()
+        self._closed = False
+        self.completed_writes = 0
+        self.write_seconds = 0.0
+        self._thread = threading.Thread(
+            target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, write, description = item
+            started = time.perf_counter()
+            try:
+                result = write()
+            except BaseException as error:
+                logging.error(
+                    "Background persistence of %s failed: %s",
+                    description, error)
+                future.set_exception(error)
+            else:
+                self.completed_writes += 1
+                future.set_result(result)
+            finally:
+                self.write_seconds += time.perf_counter() - started
+                self._slots.release()
+
+    def check(self):
+        """Raise the first failed write that has not been reported yet."""
+        while self._pending and self._pending[0][0].done():
+            future, description = self._pending.popleft()
+            error = future.exception()
+            if error is not None:
+                raise RuntimeError(
+                    f"Background persistence of {description} failed: "
+                    f"{error}") from error
+
+    def submit(self, write, description="artifact"):
+        """Queue ``write`` behind every earlier submission."""
+        if self._closed:
+            raise RuntimeError("Persistence writer is closed")
+        self.check()
+        self._slots.acquire()
+        future = Future()
+        future.set_running_or_notify_cancel()
+        self._pending.append((future, description))
+        self._queue.put((future, write, str(description)))
+        return future
+
+    def barrier(self):
+        """Wait for every submitted write, then report any failure."""
+        for future, _ in list(self._pending):
+            future.exception()
+        self.check()
+
+    def close(self):
+        """Finish outstanding writes and stop the thread."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self.barrier()
+        finally:
+            self._queue.put(None)
+            self._thread.join()
+
+
 def artifact_identity(path):
     """Return a portable identity for an artifact, accepting SB3's .zip suffix."""
     actual_path = resolve_artifact_path(path)
@@ -1619,40 +1858,6 @@ def configuration_sha256(value):
     return hashlib.sha256(payload).hexdigest()
 
 
-def _configuration_values_match(actual, expected):
-    if isinstance(expected, float):
-        try:
-            return math.isclose(
-                float(actual), expected, rel_tol=0.0, abs_tol=1e-12)
-        except (TypeError, ValueError, OverflowError):
-            return False
-    return actual == expected
-
-
-def validate_canary_cli(args):
-    """Fail closed when a named experiment's requested inputs drift."""
-    canary_id = getattr(args, "canary_config", None)
-    if not canary_id:
-        return None
-    config = CANARY_CONFIGS.get(str(canary_id))
-    if config is None:
-        raise ValueError(f"Unknown canary configuration: {canary_id}")
-    mismatches = []
-    for key, expected in config["cli"].items():
-        actual = getattr(args, key, None)
-        if not _configuration_values_match(actual, expected):
-            mismatches.append(f"{key}={actual!r} (expected {expected!r})")
-    if getattr(args, "resume", None):
-        mismatches.append("resume must be unset")
-    if getattr(args, "optimize_hp", False):
-        mismatches.append("optimize_hp must be false")
-    if mismatches:
-        raise ValueError(
-            f"Canary {canary_id} launch contract mismatch: "
-            + "; ".join(mismatches))
-    return deepcopy(config)
-
-
 def validate_canary_runtime(config, *, lineage, training_config, curriculum,
                              schedule_sha256, num_envs, selected_device,
                              checkpoint_pool_config=None):
@@ -2525,6 +2730,19 @@ def rollout_signature(observation, masks, actions, env_index):
     return signature_digest.digest()
 
 
+def callback_env_indices(callback_locals, count):
+    """Return the worker index of each entry in a callback's step arrays.
+
+    Lock-step collection reports every worker in order; asynchronous
+    collection reports only the transitions it collected and names their
+    workers in ``env_indices``.
+    """
+    env_indices = callback_locals.get("env_indices")
+    if env_indices is None:
+        return list(range(count))
+    return [int(index) for index in env_indices]
+
+
 def repeated_short_cycle_period(signatures, *, max_period=4, repeats=3):
     """Return a repeated suffix's period, or None when progress is monotonic."""
     for period in range(1, max_period + 1):
@@ -2589,6 +2807,859 @@ class StrictEvaluationVecEnv(VecEnvWrapper):
         return observations, rewards, dones, infos
 
 
+class _SharedMemoryWorkerError:
+    """Picklable failure report carried back through a worker pipe."""
+
+    def __init__(self, command, formatted_traceback):
+        self.command = command
+        self.formatted_traceback = formatted_traceback
+
+
+def _shared_memory_vec_worker(remote, parent_remote, env_fn_wrapper):
+    """Step one environment and publish results into shared memory.
+
+    Observations, rewards, dones, and fresh action masks are written to the
+    parent's blocks; only infos and a small status tuple cross the pipe.
+    """
+    from stable_baselines3.common.env_util import is_wrapped
+
+    if parent_remote is not None:
+        parent_remote.close()
+    env = env_fn_wrapper.var()
+    observation_buffer = ObservationBuffer(env.observation_space)
+    try:
+        mask_fn = env.get_wrapper_attr("action_masks")
+    except AttributeError:
+        mask_fn = None
+    attached = []
+    observations = terminal_observation = rewards = dones = masks = None
+    index = None
+    reset_info = {}
+
+    def publish(observation):
+        for name, view in observations.items():
+            view[index] = observation[name]
+        if masks is not None:
+            masks[index] = np.asarray(mask_fn(), dtype=bool)
+
+    while True:
+        try:
+            command, data = remote.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        try:
+            if command == "step":
+                observation, reward, terminated, truncated, info = \
+                    env.step(data)
+                done = bool(terminated or truncated)
+                info["TimeLimit.truncated"] = bool(
+                    truncated and not terminated)
+                if done:
+                    observation_buffer.pack(
+                        observation, block=terminal_observation)
+                    observation, reset_info = env.reset()
+                publish(observation)
+                rewards[index] = reward
+                dones[index] = done
+                remote.send((info, reset_info))
+            elif command == "reset":
+                seed, options = data
+                maybe_options = {"options": options} if options else {}
+                observation, reset_info = env.reset(seed=seed, **maybe_options)
+                publish(observation)
+                remote.send(reset_info)
+            elif command == "get_spaces":
+                # MaskablePPO masks a Discrete action space one flag per
+                # action; any other layout is served over the pipe instead.
+                action_count = getattr(env.action_space, "n", None)
+                remote.send((
+                    env.observation_space, env.action_space,
+                    int(action_count)
+                    if mask_fn is not None and action_count is not None
+                    else None))
+            elif command == "attach":
+                names, index, num_envs, mask_size = data
+                if names["observations"] is None:
+                    raise RuntimeError("Shared observation block is missing")
+                for name in names.values():
+                    if name is not None:
+                        attached.append(shared_memory.SharedMemory(name=name))
+                blocks = dict(zip(
+                    (key for key, name in names.items() if name is not None),
+                    attached))
+                observations = observation_buffer.stacked_views(
+                    np.ndarray((num_envs * observation_buffer.nbytes,),
+                               dtype=np.uint8,
+                               buffer=blocks["observations"].buf),
+                    num_envs)
+                terminal_observation = np.ndarray(
+                    (observation_buffer.nbytes,), dtype=np.uint8,
+                    buffer=blocks["terminal_observations"].buf,
+                    offset=index * observation_buffer.nbytes)
+                rewards = np.ndarray(
+                    (num_envs,), dtype=np.float64,
+                    buffer=blocks["rewards"].buf)
+                dones = np.ndarray(
+                    (num_envs,), dtype=bool, buffer=blocks["dones"].buf)
+                if mask_size is not None:
+                    masks = np.ndarray(
+                        (num_envs, mask_size), dtype=bool,
+                        buffer=blocks["masks"].buf)
+                remote.send(observation_buffer.nbytes)
+            elif command == "close":
+                env.close()
+                remote.close()
+                break
+            elif command == "env_method":
+                method = env.get_wrapper_attr(data[0])
+                remote.send(method(*data[1], **data[2]))
+            elif command == "get_attr":
+                remote.send(env.get_wrapper_attr(data))
+            elif command == "has_attr":
+                try:
+                    env.get_wrapper_attr(data)
+                    remote.send(True)
+                except AttributeError:
+                    remote.send(False)
+            elif command == "set_attr":
+                remote.send(setattr(env, data[0], data[1]))
+            elif command == "is_wrapped":
+                remote.send(is_wrapped(env, data))
+            elif command == "render":
+                remote.send(env.render())
+            else:
+                raise NotImplementedError(
+                    f"`{command}` is not implemented in the worker")
+        except Exception:
+            remote.send(_SharedMemoryWorkerError(
+                command, traceback.format_exc()))
+    # Views must be released before the mappings can close.
+    observations = terminal_observation = rewards = dones = masks = None
+    for block in attached:
+        block.close()
+
+
+class SharedMemoryVecEnv(VecEnv):
+    """Subprocess VecEnv whose per-step arrays live in shared memory.
+
+    ``SubprocVecEnv`` pickles every Dict observation (~92 KB) through a pipe
+    per worker per step, and MaskablePPO then asks every worker for its mask
+    over the pipe again. Here workers write observations, rewards, dones, and
+    their fresh ``action_masks()`` into ``multiprocessing.shared_memory``
+    blocks laid out field-major by ``ObservationBuffer``; only infos cross
+    the pipe. ``step_wait`` returns one copy of the observation block, so
+    callers may keep it across steps exactly as with ``SubprocVecEnv``.
+
+    ``env_method("action_masks")`` is answered from shared memory while the
+    published masks are current; any other ``env_method``/``set_attr`` on a
+    worker marks its mask stale until the next step or reset.
+
+    A worker answers commands in order, so a control command (``env_method``,
+    ``get_attr``, ``set_attr``, ...) sent while its step is still in flight
+    would be queued behind the step reply. Such commands first receive the
+    outstanding step reply and hold it until ``step_wait_any`` (or
+    ``step_wait``) collects it.
+    """
+
+    def __init__(self, env_fns, start_method=None):
+        self.waiting = False
+        self.closed = False
+        self._shared_blocks = {}
+        n_envs = len(env_fns)
+        if start_method is None:
+            start_method = (
+                TEMPLATE_START_METHOD if template_supported() else "spawn")
+        self.start_method = start_method
+        if start_method == TEMPLATE_START_METHOD:
+            # One preloaded template forks every worker, so the card data
+            # the factories share stays one copy-on-write object.
+            self.remotes, self.work_remotes = zip(
+                *[multiprocessing.Pipe() for _ in range(n_envs)])
+            self.processes = [start_worker_template([
+                (_shared_memory_vec_worker,
+                 (work_remote, None, SimpleNamespace(var=env_fn)))
+                for work_remote, env_fn in zip(self.work_remotes, env_fns)])]
+            for work_remote in self.work_remotes:
+                work_remote.close()
+        else:
+            context = multiprocessing.get_context(start_method)
+            self.remotes, self.work_remotes = zip(
+                *[context.Pipe() for _ in range(n_envs)])
+            self.processes = []
+            for work_remote, remote, env_fn in zip(
+                    self.work_remotes, self.remotes, env_fns):
+                process = context.Process(
+                    target=_shared_memory_vec_worker,
+                    args=(work_remote, remote, CloudpickleWrapper(env_fn)),
+                    daemon=True)
+                process.start()
+                self.processes.append(process)
+                work_remote.close()
+        try:
+            self.remotes[0].send(("get_spaces", None))
+            observation_space, action_space, mask_size = self._receive(
+                self.remotes[0])
+            self.observation_buffer = ObservationBuffer(observation_space)
+            nbytes = self.observation_buffer.nbytes
+            self._observation_block = self._create_block(
+                "observations", (n_envs * nbytes,), np.uint8)
+            self._terminal_observations = self._create_block(
+                "terminal_observations", (n_envs, nbytes), np.uint8)
+            self._rewards = self._create_block(
+                "rewards", (n_envs,), np.float64)
+            self._dones = self._create_block("dones", (n_envs,), bool)
+            self._masks = (
+                self._create_block("masks", (n_envs, mask_size), bool)
+                if mask_size is not None else None)
+            names = {
+                key: block.name for key, (block, _) in
+                self._shared_blocks.items()}
+            names.setdefault("masks", None)
+            for index, remote in enumerate(self.remotes):
+                remote.send(("attach", (names, index, n_envs, mask_size)))
+            for remote in self.remotes:
+                worker_nbytes = self._receive(remote)
+                if worker_nbytes != nbytes:
+                    raise RuntimeError(
+                        "Worker observation layout differs from the "
+                        f"parent: {worker_nbytes} != {nbytes} bytes")
+        except BaseException:
+            self._terminate()
+            raise
+        self._masks_current = [False] * n_envs
+        self._observation_rows = self.observation_buffer.stacked_views(
+            self._observation_block, n_envs)
+        self._in_flight = set()
+        # index -> [step reply, mask still current]; received early by a
+        # control command but not yet collected by the rollout.
+        self._settled = {}
+        super().__init__(n_envs, observation_space, action_space)
+
+    def _create_block(self, name, shape, dtype):
+        size = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+        block = shared_memory.SharedMemory(create=True, size=size)
+        array = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        array.fill(0)
+        self._shared_blocks[name] = (block, array)
+        return array
+
+    @staticmethod
+    def _raise_worker_error(message):
+        if isinstance(message, _SharedMemoryWorkerError):
+            raise RuntimeError(
+                f"Shared-memory worker failed during {message.command!r}:\n"
+                f"{message.formatted_traceback}")
+
+    @classmethod
+    def _receive(cls, remote):
+        message = remote.recv()
+        cls._raise_worker_error(message)
+        return message
+
+    def _settle(self, indices):
+        """Receive outstanding step replies before commanding ``indices``."""
+        indices = [int(index) for index in self._get_indices(indices)]
+        for index in indices:
+            if index in self._in_flight and index not in self._settled:
+                self._settled[index] = [
+                    self.remotes[index].recv(), self._masks is not None]
+        return indices
+
+    def _collect_step_reply(self, index):
+        if index in self._settled:
+            message, masks_current = self._settled.pop(index)
+        else:
+            message = self.remotes[index].recv()
+            masks_current = self._masks is not None
+        self._masks_current[index] = masks_current
+        return message
+
+    def _mark_masks_stale(self, index):
+        self._masks_current[index] = False
+        if index in self._settled:
+            self._settled[index][1] = False
+
+    def _batched_observation(self):
+        return self.observation_buffer.stacked_views(
+            self._observation_block.copy(), self.num_envs)
+
+    def step_async(self, actions):
+        for remote, action in zip(self.remotes, actions):
+            remote.send(("step", action))
+        self._in_flight = set(range(self.num_envs))
+        self._masks_current = [False] * self.num_envs
+        self.waiting = True
+
+    def step_wait(self):
+        # Drain every pipe before raising so no reply is left unread.
+        results = [
+            self._collect_step_reply(index) for index in range(self.num_envs)]
+        self._in_flight = set()
+        self.waiting = False
+        for message in results:
+            self._raise_worker_error(message)
+        infos = []
+        reset_infos = []
+        for index, (info, reset_info) in enumerate(results):
+            if self._dones[index]:
+                info["terminal_observation"] = self.observation_buffer.views(
+                    self._terminal_observations[index].copy())
+            infos.append(info)
+            reset_infos.append(reset_info)
+        self.reset_infos = reset_infos
+        return (
+            self._batched_observation(), self._rewards.copy(),
+            self._dones.copy(), infos)
+
+    def step_async_indices(self, indices, actions):
+        """Send actions to a subset of idle workers.
+
+        Used by asynchronous rollout collection: a worker can be given its
+        next action as soon as its previous step has been collected, without
+        waiting for the rest of the batch.
+        """
+        for index, action in zip(indices, actions):
+            index = int(index)
+            if index in self._in_flight:
+                raise RuntimeError(
+                    f"Worker {index} already has an action in flight")
+            self.remotes[index].send(("step", action))
+            self._in_flight.add(index)
+            # The worker rewrites its mask row while the step runs.
+            self._masks_current[index] = False
+        self.waiting = bool(self._in_flight)
+
+    def step_wait_any(self, timeout=None):
+        """Collect every in-flight worker that has finished its step.
+
+        Blocks until at least one worker is done (or ``timeout`` expires) and
+        returns ``(indices, observations, rewards, dones, infos)`` for the
+        finished workers only, in worker order. Observations are copies;
+        finished workers are reset automatically as in ``step_wait``.
+        """
+        if not self._in_flight:
+            raise RuntimeError("No worker has an action in flight")
+        remotes = {
+            self.remotes[index]: index for index in self._in_flight
+            if index not in self._settled}
+        # Replies already held by a control command are ready now; only
+        # poll the rest so they are not starved.
+        ready = wait_for_connections(
+            list(remotes), timeout=0 if self._settled else timeout)
+        indices = np.array(sorted(
+            [remotes[remote] for remote in ready] + list(self._settled)),
+            dtype=np.intp)
+        results = [self._collect_step_reply(index) for index in indices]
+        self._in_flight.difference_update(indices.tolist())
+        self.waiting = bool(self._in_flight)
+        for message in results:
+            self._raise_worker_error(message)
+        infos = []
+        for index, (info, reset_info) in zip(indices, results):
+            if self._dones[index]:
+                info["terminal_observation"] = self.observation_buffer.views(
+                    self._terminal_observations[index].copy())
+            self.reset_infos[index] = reset_info
+            infos.append(info)
+        observations = {
+            name: rows[indices] for name, rows in
+            self._observation_rows.items()}
+        return (
+            indices, observations, self._rewards[indices],
+            self._dones[indices], infos)
+
+    def reset(self):
+        for env_index, remote in enumerate(self.remotes):
+            remote.send((
+                "reset", (self._seeds[env_index], self._options[env_index])))
+        self.reset_infos = [self._receive(remote) for remote in self.remotes]
+        self._reset_seeds()
+        self._reset_options()
+        self._masks_current = [self._masks is not None] * self.num_envs
+        return self._batched_observation()
+
+    def _terminate(self):
+        for process in self.processes:
+            if process.is_alive():
+                process.terminate()
+            process.join(timeout=10)
+        self._release_blocks()
+
+    def _release_blocks(self):
+        # Every ndarray over a mapping must be dropped before it can close.
+        blocks = [block for block, _ in self._shared_blocks.values()]
+        self._shared_blocks = {}
+        self._observation_block = self._terminal_observations = None
+        self._observation_rows = None
+        self._rewards = self._dones = self._masks = None
+        for block in blocks:
+            try:
+                block.close()
+            finally:
+                block.unlink()
+
+    def close(self):
+        if self.closed:
+            return
+        if self.waiting:
+            for index in sorted(self._in_flight - set(self._settled)):
+                self.remotes[index].recv()
+            self._in_flight = set()
+            self._settled = {}
+        for remote in self.remotes:
+            remote.send(("close", None))
+        for process in self.processes:
+            process.join()
+        self._release_blocks()
+        self.closed = True
+
+    def get_images(self):
+        if self.render_mode != "rgb_array":
+            warnings.warn(
+                f"The render mode is {self.render_mode}, but this method "
+                "assumes it is `rgb_array` to obtain images.")
+            return [None for _ in self.remotes]
+        self._settle(None)
+        for remote in self.remotes:
+            remote.send(("render", None))
+        return [self._receive(remote) for remote in self.remotes]
+
+    def has_attr(self, attr_name):
+        self._settle(None)
+        for remote in self.remotes:
+            remote.send(("has_attr", attr_name))
+        return all([self._receive(remote) for remote in self.remotes])
+
+    def get_attr(self, attr_name, indices=None):
+        target_remotes = self._get_target_remotes(indices)
+        for remote in target_remotes:
+            remote.send(("get_attr", attr_name))
+        return [self._receive(remote) for remote in target_remotes]
+
+    def set_attr(self, attr_name, value, indices=None):
+        indices = self._settle(indices)
+        for index in indices:
+            self._mark_masks_stale(index)
+            self.remotes[index].send(("set_attr", (attr_name, value)))
+        for index in indices:
+            self._receive(self.remotes[index])
+
+    def env_method(self, method_name, *method_args, indices=None,
+                   **method_kwargs):
+        indices = list(self._get_indices(indices))
+        if (method_name == "action_masks" and not method_args
+                and not method_kwargs
+                and all(self._masks_current[index] for index in indices)):
+            return [self._masks[index].copy() for index in indices]
+        self._settle(indices)
+        for index in indices:
+            self._mark_masks_stale(index)
+            self.remotes[index].send((
+                "env_method", (method_name, method_args, method_kwargs)))
+        return [self._receive(self.remotes[index]) for index in indices]
+
+    def env_is_wrapped(self, wrapper_class, indices=None):
+        target_remotes = self._get_target_remotes(indices)
+        for remote in target_remotes:
+            remote.send(("is_wrapped", wrapper_class))
+        return [self._receive(remote) for remote in target_remotes]
+
+    def _get_target_remotes(self, indices):
+        return [self.remotes[index] for index in self._settle(indices)]
+
+
+class AsyncVecMonitor(VecMonitor):
+    """``VecMonitor`` that also records episodes for asynchronous steps.
+
+    Lock-step ``step`` behaves exactly like ``VecMonitor``;
+    ``step_wait_any`` updates returns and lengths only for the workers that
+    finished.
+    """
+
+    def step_async_indices(self, indices, actions):
+        self.venv.step_async_indices(indices, actions)
+
+    def step_wait_any(self, timeout=None):
+        indices, observations, rewards, dones, infos = \
+            self.venv.step_wait_any(timeout)
+        self.episode_returns[indices] += rewards
+        self.episode_lengths[indices] += 1
+        new_infos = list(infos)
+        for position, env_index in enumerate(indices):
+            if not dones[position]:
+                continue
+            info = infos[position].copy()
+            episode_info = {
+                "r": self.episode_returns[env_index],
+                "l": self.episode_lengths[env_index],
+                "t": round(time.time() - self.t_start, 6),
+            }
+            for key in self.info_keywords:
+                episode_info[key] = info[key]
+            info["episode"] = episode_info
+            self.episode_count += 1
+            self.episode_returns[env_index] = 0
+            self.episode_lengths[env_index] = 0
+            if self.results_writer:
+                self.results_writer.write_row(episode_info)
+            new_infos[position] = info
+        return indices, observations, rewards, dones, new_infos
+
+
+def _buffer_values(values):
+    if isinstance(values, torch.Tensor):
+        values = values.detach().cpu().numpy()
+    return np.asarray(values, dtype=np.float32).reshape(-1)
+
+
+class RaggedMaskableDictRolloutBuffer(MaskableDictRolloutBuffer):
+    """Masked Dict rollout buffer whose workers may contribute unevenly.
+
+    Storage holds ``buffer_size * n_envs`` transitions in arrival order
+    together with each transition's worker index, so a fast worker can fill
+    more of the rollout than a slow one. GAE runs along each worker's own
+    chain and bootstraps from that worker's last observation. Lock-step
+    ``add`` calls (one row per worker) are accepted as well and produce the
+    same advantages as ``MaskableDictRolloutBuffer``.
+    """
+
+    def __init__(self, buffer_size, observation_space, action_space,
+                 device="auto", gae_lambda=1, gamma=0.99, n_envs=1):
+        self.worker_count = int(n_envs)
+        super().__init__(
+            buffer_size * self.worker_count, observation_space, action_space,
+            device, gae_lambda=gae_lambda, gamma=gamma, n_envs=1)
+
+    def reset(self):
+        super().reset()
+        self.env_indices = np.zeros(self.buffer_size, dtype=np.intp)
+
+    def add(self, obs, action, reward, episode_start, value, log_prob,
+            action_masks=None):
+        self.add_transitions(
+            np.arange(self.worker_count), obs, action, reward, episode_start,
+            value, log_prob, action_masks=action_masks)
+
+    def add_transitions(self, env_indices, obs, actions, rewards,
+                        episode_starts, values, log_probs, action_masks=None):
+        """Append one transition for each worker in ``env_indices``."""
+        count = len(env_indices)
+        stop = self.pos + count
+        if stop > self.buffer_size:
+            raise ValueError(
+                f"Rollout buffer overflow: {stop} > {self.buffer_size}")
+        rows = slice(self.pos, stop)
+        for key, storage in self.observations.items():
+            storage[rows, 0] = np.asarray(obs[key]).reshape(
+                (count,) + tuple(self.obs_shape[key]))
+        self.actions[rows, 0] = np.asarray(actions).reshape(
+            (count, self.action_dim))
+        self.rewards[rows, 0] = np.asarray(rewards).reshape(-1)
+        self.episode_starts[rows, 0] = np.asarray(episode_starts).reshape(-1)
+        self.values[rows, 0] = _buffer_values(values)
+        self.log_probs[rows, 0] = _buffer_values(log_probs)
+        if action_masks is not None:
+            self.action_masks[rows, 0] = np.asarray(action_masks).reshape(
+                (count, self.mask_dims))
+        self.env_indices[rows] = env_indices
+        self.pos = stop
+        self.full = stop == self.buffer_size
+
+    def compute_returns_and_advantage(self, last_values, dones):
+        """Per-worker GAE over ragged chains, vectorized across workers.
+
+        Worker chains are laid out as columns of a padded (steps, workers)
+        grid and swept backwards once, so the loop length is the longest
+        chain rather than the transition count.
+        """
+        last_values = _buffer_values(last_values)
+        next_non_terminal_at_end = 1.0 - np.asarray(
+            dones, dtype=np.float32).reshape(-1)
+        size = self.pos
+        env_indices = self.env_indices[:size]
+        values = self.values[:size, 0]
+        rewards = self.rewards[:size, 0]
+        episode_starts = self.episode_starts[:size, 0]
+        advantages = np.zeros(size, dtype=np.float32)
+        counts = np.bincount(env_indices, minlength=self.worker_count)
+        order = np.argsort(env_indices, kind="stable")
+        chain_starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        steps = np.arange(size) - np.repeat(chain_starts, counts)
+        grid = np.full(
+            (int(counts.max(initial=0)) + 1, self.worker_count), -1,
+            dtype=np.intp)
+        grid[steps, env_indices[order]] = order
+        last_gae = np.zeros(self.worker_count, dtype=np.float32)
+        for step in reversed(range(grid.shape[0] - 1)):
+            current = grid[step]
+            following = grid[step + 1]
+            valid = current >= 0
+            is_last = valid & (following < 0)
+            safe_current = np.where(valid, current, 0)
+            safe_following = np.where(following >= 0, following, 0)
+            next_values = np.where(
+                is_last, last_values, values[safe_following])
+            next_non_terminal = np.where(
+                is_last, next_non_terminal_at_end,
+                1.0 - episode_starts[safe_following])
+            delta = (rewards[safe_current]
+                     + self.gamma * next_values * next_non_terminal
+                     - values[safe_current])
+            last_gae = np.where(
+                valid,
+                delta + self.gamma * self.gae_lambda * next_non_terminal
+                * last_gae,
+                0.0).astype(np.float32)
+            advantages[current[valid]] = last_gae[valid]
+        self.advantages[:size, 0] = advantages
+        self.returns[:size, 0] = advantages + values
+
+
+class CompactRolloutStorage:
+    """Rollout-buffer mixin that stores observations and masks compactly.
+
+    Observation fields use their ``compact_storage_layout`` form and action
+    masks are bit-packed; sampling decodes both to the declared dtypes, so
+    minibatches are identical to the base buffer's. Mix in ahead of a
+    ``MaskableDictRolloutBuffer`` subclass.
+    """
+
+    def reset(self):
+        super().reset()
+        if not hasattr(self, "compact_layout"):
+            self.compact_layout = compact_storage_layout(
+                self.observation_space)
+            self.compact_mask_field = compact_mask_field(
+                "action_masks", self.action_masks.dtype, self.mask_dims)
+        leading_shape = (self.buffer_size, self.n_envs)
+        self.observations = compact_observation_storage(
+            self.compact_layout, leading_shape)
+        self.action_masks = CompactArray(
+            self.compact_mask_field, leading_shape, fill=1)
+
+    @property
+    def storage_nbytes(self):
+        """Bytes held by the observation and action-mask storage."""
+        return int(
+            sum(storage.nbytes for storage in self.observations.values())
+            + self.action_masks.nbytes)
+
+    @property
+    def declared_nbytes(self):
+        """Bytes the same storage takes at the declared dtypes."""
+        fields = (*self.compact_layout.values(), self.compact_mask_field)
+        return int(self.buffer_size * self.n_envs * sum(
+            field.size * field.dtype.itemsize for field in fields))
+
+
+class CompactMaskableDictRolloutBuffer(
+        CompactRolloutStorage, MaskableDictRolloutBuffer):
+    """``MaskableDictRolloutBuffer`` with compact observation storage."""
+
+
+class CompactRaggedMaskableDictRolloutBuffer(
+        CompactRolloutStorage, RaggedMaskableDictRolloutBuffer):
+    """``RaggedMaskableDictRolloutBuffer`` with compact observation storage."""
+
+
+def use_compact_rollout_storage(model):
+    """Replace ``model``'s rollout buffer with its compact counterpart.
+
+    The buffer is swapped on the live model instead of being passed as
+    ``rollout_buffer_class``, so checkpoints never reference it and stay
+    loadable wherever ``main`` is not importable. Returns the new buffer.
+    """
+    buffer = model.rollout_buffer
+    if isinstance(buffer, CompactRolloutStorage):
+        return buffer
+    buffer_class = (
+        CompactRaggedMaskableDictRolloutBuffer
+        if isinstance(buffer, RaggedMaskableDictRolloutBuffer)
+        else CompactMaskableDictRolloutBuffer)
+    model.rollout_buffer = buffer_class(
+        model.n_steps, model.observation_space, model.action_space,
+        model.device, gamma=model.gamma, gae_lambda=model.gae_lambda,
+        n_envs=model.n_envs)
+    return model.rollout_buffer
+
+
+class AsyncRolloutMaskablePPO(MaskablePPO):
+    """MaskablePPO that steps whichever training workers are ready.
+
+    Lock-step collection waits for the slowest worker on every step, and MTG
+    step times range from a pass to a long combat or stack resolution. Here
+    each worker gets its next action as soon as its previous step has been
+    collected: the policy runs one batched forward pass over the workers
+    that came back together, and transitions land in a
+    ``RaggedMaskableDictRolloutBuffer``. A rollout still holds
+    ``n_steps * n_envs`` transitions; dispatch stops once the in-flight
+    steps would fill it, so every worker is idle when training starts.
+
+    Callbacks see one ``on_step`` per ``n_envs`` collected transitions
+    (keeping timestep-based frequencies unchanged). Their ``infos``,
+    ``dones``, ``rewards``, ``new_obs`` and ``actions`` cover exactly those
+    transitions and ``env_indices`` names each one's worker. Environments
+    without ``step_wait_any`` fall back to lock-step collection.
+    """
+
+    def _setup_model(self):
+        self.rollout_buffer_class = RaggedMaskableDictRolloutBuffer
+        super()._setup_model()
+
+    def _excluded_save_params(self):
+        # Saved checkpoints stay loadable by plain MaskablePPO (evaluation,
+        # the checkpoint pool, and the opponent inference server).
+        return super()._excluded_save_params() + ["rollout_buffer_class"]
+
+    def _emit_callback_step(self, callback, pending):
+        indices = np.concatenate([entry[0] for entry in pending])
+        new_obs = {
+            key: np.concatenate([entry[1][key] for entry in pending])
+            for key in pending[0][1]}
+        callback.update_locals({
+            "env_indices": indices,
+            "new_obs": new_obs,
+            "actions": np.concatenate([entry[2] for entry in pending]),
+            "rewards": np.concatenate([entry[3] for entry in pending]),
+            "dones": np.concatenate([entry[4] for entry in pending]),
+            "infos": [info for entry in pending for info in entry[5]],
+        })
+        pending.clear()
+        return callback.on_step()
+
+    def _drain_in_flight(self, env, in_flight):
+        while in_flight:
+            indices, new_obs, _, dones, _ = env.step_wait_any()
+            for key, rows in self._last_obs.items():
+                rows[indices] = new_obs[key]
+            self._last_episode_starts[indices] = dones
+            for env_index in indices:
+                in_flight.pop(int(env_index), None)
+
+    def collect_rollouts(self, env, callback, rollout_buffer,
+                         n_rollout_steps, use_masking=True):
+        if not hasattr(env, "step_wait_any"):
+            return super().collect_rollouts(
+                env, callback, rollout_buffer, n_rollout_steps,
+                use_masking=use_masking)
+        if not isinstance(rollout_buffer, RaggedMaskableDictRolloutBuffer):
+            raise TypeError(
+                "Asynchronous collection requires a "
+                "RaggedMaskableDictRolloutBuffer")
+        if self._last_obs is None:
+            raise RuntimeError("No previous observation was provided")
+        self.policy.set_training_mode(False)
+        rollout_buffer.reset()
+        if use_masking and not is_masking_supported(env):
+            raise ValueError(
+                "Environment does not support action masking. Consider "
+                "using ActionMasker wrapper")
+        callback.on_rollout_start()
+
+        capacity = rollout_buffer.buffer_size
+        num_envs = env.num_envs
+        self._last_episode_starts = np.asarray(
+            self._last_episode_starts, dtype=bool).copy()
+        # in_flight[worker] = (dispatch record, row within that record)
+        in_flight = {}
+        idle = np.arange(num_envs, dtype=np.intp)
+        collected = 0
+        pending_callback = []
+        pending_count = 0
+        while collected < capacity:
+            dispatch = idle[:max(
+                0, capacity - collected - len(in_flight))]
+            if len(dispatch):
+                observation = {
+                    key: rows[dispatch]
+                    for key, rows in self._last_obs.items()}
+                action_masks = (
+                    np.stack(env.env_method("action_masks", indices=dispatch))
+                    if use_masking else None)
+                with torch.no_grad():
+                    actions, values, log_probs = self.policy(
+                        obs_as_tensor(observation, self.device),
+                        action_masks=action_masks)
+                actions = actions.cpu().numpy()
+                record = {
+                    "observation": observation,
+                    "actions": actions,
+                    "values": _buffer_values(values),
+                    "log_probs": _buffer_values(log_probs),
+                    "action_masks": action_masks,
+                    "episode_starts": self._last_episode_starts[dispatch],
+                }
+                for row, env_index in enumerate(dispatch):
+                    in_flight[int(env_index)] = (record, row)
+                env.step_async_indices(dispatch, actions)
+                idle = idle[len(dispatch):]
+
+            indices, new_obs, rewards, dones, infos = env.step_wait_any()
+            if not len(indices):
+                continue
+            self.num_timesteps += len(indices)
+            self._update_info_buffer(infos, dones)
+            rewards = np.asarray(rewards, dtype=np.float32).copy()
+            for position, done in enumerate(dones):
+                terminal_observation = infos[position].get(
+                    "terminal_observation")
+                if (done and terminal_observation is not None
+                        and infos[position].get(
+                            "TimeLimit.truncated", False)):
+                    terminal_obs = self.policy.obs_to_tensor(
+                        terminal_observation)[0]
+                    with torch.no_grad():
+                        terminal_value = self.policy.predict_values(
+                            terminal_obs)[0]
+                    rewards[position] += self.gamma * float(terminal_value)
+
+            by_record = {}
+            for position, env_index in enumerate(indices):
+                record, row = in_flight.pop(int(env_index))
+                by_record.setdefault(id(record), (record, [], []))
+                by_record[id(record)][1].append(row)
+                by_record[id(record)][2].append(position)
+            step_actions = np.empty(len(indices), dtype=np.int64)
+            for record, rows, positions in by_record.values():
+                rows = np.asarray(rows, dtype=np.intp)
+                step_actions[positions] = np.asarray(
+                    record["actions"]).reshape(-1)[rows]
+                rollout_buffer.add_transitions(
+                    indices[positions],
+                    {key: value[rows]
+                     for key, value in record["observation"].items()},
+                    record["actions"][rows],
+                    rewards[positions],
+                    record["episode_starts"][rows],
+                    record["values"][rows],
+                    record["log_probs"][rows],
+                    action_masks=(
+                        record["action_masks"][rows]
+                        if record["action_masks"] is not None else None))
+            collected += len(indices)
+            for key, rows in self._last_obs.items():
+                rows[indices] = new_obs[key]
+            self._last_episode_starts[indices] = dones
+            idle = np.concatenate((idle, indices))
+
+            pending_callback.append(
+                (indices, new_obs, step_actions, rewards, dones, infos))
+            pending_count += len(indices)
+            if pending_count >= num_envs or collected >= capacity:
+                pending_count = 0
+                if not self._emit_callback_step(callback, pending_callback):
+                    self._drain_in_flight(env, in_flight)
+                    return False
+
+        with torch.no_grad():
+            values = self.policy.predict_values(
+                obs_as_tensor(self._last_obs, self.device))
+        rollout_buffer.compute_returns_and_advantage(
+            last_values=values, dones=self._last_episode_starts)
+        callback.on_rollout_end()
+        return True
+
+
 def validate_training_checkpoint(
         path, env, *, device, seed, expected_sha256=None,
         expected_num_timesteps=None):
@@ -2826,10 +3897,36 @@ def make_masked_mtg_env(decks, card_db, storage_root, *, agent_is_p1=True,
                             AlphaZeroMTGEnv.DEFAULT_TIME_COST_PER_STEP,
                         curriculum=None, opponent_profile="scripted",
                         matchup_seed=None, matchup_weighting=False,
-                        stats_persistence_interval_games=10):
-    """Create an environment whose generated statistics stay in one scope."""
+                        stats_persistence_interval_games=10,
+                        planner_refresh=
+                            AlphaZeroMTGEnv.DEFAULT_PLANNER_REFRESH,
+                        observation_validation_interval=
+                            AlphaZeroMTGEnv
+                            .DEFAULT_OBSERVATION_VALIDATION_INTERVAL,
+                        opponent_inference=None,
+                        fast_forward_forced_actions=False,
+                        record_step_latency=False,
+                        flat_observation=False):
+    """Create an environment whose generated statistics stay in one scope.
+
+    ``planner_refresh`` selects how often strategic planner features are
+    recomputed (see ``AlphaZeroMTGEnv.PLANNER_REFRESH_POLICIES``).
+    ``observation_validation_interval`` samples the reporting of bounds
+    violations on published observations after the environment's warmup
+    (1 reports every one); every observation is still repaired.
+    ``opponent_inference`` is an ``OpponentInferenceServer.address``; staged
+    checkpoint opponents are then served by that shared batched process
+    instead of being loaded into this worker.
+    ``fast_forward_forced_actions`` resolves agent decisions with exactly one
+    legal action inside ``step`` so they never reach the policy.
+    ``record_step_latency`` attaches per-phase step latency histograms to the
+    final ``info`` of every episode (see ``StepLatencyCallback``).
+    ``flat_observation`` presents the contiguous observation block as one
+    float32 vector for flat-input policies; the default Dict observation is
+    what ``FixedWindowMTGExtractor`` and every recorded lineage expect.
+    """
     os.makedirs(storage_root, exist_ok=True)
-    return ActionMasker(
+    env = ActionMasker(
         AlphaZeroMTGEnv(
             decks,
             card_db,
@@ -2851,9 +3948,17 @@ def make_masked_mtg_env(decks, card_db, storage_root, *, agent_is_p1=True,
             matchup_weighting=matchup_weighting,
             stats_persistence_interval_games=
                 stats_persistence_interval_games,
+            planner_refresh=planner_refresh,
+            observation_validation_interval=observation_validation_interval,
+            opponent_inference=opponent_inference,
+            fast_forward_forced_actions=fast_forward_forced_actions,
+            record_step_latency=record_step_latency,
         ),
         action_mask_fn='action_mask',
     )
+    if flat_observation:
+        env = FlatObservationWrapper(env)
+    return env
 
 class CustomLearningRateScheduler:
     """Advanced learning rate scheduler with adaptive decay"""
@@ -2882,10 +3987,17 @@ class CustomLearningRateScheduler:
 
 
 def create_training_model(env, training_config, seed=None, device="auto",
-                          tensorboard_log=None):
-    """Construct the final MaskablePPO model from one complete config."""
+                          tensorboard_log=None, model_class=MaskablePPO,
+                          features_extractor_class=FixedWindowMTGExtractor):
+    """Construct the final MaskablePPO model from one complete config.
+
+    ``model_class`` may be ``AsyncRolloutMaskablePPO`` for asynchronous
+    rollout collection; the hyperparameters are identical.
+    ``features_extractor_class`` may be ``FusedFixedWindowMTGExtractor``,
+    which computes the same features with batched per-field projections.
+    """
     policy_kwargs = {
-        'features_extractor_class': FixedWindowMTGExtractor,
+        'features_extractor_class': features_extractor_class,
         'features_extractor_kwargs': {
             'features_dim': FEATURE_OUTPUT_DIM,
         },
@@ -2894,7 +4006,7 @@ def create_training_model(env, training_config, seed=None, device="auto",
     }
     lr_scheduler = CustomLearningRateScheduler(
         initial_lr=training_config['learning_rate'])
-    return MaskablePPO(
+    return model_class(
         policy=FixedDimensionMaskableActorCriticPolicy,
         env=env,
         learning_rate=lr_scheduler,
@@ -2917,10 +4029,52 @@ def create_training_model(env, training_config, seed=None, device="auto",
         device=device,
     )
 
+HYPERPARAMETER_TRIAL_ENVS = 2
+# One core steps a trial's in-process environments and one runs its learner.
+HYPERPARAMETER_TRIAL_CPUS = 2
+HYPERPARAMETER_PRUNING_WARMUP_STEPS = 1
+
+
+def hyperparameter_worker_plan(requested_workers, n_trials, cpu_count):
+    """Split ``cpu_count`` cores between concurrent hyperparameter trials.
+
+    ``requested_workers`` of 0 picks as many workers as the machine holds at
+    ``HYPERPARAMETER_TRIAL_CPUS`` cores each.  Several workers must each fit
+    that budget; a worker's Torch threads are its share of the cores less
+    the ones its in-process environments step on, so the trials together
+    never oversubscribe the machine.  ``trials`` lists how many of
+    ``n_trials`` each worker runs.  A single worker keeps the in-process
+    default and is never rejected.
+    """
+    requested_workers = int(requested_workers)
+    n_trials = int(n_trials)
+    cpu_count = max(1, int(cpu_count))
+    if requested_workers < 0:
+        raise ValueError("hyperparameter workers cannot be negative")
+    if n_trials <= 0:
+        raise ValueError("hyperparameter optimization needs at least one trial")
+    workers = min(n_trials, requested_workers or max(
+        1, cpu_count // HYPERPARAMETER_TRIAL_CPUS))
+    if workers > 1 and workers * HYPERPARAMETER_TRIAL_CPUS > cpu_count:
+        raise ValueError(
+            f"{workers} hyperparameter workers at "
+            f"{HYPERPARAMETER_TRIAL_CPUS} CPUs each would oversubscribe "
+            f"{cpu_count} CPUs")
+    return {
+        "workers": workers,
+        "torch_threads": max(
+            1, cpu_count // workers - (HYPERPARAMETER_TRIAL_CPUS - 1)),
+        "trials": [n_trials // workers + (index < n_trials % workers)
+                   for index in range(workers)],
+    }
+
+
 def objective(trial, base_seed=42):
     """
     Advanced Optuna objective function with more sophisticated parameter space
     """
+    import optuna
+
     trial_seed = int(base_seed) + int(getattr(trial, "number", 0))
     set_random_seed(trial_seed)
 
@@ -2995,8 +4149,9 @@ def objective(trial, base_seed=42):
     # Evaluation must not step the training VecEnv. Doing so leaves PPO's
     # cached ``_last_obs`` out of sync with the environment before the next
     # learn() call and couples evaluation trajectories to training state.
-    train_env = make_vec_env(make_train_env, n_envs=2)
-    eval_env = make_vec_env(make_eval_env, n_envs=2)
+    train_env = make_vec_env(
+        make_train_env, n_envs=HYPERPARAMETER_TRIAL_ENVS)
+    eval_env = make_vec_env(make_eval_env, n_envs=HYPERPARAMETER_TRIAL_ENVS)
     if hasattr(train_env, "seed"):
         train_env.seed(trial_seed)
     if hasattr(eval_env, "seed"):
@@ -3077,22 +4232,103 @@ def objective(trial, base_seed=42):
         train_env.close()
         eval_env.close()
 
-def optimize_hyperparameters(n_trials=50, study_name="mtg_optimization",
-                             seed=42):
-    """Run Optuna hyperparameter optimization with persistence and pruning"""
-    storage_name = f"sqlite:///{study_name}.db"
-    study = optuna.create_study(
+def _hyperparameter_study(study_name, storage_url, seed, *, workers=1,
+                          load_if_exists=True):
+    """Open the shared study with a per-worker sampler seed."""
+    import optuna
+
+    # Concurrent workers share one SQLite file; wait out each other's write
+    # locks instead of failing a trial on "database is locked".
+    storage = optuna.storages.RDBStorage(
+        storage_url, engine_kwargs={"connect_args": {"timeout": 60}})
+    return optuna.create_study(
         study_name=study_name,
-        storage=storage_name,
-        load_if_exists=True,
+        storage=storage,
+        load_if_exists=load_if_exists,
         direction='maximize',
         sampler=optuna.samplers.TPESampler(seed=seed),
-        pruner=optuna.pruners.MedianPruner()  # Early stopping for bad trials
+        # Median pruning only compares a trial with finished ones; with
+        # several trials running at once, wait for at least one per worker.
+        pruner=(optuna.pruners.MedianPruner() if int(workers) == 1
+                else optuna.pruners.MedianPruner(
+                    n_startup_trials=max(5, int(workers)),
+                    n_warmup_steps=HYPERPARAMETER_PRUNING_WARMUP_STEPS)),
     )
-    
+
+
+def _hyperparameter_worker(study_name, storage_url, n_trials, seed,
+                           sampler_seed, workers, torch_threads, debug=False,
+                           trial_objective=None):
+    """Run ``n_trials`` trials of the shared study in a spawned process."""
+    trial_objective = trial_objective or objective
+    torch.set_num_threads(int(torch_threads))
+    try:
+        configure_runtime_logging(debug=debug, worker=True)
+    except Exception:
+        pass
+    study = _hyperparameter_study(
+        study_name, storage_url, sampler_seed, workers=workers)
     study.optimize(
-        lambda trial: objective(trial, base_seed=seed), n_trials=n_trials)
-    
+        lambda trial: trial_objective(trial, base_seed=seed),
+        n_trials=n_trials)
+
+
+def optimize_hyperparameters(n_trials=50, study_name="mtg_optimization",
+                             seed=42, workers=1, cpu_count=None, debug=False,
+                             storage_name=None, trial_objective=None):
+    """Run Optuna hyperparameter optimization with persistence and pruning.
+
+    With more than one worker (0 = auto), trials run in spawned processes
+    that share the study's SQLite storage; ``hyperparameter_worker_plan``
+    sizes each worker's Torch thread budget so the machine is not
+    oversubscribed.  Trial numbers, seeds and log directories come from the
+    shared storage, so they stay unique across workers.
+    ``trial_objective`` replaces ``objective`` and must be picklable by
+    reference when trials run in workers.
+    """
+    import optuna
+
+    trial_objective = trial_objective or objective
+    plan = hyperparameter_worker_plan(
+        workers, n_trials,
+        safe_cpu_count() if cpu_count is None else cpu_count)
+    storage_name = storage_name or f"sqlite:///{study_name}.db"
+    study = _hyperparameter_study(
+        study_name, storage_name, seed, workers=plan["workers"])
+
+    if plan["workers"] == 1:
+        study.optimize(
+            lambda trial: trial_objective(trial, base_seed=seed),
+            n_trials=n_trials)
+    else:
+        logging.info(
+            "Running %s hyperparameter workers with %s Torch threads each",
+            plan["workers"], plan["torch_threads"])
+        context = multiprocessing.get_context("spawn")
+        processes = [
+            context.Process(
+                target=_hyperparameter_worker,
+                args=(study_name, storage_name, worker_trials, seed,
+                      seed + worker_index, plan["workers"],
+                      plan["torch_threads"], debug, trial_objective),
+                daemon=True, name=f"hyperparameter-worker-{worker_index}")
+            for worker_index, worker_trials in enumerate(plan["trials"])]
+        try:
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+        failed = [process.name for process in processes
+                  if process.exitcode != 0]
+        if failed:
+            raise RuntimeError(
+                f"Hyperparameter workers failed: {', '.join(failed)}")
+        study = optuna.load_study(study_name=study_name, storage=storage_name)
+
     # Visualization of optimization results
     try:
         import matplotlib.pyplot as plt
@@ -3351,27 +4587,31 @@ class StrictTrainingFidelityCallback(BaseCallback):
             dtype=bool).reshape(-1)
         observations = self.locals.get("new_obs")
         actions = self.locals.get("actions")
+        workers = callback_env_indices(
+            self.locals, len(self.signature_histories or ()))
 
         if (self.signature_histories is not None
                 and observations is not None and actions is not None):
-            for env_index, history in enumerate(self.signature_histories):
-                if env_index < len(dones) and dones[env_index]:
+            for position, env_index in enumerate(workers):
+                history = self.signature_histories[env_index]
+                if position < len(dones) and dones[position]:
                     history.clear()
                     continue
                 history.append(rollout_signature(
-                    observations, None, actions, env_index))
+                    observations, None, actions, position))
                 if len(history) > 12:
                     del history[:-12]
                 period = repeated_short_cycle_period(history)
                 if period is not None:
-                    info = infos[env_index] if env_index < len(infos) else {}
+                    info = infos[position] if position < len(infos) else {}
                     raise RuntimeError(
                         "Strict training detected a non-progressing policy "
                         f"cycle of period {period} in environment {env_index}; "
                         f"actions={np.asarray(actions).reshape(-1).tolist()}, "
                         f"state={info.get('policy_state')}")
 
-        for env_index, info in enumerate(infos):
+        for env_index, info in zip(
+                callback_env_indices(self.locals, len(infos)), infos):
             detail = training_fidelity_failure(info)
             if detail is not None:
                 raise RuntimeError(
@@ -3596,6 +4836,59 @@ class PhaseTimingCallback(BaseCallback):
         self.previous_rollout_ended_at = now
 
 
+class StepLatencyCallback(BaseCallback):
+    """Log per-phase environment step latency percentiles per rollout.
+
+    Workers built with ``record_step_latency`` attach sparse histograms to
+    the final ``info`` of each episode.  They are merged over one rollout and
+    logged as ``latency/<stage>/p50_ms`` (and p95/p99), with the same
+    percentiles broken down under ``latency_by_action/<stage>/<category>``
+    and ``latency_by_phase/<stage>/<game phase>``.
+    """
+
+    def __init__(self):
+        super().__init__(verbose=0)
+        self._histograms = {}
+
+    def _on_step(self):
+        for info in self.locals.get("infos", ()) or ():
+            payload = info.get("step_latency")
+            if payload:
+                merge_latency_histograms(self._histograms, payload)
+        return True
+
+    def _record_percentiles(self, prefix, counts):
+        for quantile, milliseconds in histogram_percentiles(counts).items():
+            self.logger.record(
+                f"{prefix}/p{int(round(quantile * 100))}_ms", milliseconds)
+
+    def _on_rollout_end(self):
+        if not self._histograms:
+            return
+        by_stage, by_action, by_phase = {}, {}, {}
+        for key, counts in self._histograms.items():
+            stage, category, phase = key.split("/", 2)
+            for groups, group_key in (
+                    (by_stage, stage),
+                    (by_action, (stage, category)),
+                    (by_phase, (stage, phase))):
+                if group_key in groups:
+                    groups[group_key] = groups[group_key] + counts
+                else:
+                    groups[group_key] = counts.copy()
+        for stage, counts in by_stage.items():
+            self._record_percentiles(f"latency/{stage}", counts)
+            self.logger.record(
+                f"latency/{stage}/samples", int(counts.sum()))
+        for (stage, category), counts in by_action.items():
+            self._record_percentiles(
+                f"latency_by_action/{stage}/{category}", counts)
+        for (stage, phase), counts in by_phase.items():
+            self._record_percentiles(
+                f"latency_by_phase/{stage}/{phase}", counts)
+        self._histograms = {}
+
+
 class CurriculumProgressCallback(BaseCallback):
     """Coordinate fixed or mastery-gated deterministic matchup schedulers."""
 
@@ -3791,11 +5084,13 @@ class CurriculumProgressCallback(BaseCallback):
             self._active_stage_index]["name"]
         infos = list(self.locals.get("infos", ()) or ())
         dones = self.locals.get("dones")
+        workers = callback_env_indices(self.locals, len(infos))
         changed = False
-        for index, info in enumerate(infos):
-            if (dones is not None and index < len(dones)
-                    and not bool(dones[index])):
+        for position, info in enumerate(infos):
+            if (dones is not None and position < len(dones)
+                    and not bool(dones[position])):
                 continue
+            index = workers[position]
             if info.get("curriculum_stage") != active_name:
                 if index in self._pending_activation_workers:
                     self._stale_stage_episodes += 1
@@ -4182,9 +5477,21 @@ class CheckpointPoolSelfPlayCallback(BaseCallback):
 
     MANIFEST_SCHEMA_VERSION = 1
 
-    def __init__(self, *, run_id, pool_directory, config, lineage, verbose=0):
+    def __init__(self, *, run_id, pool_directory, config, lineage,
+                 shared_inference=False, inference_exports=False,
+                 persistence_writer=None, verbose=0):
         super().__init__(verbose)
         self.run_id = str(run_id)
+        # With a writer, the snapshot is written off-thread and the pool
+        # refresh completes at the first callback after it lands.
+        self.persistence_writer = persistence_writer
+        self._queued_snapshot = None
+        # With the batched opponent inference server, workers hold remote
+        # handles and the server keeps one copy of each leased snapshot.
+        self.shared_inference = bool(shared_inference)
+        # Each snapshot gets an actor-only export that opponent loaders
+        # prefer over the full MaskablePPO archive.
+        self.inference_exports = bool(inference_exports)
         self.pool_directory = os.path.abspath(pool_directory)
         self.manifest_path = os.path.join(
             self.pool_directory, "checkpoint_pool.json")
@@ -4345,6 +5652,23 @@ class CheckpointPoolSelfPlayCallback(BaseCallback):
         latest_leases = (
             self._lease_history[-1].get("leases")
             if self._lease_history else ()) or ()
+        if self.shared_inference:
+            leased_checkpoints = {
+                lease.get("checkpoint_sha256"): int(
+                    lease.get("checkpoint_size_bytes", 0))
+                for lease in latest_leases}
+            return {
+                "active_disk_checkpoint_count": len(self._active_pool),
+                "active_disk_checkpoint_bytes": sum(
+                    int(entry.get("size_bytes", 0))
+                    for entry in self._active_pool),
+                "opponent_inference": "batched_server",
+                "resident_policies_per_worker": 0,
+                "maximum_resident_policies_per_worker_during_refresh": 0,
+                "estimated_resident_policy_copies": len(leased_checkpoints),
+                "estimated_resident_checkpoint_file_bytes": sum(
+                    leased_checkpoints.values()),
+            }
         return {
             "active_disk_checkpoint_count": len(self._active_pool),
             "active_disk_checkpoint_bytes": sum(
@@ -4388,12 +5712,17 @@ class CheckpointPoolSelfPlayCallback(BaseCallback):
             display_path = os.path.abspath(path)
         return display_path.replace(os.sep, "/")
 
-    def _save_frozen_snapshot(self, timestep, cadence):
-        stem = f"opponent_{int(timestep):012d}"
-        final_path = os.path.join(self.pool_directory, f"{stem}.zip")
+    def _snapshot_path(self, timestep):
+        final_path = os.path.join(
+            self.pool_directory, f"opponent_{int(timestep):012d}.zip")
         if os.path.exists(final_path):
             raise RuntimeError(
                 f"Checkpoint pool snapshot already exists: {final_path}")
+        return final_path
+
+    def _save_frozen_snapshot(self, timestep, cadence):
+        final_path = self._snapshot_path(timestep)
+        stem = f"opponent_{int(timestep):012d}"
         temporary_base = os.path.join(
             self.pool_directory,
             f".{stem}.{os.getpid()}.{time.time_ns()}.tmp")
@@ -4409,12 +5738,54 @@ class CheckpointPoolSelfPlayCallback(BaseCallback):
             for candidate in (temporary_base, f"{temporary_base}.zip"):
                 if os.path.isfile(candidate):
                     os.remove(candidate)
+        if self.inference_exports:
+            export_inference_policy(self.model.policy, final_path)
+        return self._snapshot_entry(
+            timestep, cadence, final_path,
+            os.path.getsize(final_path), sha256_file(final_path))
+
+    def _queue_frozen_snapshot(self, timestep, cadence):
+        """Capture the learner now and write its snapshot off-thread."""
+        final_path = self._snapshot_path(timestep)
+        capture = ModelArchiveCapture(self.model)
+        inference_exports = self.inference_exports
+
+        def write():
+            capture.write(final_path)
+            if inference_exports:
+                export_inference_policy(capture.policy(), final_path)
+            return os.path.getsize(final_path), sha256_file(final_path)
+
+        future = self.persistence_writer.submit(
+            write, description=final_path)
+        self._queued_snapshot = (future, timestep, cadence, final_path)
+
+    def _complete_queued_snapshot(self, wait=False):
+        """Refresh the pool once the queued snapshot has been written."""
+        if self._queued_snapshot is None:
+            return
+        future, timestep, cadence, final_path = self._queued_snapshot
+        if not wait and not future.done():
+            return
+        self._queued_snapshot = None
+        try:
+            size_bytes, sha256 = future.result()
+        except Exception as error:
+            raise RuntimeError(
+                f"Checkpoint pool snapshot was not written: {final_path}: "
+                f"{error}") from error
+        self._refresh_pool(timestep, cadence, self._snapshot_entry(
+            timestep, cadence, final_path, size_bytes, sha256))
+        self._persist()
+
+    def _snapshot_entry(self, timestep, cadence, final_path, size_bytes,
+                        sha256):
         entry = {
             "policy_id": f"{self.run_id}@{int(timestep)}",
             "path": self._portable_path(final_path),
             "absolute_path": os.path.abspath(final_path),
-            "size_bytes": os.path.getsize(final_path),
-            "sha256": sha256_file(final_path),
+            "size_bytes": int(size_bytes),
+            "sha256": sha256,
             "snapshot_timestep": int(timestep),
             "cadence_boundary_timestep": int(
                 cadence["first_crossed_boundary_timestep"]),
@@ -4468,8 +5839,9 @@ class CheckpointPoolSelfPlayCallback(BaseCallback):
                 f"{worker_index}: " + "; ".join(mismatches))
         return payload
 
-    def _refresh_pool(self, timestep, cadence):
-        new_entry = self._save_frozen_snapshot(timestep, cadence)
+    def _refresh_pool(self, timestep, cadence, new_entry=None):
+        if new_entry is None:
+            new_entry = self._save_frozen_snapshot(timestep, cadence)
         prospective_pool = [*self._active_pool, new_entry]
         evicted = prospective_pool[:-self.max_checkpoints]
         prospective_pool = prospective_pool[-self.max_checkpoints:]
@@ -4539,8 +5911,10 @@ class CheckpointPoolSelfPlayCallback(BaseCallback):
                     != self.pool_directory:
                 raise RuntimeError(
                     f"Refusing to evict checkpoint outside pool: {evicted_path}")
-            if os.path.isfile(evicted_path):
-                os.remove(evicted_path)
+            for path in (evicted_path,
+                         str(inference_policy_path(evicted_path))):
+                if os.path.isfile(path):
+                    os.remove(path)
         self._persist()
         self.logger.record(
             "self_play/checkpoint_pool_size", len(self._active_pool))
@@ -4563,6 +5937,7 @@ class CheckpointPoolSelfPlayCallback(BaseCallback):
         self._persist()
 
     def _on_step(self):
+        self._complete_queued_snapshot()
         timestep = int(self.num_timesteps)
         if timestep < self._next_snapshot_timestep:
             return True
@@ -4579,13 +5954,19 @@ class CheckpointPoolSelfPlayCallback(BaseCallback):
             "crossed_boundary_count": int(crossed_count),
             "observed_snapshot_timestep": timestep,
         }
-        self._refresh_pool(timestep, cadence)
+        if self.persistence_writer is not None:
+            # One snapshot in flight at a time keeps pool refreshes in order.
+            self._complete_queued_snapshot(wait=True)
+            self._queue_frozen_snapshot(timestep, cadence)
+        else:
+            self._refresh_pool(timestep, cadence)
         self._next_snapshot_timestep = int(
             last_boundary + self.snapshot_frequency)
         self._persist()
         return True
 
     def _on_training_end(self):
+        self._complete_queued_snapshot(wait=True)
         self._persist()
 
 
@@ -4925,6 +6306,8 @@ def _build_evaluation_episode(case_index, case, outcome, reward, length):
     # capture, plus synthetic callback tests, remain valid without this field.
     if outcome.get("debug") is not None:
         episode["debug"] = deepcopy(outcome["debug"])
+    elif outcome.get("debug_sidecar") is not None:
+        episode.update(deepcopy(outcome["debug_sidecar"]))
     return episode
 
 
@@ -5013,17 +6396,55 @@ def _evaluation_debug_summary(debug):
     })
 
 
+def _evaluation_debug_sidecar_path(history_directory, timestep, case_index):
+    """Return one game's relative and absolute sidecar paths."""
+    relative_path = os.path.join(
+        "games", str(int(timestep)), f"case_{int(case_index):03d}.json.gz")
+    sidecar_path = os.path.abspath(os.path.join(
+        history_directory, relative_path))
+    if os.path.commonpath((history_directory, sidecar_path)) \
+            != history_directory:
+        raise RuntimeError(
+            "Evaluation debug sidecar resolved outside history directory")
+    return relative_path.replace(os.sep, "/"), sidecar_path
+
+
+def _write_evaluation_debug_sidecar(debug, *, history_directory, timestep,
+                                    case_index):
+    """Write one game's debug payload; return the fields that reference it."""
+    relative_path, sidecar_path = _evaluation_debug_sidecar_path(
+        history_directory, timestep, case_index)
+    write_gzip_json_atomic(sidecar_path, debug)
+    trace = debug.get("trace")
+    replay = debug.get("replay")
+    replay_actions = replay.get("actions") \
+        if isinstance(replay, dict) else None
+    return {
+        "debug_path": relative_path,
+        "debug_sha256": sha256_file(sidecar_path),
+        "debug_size_bytes": os.path.getsize(sidecar_path),
+        "trace_event_count": len(trace)
+        if isinstance(trace, (list, tuple)) else 0,
+        "replay_action_count": len(replay_actions)
+        if isinstance(replay_actions, (list, tuple)) else 0,
+        "debug_summary": _evaluation_debug_summary(debug),
+    }
+
+
 def _persist_evaluation_debug_sidecars(
         episodes, *, timestep, evaluation_history_path):
-    """Externalize inline per-game debug data before history publication.
+    """Externalize per-game debug data before history publication.
 
-    Worker results intentionally retain inline ``debug`` for process-boundary
-    compatibility.  Only the callback that owns ``evaluations.json`` knows its
-    final directory, so it atomically writes the heavy payloads and substitutes
-    small, relative references there.
+    Evaluation workers normally stream each game's payload to its sidecar as
+    the game ends and return only the reference; those sidecars are checked
+    against their recorded digest here.  Episodes that still carry inline
+    ``debug`` (older workers, direct callers) are written now, and small
+    relative references replace the payloads.
     """
     normalized = [dict(episode) for episode in episodes]
-    if not any(episode.get("debug") is not None for episode in normalized):
+    if not any(episode.get("debug") is not None
+               or episode.get("debug_path") is not None
+               for episode in normalized):
         return normalized
     if not evaluation_history_path:
         raise RuntimeError(
@@ -5045,10 +6466,10 @@ def _persist_evaluation_debug_sidecars(
     for ordinal, episode in enumerate(normalized):
         item = dict(episode)
         debug = item.pop("debug", None)
-        if debug is None:
+        if debug is None and item.get("debug_path") is None:
             externalized.append(item)
             continue
-        if not isinstance(debug, dict):
+        if debug is not None and not isinstance(debug, dict):
             raise RuntimeError(
                 f"Evaluation case {ordinal} debug payload must be an object")
         try:
@@ -5063,44 +6484,98 @@ def _persist_evaluation_debug_sidecars(
                 f"indices; received {case_index}")
         seen_case_indices.add(case_index)
 
-        relative_path = os.path.join(
-            "games", str(safe_timestep),
-            f"case_{case_index:03d}.json.gz")
-        sidecar_path = os.path.abspath(os.path.join(
-            history_directory, relative_path))
-        if os.path.commonpath((history_directory, sidecar_path)) \
-                != history_directory:
-            raise RuntimeError(
-                "Evaluation debug sidecar resolved outside history directory")
-        write_gzip_json_atomic(sidecar_path, debug)
-
-        trace = debug.get("trace")
-        replay = debug.get("replay")
-        replay_actions = replay.get("actions") \
-            if isinstance(replay, dict) else None
-        item.update({
-            "debug_path": os.path.relpath(
-                sidecar_path, history_directory).replace(os.sep, "/"),
-            "debug_sha256": sha256_file(sidecar_path),
-            "debug_size_bytes": os.path.getsize(sidecar_path),
-            "trace_event_count": len(trace)
-            if isinstance(trace, (list, tuple)) else 0,
-            "replay_action_count": len(replay_actions)
-            if isinstance(replay_actions, (list, tuple)) else 0,
-            "debug_summary": _evaluation_debug_summary(debug),
-        })
+        if debug is not None:
+            item.update(_write_evaluation_debug_sidecar(
+                debug, history_directory=history_directory,
+                timestep=safe_timestep, case_index=case_index))
+        else:
+            relative_path, sidecar_path = _evaluation_debug_sidecar_path(
+                history_directory, safe_timestep, case_index)
+            if item["debug_path"] != relative_path:
+                raise RuntimeError(
+                    f"Evaluation case {case_index} debug sidecar is at "
+                    f"{item['debug_path']!r}, expected {relative_path!r}")
+            if not os.path.isfile(sidecar_path) \
+                    or os.path.getsize(sidecar_path) \
+                    != item.get("debug_size_bytes") \
+                    or sha256_file(sidecar_path) != item.get("debug_sha256"):
+                raise RuntimeError(
+                    f"Evaluation case {case_index} debug sidecar is missing "
+                    "or changed after its game was recorded")
         externalized.append(item)
     return externalized
 
 
+def evaluation_worker_cases(case_count, worker_index, worker_count):
+    """Return the fixed-schedule case indices one evaluation worker scores.
+
+    Workers stride the schedule by ``case_index``, so every case belongs to
+    exactly one worker and each worker's share stays in schedule order.
+    """
+    return list(range(int(worker_index), int(case_count), int(worker_count)))
+
+
+def merge_evaluation_results(results):
+    """Join per-worker evaluation results for one snapshot in schedule order.
+
+    The merged result has the shape a single worker returns, with
+    ``summarize_evaluation_episodes`` applied to the whole schedule, so the
+    summary and promotion key do not depend on the worker count.
+    """
+    results = sorted(results, key=lambda item: int(item["worker_index"]))
+    worker_count = int(results[0]["worker_count"])
+    if [int(item["worker_index"]) for item in results] != list(
+            range(worker_count)):
+        raise RuntimeError(
+            "Evaluation results do not cover every worker exactly once")
+    shared_keys = ("evaluation_id", "timesteps", "snapshot_path",
+                   "checkpoint_sha256", "checkpoint_size_bytes",
+                   "schedule_sha256")
+    for item in results[1:]:
+        mismatched = [key for key in shared_keys
+                      if item.get(key) != results[0].get(key)]
+        if mismatched:
+            raise RuntimeError(
+                "Evaluation workers scored different snapshots or schedules: "
+                + ", ".join(mismatched))
+    episodes = sorted(
+        (episode for item in results for episode in item["episodes"]),
+        key=lambda episode: int(episode["case_index"]))
+    if [int(episode["case_index"]) for episode in episodes] != list(
+            range(len(episodes))):
+        raise RuntimeError(
+            "Evaluation workers did not return every fixed case exactly once")
+    episodes, summary, promotion_key = summarize_evaluation_episodes(episodes)
+    merged = {key: value for key, value in results[0].items()
+              if key not in ("worker_index", "worker_count")}
+    merged.update({
+        "episodes": episodes,
+        "summary": summary,
+        "promotion_key": list(promotion_key),
+    })
+    return merged
+
+
 def _async_evaluation_worker(request_queue, result_queue, env_factory,
-                             fixed_schedule, debug=False):
+                             fixed_schedule, debug=False,
+                             inference_policy=False, worker_index=0,
+                             worker_count=1, sequential_test=None,
+                             debug_history_directory=None):
     """Dedicated evaluation process: build one strict eval env, then score
     each requested policy snapshot with mask-aware episodes.
 
-    Any failure is posted as ``fatal`` and ends the worker — evaluation
-    fidelity failures must abort training, exactly like the synchronous
-    evaluator this replaces (Tier 3 throughput program, item 5)."""
+    With several workers, each scores its ``evaluation_worker_cases`` share
+    of the schedule and tags the result with ``worker_index``/
+    ``worker_count``; the callback merges the shares. With a
+    ``sequential_test`` rule, a single worker plays the schedule one
+    seat-swapped pair at a time and stops once the rule settles that the
+    snapshot fails qualification. With a ``debug_history_directory``, each
+    game's debug payload is written to its sidecar as soon as the game ends,
+    so only the small reference is held until the result is posted. Any
+    failure is posted
+    as ``fatal`` and ends the worker — evaluation fidelity failures must
+    abort training, exactly like the synchronous evaluator this replaces
+    (Tier 3 throughput program, item 5)."""
     torch.set_num_threads(2)
     try:
         configure_runtime_logging(debug=debug, worker=True)
@@ -5108,12 +6583,21 @@ def _async_evaluation_worker(request_queue, result_queue, env_factory,
         pass
     eval_env = None
     try:
-        eval_env = env_factory.var()
-        fixed_schedule = [dict(case) for case in fixed_schedule]
-        n_eval_episodes = len(fixed_schedule)
-        if n_eval_episodes <= 0:
+        worker_count = int(worker_count)
+        # Each worker needs its own environment storage.
+        eval_env = (env_factory.var() if worker_count == 1
+                    else env_factory.var(int(worker_index)))
+        schedule = [dict(case) for case in fixed_schedule]
+        if not schedule:
             raise RuntimeError("Asynchronous evaluation schedule is empty")
-        schedule_hash = evaluation_schedule_sha256(fixed_schedule)
+        schedule_hash = evaluation_schedule_sha256(schedule)
+        case_indices = evaluation_worker_cases(
+            len(schedule), worker_index, worker_count)
+        if not case_indices:
+            raise RuntimeError(
+                f"Evaluation worker {worker_index} of {worker_count} has no "
+                "fixed cases to score")
+        fixed_schedule = [schedule[index] for index in case_indices]
         while True:
             request = request_queue.get()
             if request is None:
@@ -5144,7 +6628,6 @@ def _async_evaluation_worker(request_queue, result_queue, env_factory,
                     "replaces_scheduled_boundary_timesteps": None,
                     "retain_snapshot": False,
                 }
-            install_fixed_evaluation_schedule(eval_env, fixed_schedule)
             snapshot_actual = resolve_artifact_path(snapshot_path)
             if snapshot_actual is None:
                 raise FileNotFoundError(
@@ -5156,54 +6639,107 @@ def _async_evaluation_worker(request_queue, result_queue, env_factory,
             model = MaskablePPO.load(
                 snapshot_actual, env=eval_env, device="cpu")
             if hasattr(model, "set_random_seed"):
-                model.set_random_seed(int(fixed_schedule[0]["seed"]))
-            terminal_infos = []
-
-            def capture_terminal_info(callback_locals, _callback_globals):
-                if not bool(callback_locals.get("done")):
-                    return
-                terminal_infos.append(_capture_evaluation_terminal_info(
-                    callback_locals.get("info")))
-
-            episode_rewards, episode_lengths = evaluate_policy(
-                model, eval_env, n_eval_episodes=n_eval_episodes,
-                deterministic=True, return_episode_rewards=True,
-                callback=capture_terminal_info)
-            if not (len(terminal_infos) == len(episode_rewards)
-                    == len(fixed_schedule)):
-                raise RuntimeError(
-                    "Fixed evaluation completed an unexpected number of "
-                    "episodes: outcomes=%s rewards=%s cases=%s" % (
-                        len(terminal_infos), len(episode_rewards),
-                        len(fixed_schedule)))
+                # Every worker seeds from the full schedule's first case.
+                model.set_random_seed(int(schedule[0]["seed"]))
+            if inference_policy:
+                # Score through the traced actor path only; the algorithm's
+                # rollout buffer and optimizer state are released first.
+                model = trace_inference_policy(model.policy, {
+                    "sha256": checkpoint_sha256,
+                    "size": os.path.getsize(snapshot_actual)})
+            # The final archive is always scored on the whole suite: its
+            # record is published with the final model.
+            sequential = (
+                sequential_test is not None
+                and request_metadata["checkpoint_role"] != "final_model")
+            stage_size = 2 if sequential else len(fixed_schedule)
             episodes = []
-            for case_index, (case, outcome, reward, length) in enumerate(zip(
-                    fixed_schedule, terminal_infos, episode_rewards,
-                    episode_lengths)):
-                expected_case = {
-                    key: case.get(key) for key in (
-                        "seed", "p1_deck", "p2_deck", "agent_is_p1",
-                        "opponent_profile")}
-                resolved_case = outcome["resolved_case"]
-                if resolved_case != expected_case:
+            test = None
+            for stage_start in range(0, len(fixed_schedule), stage_size):
+                stage_cases = fixed_schedule[
+                    stage_start:stage_start + stage_size]
+                install_fixed_evaluation_schedule(eval_env, stage_cases)
+                terminal_infos = []
+
+                def capture_terminal_info(callback_locals,
+                                          _callback_globals):
+                    if not bool(callback_locals.get("done")):
+                        return
+                    outcome = _capture_evaluation_terminal_info(
+                        callback_locals.get("info"))
+                    position = stage_start + len(terminal_infos)
+                    debug_payload = outcome.pop("debug", None)
+                    if debug_payload is not None:
+                        if (debug_history_directory is None
+                                or len(terminal_infos) >= len(stage_cases)):
+                            outcome["debug"] = debug_payload
+                        else:
+                            outcome["debug_sidecar"] = \
+                                _write_evaluation_debug_sidecar(
+                                    debug_payload,
+                                    history_directory=debug_history_directory,
+                                    timestep=trigger_timesteps,
+                                    case_index=case_indices[position])
+                    terminal_infos.append(outcome)
+
+                episode_rewards, episode_lengths = evaluate_policy(
+                    model, eval_env, n_eval_episodes=len(stage_cases),
+                    deterministic=True, return_episode_rewards=True,
+                    callback=capture_terminal_info)
+                if not (len(terminal_infos) == len(episode_rewards)
+                        == len(stage_cases)):
                     raise RuntimeError(
-                        "Fixed evaluation case did not resolve as requested: "
-                        f"index={case_index} expected={expected_case} "
-                        f"resolved={resolved_case}")
-                episodes.append(_build_evaluation_episode(
-                    case_index, case, outcome, reward, length))
-            episodes, summary, promotion_key = \
-                summarize_evaluation_episodes(episodes)
+                        "Fixed evaluation completed an unexpected number of "
+                        "episodes: outcomes=%s rewards=%s cases=%s" % (
+                            len(terminal_infos), len(episode_rewards),
+                            len(stage_cases)))
+                for case_index, case, outcome, reward, length in zip(
+                        case_indices[stage_start:], stage_cases,
+                        terminal_infos, episode_rewards, episode_lengths):
+                    expected_case = {
+                        key: case.get(key) for key in (
+                            "seed", "p1_deck", "p2_deck", "agent_is_p1",
+                            "opponent_profile")}
+                    resolved_case = outcome["resolved_case"]
+                    if resolved_case != expected_case:
+                        raise RuntimeError(
+                            "Fixed evaluation case did not resolve as "
+                            f"requested: index={case_index} "
+                            f"expected={expected_case} "
+                            f"resolved={resolved_case}")
+                    episodes.append(_build_evaluation_episode(
+                        case_index, case, outcome, reward, length))
+                if sequential:
+                    units = _paired_qualification_units(
+                        summarize_evaluation_episodes(episodes)[0])
+                    test = sequential_score_test(units or (), sequential_test)
+                    # A settled pass still needs the whole suite for the
+                    # promotion key; only a settled failure stops early.
+                    if test["decision"] == "fail":
+                        break
             result = {
                 "timesteps": int(trigger_timesteps),
                 "snapshot_path": snapshot_path,
                 "checkpoint_sha256": checkpoint_sha256,
                 "checkpoint_size_bytes": os.path.getsize(snapshot_actual),
                 "schedule_sha256": schedule_hash,
-                "episodes": episodes,
-                "summary": summary,
-                "promotion_key": list(promotion_key),
             }
+            if test is not None:
+                result["sequential_test"] = test
+            if worker_count == 1:
+                episodes, summary, promotion_key = \
+                    summarize_evaluation_episodes(episodes)
+                result.update({
+                    "episodes": episodes,
+                    "summary": summary,
+                    "promotion_key": list(promotion_key),
+                })
+            else:
+                result.update({
+                    "episodes": episodes,
+                    "worker_index": int(worker_index),
+                    "worker_count": worker_count,
+                })
             result.update(request_metadata)
             result_queue.put(result)
     except Exception:
@@ -5216,6 +6752,42 @@ def _async_evaluation_worker(request_queue, result_queue, env_factory,
                 pass
 
 
+class _EvaluationWorkerGroup:
+    """Evaluation worker processes driven as one.
+
+    ``put`` sends every request (and the ``None`` shutdown sentinel) to each
+    worker, since each scores its own share of every snapshot. The group is
+    alive only while every worker is: a missing share can never complete.
+    """
+
+    def __init__(self, processes, request_queues):
+        self.processes = list(processes)
+        self.request_queues = list(request_queues)
+
+    def start(self):
+        for process in self.processes:
+            process.start()
+
+    def put(self, request):
+        for request_queue in self.request_queues:
+            request_queue.put(request)
+
+    def is_alive(self):
+        return all(process.is_alive() for process in self.processes)
+
+    def join(self, timeout=None):
+        deadline = None if timeout is None else time.time() + timeout
+        for process in self.processes:
+            process.join(timeout=(
+                None if deadline is None
+                else max(0.0, deadline - time.time())))
+
+    def terminate(self):
+        for process in self.processes:
+            if process.is_alive():
+                process.terminate()
+
+
 class AsyncMaskableEvalCallback(BaseCallback):
     """Periodic mask-aware evaluation in a dedicated process.
 
@@ -5237,10 +6809,26 @@ class AsyncMaskableEvalCallback(BaseCallback):
                  best_model_save_path, best_candidate_save_path, snapshot_dir,
                  fixed_evaluation_schedule=None,
                  evaluation_history_path=None, debug=False,
-                 minimum_qualification_score=0.55,
-                 final_result_timeout_seconds=3600.0, verbose=0):
+                 minimum_qualification_score=(
+                     DEFAULT_MINIMUM_QUALIFICATION_SCORE),
+                 final_result_timeout_seconds=3600.0,
+                 inference_policy=False, persistence_writer=None,
+                 eval_workers=1, sequential_evaluation=False,
+                 sequential_error_rate=DEFAULT_SEQUENTIAL_ERROR_RATE,
+                 sequential_indifference=DEFAULT_SEQUENTIAL_INDIFFERENCE,
+                 verbose=0):
         super().__init__(verbose)
         self.eval_env_factory = eval_env_factory
+        # Workers split each schedule by case index; their shares are held
+        # in ``_partial_results`` until the whole schedule is back.
+        self.eval_workers = int(eval_workers)
+        if self.eval_workers < 1:
+            raise ValueError("eval_workers must be at least one")
+        self._partial_results = {}
+        # With a writer, a snapshot is handed to the evaluation worker once
+        # its archive has been written off-thread.
+        self.persistence_writer = persistence_writer
+        self.inference_policy = bool(inference_policy)
         self.eval_freq = int(eval_freq)
         self.n_eval_episodes = int(n_eval_episodes)
         self.best_model_save_path = best_model_save_path
@@ -5253,6 +6841,10 @@ class AsyncMaskableEvalCallback(BaseCallback):
                 != self.n_eval_episodes):
             raise ValueError(
                 "fixed_evaluation_schedule length must equal n_eval_episodes")
+        if (self.fixed_evaluation_schedule
+                and self.eval_workers > len(self.fixed_evaluation_schedule)):
+            raise ValueError(
+                "eval_workers cannot exceed the fixed evaluation cases")
         self.schedule_sha256 = (
             evaluation_schedule_sha256(self.fixed_evaluation_schedule)
             if self.fixed_evaluation_schedule else None)
@@ -5265,6 +6857,19 @@ class AsyncMaskableEvalCallback(BaseCallback):
         if not 0.0 <= self.minimum_qualification_score <= 1.0:
             raise ValueError(
                 "minimum_qualification_score must be between zero and one")
+        # A snapshot the sequential test settles as failing qualification
+        # stops before the rest of the suite; its record is marked
+        # ``stopped_early`` and never ranks as a candidate.
+        self.sequential_test = None
+        if sequential_evaluation:
+            if self.eval_workers != 1:
+                raise ValueError(
+                    "sequential evaluation plays the schedule's pairs in "
+                    "order and requires eval_workers=1")
+            self.sequential_test = sequential_test_config(
+                self.minimum_qualification_score,
+                error_rate=sequential_error_rate,
+                indifference=sequential_indifference)
         self.best_mean_reward = -np.inf
         self.best_promotion_key = None
         self.best_candidate_promotion_key = None
@@ -5295,17 +6900,29 @@ class AsyncMaskableEvalCallback(BaseCallback):
         os.makedirs(self.best_candidate_save_path, exist_ok=True)
         self._write_evaluation_history()
         context = multiprocessing.get_context("spawn")
-        self._request_queue = context.Queue()
         self._result_queue = context.Queue()
-        self._process = context.Process(
-            target=_async_evaluation_worker,
-            args=(self._request_queue, self._result_queue,
-                  CloudpickleWrapper(self.eval_env_factory),
-                  self.fixed_evaluation_schedule, self.debug),
-            daemon=True,
-            name="async-eval-worker",
-        )
-        self._process.start()
+        env_factory = CloudpickleWrapper(self.eval_env_factory)
+        request_queues = [
+            context.Queue() for _ in range(self.eval_workers)]
+        processes = [
+            context.Process(
+                target=_async_evaluation_worker,
+                args=(request_queue, self._result_queue, env_factory,
+                      self.fixed_evaluation_schedule, self.debug,
+                      self.inference_policy),
+                kwargs={"worker_index": worker_index,
+                        "worker_count": self.eval_workers,
+                        "sequential_test": self.sequential_test,
+                        "debug_history_directory": os.path.dirname(
+                            os.path.abspath(self.evaluation_history_path))},
+                daemon=True,
+                name=("async-eval-worker" if self.eval_workers == 1
+                      else f"async-eval-worker-{worker_index}"),
+            )
+            for worker_index, request_queue in enumerate(request_queues)]
+        workers = _EvaluationWorkerGroup(processes, request_queues)
+        self._process = self._request_queue = workers
+        workers.start()
         self._next_eval_at = (
             self.num_timesteps + self.eval_freq
             if self.eval_freq > 0 else None)
@@ -5329,6 +6946,7 @@ class AsyncMaskableEvalCallback(BaseCallback):
                 "threshold": self.minimum_qualification_score,
                 "confidence": 0.95,
             },
+            "sequential_rule": self.sequential_test,
             "promotion_order": [
                 "decisive_wins",
                 "decisive_score",
@@ -5358,8 +6976,10 @@ class AsyncMaskableEvalCallback(BaseCallback):
                             checkpoint_role="periodic",
                             scheduled_boundary_timesteps=None,
                             replaces_scheduled_boundary_timesteps=None,
-                            retain_snapshot=False):
-        snapshot_actual = resolve_artifact_path(snapshot_path)
+                            retain_snapshot=False, snapshot_actual=None):
+        queued = snapshot_actual is not None
+        if not queued:
+            snapshot_actual = resolve_artifact_path(snapshot_path)
         if snapshot_actual is None:
             raise FileNotFoundError(
                 "Evaluation snapshot save did not publish an artifact: "
@@ -5379,11 +6999,32 @@ class AsyncMaskableEvalCallback(BaseCallback):
                 else None),
             "retain_snapshot": bool(retain_snapshot),
         }
-        self._request_queue.put(request)
+        if not queued:
+            self._request_queue.put(request)
         self._pending_snapshots += 1
         self._pending_snapshot_paths[snapshot_actual] = request
         return request
 
+    def _save_and_enqueue(self, snapshot_path, timesteps, **request):
+        """Save the learner to ``snapshot_path`` and queue its evaluation."""
+        if self.persistence_writer is None:
+            self.model.save(snapshot_path)
+            return self._enqueue_evaluation(
+                snapshot_path, timesteps, **request)
+        capture = ModelArchiveCapture(self.model)
+        snapshot_actual = f"{snapshot_path}.zip"
+        queued = self._enqueue_evaluation(
+            snapshot_path, timesteps, snapshot_actual=snapshot_actual,
+            **request)
+        request_queue = self._request_queue
+
+        def publish():
+            capture.write(snapshot_actual)
+            request_queue.put(queued)
+
+        self.persistence_writer.submit(publish, description=snapshot_actual)
+        return queued
+
     def _candidate_path_from_artifact(self, artifact):
         if not isinstance(artifact, dict) or not artifact.get("path"):
             return None
@@ -5524,13 +7165,37 @@ class AsyncMaskableEvalCallback(BaseCallback):
         if "fatal" in result:
             raise RuntimeError(
                 "Asynchronous evaluation worker failed:\n" + result["fatal"])
+        if int(result.get("worker_count", 1)) > 1:
+            shares = self._partial_results.setdefault(
+                result.get("evaluation_id"), [])
+            shares.append(result)
+            if len(shares) < int(result["worker_count"]):
+                return
+            del self._partial_results[result.get("evaluation_id")]
+            result = merge_evaluation_results(shares)
         self._pending_snapshots = max(0, self._pending_snapshots - 1)
         if result.get("schedule_sha256") != self.schedule_sha256:
             raise RuntimeError(
                 "Asynchronous evaluation used a different fixed case schedule")
         episodes, summary, promotion_key = summarize_evaluation_episodes(
             result.get("episodes") or ())
-        if len(episodes) != self.n_eval_episodes:
+        sequential_test = result.get("sequential_test")
+        stopped_early = bool(
+            sequential_test
+            and sequential_test.get("decision") == "fail"
+            and len(episodes) < self.n_eval_episodes)
+        if stopped_early:
+            if self.sequential_test is None:
+                raise RuntimeError(
+                    "Asynchronous evaluation stopped early without a "
+                    "sequential evaluation rule")
+            logging.info(
+                "Async evaluation @ %s steps stopped after %s of %s cases: "
+                "the sequential test settled qualification as failed "
+                "(log likelihood ratio %.3f)", result["timesteps"],
+                len(episodes), self.n_eval_episodes,
+                sequential_test["log_likelihood_ratio"])
+        elif len(episodes) != self.n_eval_episodes:
             raise RuntimeError(
                 "Asynchronous evaluation returned %s episodes for %s cases" % (
                     len(episodes), self.n_eval_episodes))
@@ -5578,7 +7243,8 @@ class AsyncMaskableEvalCallback(BaseCallback):
         self.logger.record("eval/timeouts", summary["timeouts"])
         self.logger.record("eval/timeout_rate", summary["timeout_rate"])
         qualified = (
-            qualification_lower >= self.minimum_qualification_score)
+            not stopped_early
+            and qualification_lower >= self.minimum_qualification_score)
         self.logger.record(
             "eval/qualification_score", qualification_score)
         self.logger.record(
@@ -5604,7 +7270,9 @@ class AsyncMaskableEvalCallback(BaseCallback):
             or self._new_evaluation_id(
                 checkpoint_role, result["timesteps"]))
         retain_snapshot = bool(result.get("retain_snapshot", False))
-        candidate_promoted = (
+        # Promotion keys are counts over the whole suite, so a truncated
+        # evaluation is never compared against them.
+        candidate_promoted = not stopped_early and (
             self.best_candidate_promotion_key is None
             or tuple(promotion_key) > self.best_candidate_promotion_key)
         promoted = qualified and (
@@ -5670,6 +7338,8 @@ class AsyncMaskableEvalCallback(BaseCallback):
             "qualified": qualified,
             "candidate_promoted": candidate_promoted,
             "promoted": promoted,
+            "stopped_early": stopped_early,
+            "sequential_test": sequential_test,
             "summary": summary,
             "episodes": episodes,
         }
@@ -5851,6 +7521,7 @@ class AsyncMaskableEvalCallback(BaseCallback):
             except OSError:
                 pass
         self._pending_snapshot_paths.clear()
+        self._partial_results.clear()
         self._pending_snapshots = 0
         self._write_evaluation_history()
 
@@ -5859,6 +7530,15 @@ class AsyncMaskableEvalCallback(BaseCallback):
         if (self._process is None and not self._pending_snapshot_paths
                 and self._pending_snapshots <= 0):
             return
+        if self.persistence_writer is not None:
+            # A queued snapshot must land before the cleanup below, or it
+            # would be published after its removal.
+            try:
+                self.persistence_writer.barrier()
+            except Exception as error:
+                logging.error(
+                    "Evaluation snapshot write failed during cancellation: "
+                    "%s", error)
         try:
             self._drain_results()
         except Exception as error:
@@ -5877,6 +7557,8 @@ class AsyncMaskableEvalCallback(BaseCallback):
     def _on_step(self):
         if self._process is None:
             return True
+        if self.persistence_writer is not None:
+            self.persistence_writer.check()
         self._drain_results()
         if self._pending_snapshots > 0 and not self._process.is_alive():
             raise RuntimeError(
@@ -5918,8 +7600,7 @@ class AsyncMaskableEvalCallback(BaseCallback):
                 snapshot_path = os.path.join(
                     self.snapshot_dir,
                     f"eval_snapshot_{self.num_timesteps}_steps")
-                self.model.save(snapshot_path)
-                self._enqueue_evaluation(
+                self._save_and_enqueue(
                     snapshot_path, self.num_timesteps,
                     checkpoint_role="periodic",
                     scheduled_boundary_timesteps=scheduled_boundary)
@@ -5945,16 +7626,19 @@ class AsyncMaskableEvalCallback(BaseCallback):
             final_snapshot_path = os.path.join(
                 self.snapshot_dir,
                 f"final_model_{final_timesteps}_evaluated")
-            self.model.save(final_snapshot_path)
             replaced_boundary = (
                 self._replaced_scheduled_evaluations[-1][
                     "scheduled_boundary_timesteps"]
                 if self._replaced_scheduled_evaluations else None)
-            self._enqueue_evaluation(
+            self._save_and_enqueue(
                 final_snapshot_path, final_timesteps,
                 checkpoint_role="final_model",
                 replaces_scheduled_boundary_timesteps=replaced_boundary,
                 retain_snapshot=True)
+            if self.persistence_writer is not None:
+                # Every snapshot, the final one included, is on disk and
+                # queued before the wait for results starts.
+                self.persistence_writer.barrier()
             deadline = time.time() + self.final_result_timeout_seconds
             while (self._pending_snapshots > 0 and self._process.is_alive()
                    and time.time() < deadline):
@@ -6002,11 +7686,43 @@ def cancel_async_evaluations(callbacks, reason):
                     "Could not cancel asynchronous evaluation: %s", error)
 
 
+class BackgroundCheckpointCallback(CheckpointCallback):
+    """``CheckpointCallback`` that writes its archives off the training thread.
+
+    Each save captures the model (``ModelArchiveCapture``) and hands the
+    archive to ``persistence_writer``; the learner continues while it is
+    compressed and written.
+    """
+
+    def __init__(self, save_freq, save_path, *, persistence_writer,
+                 name_prefix="rl_model", verbose=0):
+        super().__init__(save_freq, save_path, name_prefix=name_prefix,
+                         verbose=verbose)
+        self.persistence_writer = persistence_writer
+
+    def _on_step(self):
+        if self.n_calls % self.save_freq == 0:
+            model_path = self._checkpoint_path(extension="zip")
+            capture = ModelArchiveCapture(self.model)
+            self.persistence_writer.submit(
+                lambda: capture.write(model_path), description=model_path)
+            if self.verbose >= 2:
+                print(f"Queued model checkpoint for {model_path}")
+        return True
+
+    def _on_training_end(self):
+        self.persistence_writer.barrier()
+
+
 def create_callbacks(eval_env_factory, run_id, args, num_train_envs=1,
                      tb_run_dir=None, evaluation_schedule=None,
                      curriculum=None, checkpoint_pool_config=None,
-                     checkpoint_pool_lineage=None):
-    """Create a comprehensive set of callbacks"""
+                     checkpoint_pool_lineage=None, persistence_writer=None):
+    """Create a comprehensive set of callbacks
+
+    With a ``persistence_writer``, checkpoint, pool-snapshot and evaluation
+    snapshot archives are written on its background thread.
+    """
     # BaseCallback.n_calls counts VecEnv steps, not individual transitions.
     # Keep CLI frequencies expressed in total training timesteps as documented.
     def callback_frequency(timestep_frequency):
@@ -6038,14 +7754,30 @@ def create_callbacks(eval_env_factory, run_id, args, num_train_envs=1,
         evaluation_history_path=os.path.join(
             evaluation_log_dir, "evaluations.json"),
         debug=getattr(args, "debug", False),
+        inference_policy=getattr(args, "inference_exports", False),
+        persistence_writer=persistence_writer,
+        eval_workers=getattr(args, "eval_workers", 1),
+        sequential_evaluation=getattr(args, "eval_sequential", False),
+        sequential_error_rate=getattr(
+            args, "eval_sequential_error_rate",
+            DEFAULT_SEQUENTIAL_ERROR_RATE),
+        sequential_indifference=getattr(
+            args, "eval_sequential_indifference",
+            DEFAULT_SEQUENTIAL_INDIFFERENCE),
     )
 
     # Checkpoint callback
-    checkpoint_callback = CheckpointCallback(
-        save_freq=callback_frequency(args.checkpoint_freq),
-        save_path=checkpoint_dir,
-        name_prefix=f"ppo_mtg_{run_id}"
-    )
+    if persistence_writer is not None:
+        checkpoint_callback = BackgroundCheckpointCallback(
+            callback_frequency(args.checkpoint_freq), checkpoint_dir,
+            persistence_writer=persistence_writer,
+            name_prefix=f"ppo_mtg_{run_id}")
+    else:
+        checkpoint_callback = CheckpointCallback(
+            save_freq=callback_frequency(args.checkpoint_freq),
+            save_path=checkpoint_dir,
+            name_prefix=f"ppo_mtg_{run_id}"
+        )
 
     # Progress bar callback
     progress_callback = ProgressBarCallback()
@@ -6073,6 +7805,9 @@ def create_callbacks(eval_env_factory, run_id, args, num_train_envs=1,
                 run_model_dir, "checkpoint_pool"),
             config=checkpoint_pool_config,
             lineage=checkpoint_pool_lineage,
+            shared_inference=getattr(args, "opponent_inference_server", False),
+            inference_exports=getattr(args, "inference_exports", False),
+            persistence_writer=persistence_writer,
         ))
     if curriculum is not None:
         callbacks.append(CurriculumProgressCallback(curriculum))
@@ -6085,6 +7820,8 @@ def create_callbacks(eval_env_factory, run_id, args, num_train_envs=1,
     callbacks.append(RewardComponentsCallback())
     callbacks.append(CriticDiagnosticsCallback())
     callbacks.append(PhaseTimingCallback())
+    if getattr(args, "step_latency_histograms", False):
+        callbacks.append(StepLatencyCallback())
     callbacks.append(StrictTrainingFidelityCallback())
     return callbacks
 
@@ -6197,112 +7934,9 @@ def analyze_model_weights(model_path):
         print(traceback.format_exc())
         
 def main():
-    parser = argparse.ArgumentParser(description="Train an MTG AI agent")
-    parser.add_argument("--resume", type=str, help="Path to a model to resume training from")
-    parser.add_argument("--run-name", type=str, default=None,
-                        help="Short label folded into the run id and TensorBoard "
-                             "run name so runs are recognizable at a glance "
-                             "(e.g. --run-name lr3e4-crewfix)")
-    parser.add_argument("--timesteps", type=int, default=1000000, help="Total timesteps to train")
-    parser.add_argument(
-        "--eval-freq", type=int, default=100000,
-        help="Full fixed-suite evaluation frequency in training timesteps")
-    parser.add_argument(
-        "--eval-episodes", type=int, default=64,
-        help=("Fixed paired deck/seat/seed cases per periodic evaluation "
-              "(use an even count; 64+ recommended)"))
-    parser.add_argument(
-        "--checkpoint-freq", type=int,
-        default=DEFAULT_RECOVERY_CHECKPOINT_FREQUENCY,
-        help=("Permanent recovery-checkpoint frequency in training timesteps "
-              f"(default: {DEFAULT_RECOVERY_CHECKPOINT_FREQUENCY})"))
-    parser.add_argument(
-        "--checkpoint-pool-self-play", action="store_true",
-        help=("Opt in to checkpoint-league training. Frozen "
-              "opponents are used only by training workers; fixed evaluation "
-              "remains scripted."))
-    parser.add_argument(
-        "--checkpoint-pool-snapshot-freq", type=int,
-        default=DEFAULT_CHECKPOINT_POOL_SNAPSHOT_FREQUENCY,
-        help=("Learner timesteps between frozen checkpoint-pool snapshots "
-              f"(default: {DEFAULT_CHECKPOINT_POOL_SNAPSHOT_FREQUENCY})"))
-    parser.add_argument(
-        "--checkpoint-pool-size", type=int,
-        default=DEFAULT_CHECKPOINT_POOL_SIZE,
-        help=("Maximum frozen checkpoints retained on disk "
-              f"(default: {DEFAULT_CHECKPOINT_POOL_SIZE})"))
-    parser.add_argument(
-        "--checkpoint-pool-probability", type=float,
-        default=DEFAULT_CHECKPOINT_POOL_PROBABILITY,
-        help=("Per-episode probability of using a worker's one resident "
-              "checkpoint instead of scripted play "
-              f"(default: {DEFAULT_CHECKPOINT_POOL_PROBABILITY})"))
-    parser.add_argument("--learning-rate", type=float, default=2e-4, help="Initial learning rate")
-    parser.add_argument("--batch-size", type=int, default=256, help="Batch size for training")
-    parser.add_argument("--n-steps", type=int, default=1024, help="Number of steps to collect before training")
-    parser.add_argument(
-        "--n-envs", type=int, default=DEFAULT_TRAINING_ENVIRONMENTS,
-        help="Number of environments to run in parallel (0 = auto)")
-    parser.add_argument("--debug", action="store_true", help="Enable additional debugging")
-    parser.add_argument("--optimize-hp", action="store_true", help="Run hyperparameter optimization")
-    parser.add_argument("--record-network", action="store_true", 
-                        help="Enable detailed network recording (weights, gradients)")
-    parser.add_argument("--record-freq", type=int, default=5000, 
-                        help="Frequency for recording network parameters")
-    parser.add_argument("--cpu-only", action="store_true", help="Force CPU training even if GPU is available")
-    parser.add_argument(
-        "--seed", type=int, default=DEFAULT_TRAINING_SEED,
-        help="Base seed for Python, NumPy, Torch, and training workers")
-    parser.add_argument(
-        "--eval-seed", type=int, default=DEFAULT_EVALUATION_SEED,
-        help=("Independent seed for evaluation deck selection, paired cases, "
-              "and evaluation workers"))
-    parser.add_argument(
-        "--matchup-weighting", action="store_true",
-        help="Opt-in: bias training deck selection to oversample the decks the "
-             "agent is losing with (adaptive inverse-win-rate weighting). Off "
-             "by default; fixed evaluation is unaffected. Not part of the "
-             "named-canary contract.")
-    parser.add_argument("--format", type=str, default=DEFAULT_FORMAT_NAME,
-                        help="Enforce strict format legality and load the frozen "
-                             "formats/<format> card registry and feature schema "
-                             f"(default: {DEFAULT_FORMAT_NAME})")
-    parser.add_argument("--decks", type=str, default=None,
-                        help="Deck corpus directory "
-                             "(default: formats/<format>/decks)")
-    parser.add_argument("--format-dir", type=str, default=None,
-                        help="Explicit frozen format-namespace directory "
-                             "(default: formats/<format> when --format is given)")
-    parser.add_argument(
-        "--curriculum",
-        choices=("combat-v7", "combat-v6", "combat-v5", "combat-v4",
-                 "combat-v3", "combat-v2", "combat-v1", "none"),
-        default="combat-v7",
-        help="Deterministic training opponent curriculum (evaluation stays fixed)")
-    parser.add_argument(
-        "--canary-config", choices=tuple(CANARY_CONFIGS), default=None,
-        help=("Validate the named canary's enumerated CLI and resolved "
-              "experiment contract before training starts"))
+    parser = build_parser()
     args = parser.parse_args()
-    if args.resume and args.optimize_hp:
-        parser.error("--resume and --optimize-hp cannot be used together")
-    if args.checkpoint_pool_self_play and args.optimize_hp:
-        parser.error(
-            "--checkpoint-pool-self-play is not wired into hyperparameter "
-            "trials; run one explicit training experiment instead")
-    if args.timesteps <= 0:
-        parser.error("--timesteps must be positive")
-    if args.eval_episodes <= 0:
-        parser.error("--eval-episodes must be positive")
-    if args.eval_episodes % 2:
-        parser.error("--eval-episodes must be even for paired-seat evaluation")
-    try:
-        # Validate scalar settings before creating a run directory. The exact
-        # worker-seed list is resolved again after --n-envs auto-selection.
-        resolve_checkpoint_pool_config(
-            args, num_envs=max(int(args.n_envs), 1))
-    except ValueError as error:
-        parser.error(str(error))
+    canary_config = validate_arguments(parser, args)
     resume_lineage = None
     if args.resume:
         try:
@@ -6310,23 +7944,6 @@ def main():
                 args.resume, args.curriculum)
         except ValueError as error:
             parser.error(str(error))
-    # Hyperparameter trials still derive an isolated evaluation seed with the
-    # historical offset, while the normal run consumes --eval-seed directly.
-    maximum_training_seed = (
-        (2**32 - 1) - EVALUATION_SEED_OFFSET - 10_000)
-    maximum_evaluation_seed = (2**32 - 1) - 10_000
-    if not 0 <= args.seed <= maximum_training_seed:
-        parser.error(
-            f"--seed must be between 0 and {maximum_training_seed} so "
-            "worker and hyperparameter-evaluation seeds remain valid")
-    if not 0 <= args.eval_seed <= maximum_evaluation_seed:
-        parser.error(
-            f"--eval-seed must be between 0 and {maximum_evaluation_seed} so "
-            "evaluation worker seeds remain valid")
-    try:
-        canary_config = validate_canary_cli(args)
-    except ValueError as error:
-        parser.error(str(error))
 
     configure_runtime_logging(debug=args.debug, worker=False)
 
@@ -6439,8 +8056,10 @@ def main():
 
     vec_env = None
     eval_env = None
+    opponent_inference_server = None
     model = None
     callbacks = None
+    persistence_writer = None
     resolved_curriculum = None
     checkpoint_pool_config = None
     exit_code = 1
@@ -6480,7 +8099,8 @@ def main():
                 "Running seeded hyperparameter optimization with %s trials",
                 n_trials)
             best_params = optimize_hyperparameters(
-                n_trials=n_trials, seed=args.seed)
+                n_trials=n_trials, seed=args.seed, workers=args.hp_workers,
+                cpu_count=cpu_count, debug=args.debug)
             logging.info(
                 "Hyperparameter optimization completed; applying the complete "
                 "winning configuration: %s", best_params)
@@ -6493,6 +8113,11 @@ def main():
         )
         checkpoint_pool_config = resolve_checkpoint_pool_config(
             args, num_envs=num_envs)
+        async_rollouts = bool(args.async_rollouts and num_envs > 1)
+        if args.async_rollouts and not async_rollouts:
+            logging.warning(
+                "--async-rollouts needs more than one training environment; "
+                "collecting lock-step rollouts")
         # A single alternating-seat evaluator avoids global random/NumPy stream
         # coupling between multiple environments inside DummyVecEnv.
         eval_env_count = 1
@@ -6513,7 +8138,10 @@ def main():
             selected_device=selected_device,
             checkpoint_pool_config=checkpoint_pool_config,
         )
-        subproc_start_method = "spawn" if os.name == "nt" else None
+        # Linux workers fork from one preloaded template that shares the
+        # card database copy-on-write; Windows keeps spawned workers.
+        subproc_start_method = (
+            TEMPLATE_START_METHOD if template_supported() else "spawn")
         learner_threads = (
             max(2, detected_cpus - num_envs)
             if num_envs > 1 else n_cpu_threads)
@@ -6548,7 +8176,7 @@ def main():
             "train_environments": num_envs,
             "evaluation_environments": eval_env_count,
             "train_vec_env": (
-                "SubprocVecEnv" if num_envs > 1 else "DummyVecEnv"),
+                "SharedMemoryVecEnv" if num_envs > 1 else "DummyVecEnv"),
             "evaluation_vec_env": "DummyVecEnv (dedicated async process)",
             "subprocess_start_method": (
                 subproc_start_method if num_envs > 1 else None),
@@ -6586,9 +8214,40 @@ def main():
             "evaluation_adaptive_decision_history": False,
             "training_stats_persistence_interval_games": 10,
             "evaluation_stats_persistence_interval_games": 1,
+            "training_planner_refresh": args.planner_refresh,
+            "training_observation_validation_interval":
+                args.observation_validation_interval,
+            "training_rollout_collection": (
+                "async" if async_rollouts else "lockstep"),
+            "training_fast_forward_forced_actions":
+                args.fast_forward_forced_actions,
+            "training_step_latency_histograms":
+                args.step_latency_histograms,
+            "training_inference_exports": args.inference_exports,
+            "training_rollout_storage": (
+                "compact" if args.compact_rollout_storage else "declared"),
+            "training_feature_extractor_implementation": (
+                "resumed_checkpoint" if args.resume
+                else "fused" if args.fused_extractor else "per_key"),
+            "training_opponent_inference": (
+                "batched_server"
+                if checkpoint_pool_config["enabled"]
+                and args.opponent_inference_server
+                else "per_worker"
+                if checkpoint_pool_config["enabled"] else None),
         }
         manifest["phase"] = "environment_setup"
         publish_manifest()
+        opponent_inference_address = None
+        if checkpoint_pool_config["enabled"] and args.opponent_inference_server:
+            # One resident slot per snapshot the leases can reference, plus
+            # the pending snapshot during a refresh.
+            opponent_inference_server = OpponentInferenceServer(
+                max_policies=checkpoint_pool_config["max_checkpoints"] + 1,
+                start_method=(
+                    None if subproc_start_method == TEMPLATE_START_METHOD
+                    else subproc_start_method))
+            opponent_inference_address = opponent_inference_server.address
 
         def make_env_factory(idx):
             def _init():
@@ -6612,29 +8271,38 @@ def main():
                     opponent_profile="scripted",
                     matchup_seed=derive_matchup_seed(args.seed, idx),
                     matchup_weighting=args.matchup_weighting,
-                    stats_persistence_interval_games=10)
+                    stats_persistence_interval_games=10,
+                    planner_refresh=args.planner_refresh,
+                    observation_validation_interval=
+                        args.observation_validation_interval,
+                    opponent_inference=opponent_inference_address,
+                    fast_forward_forced_actions=
+                        args.fast_forward_forced_actions,
+                    record_step_latency=args.step_latency_histograms)
             return _init
 
         env_fns = [make_env_factory(index) for index in range(num_envs)]
         if num_envs > 1:
-            subproc_kwargs = {}
-            if subproc_start_method is not None:
-                subproc_kwargs["start_method"] = subproc_start_method
-            raw_vec_env = SubprocVecEnv(env_fns, **subproc_kwargs)
+            raw_vec_env = SharedMemoryVecEnv(
+                env_fns, start_method=subproc_start_method)
         else:
             raw_vec_env = DummyVecEnv(env_fns)
-        vec_env = VecMonitor(raw_vec_env)
+        vec_env = (AsyncVecMonitor if async_rollouts else VecMonitor)(
+            raw_vec_env)
         vec_env.env_method("set_agent_version", run_id)
         if hasattr(vec_env, "seed"):
             assigned_train_seeds = vec_env.seed(args.seed)
             manifest["resolved"]["assigned_train_worker_seeds"] = json_safe(
                 assigned_train_seeds)
 
-        def make_eval_env_factory(idx):
+        def make_eval_env_factory(idx, worker_index=0):
+            # Worker 0 keeps the single-worker storage layout.
+            storage_index = worker_index * eval_env_count + idx
+
             def _init():
                 return make_masked_mtg_env(
                     eval_decks, card_db,
-                    os.path.join(eval_storage_dir, f"env_{idx}"),
+                    os.path.join(eval_storage_dir, f"env_{storage_index}"),
                     agent_is_p1=(idx % 2 == 0),
                     alternate_agent_seat=True,
                     subtype_vocab=run_subtype_vocab,
@@ -6652,13 +8320,13 @@ def main():
                     stats_persistence_interval_games=1)
             return _init
 
-        def make_evaluation_vec_env():
+        def make_evaluation_vec_env(worker_index=0):
             # Built inside the async evaluation worker process (and again in
             # the main process for final checkpoint validation). Construction
             # in the training process would only pay memory for an env the
             # trainer never steps.
             eval_env_fns = [
-                make_eval_env_factory(index)
+                make_eval_env_factory(index, worker_index)
                 for index in range(eval_env_count)]
             evaluation_env = StrictEvaluationVecEnv(
                 VecMonitor(DummyVecEnv(eval_env_fns)))
@@ -6669,6 +8337,7 @@ def main():
 
         manifest["resolved"]["assigned_evaluation_worker_seeds"] = json_safe(
             [eval_seed + index for index in range(eval_env_count)])
+        manifest["resolved"]["evaluation_workers"] = int(args.eval_workers)
 
         checkpoint_pool_lineage = {
             "source_run_id": run_id,
@@ -6698,21 +8367,28 @@ def main():
         manifest["resolved"]["checkpoint_pool_lineage"] = json_safe(
             checkpoint_pool_lineage)
 
+        persistence_writer = PersistenceWriter()
         callbacks = create_callbacks(
             make_evaluation_vec_env, run_id, args, num_train_envs=num_envs,
             tb_run_dir=tb_run_dir,
             evaluation_schedule=fixed_evaluation_schedule,
             curriculum=resolved_curriculum,
             checkpoint_pool_config=checkpoint_pool_config,
-            checkpoint_pool_lineage=checkpoint_pool_lineage)
+            checkpoint_pool_lineage=checkpoint_pool_lineage,
+            persistence_writer=persistence_writer)
+        manifest["resolved"]["sequential_evaluation"] = next((
+            callback.sequential_test for callback in callbacks
+            if isinstance(callback, AsyncMaskableEvalCallback)), None)
 
         current_phase = "model_setup"
         manifest["phase"] = current_phase
         publish_manifest()
+        model_class = (
+            AsyncRolloutMaskablePPO if async_rollouts else MaskablePPO)
         if args.resume:
             validate_resume_checkpoint_unchanged(
                 args.resume, resume_lineage)
-            model = MaskablePPO.load(
+            model = model_class.load(
                 args.resume,
                 env=vec_env,
                 tensorboard_log=tb_run_dir,
@@ -6722,7 +8398,20 @@ def main():
         else:
             model = create_training_model(
                 vec_env, training_config, args.seed, selected_device,
-                tb_run_dir)
+                tb_run_dir, model_class=model_class,
+                features_extractor_class=(
+                    FusedFixedWindowMTGExtractor if args.fused_extractor
+                    else FixedWindowMTGExtractor))
+        if args.compact_rollout_storage:
+            compact_buffer = use_compact_rollout_storage(model)
+            manifest["resolved"]["rollout_storage_bytes"] = {
+                "declared": compact_buffer.declared_nbytes,
+                "compact": compact_buffer.storage_nbytes,
+            }
+            logging.info(
+                "Compact rollout storage: %.1f MiB instead of %.1f MiB",
+                compact_buffer.storage_nbytes / 2**20,
+                compact_buffer.declared_nbytes / 2**20)
         if hasattr(model, "set_random_seed"):
             model.set_random_seed(args.seed)
         initial_num_timesteps = int(getattr(model, "num_timesteps", 0))
@@ -6767,6 +8456,12 @@ def main():
                 tb_log_name="train",
                 reset_num_timesteps=not args.resume
             )
+        # Periodic checkpoints still in flight land before the final save.
+        persistence_writer.barrier()
+        manifest["resolved"]["background_persistence"] = {
+            "completed_writes": persistence_writer.completed_writes,
+            "write_seconds": persistence_writer.write_seconds,
+        }
 
         training_duration = time.time() - start_time
         hours, remainder = divmod(training_duration, 3600)
@@ -6966,6 +8661,13 @@ def main():
         if was_interrupted:
             exit_code = 130
     finally:
+        if persistence_writer is not None:
+            try:
+                persistence_writer.close()
+            except Exception as write_error:
+                logging.error(
+                    "Background checkpoint persistence failed: %s",
+                    write_error)
         if vec_env is not None:
             try:
                 vec_env.close()
@@ -6984,6 +8686,15 @@ def main():
             except Exception as close_error:
                 logging.error(
                     "Could not close evaluation environments: %s", close_error)
+        if opponent_inference_server is not None:
+            try:
+                manifest["resolved"]["opponent_inference_stats"] = (
+                    opponent_inference_server.stats())
+            except Exception as stats_error:
+                logging.warning(
+                    "Could not read opponent inference statistics: %r",
+                    stats_error)
+            opponent_inference_server.close()
 
     if exit_code == 0:
         logging.info(f"Training run {run_id} completed")
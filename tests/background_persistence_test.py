@@ -0,0 +1,228 @@
+"""Background checkpoint and snapshot persistence contracts."""
+
+import os
+import queue
+import sys
+import tempfile
+import threading
+import time
+import unittest
+import zipfile
+
+import numpy as np
+import torch
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (REPO_ROOT, os.path.join(REPO_ROOT, "tests")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import main as m  # noqa: E402
+import checkpoint_pool_orchestration_test as pool_tests  # noqa: E402
+from compact_rollout_storage_test import (  # noqa: E402
+    ACTION_SPACE,
+    OBSERVATION_SPACE,
+    _observation_batch,
+)
+from Playersim.policy_export import inference_policy_path  # noqa: E402
+
+
+def _tiny_model():
+    import gymnasium as gym
+    from sb3_contrib import MaskablePPO
+    from stable_baselines3.common.logger import configure
+
+    class TinyEnv(gym.Env):
+        observation_space = OBSERVATION_SPACE
+        action_space = ACTION_SPACE
+        rng = np.random.default_rng(4001)
+
+        def _observation(self):
+            return {key: value[0] for key, value in
+                    _observation_batch(1, self.rng).items()}
+
+        def reset(self, *, seed=None, options=None):
+            return self._observation(), {}
+
+        def step(self, action):
+            return self._observation(), 0.0, True, False, {}
+
+    model = MaskablePPO(
+        m.FixedDimensionMaskableActorCriticPolicy, TinyEnv(),
+        n_steps=8, batch_size=8, seed=4002, device="cpu",
+        policy_kwargs={
+            "features_extractor_class": m.FixedWindowMTGExtractor,
+            "features_extractor_kwargs": {"features_dim": 16},
+            "net_arch": {"pi": [8], "vf": [8]},
+        })
+    model.set_logger(configure(folder=None, format_strings=[]))
+    return model
+
+
+def _perturb(model):
+    with torch.no_grad():
+        for parameter in model.policy.parameters():
+            parameter.add_(1.0)
+    model.num_timesteps += 100
+
+
+class PersistenceWriterTest(unittest.TestCase):
+    def setUp(self):
+        self.writer = m.PersistenceWriter(max_pending=2)
+        self.addCleanup(self.writer.close)
+
+    def test_writes_land_in_submission_order(self):
+        landed = []
+
+        def write(index, delay):
+            def run():
+                time.sleep(delay)
+                landed.append(index)
+                return index
+            return run
+
+        futures = [self.writer.submit(write(index, delay))
+                   for index, delay in enumerate((0.05, 0.0, 0.02, 0.0))]
+        self.writer.barrier()
+
+        self.assertEqual(landed, [0, 1, 2, 3])
+        self.assertEqual([future.result() for future in futures], [0, 1, 2, 3])
+        self.assertEqual(self.writer.completed_writes, 4)
+
+    def test_submissions_wait_once_the_pending_bound_is_reached(self):
+        release = threading.Event()
+        for _ in range(2):
+            self.writer.submit(release.wait)
+        third = threading.Thread(target=self.writer.submit,
+                                 args=(lambda: None,))
+        third.start()
+        third.join(timeout=0.2)
+
+        self.assertTrue(third.is_alive())
+        release.set()
+        third.join(timeout=10)
+        self.assertFalse(third.is_alive())
+        self.writer.barrier()
+
+    def test_a_failed_write_fails_the_next_call_once(self):
+        def fail():
+            raise OSError("disk full")
+
+        self.writer.submit(fail, description="checkpoint.zip")
+        with self.assertRaisesRegex(RuntimeError, "checkpoint.zip.*disk full"):
+            self.writer.barrier()
+        self.writer.submit(lambda: None)
+        self.writer.barrier()
+
+
+class ModelArchiveCaptureTest(unittest.TestCase):
+    def test_archive_holds_the_state_at_capture_time(self):
+        from sb3_contrib import MaskablePPO
+
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        model = _tiny_model()
+        reference = os.path.join(root.name, "reference")
+        model.save(reference)
+        capture = m.ModelArchiveCapture(model)
+        _perturb(model)
+        written = capture.write(os.path.join(root.name, "captured"))
+
+        self.assertTrue(written.endswith("captured.zip"))
+        with zipfile.ZipFile(written) as captured, \
+                zipfile.ZipFile(f"{reference}.zip") as expected:
+            self.assertEqual(captured.namelist(), expected.namelist())
+        restored = MaskablePPO.load(written, device="cpu")
+        original = MaskablePPO.load(reference, device="cpu")
+        self.assertEqual(restored.num_timesteps, original.num_timesteps)
+        for name, tensor in original.policy.state_dict().items():
+            torch.testing.assert_close(
+                restored.policy.state_dict()[name], tensor, rtol=0, atol=0)
+        rebuilt = capture.policy()
+        for name, tensor in original.policy.state_dict().items():
+            torch.testing.assert_close(
+                rebuilt.state_dict()[name], tensor, rtol=0, atol=0)
+        self.assertEqual(
+            [name for name in os.listdir(root.name) if "tmp" in name], [])
+
+
+class BackgroundCallbackTest(unittest.TestCase):
+    def setUp(self):
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        self.root = root.name
+        self.writer = m.PersistenceWriter()
+        self.addCleanup(self.writer.close)
+        self.model = _tiny_model()
+
+    def test_pool_refresh_completes_after_the_snapshot_lands(self):
+        env = pool_tests.CheckpointPoolCallbackTests._TrainingEnv()
+        self.model.env = env
+        callback = m.CheckpointPoolSelfPlayCallback(
+            run_id="background-test",
+            pool_directory=os.path.join(self.root, "checkpoint_pool"),
+            config=m.resolve_checkpoint_pool_config(
+                pool_tests._args(), num_envs=env.num_envs),
+            lineage={"observation_schema_version": 5},
+            inference_exports=True,
+            persistence_writer=self.writer)
+        callback.init_callback(self.model)
+        callback._on_training_start()
+        callback.num_timesteps = self.model.num_timesteps = 10
+        callback._on_step()
+        expected = {name: tensor.clone() for name, tensor in
+                    self.model.policy.state_dict().items()}
+        _perturb(self.model)
+        self.writer.barrier()
+        callback.num_timesteps = 11
+        callback._on_step()
+
+        pool = callback.progress_manifest()["active_pool"]
+        self.assertEqual([entry["snapshot_timestep"] for entry in pool], [10])
+        entry = callback._active_pool[0]
+        self.assertEqual(entry["sha256"], m.sha256_file(
+            entry["absolute_path"]))
+        self.assertTrue(inference_policy_path(entry["absolute_path"]).is_file())
+        from sb3_contrib import MaskablePPO
+        restored = MaskablePPO.load(entry["absolute_path"], device="cpu")
+        for name, tensor in expected.items():
+            torch.testing.assert_close(
+                restored.policy.state_dict()[name], tensor, rtol=0, atol=0)
+        staged = [call for call in env.calls
+                  if call[0] == "stage_checkpoint_opponent"]
+        self.assertEqual(len(staged), 2)
+
+        callback.num_timesteps = self.model.num_timesteps = 20
+        callback._on_step()
+        callback._on_training_end()
+        self.assertEqual(
+            [entry["snapshot_timestep"] for entry in callback._active_pool],
+            [10, 20])
+
+    def test_evaluation_request_follows_the_written_snapshot(self):
+        callback = m.AsyncMaskableEvalCallback(
+            None, eval_freq=10, n_eval_episodes=1,
+            best_model_save_path=self.root,
+            best_candidate_save_path=self.root,
+            snapshot_dir=self.root,
+            persistence_writer=self.writer)
+        callback.init_callback(self.model)
+        callback._request_queue = queue.Queue()
+        snapshot_path = os.path.join(self.root, "eval_snapshot_8_steps")
+        release = threading.Event()
+        self.writer.submit(release.wait)
+        request = callback._save_and_enqueue(snapshot_path, 8)
+
+        self.assertEqual(callback._pending_snapshots, 1)
+        self.assertTrue(callback._request_queue.empty())
+        self.assertFalse(os.path.exists(f"{snapshot_path}.zip"))
+        release.set()
+        self.writer.barrier()
+        self.assertIs(callback._request_queue.get(timeout=10), request)
+        self.assertTrue(os.path.isfile(f"{snapshot_path}.zip"))
+        self.assertIn(f"{snapshot_path}.zip", callback._pending_snapshot_paths)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+"""Startup-time contracts for the command-line entry points."""
+
+import os
+import subprocess
+import sys
+import unittest
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = (
+    "torch", "stable_baselines3", "sb3_contrib", "optuna", "tensorboard")
+# Measured at about 0.5 s for the slowest light command; the training stack
+# alone costs several seconds, so this only trips on a real regression.
+IMPORT_BUDGET_SECONDS = 2.0
+
+LIGHT_COMMANDS = (
+    ("main.py", "--help"),
+    ("main.py", "--timesteps", "0"),
+    ("main.py", "--canary-config", "round-7.99", "--seed", "1"),
+    ("harvest_protocol.py", "--help"),
+    ("harvest_fixtures.py", "--help"),
+    ("-m", "Playersim.card_probe", "--help"),
+    ("-m", "Playersim.deck_ingest", "--help"),
+    ("-m", "Playersim.support_preflight", "--help"),
+)
+
+
+def _import_profile(command):
+    """Run ``command`` under ``-X importtime`` and total its imports."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", *command],
+        cwd=REPO_ROOT, capture_output=True, text=True, timeout=120)
+    modules = set()
+    total_microseconds = 0
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        name = fields[2].rstrip()
+        modules.add(name.strip().split(".")[0])
+        # Top-level imports are not indented; their cumulative time covers
+        # everything they pulled in.
+        if name.startswith(" ") and not name.startswith("  "):
+            total_microseconds += int(fields[1])
+    return completed, modules, total_microseconds / 1_000_000
+
+
+class LightCommandStartupTest(unittest.TestCase):
+    def test_light_commands_skip_the_training_stack(self):
+        for command in LIGHT_COMMANDS:
+            with self.subTest(command=" ".join(command)):
+                completed, modules, seconds = _import_profile(command)
+
+                self.assertIn(completed.returncode, (0, 2), completed.stderr)
+                self.assertEqual(
+                    sorted(modules.intersection(HEAVY_MODULES)), [])
+                self.assertLess(seconds, IMPORT_BUDGET_SECONDS)
+
+    def test_rejected_arguments_report_through_the_parser(self):
+        completed, _, _ = _import_profile(
+            ("main.py", "--canary-config", "round-7.99", "--seed", "1"))
+
+        self.assertEqual(completed.returncode, 2)
+        self.assertIn("launch contract mismatch", completed.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
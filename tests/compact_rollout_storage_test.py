@@ -0,0 +1,249 @@
+"""Compact rollout storage contracts."""
+
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+import torch
+from gymnasium import spaces
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (REPO_ROOT, os.path.join(REPO_ROOT, "tests")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import main as m  # noqa: E402
+from Playersim.compact_storage import (  # noqa: E402
+    CompactArray,
+    compact_storage_layout,
+)
+from Playersim.environment import AlphaZeroMTGEnv  # noqa: E402
+from Playersim.observation_schema import (  # noqa: E402
+    EXACT_OWN_STRATEGY_PROFILE_FIELD,
+    EXACT_OWN_STRATEGY_PROFILE_SIZE,
+)
+from selfplay_environment_test import _fixture_data  # noqa: E402
+
+
+CARD_LOW = np.array([0, 0, -50, -50, 0, 0], dtype=np.float32)
+CARD_HIGH = np.array([50, 1, 50, 50, 1, 1], dtype=np.float32)
+OBSERVATION_SPACE = spaces.Dict({
+    "phase": spaces.Box(low=0, high=19, shape=(1,), dtype=np.int32),
+    "previous_actions": spaces.Box(
+        low=-1, high=480, shape=(4,), dtype=np.int32),
+    "my_life": spaces.Box(low=-10_000, high=10_000, shape=(1,),
+                          dtype=np.int32),
+    "my_damage_marked": spaces.Box(
+        low=0, high=1_000_000, shape=(3,), dtype=np.int32),
+    "my_hand_card_identity": spaces.Box(
+        low=0, high=50, shape=(4,), dtype=np.int32),
+    "my_hand": spaces.Box(
+        low=np.broadcast_to(CARD_LOW, (4, 6)).copy(),
+        high=np.broadcast_to(CARD_HIGH, (4, 6)).copy(), dtype=np.float32),
+    "card_synergy_scores": spaces.Box(
+        low=-1, high=1, shape=(2, 2), dtype=np.float32),
+    "my_exile_card_visibility": spaces.Box(
+        low=0, high=1, shape=(11,), dtype=bool),
+    "action_mask": spaces.Box(low=0, high=1, shape=(8,), dtype=bool),
+    EXACT_OWN_STRATEGY_PROFILE_FIELD: spaces.Box(
+        low=0, high=1, shape=(EXACT_OWN_STRATEGY_PROFILE_SIZE,),
+        dtype=np.float32),
+})
+ACTION_SPACE = spaces.Discrete(8)
+
+
+def _observation_batch(count, rng):
+    batch = {}
+    for key, space in OBSERVATION_SPACE.spaces.items():
+        low = np.broadcast_to(space.low, space.shape).astype(np.float64)
+        high = np.broadcast_to(space.high, space.shape).astype(np.float64)
+        values = rng.uniform(low, high, (count,) + space.shape)
+        if key == "my_hand":
+            flags = (low == 0) & (high == 1)
+            values = np.where(flags, np.round(values), values)
+        if space.dtype == bool:
+            values = values > 0.5
+        elif np.issubdtype(space.dtype, np.integer):
+            values = np.floor(values)
+        batch[key] = values.astype(space.dtype)
+    return batch
+
+
+def _fill(buffers, rng, ragged=False):
+    n_envs = buffers[0].worker_count if ragged else buffers[0].n_envs
+    steps = buffers[0].buffer_size // (n_envs if ragged else 1)
+    for _ in range(steps):
+        arguments = (
+            _observation_batch(n_envs, rng),
+            rng.integers(0, 8, (n_envs, 1)),
+            rng.normal(size=n_envs).astype(np.float32),
+            rng.random(n_envs) < 0.2,
+            torch.as_tensor(rng.normal(size=(n_envs, 1)),
+                            dtype=torch.float32),
+            torch.as_tensor(rng.normal(size=n_envs), dtype=torch.float32),
+        )
+        masks = rng.random((n_envs, 8)) < 0.5
+        for buffer in buffers:
+            buffer.add(*arguments, action_masks=masks)
+    last_values = torch.as_tensor(rng.normal(size=(n_envs, 1)),
+                                  dtype=torch.float32)
+    dones = rng.random(n_envs) < 0.5
+    for buffer in buffers:
+        buffer.compute_returns_and_advantage(last_values, dones)
+
+
+class CompactLayoutTest(unittest.TestCase):
+    def test_storage_form_follows_declared_bounds_and_schema(self):
+        layout = compact_storage_layout(OBSERVATION_SPACE)
+
+        def dense_dtype(key):
+            return layout[key].dense_dtype
+
+        self.assertEqual(dense_dtype("phase"), np.uint8)
+        self.assertEqual(dense_dtype("previous_actions"), np.int16)
+        self.assertEqual(dense_dtype("my_life"), np.int16)
+        self.assertEqual(dense_dtype("my_damage_marked"), np.int32)
+        # Identities take the schema's encoded range, not the fixture's.
+        self.assertEqual(dense_dtype("my_hand_card_identity"), np.uint16)
+        self.assertEqual(dense_dtype("card_synergy_scores"), np.float32)
+        self.assertEqual(len(layout["action_mask"].dense_elements), 0)
+        self.assertEqual(layout["action_mask"].itemsize, 1)
+        self.assertEqual(layout["my_exile_card_visibility"].itemsize, 2)
+        # Card flag columns are packed; mana value and P/T stay float32.
+        hand = layout["my_hand"]
+        self.assertEqual(len(hand.bit_elements), 12)
+        self.assertEqual(
+            list(hand.dense_elements[:3]), [0, 2, 3])
+        self.assertEqual(hand.itemsize, 2 + 12 * 4)
+        profile = layout[EXACT_OWN_STRATEGY_PROFILE_FIELD]
+        self.assertEqual(len(profile.bit_elements), 0)
+
+    def test_writes_that_would_change_values_are_rejected(self):
+        layout = compact_storage_layout(OBSERVATION_SPACE)
+        phase = CompactArray(layout["phase"], (2,))
+        hand = CompactArray(layout["my_hand"], (2,))
+
+        phase[0] = np.array([19], dtype=np.int32)
+        with self.assertRaisesRegex(ValueError, "declared bounds"):
+            phase[1] = np.array([300], dtype=np.int32)
+        values = np.zeros((4, 6), dtype=np.float32)
+        values[0, 4] = 0.5
+        with self.assertRaisesRegex(ValueError, "non-binary"):
+            hand[0] = values
+        self.assertEqual(phase[0].dtype, np.int32)
+        np.testing.assert_array_equal(phase[:1], [[19]])
+
+
+class CompactRolloutBufferTest(unittest.TestCase):
+    def _assert_same_samples(self, compact, declared, batch_size):
+        np.random.seed(3901)
+        expected = list(declared.get(batch_size))
+        np.random.seed(3901)
+        actual = list(compact.get(batch_size))
+        self.assertEqual(len(actual), len(expected))
+        for sample, reference in zip(actual, expected):
+            for key, tensor in reference.observations.items():
+                self.assertEqual(sample.observations[key].dtype, tensor.dtype)
+                torch.testing.assert_close(
+                    sample.observations[key], tensor, rtol=0, atol=0)
+            for name in ("actions", "old_values", "old_log_prob",
+                         "advantages", "returns", "action_masks"):
+                torch.testing.assert_close(
+                    getattr(sample, name), getattr(reference, name),
+                    rtol=0, atol=0)
+
+    def test_lockstep_buffer_samples_match_the_declared_buffer(self):
+        arguments = (6, OBSERVATION_SPACE, ACTION_SPACE, "cpu")
+        declared = m.MaskableDictRolloutBuffer(*arguments, n_envs=3)
+        compact = m.CompactMaskableDictRolloutBuffer(*arguments, n_envs=3)
+        _fill([declared, compact], np.random.default_rng(3902))
+
+        self.assertLess(compact.storage_nbytes, compact.declared_nbytes)
+        self._assert_same_samples(compact, declared, batch_size=5)
+
+    def test_ragged_buffer_samples_match_the_declared_buffer(self):
+        arguments = (4, OBSERVATION_SPACE, ACTION_SPACE, "cpu")
+        declared = m.RaggedMaskableDictRolloutBuffer(*arguments, n_envs=3)
+        compact = m.CompactRaggedMaskableDictRolloutBuffer(
+            *arguments, n_envs=3)
+        _fill([declared, compact], np.random.default_rng(3903), ragged=True)
+
+        self._assert_same_samples(compact, declared, batch_size=4)
+
+    def test_model_buffer_swap_trains(self):
+        import gymnasium as gym
+        from sb3_contrib import MaskablePPO
+
+        class TinyEnv(gym.Env):
+            observation_space = OBSERVATION_SPACE
+            action_space = ACTION_SPACE
+
+            rng = np.random.default_rng(3904)
+
+            def _observation(self):
+                return {key: value[0] for key, value in
+                        _observation_batch(1, self.rng).items()}
+
+            def reset(self, *, seed=None, options=None):
+                return self._observation(), {}
+
+            def step(self, action):
+                return self._observation(), 0.0, True, False, {}
+
+            def action_masks(self):
+                return np.ones(8, dtype=bool)
+
+        model = MaskablePPO(
+            m.FixedDimensionMaskableActorCriticPolicy, TinyEnv(),
+            n_steps=8, batch_size=4, n_epochs=1, seed=3904, device="cpu",
+            policy_kwargs={
+                "features_extractor_class": m.FixedWindowMTGExtractor,
+                "features_extractor_kwargs": {"features_dim": 16},
+                "net_arch": {"pi": [8], "vf": [8]},
+            })
+        buffer = m.use_compact_rollout_storage(model)
+
+        self.assertIsInstance(buffer, m.CompactMaskableDictRolloutBuffer)
+        self.assertIs(m.use_compact_rollout_storage(model), buffer)
+        model.learn(16)
+        self.assertEqual(model.num_timesteps, 16)
+        self.assertIs(model.rollout_buffer, buffer)
+
+
+class EnvironmentCompactStorageTest(unittest.TestCase):
+    def test_environment_observations_round_trip(self):
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        decks, card_db = _fixture_data()
+        env = AlphaZeroMTGEnv(
+            decks, card_db,
+            deck_stats_path=os.path.join(root.name, "deck_stats"),
+            card_memory_path=os.path.join(root.name, "card_memory"))
+        self.addCleanup(env.close)
+        layout = compact_storage_layout(env.observation_space)
+        storage = {key: CompactArray(field, (1,))
+                   for key, field in layout.items()}
+        declared = sum(field.size * field.dtype.itemsize
+                       for field in layout.values())
+
+        self.assertLess(sum(field.itemsize for field in layout.values()) * 4,
+                        declared)
+        rng = np.random.default_rng(3905)
+        observation, _ = env.reset(seed=3905)
+        for _ in range(120):
+            for key, value in observation.items():
+                storage[key][0] = value[None]
+                restored = storage[key][0]
+                self.assertEqual(restored.dtype, value.dtype)
+                np.testing.assert_array_equal(restored, value, err_msg=key)
+            action = rng.choice(np.flatnonzero(env.action_mask()))
+            observation, _, terminated, truncated, _ = env.step(action)
+            if terminated or truncated:
+                observation, _ = env.reset()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+"""Per-deck pairwise synergy table contracts."""
+
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from Playersim.card import Card  # noqa: E402
+from Playersim.deck_synergy import deck_synergy_key  # noqa: E402
+from Playersim.environment import AlphaZeroMTGEnv  # noqa: E402
+
+
+def _card(card_id, name, type_line, colors, cost, text):
+    card = Card({
+        "name": name,
+        "mana_cost": cost,
+        "type_line": type_line,
+        "color_identity": colors,
+        "power": 2,
+        "toughness": 2,
+        "oracle_text": text,
+    })
+    card.card_id = card_id
+    return card
+
+
+def _synergy_fixture():
+    cards = [
+        _card(0, "Elf Captain", "Creature - Elf Warrior", ["G"], "{1}{G}",
+              "Other Elfs you control get +1/+1. Deathtouch"),
+        _card(1, "Elf Scout", "Creature - Elf", ["G"], "{G}",
+              "First strike. When this enters, draw a card."),
+        _card(2, "Skyhunter", "Creature - Bird", ["W", "G"], "{W}{G}",
+              "Flying, lifelink"),
+        _card(3, "Life Chanter", "Creature - Cleric", ["W"], "{2}{W}",
+              "Whenever you gain life, put a +1/+1 counter on target "
+              "creature."),
+        _card(4, "Titan of Growth", "Creature - Giant", ["G"], "{5}{G}{G}",
+              "Trample. Creatures you control get +2/+2."),
+        _card(5, "Bone Spear", "Artifact - Equipment", [], "{1}",
+              "Equipped creature gets +2/+0. Equip {2}"),
+    ]
+    card_db = {card.card_id: card for card in cards}
+    deck = [card.card_id for card in cards] * 10
+    return [{"name": "Synergy A", "cards": deck},
+            {"name": "Synergy B", "cards": list(reversed(deck))}], card_db
+
+
+class DeckSynergyTableTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.TemporaryDirectory()
+        decks, card_db = _synergy_fixture()
+        self.env = AlphaZeroMTGEnv(
+            decks,
+            card_db,
+            deck_stats_path=os.path.join(self.root.name, "deck_stats"),
+            card_memory_path=os.path.join(self.root.name, "card_memory"),
+        )
+        self.env.reset(seed=2901)
+        self.rng = np.random.default_rng(2901)
+
+    def tearDown(self):
+        self.env.close()
+        self.root.cleanup()
+
+    def _live(self, hand, battlefield):
+        tables = self.env._deck_synergy_tables
+        self.env._deck_synergy_tables = {}
+        try:
+            return (self.env._get_hand_synergy_scores(hand, battlefield),
+                    self.env._calculate_card_synergies(battlefield))
+        finally:
+            self.env._deck_synergy_tables = tables
+
+    def test_table_features_match_the_live_computation(self):
+        deck = self.env.original_p1_deck
+        for _ in range(40):
+            hand = [int(card_id) for card_id in self.rng.choice(
+                deck, size=self.rng.integers(0, 9))]
+            battlefield = [int(card_id) for card_id in self.rng.choice(
+                deck, size=self.rng.integers(0, 12))]
+            hand_scores = self.env._get_hand_synergy_scores(hand, battlefield)
+            board_scores = self.env._calculate_card_synergies(battlefield)
+            live_hand, live_board = self._live(hand, battlefield)
+            np.testing.assert_allclose(hand_scores, live_hand, atol=1e-6)
+            np.testing.assert_allclose(board_scores, live_board, atol=1e-6)
+        self.assertGreater(float(np.max(hand_scores)), 0.0)
+
+    def test_tables_are_reused_across_games_by_deck_hash(self):
+        table = self.env._observer_synergy_table()
+        self.env._calculate_card_synergies([0, 1, 2])
+        self.env.reset(seed=2902)
+
+        self.assertEqual(
+            set(self.env._deck_synergy_table_cache),
+            {deck_synergy_key(self.env.original_p1_deck)})
+        self.assertIs(self.env._observer_synergy_table(), table)
+        self.assertFalse(np.isnan(table.board_pairs[0, 1]))
+
+    def test_changed_characteristics_fall_back_to_the_live_cards(self):
+        scout = self.env.card_db[1]
+        scout.subtypes = ["elf", "warrior"]
+        table = self.env._observer_synergy_table()
+
+        self.assertIsNone(table.indices([0, 1], self.env.card_db))
+        board_scores = self.env._calculate_card_synergies([0, 1])
+        self.assertAlmostEqual(float(board_scores[0, 1]), 0.4 + 0.1 + 0.3,
+                               places=6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -736,6 +736,108 @@ class EvaluationDebugReplayTest(unittest.TestCase):
             self.assertEqual(
                 stored["debug_size_bytes"], len(sidecar_bytes))
 
+    def test_payload_budget_drops_tail_events_with_few_reencodes(self):
+        with tempfile.TemporaryDirectory() as root:
+            env = self._environment(root, "budget")
+            try:
+                env.set_evaluation_checkpoint(104, "d" * 64)
+                env.reset(seed=37)
+                actions = [{"action": index, "context": {"pad": "x" * 64}}
+                           for index in range(400)]
+                replay_stats = env._evaluation_capture["replay"]
+                replay_stats["recorded_events"] = len(actions)
+                replay_stats["serialized_bytes"] = len(
+                    env._compact_json_bytes(actions))
+                payload = {
+                    "schema_version": 1,
+                    "replay": {"version": 3, "actions": actions},
+                    "trace": [],
+                    "terminal": {"game_result": "win"},
+                }
+                full_size = len(env._compact_json_bytes(payload))
+                env.EVALUATION_DEBUG_MAX_BYTES = full_size // 2
+                with mock.patch.object(
+                        env, "_sanitize_replay_value",
+                        wraps=env._sanitize_replay_value) as sanitize:
+                    bounded = env._enforce_evaluation_debug_payload_budget(
+                        payload)
+
+                encoded = env._compact_json_bytes(bounded)
+                self.assertLessEqual(
+                    len(encoded), env.EVALUATION_DEBUG_MAX_BYTES)
+                kept = len(bounded["replay"]["actions"])
+                self.assertGreater(kept, 0)
+                self.assertEqual(
+                    bounded["capture"]["replay"]["dropped_events"],
+                    400 - kept)
+                self.assertEqual(
+                    bounded["capture"]["replay"]["serialized_bytes"],
+                    len(env._compact_json_bytes(
+                        bounded["replay"]["actions"])))
+                self.assertLessEqual(sanitize.call_count, 4)
+            finally:
+                env.close()
+
+    def test_worker_streamed_sidecars_are_verified_before_publication(self):
+        case = {
+            "seed": 9,
+            "p1_deck": "Evaluation A",
+            "p2_deck": "Evaluation B",
+            "agent_is_p1": True,
+            "opponent_profile": "scripted",
+        }
+        debug = {
+            "schema_version": 1,
+            "replay": {"version": 3, "actions": [{"action": 3,
+                                                     "context": {}}]},
+            "trace": [{"sequence": 0, "actor": "learned"}],
+            "terminal": {"game_result": "win"},
+        }
+        with tempfile.TemporaryDirectory() as root:
+            history_path = os.path.join(
+                root, "evaluation", "evaluations.json")
+            outcome = training_main._capture_evaluation_terminal_info({
+                "game_result": "win",
+                "terminal_reason": "life_total",
+                "episode_seed": 9,
+                "p1_deck": "Evaluation A",
+                "p2_deck": "Evaluation B",
+                "agent_is_p1": True,
+                "opponent_profile": "scripted",
+                "evaluation_debug": debug,
+            })
+            outcome["debug_sidecar"] = \
+                training_main._write_evaluation_debug_sidecar(
+                    outcome.pop("debug"),
+                    history_directory=os.path.dirname(history_path),
+                    timestep=200, case_index=4)
+            episode = training_main._build_evaluation_episode(
+                4, case, outcome, 1.0, 5)
+            self.assertNotIn("debug", episode)
+            self.assertEqual(episode["debug_path"], "games/200/case_004.json.gz")
+            self.assertEqual(episode["replay_action_count"], 1)
+
+            persisted = training_main._persist_evaluation_debug_sidecars(
+                [episode], timestep=200,
+                evaluation_history_path=history_path)
+            self.assertEqual(persisted, [episode])
+            sidecar_path = os.path.join(
+                os.path.dirname(history_path),
+                *episode["debug_path"].split("/"))
+            with gzip.open(sidecar_path, "rt", encoding="utf-8") as handle:
+                self.assertEqual(json.load(handle), debug)
+
+            with self.assertRaisesRegex(RuntimeError, "expected"):
+                training_main._persist_evaluation_debug_sidecars(
+                    [episode], timestep=201,
+                    evaluation_history_path=history_path)
+            with open(sidecar_path, "ab") as handle:
+                handle.write(b"\0")
+            with self.assertRaisesRegex(RuntimeError, "changed"):
+                training_main._persist_evaluation_debug_sidecars(
+                    [episode], timestep=200,
+                    evaluation_history_path=history_path)
+
     def test_callback_does_not_publish_history_when_sidecar_write_fails(self):
         first_case = {
             "seed": 7,
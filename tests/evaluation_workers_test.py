@@ -0,0 +1,197 @@
+"""Multi-process fixed evaluation contracts."""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+import gymnasium as gym
+import numpy as np
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (REPO_ROOT, os.path.join(REPO_ROOT, "tests")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import main as m  # noqa: E402
+from background_persistence_test import _tiny_model  # noqa: E402
+from compact_rollout_storage_test import (  # noqa: E402
+    ACTION_SPACE,
+    OBSERVATION_SPACE,
+    _observation_batch,
+)
+
+
+DECKS = [{"name": name} for name in ("Alpha", "Beta", "Gamma")]
+SCHEDULE = m.build_fixed_evaluation_schedule(DECKS, 8, seed=4101)
+
+
+class ScheduledEnv(gym.Env):
+    """Deterministic stand-in that plays whichever fixed case is scheduled."""
+
+    observation_space = OBSERVATION_SPACE
+    action_space = ACTION_SPACE
+
+    def __init__(self):
+        self.schedule = []
+        self.index = 0
+
+    def set_episode_schedule(self, cases):
+        self.schedule = [dict(case) for case in cases]
+        self.index = 0
+
+    def reset_episode_schedule(self):
+        self.index = 0
+
+    def set_evaluation_checkpoint(self, timesteps, checkpoint_sha256):
+        pass
+
+    def set_agent_version(self, version):
+        pass
+
+    def action_masks(self):
+        return np.ones(ACTION_SPACE.n, dtype=bool)
+
+    def _observation(self):
+        return {key: value[0] for key, value in
+                _observation_batch(1, self.rng).items()}
+
+    def reset(self, *, seed=None, options=None):
+        self.case = self.schedule[self.index % len(self.schedule)]
+        self.index += 1
+        self.rng = np.random.default_rng(self.case["seed"])
+        self.turn = 0
+        return self._observation(), {}
+
+    def step(self, action):
+        self.turn += 1
+        done = self.turn >= 2 + self.case["seed"] % 4
+        info = {}
+        if done:
+            won = (int(action) + self.case["seed"]) % 2 == 0
+            info = {
+                "game_result": "win" if won else "loss",
+                "terminal_reason": "life_total",
+                "episode_seed": self.case["seed"],
+                "p1_deck": self.case["p1_deck"],
+                "p2_deck": self.case["p2_deck"],
+                "agent_is_p1": self.case["agent_is_p1"],
+                "opponent_profile": self.case["opponent_profile"],
+            }
+        return self._observation(), float(action) / 8, done, False, info
+
+
+def scheduled_vec_env(worker_index=0):
+    from stable_baselines3.common.vec_env import DummyVecEnv, VecMonitor
+
+    return m.StrictEvaluationVecEnv(VecMonitor(DummyVecEnv([ScheduledEnv])))
+
+
+def _episode(case_index, won):
+    return {
+        "case_index": case_index,
+        "case": dict(SCHEDULE[case_index]),
+        "game_result": "win" if won else "loss",
+        "terminal_reason": "life_total",
+        "reward": 0.25 * case_index - 0.5,
+        "length": 10 + case_index,
+    }
+
+
+class EvaluationMergeTest(unittest.TestCase):
+    def test_workers_partition_the_schedule_by_case_index(self):
+        for worker_count in (1, 2, 3, 8):
+            shares = [m.evaluation_worker_cases(8, index, worker_count)
+                      for index in range(worker_count)]
+            self.assertEqual(sorted(sum(shares, [])), list(range(8)))
+            for share in shares:
+                self.assertEqual(share, sorted(share))
+
+    def test_merged_shares_summarize_like_one_worker(self):
+        episodes = [_episode(index, index % 3 != 1)
+                    for index in range(len(SCHEDULE))]
+        _, summary, promotion_key = m.summarize_evaluation_episodes(episodes)
+        base = {"evaluation_id": "periodic-000000000010-0001",
+                "timesteps": 10, "snapshot_path": "snapshot",
+                "checkpoint_sha256": "a" * 64, "checkpoint_size_bytes": 1,
+                "schedule_sha256": m.evaluation_schedule_sha256(SCHEDULE)}
+        for worker_count in (2, 3):
+            shares = [
+                dict(base, worker_index=index, worker_count=worker_count,
+                     episodes=[episodes[case] for case in
+                               m.evaluation_worker_cases(
+                                   len(episodes), index, worker_count)])
+                for index in range(worker_count)]
+            merged = m.merge_evaluation_results(reversed(shares))
+
+            self.assertEqual(merged["summary"], summary)
+            self.assertEqual(merged["promotion_key"], list(promotion_key))
+            self.assertEqual(
+                [episode["case_index"] for episode in merged["episodes"]],
+                list(range(len(SCHEDULE))))
+            self.assertNotIn("worker_index", merged)
+
+    def test_incomplete_or_mismatched_shares_are_rejected(self):
+        episodes = [_episode(index, True) for index in range(len(SCHEDULE))]
+        share = {"evaluation_id": "e", "timesteps": 10,
+                 "snapshot_path": "snapshot", "checkpoint_sha256": "a",
+                 "schedule_sha256": "s", "worker_count": 2}
+        with self.assertRaisesRegex(RuntimeError, "every fixed case"):
+            m.merge_evaluation_results([
+                dict(share, worker_index=0, episodes=episodes[0::2]),
+                dict(share, worker_index=1, episodes=episodes[1::4])])
+        with self.assertRaisesRegex(RuntimeError, "checkpoint_sha256"):
+            m.merge_evaluation_results([
+                dict(share, worker_index=0, episodes=episodes[0::2]),
+                dict(share, worker_index=1, episodes=episodes[1::2],
+                     checkpoint_sha256="b")])
+
+
+class EvaluationWorkerPoolTest(unittest.TestCase):
+    def _evaluate(self, eval_workers):
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        callback = m.AsyncMaskableEvalCallback(
+            scheduled_vec_env, eval_freq=0,
+            n_eval_episodes=len(SCHEDULE),
+            best_model_save_path=os.path.join(root.name, "best"),
+            best_candidate_save_path=os.path.join(root.name, "candidates"),
+            snapshot_dir=os.path.join(root.name, "snapshots"),
+            fixed_evaluation_schedule=SCHEDULE,
+            evaluation_history_path=os.path.join(
+                root.name, "evaluation", "evaluations.json"),
+            minimum_qualification_score=0.0,
+            eval_workers=eval_workers)
+        callback.init_callback(_tiny_model())
+        callback._on_training_start()
+        self.addCleanup(callback._shutdown_worker)
+        callback._save_and_enqueue(
+            os.path.join(callback.snapshot_dir, "eval_snapshot_8_steps"), 8)
+        deadline = time.time() + 300
+        while callback._pending_snapshots and time.time() < deadline:
+            self.assertTrue(callback._process.is_alive())
+            callback._drain_results(timeout=1.0)
+        self.assertEqual(callback._pending_snapshots, 0)
+        return callback._evaluation_records[-1]
+
+    def test_scores_do_not_depend_on_the_worker_count(self):
+        single = self._evaluate(1)
+        pooled = self._evaluate(3)
+
+        for key in ("summary", "qualification_interval", "promotion_key",
+                    "schedule_sha256"):
+            if key in single:
+                self.assertEqual(pooled[key], single[key], key)
+        self.assertEqual(
+            [(episode["case_index"], episode["game_result"],
+              episode["reward"], episode["length"])
+             for episode in pooled["episodes"]],
+            [(episode["case_index"], episode["game_result"],
+              episode["reward"], episode["length"])
+             for episode in single["episodes"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
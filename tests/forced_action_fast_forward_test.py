@@ -0,0 +1,137 @@
+"""Forced single-legal-action fast-forward contracts."""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (REPO_ROOT, os.path.join(REPO_ROOT, "tests")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from Playersim.environment import AlphaZeroMTGEnv  # noqa: E402
+from selfplay_environment_test import _fixture_data  # noqa: E402
+
+
+class ForcedActionFastForwardTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.TemporaryDirectory()
+        self.decks, self.card_db = _fixture_data()
+        self.envs = []
+
+    def tearDown(self):
+        for env in self.envs:
+            env.close()
+        self.root.cleanup()
+
+    def _env(self, name, fast_forward):
+        env = AlphaZeroMTGEnv(
+            self.decks,
+            self.card_db,
+            deck_stats_path=os.path.join(self.root.name, name, "deck_stats"),
+            card_memory_path=os.path.join(self.root.name, name, "card_memory"),
+            fast_forward_forced_actions=fast_forward,
+        )
+        self.envs.append(env)
+        return env
+
+    def _play(self, env, seed, decisions=60):
+        env.reset(seed=seed)
+        rng = np.random.default_rng(seed)
+        results = []
+        for _ in range(decisions):
+            legal = np.flatnonzero(env.action_mask())
+            result = env.step(int(rng.choice(legal)))
+            results.append(result)
+            if result[2] or result[3]:
+                break
+        return results
+
+    def test_policy_only_sees_decisions_with_a_choice(self):
+        env = self._env("fast", True)
+        results = self._play(env, 3201)
+
+        skipped = sum(info["forced_actions_skipped"]
+                      for _, _, _, _, info in results)
+        self.assertGreater(skipped, 0)
+        self.assertEqual(
+            len(env.replay_actions), len(results) + skipped)
+        for observation, _, done, truncated, info in results:
+            self.assertEqual(
+                len(info["forced_actions"]), info["forced_actions_skipped"])
+            self.assertTrue(env.observation_space.contains(observation))
+            if not (done or truncated):
+                self.assertGreater(
+                    int(np.count_nonzero(info["action_mask"])), 1)
+
+    def test_replay_reproduces_the_fast_forwarded_game(self):
+        env = self._env("fast", True)
+        self._play(env, 3202)
+        payload = env.export_replay()
+        state = (env.game_state.turn, env.game_state.phase,
+                 env.game_state.p1["life"], env.game_state.p2["life"])
+
+        replay_env = self._env("replay", False)
+        replay_env.replay(payload)
+        self.assertEqual(
+            (replay_env.game_state.turn, replay_env.game_state.phase,
+             replay_env.game_state.p1["life"],
+             replay_env.game_state.p2["life"]),
+            state)
+        self.assertEqual(
+            [entry["action"] for entry in replay_env.replay_actions],
+            [entry["action"] for entry in payload["actions"]])
+
+    def test_skipped_decision_diagnostics_reach_the_returned_info(self):
+        env = self._env("merged", True)
+        env.reward_discount = 0.5
+        forced = np.zeros(env.ACTION_SPACE_SIZE, dtype=bool)
+        forced[11] = True
+        choice = forced.copy()
+        choice[12] = True
+
+        def decision(mask, reward, **extra):
+            info = {"action_mask": mask, "reward_components": {
+                "action": reward, "terminal": 0.0}}
+            info.update(extra)
+            return None, reward, False, False, info
+
+        decisions = [
+            decision(forced, 1.0),
+            decision(forced, 2.0, opponent_execution_failed=True,
+                     error_message="opponent action raised",
+                     failure_replay_path="failures/replay.json"),
+            decision(choice, 4.0, error_message=None),
+        ]
+        observation = {"marker": np.zeros(1)}
+        with mock.patch.object(env, "_step_decision",
+                               side_effect=decisions), \
+                mock.patch.object(env, "_get_obs_safe",
+                                  return_value=observation):
+            result = env.step(11)
+
+        self.assertIs(result[0], observation)
+        self.assertEqual(result[1], 1.0 + 0.5 * 2.0 + 0.25 * 4.0)
+        info = result[4]
+        self.assertEqual(info["forced_actions"], [11, 11])
+        self.assertTrue(info["opponent_execution_failed"])
+        self.assertEqual(info["error_message"], "opponent action raised")
+        self.assertEqual(info["failure_replay_path"], "failures/replay.json")
+        self.assertNotIn("critical_error", info)
+        self.assertEqual(info["reward_components"],
+                         {"action": result[1], "terminal": 0.0})
+
+    def test_disabled_by_default(self):
+        env = self._env("default", False)
+        _, _, _, _, info = self._play(env, 3203, decisions=1)[0]
+
+        self.assertNotIn("forced_actions_skipped", info)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+"""Fused grouped-projection feature extractor contracts."""
+
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+import torch
+from gymnasium import spaces
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+import main as m  # noqa: E402
+from Playersim.observation_schema import (  # noqa: E402
+    EXACT_OWN_STRATEGY_PROFILE_FIELD,
+    EXACT_OWN_STRATEGY_PROFILE_SIZE,
+)
+
+
+OBSERVATION_SPACE = spaces.Dict({
+    "phase": spaces.Box(low=0, high=19, shape=(1,), dtype=np.int32),
+    "life": spaces.Box(low=-5, high=40, shape=(2,), dtype=np.float32),
+    "hand": spaces.Box(low=0, high=1, shape=(4, 6), dtype=np.float32),
+    "mana": spaces.Box(low=0, high=9, shape=(2,), dtype=np.float32),
+    "my_hand_card_identity": spaces.Box(
+        low=0, high=50, shape=(4,), dtype=np.int32),
+    "battlefield": spaces.Box(low=0, high=1, shape=(4, 6), dtype=np.float32),
+    "recommendations": spaces.Box(
+        low=0, high=1, shape=(3, 2, 2), dtype=np.float32),
+    "turn": spaces.Box(low=0, high=30, shape=(1,), dtype=np.float32),
+    "graveyard": spaces.Box(low=0, high=1, shape=(2, 6), dtype=np.float32),
+    "action_mask": spaces.Box(low=0, high=1, shape=(8,), dtype=bool),
+    EXACT_OWN_STRATEGY_PROFILE_FIELD: spaces.Box(
+        low=0, high=1, shape=(EXACT_OWN_STRATEGY_PROFILE_SIZE,),
+        dtype=np.float32),
+})
+
+
+def _batch(size, seed):
+    rng = np.random.default_rng(seed)
+    batch = {}
+    for key, space in OBSERVATION_SPACE.spaces.items():
+        low = np.broadcast_to(space.low, space.shape)
+        high = np.broadcast_to(space.high, space.shape)
+        values = rng.uniform(low, high, (size,) + space.shape)
+        if np.issubdtype(space.dtype, np.integer):
+            values = np.floor(values)
+        batch[key] = torch.as_tensor(values, dtype=torch.float32)
+    return batch
+
+
+class FusedExtractorTest(unittest.TestCase):
+    def _pair(self, features_dim=32):
+        torch.manual_seed(3501)
+        per_key = m.FixedWindowMTGExtractor(
+            OBSERVATION_SPACE, features_dim=features_dim)
+        torch.manual_seed(3501)
+        fused = m.FusedFixedWindowMTGExtractor(
+            OBSERVATION_SPACE, features_dim=features_dim)
+        return per_key, fused
+
+    def test_layout_groups_fields_by_input_shape(self):
+        layout = m.fused_extractor_layout(OBSERVATION_SPACE)
+
+        self.assertEqual(
+            [group.keys for group in layout.groups],
+            [("battlefield", "hand"), ("graveyard",), ("life", "mana"),
+             ("recommendations",), ("turn",)])
+        self.assertEqual(
+            sorted(layout.merger_column_order),
+            list(range(len(layout.merger_column_order))))
+
+    def test_fresh_extractors_match_for_the_same_seed(self):
+        per_key, fused = self._pair()
+        batch = _batch(5, 3502)
+
+        with torch.no_grad():
+            expected = per_key(batch)
+            actual = fused(batch)
+
+        self.assertEqual(len(fused.extractors), 0)
+        torch.testing.assert_close(actual, expected, rtol=1e-5, atol=1e-6)
+
+    def test_state_dict_round_trips_between_layouts(self):
+        per_key, fused = self._pair()
+        for parameter in per_key.parameters():
+            torch.nn.init.normal_(parameter, std=0.2)
+
+        fused.load_state_dict(m.fuse_extractor_state_dict(
+            per_key.state_dict(), OBSERVATION_SPACE))
+        restored = m.unfuse_extractor_state_dict(
+            fused.state_dict(), OBSERVATION_SPACE)
+        batch = _batch(3, 3503)
+
+        self.assertEqual(set(restored), set(per_key.state_dict()))
+        for name, tensor in per_key.state_dict().items():
+            torch.testing.assert_close(restored[name], tensor)
+        with torch.no_grad():
+            torch.testing.assert_close(
+                fused(batch), per_key(batch), rtol=1e-5, atol=1e-5)
+        with self.assertRaises(ValueError):
+            m.fuse_extractor_state_dict(
+                fused.state_dict(), OBSERVATION_SPACE)
+
+    def test_traced_fused_extractor_matches_eager(self):
+        _, fused = self._pair()
+        batch = _batch(4, 3504)
+        with torch.no_grad():
+            expected = fused(batch)
+            traced = torch.jit.trace(fused, (batch,), strict=False)
+            torch.testing.assert_close(traced(batch), expected)
+
+    def test_saved_policy_predicts_identically_after_fusing(self):
+        import gymnasium as gym
+        from sb3_contrib import MaskablePPO
+
+        class TinyEnv(gym.Env):
+            observation_space = OBSERVATION_SPACE
+            action_space = spaces.Discrete(8)
+
+            def reset(self, *, seed=None, options=None):
+                return self.observation_space.sample(), {}
+
+            def step(self, action):
+                return self.observation_space.sample(), 0.0, True, False, {}
+
+        model = MaskablePPO(
+            m.FixedDimensionMaskableActorCriticPolicy, TinyEnv(),
+            n_steps=8, batch_size=8, seed=3505, device="cpu",
+            policy_kwargs={
+                "features_extractor_class": m.FixedWindowMTGExtractor,
+                "features_extractor_kwargs": {"features_dim": 32},
+                "net_arch": {"pi": [16], "vf": [16]},
+            })
+        with tempfile.TemporaryDirectory() as root:
+            path = os.path.join(root, "policy.zip")
+            model.save(path)
+            policy = MaskablePPO.load(path, device="cpu").policy
+        observation = {key: value.numpy()
+                       for key, value in _batch(6, 3506).items()}
+        masks = np.ones((6, 8), dtype=bool)
+        with torch.no_grad():
+            obs_tensor, _ = policy.obs_to_tensor(observation)
+            expected = policy.predict_values(obs_tensor)
+            actions, _ = policy.predict(
+                observation, action_masks=masks, deterministic=True)
+
+        m.fuse_policy_features_extractor(policy)
+
+        self.assertIsInstance(
+            policy.features_extractor, m.FusedFixedWindowMTGExtractor)
+        self.assertIs(policy.pi_features_extractor, policy.features_extractor)
+        with torch.no_grad():
+            torch.testing.assert_close(
+                policy.predict_values(obs_tensor), expected,
+                rtol=1e-5, atol=1e-5)
+        fused_actions, _ = policy.predict(
+            observation, action_masks=masks, deterministic=True)
+        np.testing.assert_array_equal(fused_actions, actions)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,9 +11,11 @@ import contextlib
 import gzip
 import io
 import json
+import logging
 import random
 import sys
 import tempfile
+import time
 import unittest
 from pathlib import Path
 from unittest import mock
@@ -1025,6 +1027,238 @@ class HarvestFixturesTest(unittest.TestCase):
         self.assertEqual(result["run_manifest"]["agent_seat"], "p2")
         self.assertEqual(saved["agent_seat"], "p2")
 
+    def test_lockstep_games_batch_checkpoint_decisions(self):
+        from gymnasium import spaces
+        from Playersim.environment import AlphaZeroMTGEnv as RealEnvironment
+
+        observation_space = spaces.Dict({"state": spaces.Box(
+            low=0.0, high=100.0, shape=(2,), dtype=np.float32)})
+        action_space = spaces.Discrete(480)
+
+        class FakeState:
+            _consecutive_no_ops = 0
+            stack = []
+            turn = 1
+            phase = 1
+            priority_player = None
+            agent_is_p1 = True
+            terminal_reason = "state_based_result"
+            fidelity_counters = {
+                "unimplemented_action": 0, "unparsed_mana": 0,
+                "unparsed_modal": 0, "unparsed_effects": 0,
+                "effect_continuation_failures": 0,
+                "lost_spell_recoveries": 0,
+                "unimplemented_action_types": set(),
+                "unparsed_cards": set(),
+                "effect_continuation_failure_contexts": [],
+                "lost_spell_recovery_contexts": [],
+            }
+
+        class Policy:
+            def __init__(self, offset):
+                self.observation_space = observation_space
+                self.action_space = action_space
+                self.offset = offset
+                self.batches = []
+
+            def predict(self, observation, action_masks=None,
+                        deterministic=False):
+                # Slow enough that misattributed inference would show up.
+                time.sleep(0.002)
+                masks = np.atleast_2d(np.asarray(action_masks, dtype=bool))
+                states = np.asarray(observation["state"]).reshape(
+                    len(masks), -1)
+                self.batches.append(len(masks))
+                actions = [
+                    np.flatnonzero(mask)[
+                        (int(state[0]) + self.offset)
+                        % int(mask.sum())]
+                    for state, mask in zip(states, masks)]
+                return np.asarray(actions), None
+
+        class LockstepEnvironment(RealEnvironment):
+            def __init__(self, decks, card_db, **kwargs):
+                self.decks = decks
+                self.observation_space = observation_space
+                self.action_space = action_space
+                self.opponent_policy = None
+                self.game_state = FakeState()
+                self.last_observation_error = None
+                self.last_observation_traceback = None
+                self.action_handler = None
+                self._fidelity_agg = {
+                    "games_recorded": 0, "unimplemented_action": 0,
+                    "unparsed_mana": 0, "unparsed_modal": 0,
+                    "unparsed_effects": 0,
+                    "effect_continuation_failures": 0,
+                    "lost_spell_recoveries": 0,
+                    "unparsed_cards": {},
+                }
+                self.output = Path(kwargs["deck_stats_path"])
+                self.stats_tracker = type(
+                    "Tracker", (), {"base_path": str(self.output)})()
+
+            def set_agent_version(self, version):
+                self.agent_version = version
+
+            def set_opponent_policy(self, policy):
+                self.opponent_policy = policy
+
+            def _observation(self):
+                return {"state": np.array(
+                    [random.randrange(100), np.random.randint(100)],
+                    dtype=np.float32)}
+
+            def reset(self, seed=None):
+                # The engine's only RNGs are the global ones seeded here.
+                random.seed(seed)
+                np.random.seed(seed)
+                p1, p2 = self.decks._pair
+                self.current_deck_name_p1 = p1["name"]
+                self.current_deck_name_p2 = p2["name"]
+                self.current_agent_deck = self.current_deck_name_p1
+                self.current_opponent_deck = self.current_deck_name_p2
+                self.active_opponent_profile = "scripted"
+                self.game_state = FakeState()
+                self._current_stats_artifact_entry = None
+                self._game_result_recorded = False
+                self._game_result = None
+                self.turns_left = 2 + seed % 3
+                self.score = 0
+                return self._observation(), {}
+
+            def action_mask(self):
+                mask = np.zeros(480, dtype=bool)
+                mask[random.sample(range(20, 40), 3)] = True
+                return mask
+
+            def step(self, action):
+                mask = self.action_mask()
+                reply, _ = self.opponent_policy.predict(
+                    self._observation(), action_masks=mask,
+                    deterministic=True)
+                reply = int(np.asarray(reply).reshape(-1)[0])
+                if not mask[reply]:
+                    raise RuntimeError("opponent mask violation")
+                self.score += int(action) + reply + random.randrange(3)
+                self.turns_left -= 1
+                if self.turns_left:
+                    return self._observation(), 0.0, False, False, {}
+                self._game_result_recorded = True
+                self._game_result = "win" if self.score % 2 else "loss"
+                RealEnvironment._write_stats_artifacts(self)
+                return (self._observation(), 0.0, True, False,
+                        {"game_result": self._game_result})
+
+            def close(self):
+                self.output.mkdir(parents=True, exist_ok=True)
+                (self.output / "card_support_manifest.json").write_text(
+                    "{}\n", encoding="utf-8")
+
+            @staticmethod
+            def _terminal_reason(info=None):
+                return "state_based_result"
+
+        decks = [{"name": name, "cards": [0] * 60}
+                 for name in harvest.EXPECTED_SAMPLE_DECKS]
+        lineage = {"format": "standard", "corpus": {"sha256": "abc"}}
+
+        def harvest_games(root, lockstep_games):
+            agent, opponent = Policy(0), Policy(1)
+            with mock.patch.object(
+                        harvest, "load_corpus_decks",
+                        return_value=(decks, {}, lineage)), \
+                    mock.patch.object(
+                        harvest, "validate_checkpoint_provenance",
+                        side_effect=lambda path, lineage, role: {
+                            "kind": "checkpoint", "path": str(path)}), \
+                    mock.patch.object(
+                        harvest, "verify_checkpoint_identity_unchanged"), \
+                    mock.patch.object(
+                        harvest, "load_checkpoint_policy",
+                        side_effect=[agent, opponent]), \
+                    mock.patch.object(
+                        harvest, "_validate_tracker_artifacts"), \
+                    mock.patch(
+                        "Playersim.environment.AlphaZeroMTGEnv",
+                        LockstepEnvironment), \
+                    contextlib.redirect_stdout(io.StringIO()):
+                result = harvest.run_harvest(
+                    7, 31, root / f"run_{lockstep_games}", max_steps=10,
+                    game_offset=3, agent_model=root / "agent.zip",
+                    opponent_model=root / "opponent.zip",
+                    lockstep_games=lockstep_games)
+            return result, agent, opponent
+
+        with tempfile.TemporaryDirectory() as temp:
+            root = Path(temp)
+            serial, serial_agent, _ = harvest_games(root, 1)
+            batched, agent, opponent = harvest_games(root, 3)
+            lanes = sorted(path.name for path in batched["output"].iterdir()
+                           if path.is_dir())
+            reloaded = harvest.load_completed_harvest(batched["output"])
+
+        def outcome(record):
+            return (record["p1_deck"], record["p2_deck"], record["result"])
+
+        self.assertEqual([outcome(record) for record in batched["records"]],
+                         [outcome(record) for record in serial["records"]])
+        self.assertEqual(set(serial_agent.batches), {1})
+        self.assertEqual(max(agent.batches), 3)
+        self.assertEqual(max(opponent.batches), 3)
+        self.assertEqual(sum(agent.batches), sum(serial_agent.batches))
+        self.assertEqual(batched["fidelity"]["games_recorded"], 7)
+        self.assertEqual(
+            batched["run_manifest"]["matchups"],
+            serial["run_manifest"]["matchups"])
+        lockstep = batched["run_manifest"]["lockstep"]
+        self.assertEqual(lanes, ["lane_00", "lane_01", "lane_02"])
+        self.assertEqual(lockstep["lanes"][1]["games"], [4, 7])
+        self.assertEqual(lockstep["largest_batch"], 3)
+        for key in ("records", "fidelity", "manifest", "run_manifest"):
+            self.assertEqual(reloaded[key], batched[key], key)
+        # Opponent predictions run inside env.step and parked lanes wait on
+        # other lanes; neither may be charged to the environment.
+        for run in (serial, batched):
+            timing = run["run_manifest"]["timing"]
+            self.assertEqual(
+                tuple(timing["seconds"]), harvest.TIMING_PHASES + ("other",))
+            self.assertEqual(timing["steps"], len(serial_agent.batches))
+            self.assertLess(timing["seconds"]["env_step"],
+                            timing["seconds"]["policy_inference"])
+        self.assertGreaterEqual(
+            batched["run_manifest"]["timing"]["seconds"]["policy_inference"],
+            0.002 * (len(agent.batches) + len(opponent.batches)))
+
+    def test_lane_state_swaps_owned_globals_and_guards_shared_ones(self):
+        from Playersim import card_support
+
+        previous = card_support.get_manifest()
+        self.addCleanup(card_support.install_manifest, previous)
+        card_support.reset_manifest_for_tests()
+        random.seed(11)
+        card_support.report_unsupported("Lane Card", "no parser")
+        lane_state = harvest._capture_lane_state()
+        lane_manifest = card_support.get_manifest()
+        lane_draw = random.random()
+
+        random.seed(12)
+        card_support.reset_manifest_for_tests()
+        harvest._restore_lane_state(lane_state)
+        self.assertIs(card_support.get_manifest(), lane_manifest)
+        self.assertIn("Lane Card", lane_manifest.entries)
+        self.assertEqual(random.random(), lane_draw)
+
+        previous_disable = logging.root.manager.disable
+        self.addCleanup(logging.disable, previous_disable)
+        logging.disable(logging.WARNING
+                        if previous_disable != logging.WARNING
+                        else logging.ERROR)
+        with self.assertRaisesRegex(RuntimeError, "lanes may only own"):
+            harvest._restore_lane_state(lane_state)
+        with self.assertRaises(TypeError):
+            card_support.install_manifest({})
+
     def test_summary_is_compact_and_manifest_ranked(self):
         records = [{"result": "loss"}, {"result": "win"}]
         fidelity = {
@@ -1045,6 +1279,67 @@ class HarvestFixturesTest(unittest.TestCase):
         self.assertLess(text.index("First"), text.index("Second"))
         self.assertIn("fidelity_issues=1", text)
 
+    def test_benchmark_reports_throughput_and_fails_on_regression(self):
+        def run_manifest(elapsed):
+            return {
+                "seed": 42, "games": 4, "game_offset": 0, "max_steps": 50,
+                "lockstep_games": 1, "agent_seat": "p1",
+                "agent_policy": {"kind": "random-valid"},
+                "opponent_policy": {"kind": "scripted"},
+                "lineage": {"corpus": {"sha256": "abc"}},
+                "timing": {
+                    "elapsed_seconds": elapsed, "steps": 200,
+                    "seconds": dict(
+                        {phase: elapsed / 10 for phase
+                         in harvest.TIMING_PHASES},
+                        other=elapsed / 2),
+                },
+            }
+
+        def benchmark(root, name, elapsed, *extra):
+            output = root / name
+            output.mkdir()
+            result = {"output": output, "run_manifest": run_manifest(elapsed)}
+            with mock.patch.object(
+                    harvest, "run_harvest", return_value=result), \
+                    contextlib.redirect_stdout(io.StringIO()), \
+                    contextlib.redirect_stderr(io.StringIO()):
+                status = harvest.main(
+                    ["--output", str(output), "--benchmark", *extra])
+            report_path = output / "benchmark.json"
+            report = (json.loads(report_path.read_text(encoding="utf-8"))
+                      if report_path.is_file() else None)
+            return status, report
+
+        with tempfile.TemporaryDirectory() as temp:
+            root = Path(temp)
+            status, baseline = benchmark(root, "baseline", 2.0)
+            self.assertEqual(status, 0)
+            self.assertEqual(baseline["games_per_second"], 2.0)
+            self.assertEqual(baseline["steps_per_second"], 100.0)
+            self.assertAlmostEqual(
+                baseline["milliseconds_per_step"]["env_step"], 1.0)
+            baseline_path = str(root / "baseline" / "benchmark.json")
+
+            status, report = benchmark(
+                root, "noise", 2.2, "--benchmark-baseline", baseline_path)
+            self.assertEqual(status, 0)
+            self.assertTrue(report["comparison"]["passed"])
+
+            status, report = benchmark(
+                root, "slow", 3.0, "--benchmark-baseline", baseline_path)
+            self.assertEqual(status, 2)
+            self.assertFalse(
+                report["comparison"]["metrics"]["steps_per_second"]["passed"])
+
+            other = dict(baseline, settings=dict(baseline["settings"], seed=7))
+            other_path = root / "other.json"
+            other_path.write_text(json.dumps(other), encoding="utf-8")
+            status, report = benchmark(
+                root, "other", 2.0, "--benchmark-baseline", str(other_path))
+            self.assertEqual(status, 1)
+            self.assertIsNone(report)
+
     def test_cli_arguments(self):
         args = harvest.build_parser().parse_args(
             ["--games", "3", "--seed", "99", "--max-steps", "77",
@@ -1055,10 +1350,13 @@ class HarvestFixturesTest(unittest.TestCase):
         self.assertIsNone(args.decks)
         self.assertIsNone(args.format)
         self.assertIsNone(args.format_dir)
+        self.assertEqual(args.lockstep_games, 1)
         corpus_args = harvest.build_parser().parse_args(
             ["--output", "somewhere", "--decks", "MyDecks",
-             "--format", "standard", "--format-dir", "formats/standard"]
+             "--format", "standard", "--format-dir", "formats/standard",
+             "--lockstep-games", "4"]
         )
+        self.assertEqual(corpus_args.lockstep_games, 4)
         self.assertEqual(corpus_args.decks, Path("MyDecks"))
         self.assertEqual(corpus_args.format, "standard")
         self.assertEqual(corpus_args.format_dir, Path("formats/standard"))
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+import io
 import json
 from pathlib import Path
 import sys
 import tempfile
+import threading
+import time
 import unittest
 from unittest import mock
 
@@ -30,14 +36,43 @@ class _Policy:
         return np.array([self.action]), None
 
 
+def _write_record_log(arguments, records):
+    """Write a fake shard's records where a real shard leaves its game log."""
+    output = Path(arguments["output"])
+    output.mkdir(parents=True, exist_ok=True)
+    with (output / "game_log.jsonl").open("w", encoding="utf-8") as handle:
+        for record in records:
+            handle.write(json.dumps(record) + "\n")
+    return [{"path": "game_log.jsonl", "sha256": None,
+             "games": list(range(arguments["offset"],
+                                 arguments["offset"] + len(records)))}]
+
+
+@contextlib.contextmanager
+def _patch_harvest_legs(**mock_kwargs):
+    """Answer each shared-pool run with a ``run_parallel_harvest``-shaped mock."""
+    leg = mock.Mock(**mock_kwargs)
+
+    def run_harvests(runs, workers):
+        return [
+            leg(run["games"], workers, run["seed"], run["output_directory"],
+                **{key: value for key, value in run.items()
+                   if key not in {"games", "seed", "output_directory"}})
+            for run in runs]
+
+    with mock.patch.object(
+            protocol, "run_parallel_harvests", side_effect=run_harvests):
+        yield leg
+
+
 class HarvestProtocolTest(unittest.TestCase):
-    def test_partition_is_complete_deterministic_and_caps_workers(self):
-        self.assertEqual(protocol.partition_games(10, 3), [
+    def test_partition_is_complete_deterministic_and_chunked(self):
+        self.assertEqual(protocol.partition_games(10, 4), [
             {"shard": 0, "offset": 0, "games": 4},
-            {"shard": 1, "offset": 4, "games": 3},
-            {"shard": 2, "offset": 7, "games": 3},
+            {"shard": 1, "offset": 4, "games": 4},
+            {"shard": 2, "offset": 8, "games": 2},
         ])
-        self.assertEqual(len(protocol.partition_games(2, 20)), 2)
+        self.assertEqual(len(protocol.partition_games(2, 20)), 1)
         with self.assertRaises(ValueError):
             protocol.partition_games(0, 1)
         with self.assertRaises(ValueError):
@@ -64,7 +99,7 @@ class HarvestProtocolTest(unittest.TestCase):
                 "output": Path(arguments["output"]).name,
                 "agent_version": "test-agent",
                 "results": {"win": count},
-                "records": [{"result": "win"} for _ in range(count)],
+                "record_logs": _write_record_log(arguments, [{"result": "win"} for _ in range(count)]),
                 "fidelity": {key: 0 for key in protocol.fixture.FIDELITY_COUNTERS},
                 "agent_policy": {"kind": "random-valid"},
                 "opponent_policy": {"kind": "scripted"},
@@ -87,6 +122,208 @@ class HarvestProtocolTest(unittest.TestCase):
             self.assertEqual(saved["games"], 3)
             self.assertEqual(result["manifest"]["Test Card"]["count"], 3)
 
+    def test_workers_pull_shards_and_merge_independently_of_count(self):
+        lock = threading.Lock()
+        ran_on = {}
+
+        def fake_shard(arguments):
+            # The first shard is a long matchup; the rest are quick.
+            time.sleep(0.3 if arguments["shard"] == 0 else 0.01)
+            with lock:
+                ran_on[arguments["shard"]] = threading.current_thread().name
+            count = arguments["games"]
+            indices = range(arguments["offset"], arguments["offset"] + count)
+            return {
+                "shard": arguments["shard"],
+                "offset": arguments["offset"],
+                "games": count,
+                "output": Path(arguments["output"]).name,
+                "agent_version": "test-agent",
+                "results": {"win": count},
+                "record_logs": _write_record_log(
+                    arguments, [{"result": "win", "game": index}
+                                for index in indices]),
+                "fidelity": {key: 0 for key in protocol.fixture.FIDELITY_COUNTERS},
+                "agent_policy": {"kind": "random-valid"},
+                "opponent_policy": {"kind": "scripted"},
+                "manifest": {
+                    f"Card {index % 3}": {
+                        "count": 1, "severity": "partial",
+                        "reasons": {f"reason {index % 2}": 1},
+                    }
+                    for index in indices
+                },
+            }
+
+        class _ThreadPool(ThreadPoolExecutor):
+            def __init__(self, max_workers=None, mp_context=None):
+                super().__init__(max_workers=max_workers)
+
+        outputs = {}
+        with tempfile.TemporaryDirectory() as temp, \
+                mock.patch.object(protocol, "_run_shard", side_effect=fake_shard), \
+                mock.patch.object(protocol, "ProcessPoolExecutor", _ThreadPool), \
+                mock.patch.object(protocol, "template_supported",
+                                  return_value=False), \
+                mock.patch.object(protocol, "_preload_shard_template"):
+            for workers in (1, 2):
+                ran_on.clear()
+                output = Path(temp) / f"workers_{workers}"
+                result = protocol.run_parallel_harvest(
+                    10, workers, 5, output, chunk_games=2)
+                outputs[workers] = (
+                    list(result["records"]),
+                    (output / "card_support_manifest.json").read_bytes(),
+                    dict(ran_on))
+                self.assertEqual(result["protocol_manifest"]["workers"], workers)
+                self.assertEqual(
+                    [shard["offset"] for shard in
+                     result["protocol_manifest"]["shards"]],
+                    [0, 2, 4, 6, 8])
+
+        self.assertEqual(
+            [record["game"] for record in outputs[2][0]], list(range(10)))
+        self.assertEqual(outputs[2][:2], outputs[1][:2])
+        # While one worker plays the long shard the other drains the queue.
+        pooled = outputs[2][2]
+        self.assertTrue(all(pooled[shard] != pooled[0] for shard in range(1, 5)))
+
+    def test_shard_logs_stream_into_one_root_log_in_game_order(self):
+        def fake_shard(arguments, corrupt=False):
+            # Two lockstep lanes per shard: lane j holds every other game.
+            output = Path(arguments["output"])
+            first, count = arguments["offset"], arguments["games"]
+            logs = []
+            for lane in range(2):
+                games = list(range(first + lane, first + count, 2))
+                path = output / f"lane_{lane:02d}" / "game_log.jsonl"
+                path.parent.mkdir(parents=True)
+                path.write_text("".join(
+                    json.dumps({"result": "win", "game": index}) + "\n"
+                    for index in games))
+                digest = protocol.fixture._file_sha256(path)
+                logs.append({"path": f"lane_{lane:02d}/game_log.jsonl",
+                             "games": games,
+                             "sha256": "0" * 64 if corrupt else digest})
+            return {
+                "shard": arguments["shard"], "offset": first, "games": count,
+                "output": output.name, "agent_version": "test-agent",
+                "results": {"win": count}, "record_logs": logs,
+                "fidelity": {
+                    key: 0 for key in protocol.fixture.FIDELITY_COUNTERS},
+                "manifest": {}, "agent_policy": {"kind": "random-valid"},
+                "opponent_policy": {"kind": "scripted"},
+            }
+
+        with tempfile.TemporaryDirectory() as temp, \
+                mock.patch.object(protocol, "_preload_shard_template"):
+            output = Path(temp) / "run"
+            with mock.patch.object(
+                    protocol, "_run_shard", side_effect=fake_shard):
+                result = protocol.run_parallel_harvest(
+                    7, 1, 5, output, chunk_games=3)
+            merged = [json.loads(line)["game"] for line in
+                      (output / "game_log.jsonl").read_text().splitlines()]
+            self.assertEqual(merged, list(range(7)))
+            self.assertEqual(len(result["records"]), 7)
+            self.assertEqual(result["records"][4]["game"], 4)
+            self.assertEqual(result["records"][-1]["game"], 6)
+            self.assertEqual(
+                [record["game"] for record in result["records"][2:5]],
+                [2, 3, 4])
+            self.assertEqual([record["game"] for record in result["records"]],
+                             merged)
+            self.assertEqual(
+                result["protocol_manifest"]["results"], {"win": 7})
+
+            corrupt = Path(temp) / "corrupt"
+            with mock.patch.object(
+                    protocol, "_run_shard",
+                    side_effect=lambda item: fake_shard(item, corrupt=True)):
+                with self.assertRaisesRegex(RuntimeError, "changed after"):
+                    protocol.run_parallel_harvest(
+                        4, 1, 5, corrupt, chunk_games=2)
+            self.assertFalse((corrupt / "harvest_protocol.json").exists())
+            self.assertFalse((corrupt / "game_log.jsonl").exists())
+
+    def test_resume_replays_only_shards_without_a_completion_marker(self):
+        played = []
+
+        def fake_shard(arguments, crash_at=None):
+            # Write what run_harvest leaves behind, completion marker last.
+            output = Path(arguments["output"])
+            output.mkdir(parents=True)
+            indices = range(arguments["offset"],
+                            arguments["offset"] + arguments["games"])
+            with (output / "game_log.jsonl").open("w") as handle:
+                for index in indices:
+                    handle.write(json.dumps(
+                        {"result": "win", "game": index}) + "\n")
+            if arguments["shard"] == crash_at:
+                raise RuntimeError("worker pre-empted")
+            played.append(arguments["shard"])
+            (output / "fidelity_report.json").write_text(json.dumps(
+                {key: 0 for key in protocol.fixture.FIDELITY_COUNTERS}))
+            (output / "card_support_manifest.json").write_text(json.dumps(
+                {f"Card {arguments['shard']}": {
+                    "count": 1, "severity": "partial", "reasons": {}}}))
+            run_manifest = {
+                "status": "complete", "agent_version": "test-agent",
+                "seed": arguments["seed"], "games": arguments["games"],
+                "game_offset": arguments["offset"],
+                "max_steps": arguments["max_steps"], "agent_seat": "p1",
+                "agent_policy": {"kind": "random-valid"},
+                "opponent_policy": {"kind": "scripted"},
+                "results": {"win": arguments["games"]},
+                "artifacts": {
+                    name: protocol.fixture._file_sha256(output / name)
+                    for name in protocol.fixture.HARVEST_ARTIFACTS},
+            }
+            (output / "harvest_run.json").write_text(json.dumps(run_manifest))
+            return protocol._shard_summary(
+                arguments, protocol.fixture.load_completed_harvest(output))
+
+        with tempfile.TemporaryDirectory() as temp, \
+                mock.patch.object(protocol, "_preload_shard_template"):
+            output = Path(temp) / "run"
+            with mock.patch.object(
+                    protocol, "_run_shard",
+                    side_effect=lambda item: fake_shard(item, crash_at=3)):
+                with self.assertRaisesRegex(RuntimeError, "pre-empted"):
+                    protocol.run_parallel_harvest(10, 1, 5, output,
+                                                  chunk_games=2)
+            self.assertFalse((output / "harvest_protocol.json").exists())
+            self.assertEqual(played, [0, 1, 2])
+
+            with self.assertRaisesRegex(RuntimeError, "seed"):
+                protocol.run_parallel_harvest(
+                    10, 1, 6, output, chunk_games=2, resume=True)
+
+            played.clear()
+            with mock.patch.object(
+                    protocol, "_run_shard", side_effect=fake_shard):
+                result = protocol.run_parallel_harvest(
+                    10, 1, 5, output, chunk_games=2, resume=True)
+            self.assertEqual(played, [3, 4])
+            self.assertEqual(
+                [record["game"] for record in result["records"]],
+                list(range(10)))
+            self.assertEqual(sorted(result["manifest"]),
+                             [f"Card {shard}" for shard in range(5)])
+            saved = json.loads(
+                (output / "harvest_protocol.json").read_text(encoding="utf-8"))
+            self.assertEqual(saved["resumed_shards"], 3)
+
+            with self.assertRaisesRegex(RuntimeError, "already completed"):
+                protocol.run_parallel_harvest(
+                    10, 1, 5, output, chunk_games=2, resume=True)
+            (output / "harvest_protocol.json").unlink()
+            with (output / "shard_001" / "game_log.jsonl").open("a") as handle:
+                handle.write(json.dumps({"result": "loss"}) + "\n")
+            with self.assertRaisesRegex(RuntimeError, "changed after"):
+                protocol.run_parallel_harvest(
+                    10, 1, 5, output, chunk_games=2, resume=True)
+
     def test_parallel_harvest_rejects_worker_checkpoint_identity_mismatch(self):
         expected = {
             "name": "candidate.zip", "sha256": "a" * 64, "size": 7}
@@ -98,7 +335,8 @@ class HarvestProtocolTest(unittest.TestCase):
                 "shard": 0, "offset": 0, "games": 1,
                 "output": Path(arguments["output"]).name,
                 "agent_version": "worker-policy", "results": {"win": 1},
-                "records": [{"result": "win"}],
+                "record_logs": _write_record_log(
+                    arguments, [{"result": "win"}]),
                 "fidelity": {
                     key: 0 for key in protocol.fixture.FIDELITY_COUNTERS},
                 "manifest": {}, "agent_policy": observed,
@@ -129,7 +367,8 @@ class HarvestProtocolTest(unittest.TestCase):
                 "shard": 0, "offset": 0, "games": 1,
                 "output": Path(arguments["output"]).name,
                 "agent_version": "worker-policy", "results": {"win": 1},
-                "records": [{"result": "win"}],
+                "record_logs": _write_record_log(
+                    arguments, [{"result": "win"}]),
                 "fidelity": {
                     key: 0 for key in protocol.fixture.FIDELITY_COUNTERS},
                 "manifest": {}, "agent_policy": initial,
@@ -164,6 +403,8 @@ class HarvestProtocolTest(unittest.TestCase):
                 "opponent_policy": {"kind": "scripted"},
                 "lineage": {"format": "standard"},
                 "decks": ["A", "B"],
+                "results": {"win": 1},
+                "artifacts": {"game_log.jsonl": "f" * 64},
             },
         }
         arguments = {
@@ -182,8 +423,10 @@ class HarvestProtocolTest(unittest.TestCase):
                 return_value=fixture_result) as run:
             shard = protocol._run_shard(arguments)
         self.assertIs(run.call_args.kwargs["agent_is_p1"], False)
-        self.assertEqual(shard["records"][0]["result"], "win")
-        self.assertIs(shard["records"][0]["agent_is_p1"], False)
+        self.assertEqual(shard["results"], {"win": 1})
+        self.assertNotIn("records", shard)
+        self.assertEqual(shard["record_logs"], [
+            {"path": "game_log.jsonl", "games": [0], "sha256": "f" * 64}])
         self.assertEqual(
             shard["agent_policy"], fixture_result["run_manifest"]["agent_policy"])
 
@@ -222,8 +465,7 @@ class HarvestProtocolTest(unittest.TestCase):
         ]
         identity = {"name": "model.zip", "sha256": "a" * 64, "size": 1}
         with tempfile.TemporaryDirectory() as temp, \
-                mock.patch.object(
-                    protocol, "run_parallel_harvest", side_effect=legs), \
+                _patch_harvest_legs(side_effect=legs), \
                 mock.patch.object(
                     protocol.fixture, "checkpoint_identity", return_value=identity):
             output = Path(temp) / "promotion"
@@ -246,6 +488,51 @@ class HarvestProtocolTest(unittest.TestCase):
         self.assertEqual(protocol._candidate_points(records, True), 1.0)
         self.assertEqual(protocol._candidate_points(records, False), 0.0)
 
+    def test_harvest_benchmark_sums_shard_timing_over_wall_time(self):
+        def shard_timing(elapsed):
+            return {
+                "elapsed_seconds": elapsed, "steps": 100,
+                "seconds": dict(
+                    {phase: 0.1 for phase in protocol.fixture.TIMING_PHASES},
+                    other=elapsed - 0.5),
+            }
+
+        timing = protocol.fixture.sum_run_timing(
+            [shard_timing(1.0), shard_timing(3.0)])
+        self.assertEqual(timing["shard_seconds"], 4.0)
+        self.assertEqual(timing["steps"], 200)
+        self.assertAlmostEqual(timing["seconds"]["env_step"], 0.2)
+        summary = {
+            "seed": 5, "games": 8, "game_offset": 0, "chunk_games": 4,
+            "lockstep_games": 1, "workers": 2, "max_steps": 50,
+            "agent_seat": "p1", "agent_policy": {"kind": "random-valid"},
+            "opponent_policy": {"kind": "scripted"}, "lineage": {},
+            "elapsed_seconds": 4.0, "games_per_second": 2.0,
+            "resumed_shards": 0, "timing": timing,
+        }
+        with tempfile.TemporaryDirectory() as temp, \
+                mock.patch.object(
+                    protocol, "run_parallel_harvest",
+                    return_value={"output": Path(temp),
+                                  "protocol_manifest": summary}), \
+                contextlib.redirect_stdout(io.StringIO()):
+            status = protocol.main([
+                "harvest", "--games", "8", "--workers", "2",
+                "--output", temp, "--benchmark"])
+            report = json.loads(
+                (Path(temp) / "benchmark.json").read_text(encoding="utf-8"))
+        self.assertEqual(status, 0)
+        self.assertEqual(report["kind"], "harvest_protocol")
+        self.assertEqual(report["steps_per_second"], 50.0)
+        self.assertEqual(report["worker_utilization"], 0.5)
+        self.assertEqual(report["settings"]["workers"], 2)
+
+        with contextlib.redirect_stderr(io.StringIO()), \
+                self.assertRaises(SystemExit):
+            protocol.main([
+                "harvest", "--games", "8", "--output", "run", "--resume",
+                "--benchmark"])
+
     def test_cli_parses_harvest_and_promotion(self):
         parser = protocol.build_parser()
         harvest = parser.parse_args([
@@ -288,7 +575,7 @@ class HarvestProtocolTest(unittest.TestCase):
                 "output": Path(arguments["output"]).name,
                 "agent_version": "test-agent",
                 "results": {"win": count},
-                "records": [{"result": "win"} for _ in range(count)],
+                "record_logs": _write_record_log(arguments, [{"result": "win"} for _ in range(count)]),
                 "fidelity": {key: 0 for key in protocol.fixture.FIDELITY_COUNTERS},
                 "agent_policy": {"kind": "random-valid"},
                 "opponent_policy": {"kind": "scripted"},
@@ -319,8 +606,9 @@ class HarvestProtocolTest(unittest.TestCase):
                 "output": Path(arguments["output"]).name,
                 "agent_version": "test-agent",
                 "results": {"win": arguments["games"]},
-                "records": [{"result": "win"}
-                            for _ in range(arguments["games"])],
+                "record_logs": _write_record_log(
+                    arguments, [{"result": "win"}
+                                for _ in range(arguments["games"])]),
                 "fidelity": {key: 0 for key in protocol.fixture.FIDELITY_COUNTERS},
                 "agent_policy": {"kind": "random-valid"},
                 "opponent_policy": {"kind": "scripted"},
@@ -337,7 +625,7 @@ class HarvestProtocolTest(unittest.TestCase):
                 return self._value
 
         class _SerialExecutor:
-            def __init__(self, max_workers=None):
+            def __init__(self, max_workers=None, mp_context=None):
                 pass
 
             def __enter__(self):
@@ -355,7 +643,7 @@ class HarvestProtocolTest(unittest.TestCase):
                 mock.patch.object(protocol, "as_completed", lambda futures: list(futures)):
             output = Path(temp) / "run"
             with self.assertRaisesRegex(RuntimeError, "lineage"):
-                protocol.run_parallel_harvest(2, 2, 5, output)
+                protocol.run_parallel_harvest(2, 2, 5, output, chunk_games=1)
             self.assertFalse((output / "harvest_protocol.json").exists())
 
     def test_qualification_pairs_seats_and_publishes_strength_gate(self):
@@ -387,8 +675,7 @@ class HarvestProtocolTest(unittest.TestCase):
             ]),
         ]
         with tempfile.TemporaryDirectory() as temp, \
-                mock.patch.object(
-                    protocol, "run_parallel_harvest", side_effect=legs) as run, \
+                _patch_harvest_legs(side_effect=legs) as run, \
                 mock.patch.object(
                     protocol.fixture, "checkpoint_identity",
                     return_value=identity):
@@ -413,6 +700,216 @@ class HarvestProtocolTest(unittest.TestCase):
             self.assertEqual(saved["candidate"], identity)
             self.assertEqual(saved["lineage"], lineage)
 
+    def test_qualification_seats_share_one_worker_queue(self):
+        identity = {"name": "candidate.zip", "sha256": "a" * 64, "size": 7}
+        submitted = []
+
+        def fake_shard(arguments):
+            agent_is_p1 = arguments["agent_is_p1"]
+            count = arguments["games"]
+            # The candidate wins every p1 game and loses every p2 game.
+            result = "win" if agent_is_p1 else "loss"
+            return {
+                "shard": arguments["shard"],
+                "offset": arguments["offset"],
+                "games": count,
+                "output": Path(arguments["output"]).name,
+                "agent_version": "test-agent",
+                "results": {result: count},
+                "record_logs": _write_record_log(arguments, [
+                    {"result": result, "agent_is_p1": agent_is_p1}
+                    for _ in range(count)]),
+                "fidelity": {key: 0 for key in protocol.fixture.FIDELITY_COUNTERS},
+                "agent_policy": identity,
+                "opponent_policy": {"kind": "scripted"},
+                "manifest": {},
+                "lineage": {"format": "standard"},
+                "decks": ["A", "B"],
+            }
+
+        class _RecordingExecutor(ThreadPoolExecutor):
+            def submit(self, fn, item):
+                submitted.append(
+                    ("p1" if item["agent_is_p1"] else "p2", item["shard"]))
+                return super().submit(fn, item)
+
+        with tempfile.TemporaryDirectory() as temp, \
+                mock.patch.object(protocol, "_run_shard", side_effect=fake_shard), \
+                mock.patch.object(protocol, "template_supported", return_value=False), \
+                mock.patch.object(protocol, "ProcessPoolExecutor", _RecordingExecutor), \
+                mock.patch.object(
+                    protocol.fixture, "checkpoint_identity",
+                    return_value=identity):
+            output = Path(temp) / "qualification"
+            decision = protocol.run_qualification(
+                "candidate.zip", 2 * 3 * protocol.DEFAULT_CHUNK_GAMES, 2, 13,
+                output)
+            p1 = json.loads(
+                (output / "candidate_p1" / "harvest_protocol.json").read_text())
+            p2 = json.loads(
+                (output / "candidate_p2" / "harvest_protocol.json").read_text())
+
+        self.assertEqual(submitted, [
+            ("p1", 0), ("p2", 0), ("p1", 1), ("p2", 1), ("p1", 2), ("p2", 2)])
+        self.assertEqual((p1["agent_seat"], p1["results"]),
+                         ("p1", {"win": 3 * protocol.DEFAULT_CHUNK_GAMES}))
+        self.assertEqual((p2["agent_seat"], p2["results"]),
+                         ("p2", {"loss": 3 * protocol.DEFAULT_CHUNK_GAMES}))
+        self.assertEqual(p1["elapsed_seconds"], p2["elapsed_seconds"])
+        self.assertEqual(
+            decision["outcome_counts"],
+            {"wins": 3 * protocol.DEFAULT_CHUNK_GAMES,
+             "losses": 3 * protocol.DEFAULT_CHUNK_GAMES, "draws": 0})
+
+    def test_sequential_qualification_stops_once_the_decision_is_settled(self):
+        clean = {key: 0 for key in protocol.fixture.FIDELITY_COUNTERS}
+        identity = {"name": "candidate.zip", "sha256": "a" * 64, "size": 7}
+
+        def leg(games, seed, output, *, agent_is_p1, game_offset, **_kwargs):
+            return {
+                "records": [{"result": "win", "agent_is_p1": agent_is_p1}
+                            for _ in range(games)],
+                "fidelity": dict(clean),
+                "manifest": {},
+                "protocol_manifest": {
+                    "status": "complete",
+                    "agent_policy": identity,
+                    "agent_seat": "p1" if agent_is_p1 else "p2",
+                    "lineage": {"format": "standard"},
+                },
+            }
+
+        with tempfile.TemporaryDirectory() as temp, \
+                _patch_harvest_legs(
+                    side_effect=lambda games, workers, seed, output, **kwargs:
+                        leg(games, seed, output, **kwargs)) as run, \
+                mock.patch.object(
+                    protocol.fixture, "checkpoint_identity",
+                    return_value=identity):
+            output = Path(temp) / "qualification"
+            decision = protocol.run_qualification(
+                "candidate.zip", 200, 1, 13, output, sequential=True,
+                sequential_batch=4)
+            saved = json.loads(
+                (output / "qualification.json").read_text(encoding="utf-8"))
+
+        # log(20) / log(0.6 / 0.5) needs 17 straight pair wins: 5 stages.
+        self.assertEqual(run.call_count, 10)
+        self.assertEqual(
+            [call.kwargs["game_offset"] for call in run.call_args_list[::2]],
+            [0, 4, 8, 12, 16])
+        self.assertEqual(run.call_args_list[2].args[3],
+                         output.resolve() / "candidate_p1" / "stage_001")
+        self.assertEqual(decision["games"], 40)
+        self.assertEqual(decision["games_budget"], 200)
+        self.assertEqual(decision["stopping_rule"], "sequential")
+        self.assertTrue(decision["passed"])
+        test = saved["sequential_test"]
+        self.assertEqual(test["decision"], "pass")
+        self.assertEqual(test["units"], 17)
+        self.assertEqual(
+            [stage["decision"] for stage in test["stages"]],
+            [None, None, None, None, "pass"])
+
+    def test_sequential_qualification_streams_each_stage_once(self):
+        clean = {key: 0 for key in protocol.fixture.FIDELITY_COUNTERS}
+        identity = {"name": "candidate.zip", "sha256": "a" * 64, "size": 7}
+        logs = []
+
+        class StreamedRecords(Sequence):
+            """Game log that counts full passes and refuses random access."""
+
+            def __init__(self, records):
+                self.records = records
+                self.passes = 0
+                logs.append(self)
+
+            def __len__(self):
+                return len(self.records)
+
+            def __iter__(self):
+                self.passes += 1
+                return iter(self.records)
+
+            def __getitem__(self, index):
+                raise AssertionError("qualification indexed a game log")
+
+        def leg(games, workers, seed, output, *, agent_is_p1, game_offset,
+                **_kwargs):
+            return {
+                "records": StreamedRecords([
+                    {"result": "win" if (game_offset + index) % 3 else "draw",
+                     "agent_is_p1": agent_is_p1}
+                    for index in range(games)]),
+                "fidelity": dict(clean),
+                "manifest": {},
+                "protocol_manifest": {
+                    "status": "complete",
+                    "agent_policy": identity,
+                    "agent_seat": "p1" if agent_is_p1 else "p2",
+                    "lineage": {"format": "standard"},
+                },
+            }
+
+        with tempfile.TemporaryDirectory() as temp, \
+                _patch_harvest_legs(side_effect=leg), \
+                mock.patch.object(
+                    protocol.fixture, "checkpoint_identity",
+                    return_value=identity):
+            decision = protocol.run_qualification(
+                "candidate.zip", 24, 1, 13, Path(temp) / "qualification",
+                sequential=True, sequential_batch=4)
+
+        self.assertEqual(decision["games"], 24)
+        self.assertEqual(len(logs), 6)
+        # One pass validates the seat, one scores the pairs; earlier stages
+        # are never read again.
+        self.assertEqual([log.passes for log in logs], [2] * 6)
+        self.assertEqual(decision["outcome_counts"],
+                         {"wins": 16, "losses": 0, "draws": 8})
+        self.assertEqual(decision["candidate_points"], 20.0)
+        units = [1.0 if index % 3 else 0.5 for index in range(12)]
+        self.assertEqual(
+            decision["sequential_test"]["log_likelihood_ratio"],
+            protocol.sequential_score_test(
+                units, decision["sequential_test"])["log_likelihood_ratio"])
+
+    def test_unsettled_sequential_qualification_uses_the_fixed_rule(self):
+        clean = {key: 0 for key in protocol.fixture.FIDELITY_COUNTERS}
+        identity = {"name": "candidate.zip", "sha256": "a" * 64, "size": 7}
+
+        def leg(games, workers, seed, output, *, agent_is_p1, game_offset,
+                **_kwargs):
+            results = ["win" if (game_offset + index) % 2 else "loss"
+                       for index in range(games)]
+            return {
+                "records": [{"result": result, "agent_is_p1": agent_is_p1}
+                            for result in results],
+                "fidelity": dict(clean),
+                "manifest": {},
+                "protocol_manifest": {
+                    "status": "complete",
+                    "agent_policy": identity,
+                    "agent_seat": "p1" if agent_is_p1 else "p2",
+                    "lineage": {"format": "standard"},
+                },
+            }
+
+        with tempfile.TemporaryDirectory() as temp, \
+                _patch_harvest_legs(side_effect=leg), \
+                mock.patch.object(
+                    protocol.fixture, "checkpoint_identity",
+                    return_value=identity):
+            decision = protocol.run_qualification(
+                "candidate.zip", 12, 1, 13, Path(temp) / "qualification",
+                sequential=True, sequential_batch=4)
+
+        self.assertEqual(decision["games"], 12)
+        self.assertEqual(decision["stopping_rule"], "game_budget")
+        self.assertIsNone(decision["sequential_test"]["decision"])
+        self.assertEqual(decision["candidate_score"], 0.5)
+        self.assertFalse(decision["passed"])
+
     def test_qualification_fidelity_failure_is_recorded_and_cli_is_nonzero(self):
         decision = {
             "decision": "fail",
@@ -459,8 +956,7 @@ class HarvestProtocolTest(unittest.TestCase):
             leg("p2", clean, {}),
         ]
         with tempfile.TemporaryDirectory() as temp, \
-                mock.patch.object(
-                    protocol, "run_parallel_harvest", side_effect=legs), \
+                _patch_harvest_legs(side_effect=legs), \
                 mock.patch.object(
                     protocol.fixture, "checkpoint_identity",
                     return_value=identity):
@@ -497,8 +993,7 @@ class HarvestProtocolTest(unittest.TestCase):
         legs = [leg("p1", {"corpus": "one"}),
                 leg("p2", {"corpus": "two"})]
         with tempfile.TemporaryDirectory() as temp, \
-                mock.patch.object(
-                    protocol, "run_parallel_harvest", side_effect=legs), \
+                _patch_harvest_legs(side_effect=legs), \
                 mock.patch.object(
                     protocol.fixture, "checkpoint_identity",
                     return_value=identity):
@@ -0,0 +1,148 @@
+"""Parallel hyperparameter trials share one SQLite study."""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+import optuna  # noqa: E402
+
+import main as m  # noqa: E402
+import training_cli  # noqa: E402
+
+
+def _pruned_objective(trial, base_seed=42):
+    """Report a poor curve for odd trials so the median pruner stops them."""
+    value = -1.0 if trial.number % 2 else 1.0
+    for step in range(3):
+        trial.report(value, step)
+        if trial.should_prune():
+            raise optuna.TrialPruned()
+    return value
+
+
+def _spawned_objective(trial, base_seed=42):
+    """Cheap objective that records which process ran each trial."""
+    trial.set_user_attr("pid", os.getpid())
+    value = trial.suggest_float("x", -1.0, 1.0)
+    time.sleep(0.2)
+    return -value * value
+
+
+class HyperparameterWorkerPlanTest(unittest.TestCase):
+    def test_auto_workers_split_cpus_and_trials(self):
+        plan = m.hyperparameter_worker_plan(0, 7, 8)
+        self.assertEqual(plan["workers"], 4)
+        self.assertEqual(plan["torch_threads"], 1)
+        self.assertEqual(plan["trials"], [2, 2, 2, 1])
+        # Each worker's learner threads plus its environment core.
+        self.assertLessEqual(
+            plan["workers"] * (plan["torch_threads"] + 1), 8)
+        self.assertEqual(
+            m.hyperparameter_worker_plan(2, 7, 8)["torch_threads"], 3)
+
+        self.assertEqual(m.hyperparameter_worker_plan(0, 3, 1)["workers"], 1)
+        self.assertEqual(
+            m.hyperparameter_worker_plan(6, 2, 8)["trials"], [1, 1])
+
+    def test_oversubscription_and_bad_counts_are_rejected(self):
+        for workers in (5, 8, 9):
+            with self.assertRaisesRegex(ValueError, "oversubscribe"):
+                m.hyperparameter_worker_plan(workers, 20, 8)
+        self.assertEqual(m.hyperparameter_worker_plan(1, 20, 1)["workers"], 1)
+        with self.assertRaisesRegex(ValueError, "negative"):
+            m.hyperparameter_worker_plan(-1, 20, 8)
+        with self.assertRaisesRegex(ValueError, "at least one trial"):
+            m.hyperparameter_worker_plan(2, 0, 8)
+
+    def test_hp_workers_require_optimization(self):
+        parser = training_cli.build_parser()
+        with contextlib.redirect_stderr(io.StringIO()):
+            with self.assertRaises(SystemExit):
+                training_cli.validate_arguments(
+                    parser, parser.parse_args(["--hp-workers", "4"]))
+            with self.assertRaises(SystemExit):
+                training_cli.validate_arguments(parser, parser.parse_args(
+                    ["--optimize-hp", "--hp-workers", "-1"]))
+        args = parser.parse_args(["--optimize-hp", "--hp-workers", "0"])
+        training_cli.validate_arguments(parser, args)
+        self.assertEqual(args.hp_workers, 0)
+
+
+class SharedStudyWorkerTest(unittest.TestCase):
+    def test_single_worker_keeps_the_default_pruner(self):
+        with tempfile.TemporaryDirectory() as root:
+            storage = "sqlite:///" + os.path.join(root, "study.db")
+            single = m._hyperparameter_study("single", storage, 7, workers=1)
+            shared = m._hyperparameter_study("shared", storage, 7, workers=8)
+        default = optuna.pruners.MedianPruner()
+        self.assertEqual(
+            (single.pruner._n_startup_trials, single.pruner._n_warmup_steps),
+            (default._n_startup_trials, default._n_warmup_steps))
+        self.assertEqual(
+            (shared.pruner._n_startup_trials, shared.pruner._n_warmup_steps),
+            (8, m.HYPERPARAMETER_PRUNING_WARMUP_STEPS))
+
+    def test_spawned_workers_write_one_study_concurrently(self):
+        with tempfile.TemporaryDirectory() as root:
+            storage = "sqlite:///" + os.path.join(root, "study.db")
+            with mock.patch.dict(sys.modules, {"matplotlib": None}):
+                best = m.optimize_hyperparameters(
+                    n_trials=6, study_name="spawned", seed=3, workers=2,
+                    cpu_count=4, storage_name=storage,
+                    trial_objective=_spawned_objective)
+            study = optuna.load_study(study_name="spawned", storage=storage)
+
+        trials = study.trials
+        self.assertEqual([trial.number for trial in trials], list(range(6)))
+        self.assertTrue(all(
+            trial.state == optuna.trial.TrialState.COMPLETE
+            for trial in trials))
+        pids = {trial.user_attrs["pid"] for trial in trials}
+        self.assertEqual(len(pids), 2)
+        self.assertNotIn(os.getpid(), pids)
+        # The two workers' trials overlapped in time.
+        first, second = (
+            [trial for trial in trials if trial.user_attrs["pid"] == pid]
+            for pid in pids)
+        self.assertLess(
+            max(min(t.datetime_start for t in first),
+                min(t.datetime_start for t in second)),
+            min(max(t.datetime_complete for t in first),
+                max(t.datetime_complete for t in second)))
+        self.assertEqual(best, study.best_params)
+
+    def test_workers_add_trials_to_one_study_and_prune(self):
+        with tempfile.TemporaryDirectory() as root:
+            storage = "sqlite:///" + os.path.join(root, "study.db")
+            m._hyperparameter_study("shared", storage, 7, workers=2)
+            with mock.patch.object(m, "objective", _pruned_objective), \
+                    mock.patch.object(m, "configure_runtime_logging"), \
+                    mock.patch.object(m.torch, "set_num_threads") as threads:
+                for worker_index, trials in enumerate((5, 4)):
+                    m._hyperparameter_worker(
+                        "shared", storage, trials, 7, 7 + worker_index,
+                        2, 3)
+
+            threads.assert_called_with(3)
+            study = optuna.load_study(study_name="shared", storage=storage)
+            numbers = [trial.number for trial in study.trials]
+            self.assertEqual(numbers, list(range(9)))
+            states = [trial.state for trial in study.trials]
+            self.assertIn(optuna.trial.TrialState.PRUNED, states)
+            self.assertEqual(study.best_value, 1.0)
+            self.assertIsInstance(
+                study.pruner, optuna.pruners.MedianPruner)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""Lockstep lanes share batched checkpoint predictions."""
+
+import os
+import random
+import sys
+import unittest
+
+import numpy as np
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from Playersim.lockstep_inference import LockstepScheduler  # noqa: E402
+
+
+class CountingPolicy:
+    """Picks a legal action from the observation; records batch sizes."""
+
+    def __init__(self, offset=0):
+        self.offset = offset
+        self.batches = []
+
+    def predict(self, observation, state=None, episode_start=None,
+                deterministic=False, action_masks=None):
+        masks = np.atleast_2d(np.asarray(action_masks, dtype=bool))
+        values = np.asarray(observation["value"]).reshape(len(masks), -1)
+        self.batches.append(len(masks))
+        actions = []
+        for value, mask in zip(values, masks):
+            legal = np.flatnonzero(mask)
+            actions.append(legal[(int(value[0]) + self.offset) % len(legal)])
+        return np.asarray(actions), state
+
+
+def _play(seed, agent, opponent, decisions=5):
+    """Draw from the global RNGs between decisions, like the engine does."""
+    random.seed(seed)
+    np.random.seed(seed)
+    trace = []
+    for turn in range(decisions + seed % 3):
+        mask = np.zeros(8, dtype=bool)
+        mask[random.sample(range(8), 3)] = True
+        policy = agent if turn % 2 == 0 else opponent
+        action, _ = policy.predict(
+            {"value": np.array([np.random.randint(100)])},
+            action_masks=mask, deterministic=True)
+        trace.append((int(np.asarray(action).reshape(-1)[0]),
+                      random.random()))
+    return trace
+
+
+class LockstepSchedulerTest(unittest.TestCase):
+    def test_batched_lanes_match_one_game_at_a_time(self):
+        seeds = list(range(101, 107))
+        serial = [_play(seed, CountingPolicy(), CountingPolicy(3))
+                  for seed in seeds]
+
+        agent, opponent = CountingPolicy(), CountingPolicy(3)
+        scheduler = LockstepScheduler()
+        agent_handle = scheduler.policy(agent)
+        opponent_handle = scheduler.policy(opponent)
+        lanes = scheduler.run([
+            lambda seed=seed: _play(seed, agent_handle, opponent_handle)
+            for seed in seeds])
+
+        self.assertEqual(lanes, serial)
+        self.assertEqual(max(agent.batches), len(seeds))
+        self.assertEqual(scheduler.stats["largest_batch"], len(seeds))
+        self.assertEqual(scheduler.stats["requests"],
+                         sum(len(trace) for trace in serial))
+        self.assertLess(scheduler.stats["batches"],
+                        scheduler.stats["requests"])
+
+    def test_handles_predict_directly_outside_a_lane(self):
+        policy = CountingPolicy()
+        handle = LockstepScheduler().policy(policy)
+        mask = np.array([False, True, True])
+        action, _ = handle.predict(
+            {"value": np.array([1])}, action_masks=mask, deterministic=True)
+        self.assertEqual(int(action[0]), 2)
+        self.assertEqual(policy.batches, [1])
+
+    def test_a_failed_lane_aborts_the_rest(self):
+        scheduler = LockstepScheduler()
+        handle = scheduler.policy(CountingPolicy())
+        finished = []
+
+        def lane(seed):
+            _play(seed, handle, handle)
+            finished.append(seed)
+
+        def failing():
+            _play(7, handle, handle, decisions=1)
+            raise RuntimeError("lane 1 failed")
+
+        with self.assertRaisesRegex(RuntimeError, "lane 1 failed"):
+            scheduler.run([lambda: lane(5), failing, lambda: lane(6)])
+        self.assertEqual(finished, [])
+
+    def test_predict_errors_reach_every_lane_in_the_batch(self):
+        class Broken(CountingPolicy):
+            def predict(self, *args, **kwargs):
+                raise ValueError("no forward pass")
+
+        scheduler = LockstepScheduler()
+        handle = scheduler.policy(Broken())
+        with self.assertRaisesRegex(ValueError, "no forward pass"):
+            scheduler.run([lambda seed=seed: _play(seed, handle, handle)
+                           for seed in (1, 2)])
+
+
+if __name__ == "__main__":
+    unittest.main()
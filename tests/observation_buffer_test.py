@@ -0,0 +1,151 @@
+"""Contiguous observation block and flat-view contracts."""
+
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+from gymnasium import spaces
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (REPO_ROOT, os.path.join(REPO_ROOT, "tests")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from Playersim.environment import AlphaZeroMTGEnv  # noqa: E402
+from Playersim.observation_buffer import (  # noqa: E402
+    FlatObservationWrapper,
+    ObservationBuffer,
+    observation_buffer_layout,
+)
+from selfplay_environment_test import _fixture_data  # noqa: E402
+
+
+class ObservationLayoutTest(unittest.TestCase):
+    def test_layout_groups_widest_dtype_first_without_padding(self):
+        space = spaces.Dict({
+            "flag": spaces.Box(low=0, high=1, shape=(3,), dtype=bool),
+            "count": spaces.Box(low=0, high=9, shape=(2,), dtype=np.int32),
+            "ids": spaces.Box(low=-1, high=99, shape=(2,), dtype=np.int64),
+            "value": spaces.Box(low=0.0, high=1.0, shape=(2, 2),
+                                dtype=np.float32),
+        })
+        layout = observation_buffer_layout(space)
+
+        self.assertEqual(layout[0].name, "ids")
+        self.assertEqual(layout[-1].name, "flag")
+        for field in layout:
+            self.assertEqual(field.offset % field.dtype.itemsize, 0)
+        self.assertEqual(layout, observation_buffer_layout(space))
+        self.assertEqual(ObservationBuffer(space).nbytes, 16 + 8 + 16 + 3)
+
+    def test_non_box_fields_are_rejected(self):
+        with self.assertRaises(TypeError):
+            observation_buffer_layout(spaces.Dict({"x": spaces.Discrete(3)}))
+
+    def test_violations_report_nan_and_out_of_bounds_fields(self):
+        space = spaces.Dict({
+            "count": spaces.Box(low=0, high=9, shape=(3,), dtype=np.int32),
+            "value": spaces.Box(low=-1.0, high=1.0, shape=(2,),
+                                dtype=np.float32),
+            "scale": spaces.Box(low=0.0, high=5.0, shape=(2,),
+                                dtype=np.float32),
+            "flag": spaces.Box(low=0, high=1, shape=(2,), dtype=bool),
+        })
+        buffer = ObservationBuffer(space)
+        block, views = buffer.allocate()
+        for view in views.values():
+            view.fill(0)
+        self.assertEqual(buffer.violations(block), [])
+
+        views["count"][2] = 10
+        views["scale"][1] = np.nan
+        self.assertEqual(sorted(buffer.violations(block)), ["count", "scale"])
+
+
+class EnvironmentObservationBufferTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.TemporaryDirectory()
+        decks, card_db = _fixture_data()
+        self.env = AlphaZeroMTGEnv(
+            decks,
+            card_db,
+            deck_stats_path=os.path.join(self.root.name, "deck_stats"),
+            card_memory_path=os.path.join(self.root.name, "card_memory"),
+        )
+
+    def tearDown(self):
+        self.env.close()
+        self.root.cleanup()
+
+    def test_published_observations_are_independent_contiguous_blocks(self):
+        first, _ = self.env.reset(seed=2601)
+        second = self.env._get_obs()
+        buffer = self.env.observation_buffer
+
+        self.assertTrue(self.env.observation_space.contains(first))
+        first_block = buffer.block_of(first)
+        second_block = buffer.block_of(second)
+        self.assertIsNotNone(first_block)
+        self.assertIsNotNone(second_block)
+        self.assertIsNot(first_block, second_block)
+        self.assertFalse(np.shares_memory(first_block, buffer.scratch))
+        for key in first:
+            np.testing.assert_array_equal(first[key], second[key])
+
+    def test_nested_build_does_not_share_the_scratch_block(self):
+        self.env.reset(seed=2602)
+        self.env._observation_scratch_in_use = True
+        observation = self.env._get_obs()
+
+        self.assertTrue(self.env._observation_scratch_in_use)
+        self.assertIsNone(self.env.last_observation_error)
+        self.assertTrue(self.env.observation_space.contains(observation))
+
+    def test_validate_obs_accepts_published_and_rejects_corrupt(self):
+        observation, _ = self.env.reset(seed=2604)
+        self.assertTrue(self.env._validate_obs(observation))
+
+        observation["turn"][0] = -1
+        self.assertFalse(self.env._validate_obs(observation))
+
+    def test_sampled_validation_repairs_every_observation(self):
+        self.env.reset(seed=2605)
+        self.env.observation_validation_interval = 4
+        self.env.observation_validation_warmup = 0
+        self.env._observations_coerced = 0
+        raw = {key: np.zeros(space.shape, dtype=space.dtype)
+               for key, space in self.env.observation_space.spaces.items()}
+        raw["turn"][0] = -1
+        raw["my_life"][0] = np.iinfo(raw["my_life"].dtype).max
+        self.env.last_observation_error = None
+
+        with self.assertNoLogs(level="ERROR"):
+            unreported = self.env._coerce_observation(raw)
+        self.assertTrue(self.env.observation_space.contains(unreported))
+        self.assertEqual(int(unreported["turn"][0]), 0)
+        self.assertIn("turn", self.env.last_observation_error)
+        self.assertEqual(self.env.observation_validation_interval, 4)
+
+        for _ in range(3):
+            reported = self.env._coerce_observation(raw)
+            self.assertTrue(self.env.observation_space.contains(reported))
+        self.assertEqual(self.env.observation_validation_interval, 1)
+
+    def test_flat_wrapper_preserves_every_field_in_layout_order(self):
+        wrapper = FlatObservationWrapper(self.env)
+        flat, _ = wrapper.reset(seed=2603)
+        observation = self.env._get_obs()
+
+        self.assertEqual(flat.dtype, np.float32)
+        self.assertTrue(wrapper.observation_space.contains(flat))
+        for field in wrapper.observation_buffer.fields:
+            np.testing.assert_array_equal(
+                flat[field.flat_offset:field.flat_offset + field.size],
+                observation[field.name].reshape(-1).astype(np.float32))
+
+
+if __name__ == "__main__":
+    unittest.main()
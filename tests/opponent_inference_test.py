@@ -0,0 +1,143 @@
+"""Batched opponent inference server contracts."""
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+import numpy as np
+from gymnasium import spaces
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from Playersim.opponent_inference import (  # noqa: E402
+    OpponentInferenceClient,
+    OpponentInferenceServer,
+)
+
+
+OBSERVATION_SPACE = spaces.Dict({
+    "value": spaces.Box(low=-1.0, high=1.0, shape=(6,), dtype=np.float32),
+    "count": spaces.Box(low=0, high=9, shape=(2,), dtype=np.int32),
+    "flag": spaces.Box(low=0, high=1, shape=(3,), dtype=bool),
+})
+ACTION_SPACE = spaces.Discrete(5)
+
+
+def _save_tiny_policy(path, seed):
+    import gymnasium as gym
+    from sb3_contrib import MaskablePPO
+
+    class TinyEnv(gym.Env):
+        observation_space = OBSERVATION_SPACE
+        action_space = ACTION_SPACE
+
+        def reset(self, *, seed=None, options=None):
+            return self.observation_space.sample(), {}
+
+        def step(self, action):
+            return self.observation_space.sample(), 0.0, True, False, {}
+
+    model = MaskablePPO(
+        "MultiInputPolicy", TinyEnv(), n_steps=8, batch_size=8, seed=seed,
+        policy_kwargs={"net_arch": [8]}, device="cpu")
+    model.save(path)
+    return model.policy
+
+
+class OpponentInferenceServerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.root = tempfile.TemporaryDirectory()
+        cls.paths = []
+        cls.local = []
+        for seed in (3101, 3102):
+            path = os.path.join(cls.root.name, f"policy_{seed}.zip")
+            cls.local.append(_save_tiny_policy(path, seed))
+            cls.paths.append(path)
+        cls.server = OpponentInferenceServer(
+            max_policies=1, batch_window=0.05)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.close()
+        cls.root.cleanup()
+
+    def setUp(self):
+        self.rng = np.random.default_rng(3103)
+
+    def _sample(self):
+        observation = {
+            "value": self.rng.uniform(-1, 1, 6).astype(np.float32),
+            "count": self.rng.integers(0, 10, 2).astype(np.int32),
+            "flag": self.rng.integers(0, 2, 3).astype(bool),
+        }
+        mask = self.rng.integers(0, 2, ACTION_SPACE.n).astype(bool)
+        mask[self.rng.integers(0, ACTION_SPACE.n)] = True
+        return observation, mask
+
+    def _client(self):
+        client = OpponentInferenceClient(
+            self.server.address, OBSERVATION_SPACE, ACTION_SPACE)
+        self.addCleanup(client.close)
+        return client
+
+    def test_remote_actions_match_local_prediction(self):
+        client = self._client()
+        for path, local in zip(self.paths, self.local):
+            remote = client.load(path)
+            self.assertEqual(remote.observation_space, OBSERVATION_SPACE)
+            for _ in range(10):
+                observation, mask = self._sample()
+                expected, _ = local.predict(
+                    observation, action_masks=mask, deterministic=True)
+                action, _ = remote.predict(
+                    observation, action_masks=mask, deterministic=True)
+                self.assertEqual(int(action[0]), int(expected))
+                self.assertTrue(mask[int(action[0])])
+
+    def test_concurrent_workers_share_one_batch(self):
+        clients = [self._client() for _ in range(3)]
+        remotes = [client.load(self.paths[0]) for client in clients]
+        samples = [self._sample() for _ in clients]
+        before = self.server.stats()
+        results = [None] * len(clients)
+
+        def request(index):
+            observation, mask = samples[index]
+            results[index] = int(remotes[index].predict(
+                observation, action_masks=mask, deterministic=True)[0][0])
+
+        threads = [threading.Thread(target=request, args=(index,))
+                   for index in range(len(clients))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        after = self.server.stats()
+
+        for (observation, mask), action in zip(samples, results):
+            expected, _ = self.local[0].predict(
+                observation, action_masks=mask, deterministic=True)
+            self.assertEqual(action, int(expected))
+        self.assertEqual(after["requests"] - before["requests"], 3)
+        self.assertEqual(after["largest_batch"], 3)
+        self.assertLessEqual(after["resident_policies"], 1)
+
+    def test_invalid_checkpoint_raises_at_load(self):
+        client = self._client()
+        corrupt = os.path.join(self.root.name, "corrupt.zip")
+        with open(corrupt, "wb") as handle:
+            handle.write(b"not a checkpoint")
+        with self.assertRaises(RuntimeError):
+            client.load(corrupt)
+        self.assertEqual(client.load(self.paths[0]).sha256,
+                         client.load(self.paths[0]).sha256)
+
+
+if __name__ == "__main__":
+    unittest.main()
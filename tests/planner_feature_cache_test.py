@@ -0,0 +1,116 @@
+"""Strategic planner feature refresh-policy contracts."""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (REPO_ROOT, os.path.join(REPO_ROOT, "tests")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from Playersim.environment import AlphaZeroMTGEnv  # noqa: E402
+from selfplay_environment_test import _fixture_data  # noqa: E402
+
+
+PLANNER_FIELDS = (
+    AlphaZeroMTGEnv._STRATEGIC_PLANNER_FEATURES
+    + AlphaZeroMTGEnv._TACTICAL_PLANNER_FEATURES
+    + ("threat_assessment",))
+
+
+class PlannerFeatureCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.TemporaryDirectory()
+        self.decks, self.card_db = _fixture_data()
+        self.envs = []
+
+    def tearDown(self):
+        for env in self.envs:
+            env.close()
+        self.root.cleanup()
+
+    def _env(self, planner_refresh):
+        env = AlphaZeroMTGEnv(
+            self.decks,
+            self.card_db,
+            deck_stats_path=os.path.join(
+                self.root.name, planner_refresh, "deck_stats"),
+            card_memory_path=os.path.join(
+                self.root.name, planner_refresh, "card_memory"),
+            planner_refresh=planner_refresh,
+        )
+        self.envs.append(env)
+        return env
+
+    def test_unknown_policy_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self._env("sometimes")
+
+    def test_turn_policy_reuses_features_without_rerunning_planner(self):
+        env = self._env("turn")
+        first, _ = env.reset(seed=2801)
+        planner = env.strategic_planner
+        with mock.patch.object(
+                planner, "analyze_game_state",
+                wraps=planner.analyze_game_state) as analyze, \
+                mock.patch.object(
+                    planner, "project_future_states",
+                    wraps=planner.project_future_states) as project:
+            second = env._get_obs()
+
+        analyze.assert_not_called()
+        project.assert_not_called()
+        self.assertIsNone(env.last_observation_error)
+        for key in PLANNER_FIELDS:
+            np.testing.assert_array_equal(first[key], second[key])
+
+    def test_cached_features_match_a_fresh_planner_run(self):
+        cached_env = self._env("dirty")
+        fresh_env = self._env("observation")
+        cached_env.reset(seed=2802)
+        fresh_env.reset(seed=2802)
+        cached = cached_env._get_obs()
+        fresh = fresh_env._get_obs()
+
+        for key in PLANNER_FIELDS:
+            np.testing.assert_array_equal(cached[key], fresh[key])
+
+    def test_dirty_policy_recomputes_after_a_board_change(self):
+        env = self._env("dirty")
+        env.reset(seed=2803)
+        gs = env.game_state
+        opponent = gs.p2 if gs.agent_is_p1 else gs.p1
+        opponent["life"] -= 3
+        planner = env.strategic_planner
+        with mock.patch.object(
+                planner, "analyze_game_state",
+                wraps=planner.analyze_game_state) as analyze:
+            env._get_obs()
+
+        analyze.assert_called_once()
+
+    def test_cache_entries_are_keyed_by_observer_seat(self):
+        env = self._env("turn")
+        env.reset(seed=2804)
+        gs = env.game_state
+        opponent = gs.p2 if gs.agent_is_p1 else gs.p1
+        planner = env.strategic_planner
+        with mock.patch.object(
+                planner, "analyze_game_state",
+                wraps=planner.analyze_game_state) as analyze:
+            env.observation_for(opponent)
+
+        analyze.assert_called_once()
+        self.assertEqual(
+            {key[1] for key in env._planner_feature_cache},
+            {True, False})
+
+
+if __name__ == "__main__":
+    unittest.main()
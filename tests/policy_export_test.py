@@ -0,0 +1,162 @@
+"""Inference-only policy export contracts."""
+
+import hashlib
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+from gymnasium import spaces
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+import harvest_fixtures as harvest  # noqa: E402
+import main as m  # noqa: E402
+from Playersim.opponent_inference import _PolicyCache  # noqa: E402
+from Playersim.policy_export import (  # noqa: E402
+    InferencePolicy,
+    export_inference_policy,
+    inference_policy_path,
+    load_inference_policy,
+    load_matching_inference_policy,
+)
+from Playersim.observation_schema import (  # noqa: E402
+    EXACT_OWN_STRATEGY_PROFILE_FIELD,
+    EXACT_OWN_STRATEGY_PROFILE_SIZE,
+)
+
+
+OBSERVATION_SPACE = spaces.Dict({
+    "phase": spaces.Box(low=0, high=19, shape=(1,), dtype=np.int32),
+    "life": spaces.Box(low=-5, high=40, shape=(2,), dtype=np.float32),
+    "hand": spaces.Box(low=0, high=1, shape=(4, 6), dtype=np.float32),
+    "my_hand_card_identity": spaces.Box(
+        low=0, high=50, shape=(4,), dtype=np.int32),
+    "recommendations": spaces.Box(
+        low=0, high=1, shape=(3, 2, 2), dtype=np.float32),
+    "action_mask": spaces.Box(low=0, high=1, shape=(8,), dtype=bool),
+    EXACT_OWN_STRATEGY_PROFILE_FIELD: spaces.Box(
+        low=0, high=1, shape=(EXACT_OWN_STRATEGY_PROFILE_SIZE,),
+        dtype=np.float32),
+})
+ACTION_SPACE = spaces.Discrete(8)
+
+
+def _observations(size, seed):
+    OBSERVATION_SPACE.seed(seed)
+    samples = [OBSERVATION_SPACE.sample() for _ in range(size)]
+    return {key: np.stack([sample[key] for sample in samples])
+            for key in OBSERVATION_SPACE.spaces}
+
+
+def _identity(path):
+    payload = Path(path).read_bytes()
+    return {"sha256": hashlib.sha256(payload).hexdigest(),
+            "size": len(payload)}
+
+
+class PolicyExportTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        import gymnasium as gym
+        from sb3_contrib import MaskablePPO
+
+        class TinyEnv(gym.Env):
+            observation_space = OBSERVATION_SPACE
+            action_space = ACTION_SPACE
+
+            def reset(self, *, seed=None, options=None):
+                return self.observation_space.sample(), {}
+
+            def step(self, action):
+                return self.observation_space.sample(), 0.0, True, False, {}
+
+        cls.root = tempfile.TemporaryDirectory()
+        cls.checkpoint = Path(cls.root.name) / "policy.zip"
+        MaskablePPO(
+            m.FixedDimensionMaskableActorCriticPolicy, TinyEnv(),
+            n_steps=8, batch_size=8, seed=3601, device="cpu",
+            policy_kwargs={
+                "features_extractor_class": m.FixedWindowMTGExtractor,
+                "features_extractor_kwargs": {"features_dim": 32},
+                "net_arch": {"pi": [16], "vf": [16]},
+            }).save(cls.checkpoint)
+        cls.policy = MaskablePPO.load(cls.checkpoint, device="cpu").policy
+        cls.export = export_inference_policy(cls.policy, cls.checkpoint)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.root.cleanup()
+
+    def test_export_predicts_like_the_checkpoint_policy(self):
+        exported = load_inference_policy(
+            self.export, _identity(self.checkpoint))
+        observation = _observations(6, 3602)
+        rng = np.random.default_rng(3603)
+        masks = rng.random((6, 8)) < 0.4
+        masks[:, 5] = True
+
+        self.assertEqual(self.export, inference_policy_path(self.checkpoint))
+        self.assertEqual(exported.observation_space, OBSERVATION_SPACE)
+        self.assertEqual(exported.action_space, ACTION_SPACE)
+        self.assertEqual(
+            exported.observation_keys, tuple(OBSERVATION_SPACE.spaces))
+        for action_masks in (masks, None):
+            expected, _ = self.policy.predict(
+                observation, action_masks=action_masks, deterministic=True)
+            actual, _ = exported.predict(
+                observation, action_masks=action_masks, deterministic=True)
+            np.testing.assert_array_equal(actual, expected)
+        single = {key: value[0] for key, value in observation.items()}
+        expected, _ = self.policy.predict(
+            single, action_masks=masks[0], deterministic=True)
+        actual, _ = exported.predict(
+            single, action_masks=masks[0], deterministic=True)
+        self.assertEqual(actual.shape, expected.shape)
+        self.assertEqual(int(actual), int(expected))
+        sampled, _ = exported.predict(observation, action_masks=masks)
+        self.assertTrue(masks[np.arange(6), sampled].all())
+
+    def test_export_bound_to_other_bytes_is_rejected(self):
+        stale = {"sha256": "0" * 64, "size": _identity(self.checkpoint)["size"]}
+
+        with self.assertRaisesRegex(RuntimeError, "different checkpoint"):
+            load_inference_policy(self.export, stale)
+        self.assertIsNone(
+            load_matching_inference_policy(self.checkpoint, stale))
+        self.assertIsNone(load_matching_inference_policy(
+            Path(self.root.name) / "unexported.zip", stale))
+
+    def test_harvest_loader_uses_a_matching_export(self):
+        exported = harvest.load_checkpoint_policy(
+            self.checkpoint, _identity(self.checkpoint))
+        self.assertIsInstance(exported, InferencePolicy)
+
+        full = harvest.load_checkpoint_policy(
+            self.checkpoint, {"sha256": "0" * 64, "size": 1})
+        self.assertNotIsInstance(full, InferencePolicy)
+        self.assertNotIsInstance(
+            harvest.load_checkpoint_policy(self.checkpoint), InferencePolicy)
+
+    def test_opponent_inference_cache_prefers_the_export(self):
+        cache = _PolicyCache(max_policies=2)
+        with mock.patch(
+                "sb3_contrib.MaskablePPO.load",
+                side_effect=AssertionError("full checkpoint loaded")):
+            sha256 = cache.load(
+                self.checkpoint, OBSERVATION_SPACE, ACTION_SPACE)
+
+        self.assertIsInstance(cache.policies[sha256], InferencePolicy)
+        with self.assertRaisesRegex(ValueError, "incompatible"):
+            _PolicyCache(max_policies=1).load(
+                self.checkpoint, OBSERVATION_SPACE, spaces.Discrete(9))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+"""Sequential stopping for paired evaluation and qualification."""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+import numpy as np
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (REPO_ROOT, os.path.join(REPO_ROOT, "tests")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import main as m  # noqa: E402
+from background_persistence_test import _tiny_model  # noqa: E402
+import evaluation_workers_test as worker_tests  # noqa: E402
+from Playersim.sequential_evaluation import (  # noqa: E402
+    sequential_score_test,
+    sequential_test_config,
+)
+
+
+class SequentialRuleTest(unittest.TestCase):
+    def test_error_rate_holds_at_the_indifference_edges(self):
+        rule = sequential_test_config(0.55, error_rate=0.05)
+        rng = np.random.default_rng(4201)
+        wrong = {"pass": 0, "fail": 0}
+        trials = 2000
+        for mean, wrong_decision in ((rule["null_score"], "pass"),
+                                     (rule["alternative_score"], "fail")):
+            for _ in range(trials):
+                # Pair units take the values a seat-swapped pair can score.
+                units = rng.binomial(2, mean, size=400) / 2.0
+                if sequential_score_test(units, rule)["decision"] \
+                        == wrong_decision:
+                    wrong[wrong_decision] += 1
+        self.assertLess(wrong["pass"] / trials, 0.05)
+        self.assertLess(wrong["fail"] / trials, 0.05)
+
+    def test_clear_cut_candidates_stop_at_the_first_crossing(self):
+        rule = sequential_test_config(0.55)
+        winning = sequential_score_test([1.0] * 100, rule)
+        losing = sequential_score_test([0.0] * 100, rule)
+
+        self.assertEqual((winning["decision"], winning["units"]), ("pass", 17))
+        self.assertEqual((losing["decision"], losing["units"]), ("fail", 14))
+        self.assertGreaterEqual(
+            winning["log_likelihood_ratio"], rule["pass_log_bound"])
+        self.assertIsNone(sequential_score_test([0.5] * 8, rule)["decision"])
+
+    def test_continuing_from_a_previous_stage_matches_one_pass(self):
+        rule = sequential_test_config(0.55)
+        units = [1.0, 0.5, 0.0, 1.0, 1.0, 0.5, 1.0, 0.0, 1.0]
+        result = None
+        for start in range(0, len(units), 4):
+            result = sequential_score_test(
+                units[start:start + 4], rule, previous=result)
+        whole = sequential_score_test(units, rule)
+
+        self.assertEqual(result["units"], whole["units"])
+        self.assertAlmostEqual(
+            result["log_likelihood_ratio"], whole["log_likelihood_ratio"])
+        self.assertAlmostEqual(
+            result["mean_unit_score"], whole["mean_unit_score"])
+        settled = sequential_score_test([1.0] * 20, rule)
+        self.assertEqual(
+            sequential_score_test([0.0] * 20, rule, previous=settled),
+            settled)
+
+    def test_rules_outside_the_unit_interval_are_rejected(self):
+        with self.assertRaisesRegex(ValueError, "inside"):
+            sequential_test_config(1.0)
+        with self.assertRaisesRegex(ValueError, "error rate"):
+            sequential_test_config(0.55, error_rate=0.5)
+        with self.assertRaisesRegex(ValueError, "units"):
+            sequential_score_test([1.5], sequential_test_config(0.55))
+
+
+class LosingScheduledEnv(worker_tests.ScheduledEnv):
+    def step(self, action):
+        observation, reward, done, truncated, info = super().step(action)
+        if done:
+            info["game_result"] = "loss"
+        return observation, reward, done, truncated, info
+
+
+def losing_vec_env(worker_index=0):
+    from stable_baselines3.common.vec_env import DummyVecEnv, VecMonitor
+
+    return m.StrictEvaluationVecEnv(
+        VecMonitor(DummyVecEnv([LosingScheduledEnv])))
+
+
+class SequentialPeriodicEvaluationTest(unittest.TestCase):
+    def test_settled_failure_stops_and_never_ranks(self):
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        schedule = m.build_fixed_evaluation_schedule(
+            worker_tests.DECKS, 16, seed=4202)
+        callback = m.AsyncMaskableEvalCallback(
+            losing_vec_env, eval_freq=0, n_eval_episodes=len(schedule),
+            best_model_save_path=os.path.join(root.name, "best"),
+            best_candidate_save_path=os.path.join(root.name, "candidates"),
+            snapshot_dir=os.path.join(root.name, "snapshots"),
+            fixed_evaluation_schedule=schedule,
+            evaluation_history_path=os.path.join(
+                root.name, "evaluation", "evaluations.json"),
+            sequential_evaluation=True, sequential_indifference=0.2)
+        callback.init_callback(_tiny_model())
+        callback._on_training_start()
+        self.addCleanup(callback._shutdown_worker)
+        callback._save_and_enqueue(
+            os.path.join(callback.snapshot_dir, "eval_snapshot_8_steps"), 8)
+        deadline = time.time() + 300
+        while callback._pending_snapshots and time.time() < deadline:
+            self.assertTrue(callback._process.is_alive())
+            callback._drain_results(timeout=1.0)
+
+        record = callback._evaluation_records[-1]
+        # Each lost pair adds log(0.25 / 0.65); log(20) needs four.
+        self.assertEqual(len(record["episodes"]), 8)
+        self.assertTrue(record["stopped_early"])
+        self.assertEqual(record["sequential_test"]["decision"], "fail")
+        self.assertFalse(record["qualified"])
+        self.assertFalse(record["candidate_promoted"])
+        self.assertIsNone(callback.best_candidate_promotion_key)
+
+    def test_sequential_evaluation_needs_one_worker(self):
+        with self.assertRaisesRegex(ValueError, "eval_workers=1"):
+            m.AsyncMaskableEvalCallback(
+                losing_vec_env, eval_freq=0, n_eval_episodes=16,
+                best_model_save_path="best",
+                best_candidate_save_path="candidates",
+                snapshot_dir="snapshots", eval_workers=2,
+                sequential_evaluation=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+"""Control commands stay in sync with in-flight shared-memory steps."""
+
+import os
+import sys
+import time
+import unittest
+from functools import partial
+
+import gymnasium as gym
+import numpy as np
+from gymnasium import spaces
+from stable_baselines3.common.callbacks import BaseCallback
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+import main as m  # noqa: E402
+
+
+class _CountingEnv(gym.Env):
+    """Tiny masked env whose step can be slowed down per worker."""
+
+    observation_space = spaces.Dict({
+        "value": spaces.Box(low=0, high=1_000, shape=(1,), dtype=np.float32)})
+    action_space = spaces.Discrete(2)
+
+    def __init__(self, step_delay=0.0):
+        self.step_delay = step_delay
+        self.steps = 0
+        self.calls = 0
+
+    def _observation(self):
+        return {"value": np.array([self.steps], dtype=np.float32)}
+
+    def reset(self, *, seed=None, options=None):
+        super().reset(seed=seed)
+        self.steps = 0
+        return self._observation(), {}
+
+    def step(self, action):
+        time.sleep(self.step_delay)
+        self.steps += 1
+        return self._observation(), 1.0, self.steps >= 5, False, {
+            "steps": self.steps}
+
+    def action_masks(self):
+        return np.ones(2, dtype=bool)
+
+    def bump(self):
+        self.calls += 1
+        return self.calls
+
+
+def _vec_env(delays):
+    return m.SharedMemoryVecEnv(
+        [partial(_CountingEnv, delay) for delay in delays],
+        start_method="spawn")
+
+
+class _BumpCallback(BaseCallback):
+    def __init__(self):
+        super().__init__()
+        self.replies = []
+
+    def _on_step(self):
+        self.replies.append(self.training_env.env_method("bump"))
+        return True
+
+
+class SharedMemoryControlCommandTest(unittest.TestCase):
+    def test_env_method_waits_out_a_busy_worker(self):
+        env = _vec_env([0.0, 0.5])
+        try:
+            env.reset()
+            env.step_async_indices([0, 1], [0, 0])
+            indices = env.step_wait_any()[0]
+            self.assertEqual(indices.tolist(), [0])
+
+            # Worker 1 is still stepping; its reply must not be mistaken
+            # for the method result (or vice versa).
+            self.assertEqual(env.env_method("bump"), [1, 1])
+            self.assertEqual(env.get_attr("calls"), [1, 1])
+            env.set_attr("calls", 10, indices=[1])
+            self.assertEqual(env.env_method("bump", indices=[1]), [11])
+
+            indices, observations, rewards, dones, infos = \
+                env.step_wait_any(timeout=0)
+            self.assertEqual(indices.tolist(), [1])
+            self.assertEqual(infos[0]["steps"], 1)
+            self.assertEqual(observations["value"].tolist(), [[1.0]])
+            self.assertFalse(env.waiting)
+            # The held reply came back after ``bump`` ran on the worker.
+            self.assertFalse(env._masks_current[1])
+            self.assertEqual(
+                np.stack(env.env_method("action_masks")).tolist(),
+                [[True, True], [True, True]])
+        finally:
+            env.close()
+
+    def test_callback_env_method_during_async_rollout(self):
+        env = m.AsyncVecMonitor(_vec_env([0.0, 0.05]))
+        try:
+            model = m.AsyncRolloutMaskablePPO(
+                "MultiInputPolicy", env, n_steps=8, batch_size=16,
+                n_epochs=1, verbose=0,
+                policy_kwargs={"net_arch": {"pi": [8], "vf": [8]}})
+            callback = _BumpCallback()
+            model.learn(total_timesteps=32, callback=callback,
+                        progress_bar=False)
+            self.assertEqual(model.num_timesteps, 32)
+            self.assertEqual(
+                callback.replies,
+                [[call, call] for call in range(
+                    1, len(callback.replies) + 1)])
+            self.assertFalse(env.venv.waiting)
+        finally:
+            env.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+"""Per-phase step latency histogram contracts."""
+
+import os
+import sys
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (REPO_ROOT, os.path.join(REPO_ROOT, "tests")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import main as m  # noqa: E402
+from Playersim.environment import AlphaZeroMTGEnv  # noqa: E402
+from Playersim.step_latency import (  # noqa: E402
+    BUCKET_COUNT,
+    LATENCY_STAGES,
+    StepLatencyRecorder,
+    bucket_upper_bound_ms,
+    histogram_percentiles,
+    latency_bucket,
+    merge_latency_histograms,
+)
+from selfplay_environment_test import _fixture_data  # noqa: E402
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+class LatencyHistogramTest(unittest.TestCase):
+    def test_buckets_are_monotonic_and_bound_their_samples(self):
+        previous = 0
+        for micros in list(range(0, 5000)) + [10 ** 6, 10 ** 7, 10 ** 11]:
+            bucket = latency_bucket(micros * 1000)
+            self.assertGreaterEqual(bucket, previous)
+            self.assertLess(bucket, BUCKET_COUNT)
+            if bucket < BUCKET_COUNT - 1:
+                self.assertLess(micros / 1000.0, bucket_upper_bound_ms(bucket))
+                self.assertLessEqual(
+                    micros / 1000.0, 1.25 * bucket_upper_bound_ms(bucket))
+            previous = bucket
+
+    def test_percentiles_report_the_bucket_holding_each_rank(self):
+        counts = np.zeros(BUCKET_COUNT, dtype=np.int64)
+        counts[latency_bucket(1_000_000)] = 98
+        counts[latency_bucket(50_000_000)] = 2
+
+        percentiles = histogram_percentiles(counts)
+
+        self.assertAlmostEqual(percentiles[0.5], 1.024)
+        self.assertAlmostEqual(percentiles[0.95], 1.024)
+        self.assertGreater(percentiles[0.99], 50.0)
+        self.assertEqual(histogram_percentiles(np.zeros(BUCKET_COUNT)), {})
+
+    def test_nested_stages_are_charged_exclusively(self):
+        clock = FakeClock()
+        recorder = StepLatencyRecorder(clock=clock)
+        recorder.begin_step("CAST_SPELL", "MAIN_PRECOMBAT")
+        recorder.enter("action_execution")
+        clock.now += 3_000_000
+        recorder.enter("sba_triggers")
+        clock.now += 2_000_000
+        recorder.exit()
+        recorder.exit()
+        recorder.enter("observation")
+        clock.now += 1_000_000
+        recorder.exit()
+        recorder.end_step()
+        recorder.enter("observation")
+        clock.now += 9_000_000
+        recorder.exit()
+
+        payload = recorder.drain()
+        merged = merge_latency_histograms({}, payload)
+        expected = {"action_execution": 3_000_000, "sba_triggers": 2_000_000,
+                    "observation": 1_000_000, "step": 6_000_000}
+        self.assertEqual(set(merged), {
+            f"{stage}/CAST_SPELL/MAIN_PRECOMBAT" for stage in expected})
+        for stage, nanoseconds in expected.items():
+            counts = merged[f"{stage}/CAST_SPELL/MAIN_PRECOMBAT"]
+            self.assertEqual(int(counts.sum()), 1)
+            self.assertEqual(int(np.argmax(counts)),
+                             latency_bucket(nanoseconds))
+        self.assertEqual(recorder.drain(), {})
+
+
+class EnvironmentStepLatencyTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.TemporaryDirectory()
+        self.decks, self.card_db = _fixture_data()
+        self.envs = []
+
+    def tearDown(self):
+        for env in self.envs:
+            env.close()
+        self.root.cleanup()
+
+    def _env(self, name, record):
+        env = AlphaZeroMTGEnv(
+            self.decks,
+            self.card_db,
+            deck_stats_path=os.path.join(self.root.name, name, "deck_stats"),
+            card_memory_path=os.path.join(self.root.name, name, "card_memory"),
+            record_step_latency=record,
+        )
+        self.envs.append(env)
+        return env
+
+    def _play(self, env, seed, decisions=600):
+        env.reset(seed=seed)
+        rng = np.random.default_rng(seed)
+        results = []
+        for _ in range(decisions):
+            legal = np.flatnonzero(env.action_mask())
+            results.append(env.step(int(rng.choice(legal))))
+            if results[-1][2] or results[-1][3]:
+                break
+        return results
+
+    def test_episode_end_ships_histograms_for_every_decision(self):
+        env = self._env("recorded", True)
+        results = self._play(env, 3401)
+        self.assertTrue(results[-1][2] or results[-1][3])
+
+        for _, _, _, _, info in results[:-1]:
+            self.assertNotIn("step_latency", info)
+        merged = merge_latency_histograms(
+            {}, results[-1][4]["step_latency"])
+        stages = {key.split("/", 1)[0] for key in merged}
+        self.assertEqual(stages, set(LATENCY_STAGES))
+        steps = sum(int(counts.sum()) for key, counts in merged.items()
+                    if key.startswith("step/"))
+        self.assertEqual(steps, len(results))
+
+    def test_recording_does_not_change_the_game(self):
+        recorded = self._play(self._env("recorded", True), 3402, 80)
+        plain = self._play(self._env("plain", False), 3402, 80)
+
+        self.assertEqual([reward for _, reward, _, _, _ in recorded],
+                         [reward for _, reward, _, _, _ in plain])
+        self.assertNotIn("_get_obs", vars(self.envs[1]))
+
+    def test_transaction_checkpoints_share_the_live_recorder(self):
+        env = self._env("recorded", True)
+        self._play(env, 3403, 2)
+        checkpoint = env.game_state.create_transaction_checkpoint()
+
+        self.assertIs(checkpoint["state"].latency_recorder, env.step_latency)
+        self.assertIsNone(env.game_state.clone().latency_recorder)
+
+
+class StepLatencyCallbackTest(unittest.TestCase):
+    def test_rollout_end_logs_stage_action_and_phase_percentiles(self):
+        metrics = {}
+        callback = m.StepLatencyCallback()
+        callback.model = SimpleNamespace(logger=SimpleNamespace(
+            record=lambda name, value: metrics.__setitem__(name, value)))
+        sample = {latency_bucket(2_000_000): 3}
+        callback.locals = {"infos": [
+            {"step_latency": {"observation/PASS_PRIORITY/UPKEEP": sample}},
+            {},
+            {"step_latency": {"observation/PLAY_LAND/UPKEEP": sample}},
+        ]}
+        self.assertTrue(callback._on_step())
+        callback._on_rollout_end()
+
+        self.assertEqual(metrics["latency/observation/samples"], 6)
+        self.assertAlmostEqual(metrics["latency/observation/p99_ms"], 2.048)
+        self.assertIn(
+            "latency_by_action/observation/PLAY_LAND/p50_ms", metrics)
+        self.assertIn("latency_by_phase/observation/UPKEEP/p95_ms", metrics)
+        metrics.clear()
+        callback._on_rollout_end()
+        self.assertEqual(metrics, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -25,6 +25,12 @@ What it verifies:
      did not exist on a freshly constructed policy).
   7. Two masked MTG environments reset and step through SubprocVecEnv using
      Windows-compatible spawn semantics, then shut their worker processes down.
+  8. SharedMemoryVecEnv returns the same observations, masks, rewards, and
+     dones as SubprocVecEnv for the same seeds and actions, and on Linux its
+     workers forked from a preloaded template match spawned workers.
+  9. The ragged rollout buffer's per-worker GAE matches MaskablePPO's buffer
+     for lock-step input and a per-worker reference for ragged input, and
+     asynchronous rollout collection trains through SharedMemoryVecEnv.
 """
 
 import os
@@ -2451,6 +2457,221 @@ def check_subproc_vec_env(deck_folder):
         assert vec_env is not None and vec_env.closed
 
 
+@stage("shared-memory VecEnv matches SubprocVecEnv step for step")
+def check_shared_memory_vec_env(deck_folder):
+    import main as m
+    from sb3_contrib.common.maskable.utils import get_action_masks
+    from stable_baselines3.common.vec_env import SubprocVecEnv
+    from Playersim.card import load_decks_and_card_db
+    from Playersim.card import Card
+
+    decks, card_db = load_decks_and_card_db(deck_folder)
+    subtype_vocab = tuple(Card.SUBTYPE_VOCAB)
+    shared_env = reference_env = None
+    with tempfile.TemporaryDirectory() as storage_root:
+        def factories(label):
+            return [
+                partial(
+                    _make_subproc_masked_env,
+                    decks,
+                    card_db,
+                    os.path.join(storage_root, label),
+                    worker_index,
+                    subtype_vocab,
+                )
+                for worker_index in range(2)
+            ]
+
+        try:
+            shared_env = m.SharedMemoryVecEnv(
+                factories("shared"), start_method="spawn")
+            reference_env = SubprocVecEnv(
+                factories("reference"), start_method="spawn")
+            assert shared_env.observation_space == \
+                reference_env.observation_space
+            shared_env.seed(20260711)
+            reference_env.seed(20260711)
+            shared_obs = shared_env.reset()
+            reference_obs = reference_env.reset()
+            for _ in range(6):
+                for key, value in reference_obs.items():
+                    assert np.array_equal(shared_obs[key], value), key
+                    assert shared_obs[key].flags["C_CONTIGUOUS"], key
+                masks = np.asarray(get_action_masks(shared_env), dtype=bool)
+                assert np.array_equal(
+                    masks, np.asarray(get_action_masks(reference_env)))
+                previous_batch = shared_obs
+                previous = {
+                    key: value.copy() for key, value in shared_obs.items()}
+                actions = np.argmax(masks, axis=1).astype(np.int64)
+                shared_obs, rewards, dones, infos = shared_env.step(actions)
+                reference_obs, ref_rewards, ref_dones, ref_infos = \
+                    reference_env.step(actions)
+                assert np.array_equal(rewards, ref_rewards)
+                assert np.array_equal(dones, ref_dones)
+                assert len(infos) == len(ref_infos) == 2
+                # A returned batch must stay valid after the next step.
+                assert all(
+                    np.array_equal(previous_batch[key], value)
+                    for key, value in previous.items())
+        finally:
+            for vec_env in (shared_env, reference_env):
+                if vec_env is not None:
+                    vec_env.close()
+
+        assert shared_env is not None and shared_env.closed
+
+
+@stage("template-forked SharedMemoryVecEnv workers match spawned workers")
+def check_template_vec_env(deck_folder):
+    import main as m
+    from sb3_contrib.common.maskable.utils import get_action_masks
+    from Playersim.card import Card, load_decks_and_card_db
+    from Playersim.worker_template import (
+        TEMPLATE_START_METHOD, template_supported)
+
+    if not template_supported():
+        return
+    decks, card_db = load_decks_and_card_db(deck_folder)
+    subtype_vocab = tuple(Card.SUBTYPE_VOCAB)
+    vec_envs = {}
+    with tempfile.TemporaryDirectory() as storage_root:
+        try:
+            for method in (TEMPLATE_START_METHOD, "spawn"):
+                vec_envs[method] = m.SharedMemoryVecEnv([
+                    partial(_make_subproc_masked_env, decks, card_db,
+                            os.path.join(storage_root, method),
+                            worker_index, subtype_vocab)
+                    for worker_index in range(2)], start_method=method)
+                vec_envs[method].seed(20260712)
+            template_env = vec_envs[TEMPLATE_START_METHOD]
+            spawned_env = vec_envs["spawn"]
+            # One template process owns both forked workers.
+            assert len(template_env.processes) == 1
+            template_obs = template_env.reset()
+            spawned_obs = spawned_env.reset()
+            for _ in range(6):
+                for key, value in spawned_obs.items():
+                    assert np.array_equal(template_obs[key], value), key
+                masks = np.asarray(get_action_masks(template_env), dtype=bool)
+                assert np.array_equal(
+                    masks, np.asarray(get_action_masks(spawned_env)))
+                actions = np.argmax(masks, axis=1).astype(np.int64)
+                template_obs, rewards, dones, _ = template_env.step(actions)
+                spawned_obs, ref_rewards, ref_dones, _ = spawned_env.step(
+                    actions)
+                assert np.array_equal(rewards, ref_rewards)
+                assert np.array_equal(dones, ref_dones)
+        finally:
+            for vec_env in vec_envs.values():
+                vec_env.close()
+
+        template = vec_envs[TEMPLATE_START_METHOD].processes[0]
+        assert template.exitcode == 0, template.exitcode
+
+
+@stage("ragged rollout buffer GAE matches lock-step and per-worker references")
+def check_ragged_rollout_buffer():
+    import torch
+    from gymnasium import spaces
+    from sb3_contrib.common.maskable.buffers import MaskableDictRolloutBuffer
+    import main as m
+
+    observation_space = spaces.Dict({
+        "x": spaces.Box(low=-1.0, high=1.0, shape=(3,), dtype=np.float32)})
+    action_space = spaces.Discrete(4)
+    rng = np.random.default_rng(3301)
+    steps, workers, gamma, lam = 6, 3, 0.9, 0.8
+
+    def transition(count):
+        return (
+            {"x": rng.uniform(-1, 1, (count, 3)).astype(np.float32)},
+            rng.integers(0, 4, count),
+            rng.normal(size=count).astype(np.float32),
+            rng.random(count) < 0.2,
+            torch.as_tensor(rng.normal(size=count).astype(np.float32)),
+            torch.as_tensor(rng.normal(size=count).astype(np.float32)),
+        )
+
+    reference = MaskableDictRolloutBuffer(
+        steps, observation_space, action_space, gamma=gamma, gae_lambda=lam,
+        n_envs=workers)
+    ragged = m.RaggedMaskableDictRolloutBuffer(
+        steps, observation_space, action_space, gamma=gamma, gae_lambda=lam,
+        n_envs=workers)
+    reference.reset()
+    ragged.reset()
+    for _ in range(steps):
+        sample = transition(workers)
+        reference.add(*sample)
+        ragged.add(*sample)
+    last_values = torch.as_tensor(rng.normal(size=workers))
+    dones = np.array([True, False, False])
+    reference.compute_returns_and_advantage(last_values, dones)
+    ragged.compute_returns_and_advantage(last_values, dones)
+    assert np.allclose(
+        ragged.advantages.reshape(steps, workers), reference.advantages,
+        atol=1e-5)
+
+    ragged.reset()
+    order = rng.permutation(np.repeat(np.arange(workers), [9, 5, 4]))
+    for env_index in order:
+        ragged.add_transitions(np.array([env_index]), *transition(1))
+    assert ragged.full
+    ragged.compute_returns_and_advantage(last_values, dones)
+    for env_index in range(workers):
+        rows = np.flatnonzero(ragged.env_indices == env_index)
+        next_value = float(last_values[env_index])
+        next_non_terminal = 1.0 - float(dones[env_index])
+        advantage = 0.0
+        for row in rows[::-1]:
+            delta = (ragged.rewards[row, 0]
+                     + gamma * next_value * next_non_terminal
+                     - ragged.values[row, 0])
+            advantage = delta + gamma * lam * next_non_terminal * advantage
+            assert abs(ragged.advantages[row, 0] - advantage) < 1e-4
+            next_value = ragged.values[row, 0]
+            next_non_terminal = 1.0 - ragged.episode_starts[row, 0]
+
+
+@stage("asynchronous rollout collection trains through SharedMemoryVecEnv")
+def check_async_rollout_collection(deck_folder):
+    import main as m
+    from Playersim.card import Card, load_decks_and_card_db
+
+    decks, card_db = load_decks_and_card_db(deck_folder)
+    subtype_vocab = tuple(Card.SUBTYPE_VOCAB)
+    vec_env = None
+    with tempfile.TemporaryDirectory() as storage_root:
+        try:
+            vec_env = m.AsyncVecMonitor(m.SharedMemoryVecEnv([
+                partial(_make_subproc_masked_env, decks, card_db,
+                        storage_root, worker_index, subtype_vocab)
+                for worker_index in range(2)], start_method="spawn"))
+            model = m.AsyncRolloutMaskablePPO(
+                policy=m.FixedDimensionMaskableActorCriticPolicy,
+                env=vec_env,
+                policy_kwargs={
+                    "features_extractor_class": m.FixedWindowMTGExtractor,
+                    "features_extractor_kwargs": {
+                        "features_dim": m.FEATURE_OUTPUT_DIM},
+                    "net_arch": {"pi": [32], "vf": [32]},
+                },
+                n_steps=16, batch_size=16, n_epochs=1, verbose=0)
+            assert isinstance(
+                model.rollout_buffer, m.RaggedMaskableDictRolloutBuffer)
+            model.learn(total_timesteps=64, progress_bar=False)
+            assert model.num_timesteps == 64, model.num_timesteps
+            buffer = model.rollout_buffer
+            assert buffer.full and buffer.pos == 32
+            assert set(np.unique(buffer.env_indices)) <= {0, 1}
+            assert np.isfinite(buffer.advantages).all()
+            assert not vec_env.venv.waiting
+        finally:
+            if vec_env is not None:
+                vec_env.close()
+
+
 @stage("build masked vec env from fixture decks")
 def build_vec_env(deck_folder):
     from stable_baselines3.common.vec_env import DummyVecEnv
@@ -2771,6 +2992,10 @@ def main():
     with tempfile.TemporaryDirectory() as folder:
         build_fixture_decks(folder)
         check_subproc_vec_env(folder)
+        check_shared_memory_vec_env(folder)
+        check_template_vec_env(folder)
+        check_ragged_rollout_buffer()
+        check_async_rollout_collection(folder)
         vec_env = build_vec_env(folder)
         if vec_env is None:
             return finish()
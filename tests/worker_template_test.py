@@ -0,0 +1,95 @@
+"""Preloaded worker template contracts."""
+
+import multiprocessing
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+import harvest_fixtures as harvest  # noqa: E402
+from Playersim.worker_template import (  # noqa: E402
+    start_worker_template,
+    template_supported,
+)
+
+
+def _report(connection, shared):
+    """Send back where this worker runs and which copy of ``shared`` it has."""
+    connection.send((os.getpid(), os.getppid(), id(shared),
+                     "torch" in sys.modules, len(shared["cards"])))
+    connection.recv()
+    connection.close()
+
+
+@unittest.skipUnless(template_supported(), "worker templates need Linux fork")
+class WorkerTemplateTest(unittest.TestCase):
+    def _start(self, count):
+        shared = {"cards": [{"name": f"card {index}"} for index in range(500)]}
+        pipes = [multiprocessing.Pipe() for _ in range(count)]
+        template = start_worker_template(
+            [(_report, (child, shared)) for _, child in pipes],
+            modules=("torch",))
+        for _, child in pipes:
+            child.close()
+        return template, [parent for parent, _ in pipes]
+
+    def test_workers_fork_from_one_template_and_share_arguments(self):
+        template, connections = self._start(3)
+        reports = [connection.recv() for connection in connections]
+
+        self.assertEqual({report[1] for report in reports}, {template.pid})
+        self.assertEqual(len({report[0] for report in reports}), 3)
+        self.assertEqual(len({report[2] for report in reports}), 1)
+        for _, _, _, torch_loaded, cards in reports:
+            self.assertTrue(torch_loaded)
+            self.assertEqual(cards, 500)
+        for connection in connections:
+            connection.send("exit")
+        template.join(timeout=60)
+        self.assertEqual(template.exitcode, 0)
+
+    def test_terminating_the_template_stops_its_workers(self):
+        template, connections = self._start(2)
+        reports = [connection.recv() for connection in connections]
+
+        template.terminate()
+        template.join(timeout=60)
+
+        self.assertFalse(template.is_alive())
+        for connection in connections:
+            with self.assertRaises(EOFError):
+                connection.recv()
+        for pid, *_ in reports:
+            with self.assertRaises(ProcessLookupError):
+                os.kill(pid, 0)
+
+
+class PreloadedCorpusTest(unittest.TestCase):
+    def tearDown(self):
+        harvest.clear_preloaded_corpora()
+
+    def test_preload_is_keyed_by_the_run_harvest_corpus_arguments(self):
+        corpus = ([{"name": "A"}, {"name": "B"}], {}, {"corpus": "preloaded"})
+        with mock.patch.object(
+                harvest, "load_corpus_decks", return_value=corpus) as load:
+            harvest.preload_corpus(format_name="standard")
+        key = harvest._corpus_key(*harvest._corpus_arguments(
+            format_name="standard"))
+
+        self.assertEqual(load.call_count, 1)
+        self.assertIs(harvest._PRELOADED_CORPORA[key], corpus)
+        self.assertEqual(
+            harvest._corpus_arguments()[0],
+            Path(harvest.DEFAULT_DECKS_DIRECTORY))
+        harvest.clear_preloaded_corpora()
+        self.assertEqual(harvest._PRELOADED_CORPORA, {})
+
+
+if __name__ == "__main__":
+    unittest.main()